@@ -0,0 +1,283 @@
+"""
+Asyncio table runner.
+
+Every table is a coroutine that plays its game turn by turn. Players whose strategy is an AsyncStrategy have their
+card choice awaited, so a slow external agent only holds up its own table while the other tables keep playing on
+the same event loop. A choice that takes longer than the move timeout, or that is not a playable card, is replaced
+by the choice of the default strategy.
+"""
+import asyncio
+from abc import abstractmethod
+
+from data_structures.referential_array import ArrayR
+from data_structures.sorting import counting_sort
+from card import CardColor
+from deck import DeckSpec, STANDARD_DECK
+from game import Game, PilesExhausted
+from player import Player
+from random_gen import RandomGen, RandomStream
+from rules import RuleSet, STANDARD_RULES
+from strategy import Strategy, DEFAULT_STRATEGY
+
+
+class AsyncStrategy(Strategy):
+    """
+    Abstract class for strategies whose card choice has to be awaited, e.g. because it is made by another process.
+    Colors are still chosen synchronously with choose_color().
+    """
+
+    @abstractmethod
+    async def choose_card_async(self, player: Player, mask: int) -> int:
+        """
+        Method to choose which playable card to play
+
+        Args:
+            player (Player): The player making the decision
+            mask (int): Non-zero bitmask with bit i set if player.hand[i] is playable
+
+        Returns:
+            int: The index in the player's hand of the card to play
+        """
+        pass
+
+    def choose_card(self, player: Player, mask: int) -> int:
+        """
+        Method used when the game is played synchronously with play_game(), where nothing can be awaited
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return DEFAULT_STRATEGY.choose_card(player, mask)
+
+
+class DelayedStrategy(AsyncStrategy):
+    """
+    Strategy that waits before answering with the choice of another strategy, standing in for a slow agent
+    """
+
+    def __init__(self, delay: float, strategy: Strategy = DEFAULT_STRATEGY) -> None:
+        """
+        Constructor for the DelayedStrategy class
+
+        Args:
+            delay (float): Number of seconds to wait before every choice
+            strategy (Strategy): The strategy making the actual choices
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.delay = delay
+        self.strategy = strategy
+
+    async def choose_card_async(self, player: Player, mask: int) -> int:
+        """
+        Method to wait for the delay, then choose a card with the wrapped strategy
+
+        Complexity:
+            Best Case Complexity: O(1) plus the cost of the wrapped strategy
+            Worst Case Complexity: O(1) plus the cost of the wrapped strategy
+        """
+        await asyncio.sleep(self.delay)
+        return self.strategy.choose_card(player, mask)
+
+    def choose_color(self, player: Player, rng=RandomGen) -> CardColor:
+        """
+        Method to choose a color with the wrapped strategy
+
+        Complexity:
+            Best Case Complexity: O(1) plus the cost of the wrapped strategy
+            Worst Case Complexity: O(1) plus the cost of the wrapped strategy
+        """
+        return self.strategy.choose_color(player, rng)
+
+
+def new_table(players: ArrayR[Player], seed: int, deck_spec: DeckSpec = STANDARD_DECK,
+              rules: RuleSet = STANDARD_RULES) -> Game:
+    """
+    Method to create and initialise a game with its own random number stream, so that tables sharing an
+    event loop do not draw from the same generator and every table is repeatable from its seed
+
+    Args:
+        players (ArrayR[Player]): The players of the table
+        seed (int): Seed for the table's random numbers
+        deck_spec (DeckSpec): The composition of the deck
+        rules (RuleSet): The effects of the cards
+
+    Returns:
+        Game: The initialised game
+
+    Complexity:
+        Best Case Complexity: O(n + p * log(p)) where n is the number of cards and p is the number of players
+        Worst Case Complexity: O(n + p * log(p)) where n is the number of cards and p is the number of players
+    """
+    game = Game(deck_spec, rules)
+    game.rng = RandomStream(seed)
+    game.initialise_game(players)
+    return game
+
+
+class Arena:
+    """
+    Runs many tables concurrently on one event loop
+    """
+
+    def __init__(self, move_timeout: float | None = 1.0, max_concurrent_tables: int | None = None,
+                 yield_every: int = 8) -> None:
+        """
+        Constructor for the Arena class
+
+        Args:
+            move_timeout (float | None): Seconds an AsyncStrategy gets to choose a card, None to wait forever
+            max_concurrent_tables (int | None): Maximum number of tables in play at once, None for no limit
+            yield_every (int): Number of synchronous turns a table plays before letting other tables run
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.move_timeout = move_timeout
+        self.max_concurrent_tables = max_concurrent_tables
+        self.yield_every = max(1, yield_every)
+        self.fallbacks = 0
+
+    async def choose_card(self, player: Player, mask: int) -> int:
+        """
+        Method to get the card choice of a player, awaiting it if their strategy is asynchronous
+
+        Args:
+            player (Player): The current player
+            mask (int): Non-zero bitmask with bit i set if player.hand[i] is playable
+
+        Returns:
+            int: The index in the player's hand of the card to play
+
+        Complexity:
+            Best Case Complexity: O(1) plus the cost of the strategy
+            Worst Case Complexity: O(1) plus the cost of the strategy
+        """
+        strategy = player.strategy
+        if not isinstance(strategy, AsyncStrategy):
+            return strategy.choose_card(player, mask)
+
+        try:
+            index = await asyncio.wait_for(strategy.choose_card_async(player, mask), self.move_timeout)
+        except asyncio.TimeoutError:
+            index = -1
+        if index < 0 or not (mask >> index) & 1:
+            # Too slow, or not a playable card
+            self.fallbacks += 1
+            index = DEFAULT_STRATEGY.choose_card(player, mask)
+        return index
+
+    async def play_table(self, game: Game) -> Player | None:
+        """
+        Method to play an initialised game to the end
+
+        Args:
+            game (Game): The game to play
+
+        Returns:
+            Player | None: The winner of the game, None if the game got stuck because a card had to be drawn
+                when there were none left to draw (see PilesExhausted)
+
+        Complexity:
+            Best Case Complexity: O(k * (h + p + n)) where k is the number of turns, see Game.play_game()
+            Worst Case Complexity: O(k * (h + p + n)) where k is the number of turns, see Game.play_game()
+        """
+        winner = None
+        turns = 0
+        while winner is None:
+            try:
+                mask = game.begin_turn()
+                if mask:
+                    index = await self.choose_card(game.current_player, mask)
+                    winner = game.play_from_hand(index)
+                else:
+                    winner = game.draw_turn()
+            except PilesExhausted:
+                # Only this table is given up, the others keep playing
+                return None
+
+            # Tables of synchronous players would otherwise never give up the event loop
+            turns += 1
+            if turns % self.yield_every == 0:
+                await asyncio.sleep(0)
+
+        return winner
+
+    async def play_tables(self, games: ArrayR[Game]) -> ArrayR[Player | None]:
+        """
+        Method to play many games concurrently
+
+        Args:
+            games (ArrayR[Game]): The initialised games to play
+
+        Returns:
+            ArrayR[Player | None]: The winner of each game, in the same order as games, None for a game that got
+                stuck, see play_table()
+
+        Complexity:
+            Best Case Complexity: O(g * k * (h + p + n)) where g is the number of games, see play_table()
+            Worst Case Complexity: O(g * k * (h + p + n)) where g is the number of games, see play_table()
+        """
+        winners: ArrayR[Player | None] = ArrayR(len(games))
+        limit = None if self.max_concurrent_tables is None else asyncio.Semaphore(self.max_concurrent_tables)
+
+        async def run(index: int) -> None:
+            if limit is None:
+                winners[index] = await self.play_table(games[index])
+            else:
+                async with limit:
+                    winners[index] = await self.play_table(games[index])
+
+        await asyncio.gather(*map(run, range(len(games))))
+        return winners
+
+    def run(self, games: ArrayR[Game]) -> ArrayR[Player | None]:
+        """
+        Method to play many games concurrently on a new event loop
+
+        Args:
+            games (ArrayR[Game]): The initialised games to play
+
+        Returns:
+            ArrayR[Player | None]: The winner of each game, in the same order as games, None for a game that got
+                stuck, see play_table()
+
+        Complexity:
+            Best Case Complexity: O(g * k * (h + p + n)) where g is the number of games, see play_table()
+            Worst Case Complexity: O(g * k * (h + p + n)) where g is the number of games, see play_table()
+        """
+        return asyncio.run(self.play_tables(games))
+
+
+def rank(wins: ArrayR[int]) -> ArrayR[int]:
+    """
+    Method to rank the entrants of a tournament by their number of wins
+
+    Args:
+        wins (ArrayR[int]): The number of games won by each entrant
+
+    Returns:
+        ArrayR[int]: The entrants' indices from most to fewest wins, entrants with the same number of wins
+            keeping their order
+
+    Complexity:
+        Best Case Complexity: O(e + w) where e is the number of entrants and w the largest number of wins
+        Worst Case Complexity: O(e + w) where e is the number of entrants and w the largest number of wins
+    """
+    most_wins = 0
+    order: ArrayR[int] = ArrayR(len(wins))
+    for i in range(len(wins)):
+        order[i] = i
+        most_wins = max(most_wins, wins[i])
+    counting_sort(order, lambda entrant: most_wins - wins[entrant], most_wins + 1)
+    return order
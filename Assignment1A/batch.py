@@ -0,0 +1,382 @@
+"""
+Seeded batches of games played across processes, with the results gathered in shared memory.
+
+Every game of a batch has a fixed-width record in a ResultsBuffer, a block of multiprocessing.shared_memory.
+Workers attach to the block by name and write the records of their own range of games in place, so nothing but
+the seeds is sent to them and nothing at all is sent back. The parent reads the block as a NumPy structured array
+viewing the shared memory directly, without copying or unpickling anything.
+
+Record layout (little endian, RECORD.size bytes):
+    seed         int64   the game's seed
+    winner       int32   seat of the winner, NO_WINNER if the game was a draw or was aborted
+    turns        int32   number of turns played
+    cards_drawn  int32   number of cards drawn from the draw pile, including the deal
+    recycles     int32   number of times the discard pile was shuffled back into the draw pile
+
+Short-lived workers spend much of their life importing the game. worker_pool() starts them from a forkserver that
+has already imported PRELOAD, so each new worker is forked with the modules and their enum classes ready instead of
+importing them again.
+"""
+from __future__ import annotations
+
+import importlib
+import multiprocessing
+from multiprocessing import resource_tracker, shared_memory
+import struct
+import sys
+from typing import TYPE_CHECKING
+
+from data_structures.referential_array import ArrayR
+from bounded import BoundedGame, Outcome
+from card import Card
+from constants import Constants
+from lazy import lazy_import
+from player import Player
+from random_gen import RandomStream
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, ProcessPoolExecutor
+
+np = lazy_import("numpy")
+
+NO_WINNER = -1
+RECORD = struct.Struct("<qiiii")
+FIELDS = ("seed", "winner", "turns", "cards_drawn", "recycles")
+PRELOAD = ("batch",)
+
+
+def record_dtype():
+    """
+    Method to get the NumPy dtype of a record, matching RECORD field for field
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    return np.dtype([("seed", "<i8"), ("winner", "<i4"), ("turns", "<i4"), ("cards_drawn", "<i4"),
+                     ("recycles", "<i4")])
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Method to attach to an existing block of shared memory without registering it with this process's resource
+    tracker. Before Python 3.13 attaching registers the block too, and a worker whose pool was started before the
+    block existed has a tracker of its own, which would unlink the block when the worker exits.
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+class ResultsBuffer:
+    """
+    Fixed number of game records in a block of shared memory
+    """
+
+    def __init__(self, capacity: int, name: str | None = None) -> None:
+        """
+        Constructor for the ResultsBuffer class, creating a new block, or attaching to an existing one if a name
+        is given. Only the creator unlinks the block.
+
+        Args:
+            capacity (int): Number of records
+            name (str | None): Name of the block to attach to, None to create one
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(c) where c is the capacity, to zero a new block
+        """
+        if capacity <= 0:
+            raise ValueError("A results buffer needs room for at least one record.")
+        self.capacity = capacity
+        self.owner = name is None
+        if self.owner:
+            self.memory = shared_memory.SharedMemory(create=True, size=capacity * RECORD.size)
+            self.memory.buf[:capacity * RECORD.size] = bytes(capacity * RECORD.size)
+        else:
+            self.memory = _attach(name)
+        self.name = self.memory.name
+
+    def __enter__(self) -> 'ResultsBuffer':
+        """ Method to use the buffer in a with statement, closing it at the end. """
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """ Method to close the buffer at the end of a with statement, see close(). """
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Method to get the number of records
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.capacity
+
+    def write(self, index: int, seed: int, winner: int, turns: int, cards_drawn: int, recycles: int) -> None:
+        """
+        Method to write the record at an index
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if not 0 <= index < self.capacity:
+            raise IndexError("Record index out of range.")
+        RECORD.pack_into(self.memory.buf, index * RECORD.size, seed, winner, turns, cards_drawn, recycles)
+
+    def record(self, index: int) -> tuple[int, int, int, int, int]:
+        """
+        Method to read the record at an index without NumPy
+
+        Returns:
+            tuple[int, int, int, int, int]: The fields of the record, in the order of FIELDS
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if not 0 <= index < self.capacity:
+            raise IndexError("Record index out of range.")
+        return RECORD.unpack_from(self.memory.buf, index * RECORD.size)
+
+    def as_array(self):
+        """
+        Method to view the records as a NumPy structured array with the fields of FIELDS. The array shares the
+        buffer's memory, so it must be deleted before the buffer is closed.
+
+        Returns:
+            numpy.ndarray: The records, without a copy
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if np is None:
+            raise ImportError("Reading a results buffer as an array needs numpy.")
+        return np.ndarray((self.capacity,), dtype=record_dtype(), buffer=self.memory.buf)
+
+    def close(self) -> None:
+        """
+        Method to detach from the block, and to free it if this buffer created it
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+
+
+class RecordingGame(BoundedGame):
+    """
+    Bounded game counting the cards drawn and the times the discard pile is recycled
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Constructor for the RecordingGame class, see BoundedGame.__init__()
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        BoundedGame.__init__(self, *args, **kwargs)
+        self.cards_drawn = 0
+        self.recycles = 0
+
+    def shuffle_pile(self) -> None:
+        """
+        Method to recycle the discard pile, see Game.shuffle_pile(), counting it if any card was recycled
+
+        Complexity:
+            Best Case Complexity: O(n) where n is the number of cards in the discard pile
+            Worst Case Complexity: O(n * log(n)) where n is the number of cards in the discard pile
+        """
+        BoundedGame.shuffle_pile(self)
+        if len(self.draw_pile) > 0:
+            self.recycles += 1
+
+    def draw_card(self, player: Player, playing: bool) -> Card | None:
+        """
+        Method to draw a card, see BoundedGame.draw_card(), counting it
+
+        Complexity:
+            Best Case Complexity: O(log h + p) where h is the number of cards in the hand, p the number of players
+            Worst Case Complexity: O(h + n + p) where n is the number of cards in the discard pile
+        """
+        card = BoundedGame.draw_card(self, player, playing)
+        self.cards_drawn += 1
+        return card
+
+
+def play_recorded(seed: int, num_players: int, cards_at_init: int | None = None) \
+        -> tuple[RecordingGame, int, int]:
+    """
+    Method to play one bounded game with default players
+
+    Args:
+        seed (int): Seed for the game's random numbers
+        num_players (int): Number of players at the table
+        cards_at_init (int | None): Cards dealt to every player, Constants.NUM_CARDS_AT_INIT if None
+
+    Returns:
+        tuple[RecordingGame, int, int]: The finished game, the seat of the winner (NO_WINNER if the game was a
+            draw or was aborted) and the number of turns played
+
+    Complexity:
+        Best Case Complexity: O(n + p * log(p)) for a game won on the first turn, see BoundedGame.play_bounded()
+        Worst Case Complexity: O(t * (h + n + p)) where t is the turn limit, see BoundedGame.play_bounded()
+    """
+    players: ArrayR[Player] = ArrayR(num_players)
+    for seat in range(num_players):
+        players[seat] = Player(str(seat), seat)
+    if cards_at_init is None:
+        cards_at_init = Constants.NUM_CARDS_AT_INIT
+    game = RecordingGame()
+    game.rng = RandomStream(seed)
+    game.initialise_game(players, cards_at_init)
+    # The deal does not go through draw_card(), so it is counted here
+    game.cards_drawn += num_players * cards_at_init
+    result = game.play_bounded()
+
+    winner = NO_WINNER
+    if result.outcome == Outcome.WIN:
+        for seat in range(num_players):
+            if players[seat] is result.winner:
+                winner = seat
+    return game, winner, result.turns
+
+
+def play_range(name: str, capacity: int, start: int, seeds: tuple[int, ...], num_players: int,
+               cards_at_init: int) -> int:
+    """
+    Method run by a worker to play a range of a batch's games, writing their records into the shared buffer
+
+    Args:
+        name (str): Name of the results buffer's block
+        capacity (int): Number of records in the buffer
+        start (int): Index of the first game's record
+        seeds (tuple[int, ...]): Seeds of the games, in record order
+        num_players (int): Number of players at every table
+        cards_at_init (int): Number of cards dealt to every player
+
+    Returns:
+        int: Number of games played
+
+    Complexity:
+        Best Case Complexity: O(s * g) where s is the number of seeds and g the cost of a game
+        Worst Case Complexity: O(s * g) where s is the number of seeds and g the cost of a game
+    """
+    results = ResultsBuffer(capacity, name)
+    try:
+        for i in range(len(seeds)):
+            game, winner, turns = play_recorded(seeds[i], num_players, cards_at_init)
+            results.write(start + i, seeds[i], winner, turns, game.cards_drawn, game.recycles)
+    finally:
+        results.close()
+    return len(seeds)
+
+
+def run_batch(seeds: ArrayR[int], num_players: int, executor: Executor | None = None, chunks: int = 1,
+              cards_at_init: int | None = None) -> ResultsBuffer:
+    """
+    Method to play one game per seed and gather their records in a new results buffer
+
+    Args:
+        seeds (ArrayR[int]): Seeds of the games, in record order
+        num_players (int): Number of players at every table
+        executor (Executor | None): Process pool to play the games on, None to play them in this process
+        chunks (int): Number of contiguous ranges of games handed to the executor
+        cards_at_init (int | None): Cards dealt to every player, Constants.NUM_CARDS_AT_INIT if None
+
+    Returns:
+        ResultsBuffer: The records, owned by the caller, who must close it
+
+    Complexity:
+        Best Case Complexity: O(s * g) where s is the number of seeds and g the cost of a game
+        Worst Case Complexity: O(s * g) where s is the number of seeds and g the cost of a game
+    """
+    cards_at_init = Constants.NUM_CARDS_AT_INIT if cards_at_init is None else cards_at_init
+    results = ResultsBuffer(len(seeds))
+    try:
+        if executor is None:
+            chunks = 1
+        chunks = max(1, min(chunks, len(seeds)))
+        futures = ArrayR(chunks)
+        for c in range(chunks):
+            start = c * len(seeds) // chunks
+            stop = (c + 1) * len(seeds) // chunks
+            args = (results.name, len(seeds), start, tuple(seeds[i] for i in range(start, stop)), num_players,
+                    cards_at_init)
+            if executor is None:
+                play_range(*args)
+            else:
+                futures[c] = executor.submit(play_range, *args)
+        if executor is not None:
+            for future in futures:
+                future.result()
+    except BaseException:
+        results.close()
+        raise
+    return results
+
+
+def _import_modules(modules: tuple[str, ...]) -> None:
+    """
+    Method run by every new worker of a pool to import the modules its tasks need before the first task arrives
+
+    Complexity:
+        Best Case Complexity: O(m) where m is the number of modules, if they were preloaded
+        Worst Case Complexity: O(m * i) where i is the cost of importing a module
+    """
+    for module in modules:
+        importlib.import_module(module)
+
+
+def worker_pool(workers: int, preload: tuple[str, ...] = PRELOAD, start_method: str = "forkserver") \
+        -> ProcessPoolExecutor:
+    """
+    Method to create a process pool whose workers start with the game already imported
+
+    With the "forkserver" start method the modules are imported once, by the fork server, and every worker is forked
+    from it. This only works if the pool is the first use of the fork server in this process, since later pools
+    share the server and its modules. Other start methods, and platforms without fork servers (which use "spawn"),
+    import the modules in every worker as it starts.
+
+    Args:
+        workers (int): Number of worker processes
+        preload (tuple[str, ...]): Names of the modules the workers' tasks need
+        start_method (str): multiprocessing start method of the workers
+
+    Returns:
+        ProcessPoolExecutor: The pool, owned by the caller, who must shut it down
+
+    Complexity:
+        Best Case Complexity: O(m) where m is the number of modules
+        Worst Case Complexity: O(m) where m is the number of modules
+    """
+    # Imported here so that workers, which only play games, do not import the pool's own machinery
+    from concurrent.futures import ProcessPoolExecutor
+
+    if start_method not in multiprocessing.get_all_start_methods():
+        start_method = "spawn"
+    context = multiprocessing.get_context(start_method)
+    if start_method == "forkserver":
+        context.set_forkserver_preload(list(preload))
+    return ProcessPoolExecutor(workers, mp_context=context, initializer=_import_modules, initargs=(tuple(preload),))
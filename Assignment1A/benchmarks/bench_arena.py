@@ -0,0 +1,56 @@
+"""
+Benchmark of many tables multiplexed on one event loop by the Arena, against playing the same
+games one after another with play_game().
+
+Usage (from the Assignment1A folder):
+    python -m benchmarks.bench_arena
+"""
+import time
+
+from data_structures.referential_array import ArrayR
+from arena import Arena, DelayedStrategy, new_table
+from constants import Constants
+from player import Player
+
+NUM_TABLES = 2000
+SLOW_EVERY = 10
+SLOW_DELAY = 0.001
+
+
+def make_tables(slow: bool) -> ArrayR:
+    games = ArrayR(NUM_TABLES)
+    for i in range(NUM_TABLES):
+        players = ArrayR(4)
+        for p in range(4):
+            strategy = DelayedStrategy(SLOW_DELAY) if slow and p == 0 and i % SLOW_EVERY == 0 else None
+            players[p] = Player(str(p), p, strategy)
+        games[i] = new_table(players, i)
+    return games
+
+
+def main() -> None:
+    Constants.NUM_CARDS_AT_INIT = 7
+
+    games = make_tables(False)
+    start = time.perf_counter()
+    for i in range(NUM_TABLES):
+        games[i].play_game()
+    elapsed = time.perf_counter() - start
+    print(f"{'sequential play_game':>32}: {NUM_TABLES / elapsed:8.1f} games/sec")
+
+    for yield_every in (1, 8):
+        games = make_tables(False)
+        start = time.perf_counter()
+        Arena(yield_every=yield_every).run(games)
+        elapsed = time.perf_counter() - start
+        print(f"{f'arena, yield every {yield_every}':>32}: {NUM_TABLES / elapsed:8.1f} games/sec")
+
+    games = make_tables(True)
+    start = time.perf_counter()
+    Arena(move_timeout=0.1, yield_every=8).run(games)
+    elapsed = time.perf_counter() - start
+    print(f"{f'arena, 1 in {SLOW_EVERY} tables slow':>32}: {NUM_TABLES / elapsed:8.1f} games/sec")
+
+
+if __name__ == '__main__':
+    main()
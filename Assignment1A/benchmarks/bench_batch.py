@@ -0,0 +1,59 @@
+"""
+Benchmark of gathering batch results through shared memory against returning them through the process pool's
+pipes. Both play the same games; the pipe version sends every record back as a pickled list of tuples.
+
+Usage (from the Assignment1A folder):
+    python -m benchmarks.bench_batch
+"""
+from concurrent.futures import ProcessPoolExecutor
+import os
+import time
+
+from data_structures.referential_array import ArrayR
+from batch import ResultsBuffer, play_range, run_batch
+from constants import Constants
+
+NUM_GAMES = 4000
+NUM_PLAYERS = 4
+
+
+def play_and_return(start: int, seeds: tuple[int, ...], num_players: int, cards_at_init: int) -> list[tuple]:
+    # Play into a private buffer, then send the records back through the pipe like a plain worker would
+    with ResultsBuffer(len(seeds)) as results:
+        play_range(results.name, len(seeds), 0, seeds, num_players, cards_at_init)
+        return [results.record(i) for i in range(len(seeds))]
+
+
+def main() -> None:
+    Constants.NUM_CARDS_AT_INIT = 7
+    workers = os.cpu_count() or 1
+    seeds: ArrayR[int] = ArrayR(NUM_GAMES)
+    for i in range(NUM_GAMES):
+        seeds[i] = i
+
+    with ProcessPoolExecutor(workers) as executor:
+        # Start the workers before timing
+        list(executor.map(abs, range(workers)))
+
+        start = time.perf_counter()
+        results = run_batch(seeds, NUM_PLAYERS, executor, chunks=workers * 4)
+        records = results.as_array()
+        turns = int(records["turns"].sum())
+        elapsed = time.perf_counter() - start
+        del records
+        results.close()
+        print(f"{'shared memory':>16}: {NUM_GAMES / elapsed:8.1f} games/sec ({turns} turns)")
+
+        start = time.perf_counter()
+        chunks = workers * 4
+        futures = []
+        for c in range(chunks):
+            lo, hi = c * NUM_GAMES // chunks, (c + 1) * NUM_GAMES // chunks
+            futures.append(executor.submit(play_and_return, lo, tuple(range(lo, hi)), NUM_PLAYERS, 7))
+        turns = sum(record[2] for future in futures for record in future.result())
+        elapsed = time.perf_counter() - start
+        print(f"{'pipes':>16}: {NUM_GAMES / elapsed:8.1f} games/sec ({turns} turns)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark of ArrayList and LinkedList on the access patterns of game logging and result buffering, against a
+hand-rolled ArrayR with manual doubling (what the project used before) and Python's list for reference:
+
+    log turns        append one record per turn, then read the log back in order
+    buffer chunks    gather per-worker chunks of records into one buffer (extend / splice), then clear it
+    annotate log     insert a note after every tenth record while walking the log (insert at a cursor)
+    drain front      serve records from the front of a buffer until it is empty
+
+The last two are quadratic for array-backed lists, so they run on fewer records.
+
+Usage (from the Assignment1A folder):
+    python -m benchmarks.bench_lists
+"""
+import time
+
+from data_structures.array_list import ArrayList
+from data_structures.linked_list import LinkedList
+from data_structures.referential_array import ArrayR
+
+RECORDS = 20000
+SHIFTED_RECORDS = 4000
+CHUNKS = 40
+REPEATS = 3
+
+
+def filled(cls, count: int):
+    log = cls()
+    for i in range(count):
+        log.append(i)
+    return log
+
+
+def log_turns_array(count: int) -> float:
+    start = time.perf_counter()
+    array, length = ArrayR(1), 0
+    for turn in range(count):
+        if length == len(array):
+            grown = ArrayR(2 * len(array))
+            for i in range(length):
+                grown[i] = array[i]
+            array = grown
+        array[length] = turn
+        length += 1
+    for i in range(length):
+        array[i]
+    return time.perf_counter() - start
+
+
+def log_turns(cls, count: int) -> float:
+    start = time.perf_counter()
+    log = filled(cls, count)
+    for _ in log:
+        pass
+    return time.perf_counter() - start
+
+
+def buffer_chunks(cls, count: int) -> float:
+    chunks = [filled(cls, count // CHUNKS) for _ in range(CHUNKS)]
+    start = time.perf_counter()
+    buffer = cls()
+    for chunk in chunks:
+        if cls is LinkedList:
+            buffer.splice(chunk)
+        else:
+            buffer.extend(chunk)
+    buffer.clear()
+    return time.perf_counter() - start
+
+
+def annotate(cls, count: int) -> float:
+    log = filled(cls, count)
+    start = time.perf_counter()
+    if cls is LinkedList:
+        node, position = log.head, 0
+        while node is not None:
+            if position % 10 == 9:
+                node = log.insert_after(node, "note")
+            node, position = node.next, position + 1
+    else:
+        index = 0
+        while index < len(log):
+            if index % 11 == 10:
+                log.insert(index, "note")
+            index += 1
+    return time.perf_counter() - start
+
+
+def drain_front(cls, count: int) -> float:
+    buffer = filled(cls, count)
+    start = time.perf_counter()
+    if cls is LinkedList:
+        while len(buffer) > 0:
+            buffer.delete_node(buffer.head)
+    else:
+        while len(buffer) > 0:
+            buffer.delete_at_index(0) if cls is ArrayList else buffer.pop(0)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"us per record (best of {REPEATS})")
+    print(f"{'':>24}{'ArrayR':>12}{'ArrayList':>12}{'LinkedList':>12}{'list':>12}")
+    for name, workload, count in (("log turns", log_turns, RECORDS), ("buffer chunks", buffer_chunks, RECORDS),
+                                  ("annotate log", annotate, SHIFTED_RECORDS),
+                                  ("drain front", drain_front, SHIFTED_RECORDS)):
+        cells = ""
+        for cls in (ArrayR, ArrayList, LinkedList, list):
+            if cls is ArrayR:
+                if workload is not log_turns:
+                    cells += f"{'-':>12}"
+                    continue
+                seconds = min(log_turns_array(count) for _ in range(REPEATS))
+            else:
+                seconds = min(workload(cls, count) for _ in range(REPEATS))
+            cells += f"{seconds * 1e6 / count:12.3f}"
+        print(f"{f'{name} ({count})':>24}{cells}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""
+Benchmark of the NumPy lockstep engine against playing the same games one after another with play_game().
+
+Usage (from the Assignment1A folder):
+    python -m benchmarks.bench_lockstep
+"""
+import time
+
+from data_structures.referential_array import ArrayR
+from arena import new_table
+from constants import Constants
+from lockstep import LockstepEngine
+from player import Player
+
+NUM_PLAYERS = 4
+
+
+def main() -> None:
+    Constants.NUM_CARDS_AT_INIT = 7
+
+    for num_games in (1000, 10000):
+        start = time.perf_counter()
+        for seed in range(min(num_games, 2000)):
+            players = ArrayR(NUM_PLAYERS)
+            for p in range(NUM_PLAYERS):
+                players[p] = Player(str(p), p)
+            new_table(players, seed).play_game()
+        elapsed = time.perf_counter() - start
+        print(f"{f'{num_games} games, play_game':>32}: {min(num_games, 2000) / elapsed:9.1f} games/sec")
+
+        start = time.perf_counter()
+        engine = LockstepEngine(range(num_games), NUM_PLAYERS)
+        engine.run()
+        elapsed = time.perf_counter() - start
+        print(f"{f'{num_games} games, lockstep':>32}: {num_games / elapsed:9.1f} games/sec"
+              f"  ({int(engine.turns.max())} steps)")
+
+
+if __name__ == '__main__':
+    main()
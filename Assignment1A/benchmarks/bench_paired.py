@@ -0,0 +1,35 @@
+"""
+Benchmark of paired comparisons with common random numbers against comparing separate batches of games: for
+MostFrequentColorStrategy against FirstPlayableStrategy on tables of growing size, the number of games each design
+needs for a 95% confidence interval of +-HALF_WIDTH on the difference in win rates, estimated from DEALS deals
+played from every seat by both strategies.
+
+Usage (from the Assignment1A folder):
+    python -m benchmarks.bench_paired
+"""
+import time
+
+from constants import Constants
+from paired import compare_paired
+from strategy import FirstPlayableStrategy, MostFrequentColorStrategy
+
+DEALS = 300
+HALF_WIDTH = 0.01
+TABLE_SIZES = (2, 3, 4, 6)
+
+
+def main() -> None:
+    Constants.NUM_CARDS_AT_INIT = 7
+    print(f"{'players':>8} {'difference':>11} {'separate':>10} {'paired':>10} {'ratio':>7} {'per game':>10}")
+    for num_players in TABLE_SIZES:
+        start = time.perf_counter()
+        comparison = compare_paired(MostFrequentColorStrategy(), FirstPlayableStrategy(), range(DEALS), num_players)
+        per_game = (time.perf_counter() - start) / comparison.games
+        separate = comparison.independent_games_needed(HALF_WIDTH)
+        paired = comparison.games_needed(HALF_WIDTH)
+        print(f"{num_players:>8} {comparison.mean_difference():+11.4f} {separate:>10} {paired:>10} "
+              f"{separate / max(paired, 1):6.1f}x {per_game * 1e6:7.0f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark of pickling a mid-game Game, as process pool runners do, against copying the same state with
+snapshot()/from_snapshot() and against pickling the full object graph (every Card and ArrayR slot), which is what
+pickle would do without the compact __reduce__/__getstate__ methods.
+
+Usage (from the Assignment1A folder):
+    python -m benchmarks.bench_pickle
+"""
+import copyreg
+import io
+import pickle
+import time
+
+from data_structures.referential_array import ArrayR
+from arena import new_table
+from card import Card
+from constants import Constants
+from game import Game
+from player import Player
+
+REPEATS = 2000
+
+
+def mid_game() -> Game:
+    players = ArrayR(4)
+    for p in range(4):
+        players[p] = Player(str(p), p)
+    game = new_table(players, 11)
+    for _ in range(30):
+        game.play_turn()
+    return game
+
+
+def graph_rebuild(cls, state: dict):
+    obj = object.__new__(cls)
+    obj.__dict__.update(state)
+    return obj
+
+
+def graph_reduce(obj) -> tuple:
+    # Pickle an object as its class and attributes, the way pickle would without the compact methods
+    return graph_rebuild, (type(obj), obj.__dict__)
+
+
+def time_per_call(run) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        run()
+    return (time.perf_counter() - start) / REPEATS * 1e6
+
+
+def main() -> None:
+    Constants.NUM_CARDS_AT_INIT = 7
+    game = mid_game()
+
+    data = pickle.dumps(game, protocol=pickle.HIGHEST_PROTOCOL)
+    elapsed = time_per_call(lambda: pickle.loads(pickle.dumps(game, protocol=pickle.HIGHEST_PROTOCOL)))
+    print(f"{'compact pickle':>24}: {elapsed:8.1f} us per round trip, {len(data):6d} bytes")
+
+    snapshot = game.snapshot()
+    elapsed = time_per_call(lambda: Game.from_snapshot(game.snapshot()))
+    print(f"{'snapshot only':>24}: {elapsed:8.1f} us per round trip, {len(snapshot):6d} bytes")
+
+    # Pickle every object field by field instead, bypassing the classes' own methods
+    table = copyreg.dispatch_table.copy()
+    for cls in (Game, Player, Card):
+        table[cls] = graph_reduce
+
+    def graph_dumps() -> bytes:
+        buffer = io.BytesIO()
+        pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+        pickler.dispatch_table = table
+        pickler.dump(game)
+        return buffer.getvalue()
+
+    data = graph_dumps()
+    elapsed = time_per_call(lambda: pickle.loads(graph_dumps()))
+    print(f"{'object graph pickle':>24}: {elapsed:8.1f} us per round trip, {len(data):6d} bytes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark of the heap priority queues against an ArraySortedList used as one, on event-scheduling workloads:
+the hold model (serve the next event, schedule a new one a random delay later) at several queue sizes, and
+deadline updates (bring forward the deadline of a random pending event).
+
+The sorted list keeps entries in descending order so the next event is at the end and serving it shifts nothing;
+scheduling and updates still shift the entries after the insertion point.
+
+Usage (from the Assignment1A folder):
+    python -m benchmarks.bench_priority_queue
+"""
+import time
+
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.priority_queue_adt import ArrayHeap, DaryHeap
+from data_structures.referential_array import ArrayR
+from random_gen import RandomStream
+
+SIZES = (100, 1000, 5000)
+OPERATIONS = 5000
+
+
+class Entry:
+    """ Event in the sorted list, ordered latest first so the next event is the last entry. """
+    __slots__ = ("time", "order", "event")
+
+    def __init__(self, time: float, order: int, event: int) -> None:
+        self.time, self.order, self.event = time, order, event
+
+    def __lt__(self, other: 'Entry') -> bool:
+        return self.time > other.time or (self.time == other.time and self.order > other.order)
+
+    def __le__(self, other: 'Entry') -> bool:
+        return not other < self
+
+
+class SortedListQueue:
+    """ The operations of the priority queues, on an ArraySortedList and a dict from event to entry. An event is
+    its own handle. """
+
+    def __init__(self) -> None:
+        self.entries: ArraySortedList[Entry] = ArraySortedList(1)
+        self.of_event: dict[int, Entry] = {}
+        self.added = 0
+
+    def add(self, event: int, time: float) -> int:
+        entry = self.of_event[event] = Entry(time, self.added, event)
+        self.added += 1
+        self.entries.add(entry)
+        return event
+
+    def peek(self) -> int:
+        return self.entries[len(self.entries) - 1].event
+
+    def peek_priority(self) -> float:
+        return self.entries[len(self.entries) - 1].time
+
+    def serve(self) -> int:
+        event = self.entries.delete_at_index(len(self.entries) - 1).event
+        del self.of_event[event]
+        return event
+
+    def decrease_key(self, event: int, time: float) -> None:
+        entry = self.of_event[event]
+        self.entries.delete_at_index(self.entries.index(entry))
+        entry.time = time
+        self.entries.add(entry)
+
+    def priority(self, event: int) -> float:
+        return self.of_event[event].time
+
+
+def hold(queue, size: int, rng: RandomStream) -> float:
+    for event in range(size):
+        queue.add(event, rng.random() * size)
+    start = time.perf_counter()
+    for event in range(size, size + OPERATIONS):
+        now = queue.peek_priority()
+        queue.serve()
+        queue.add(event, now + rng.random() * size)
+    return (time.perf_counter() - start) / OPERATIONS
+
+
+def updates(queue, size: int, rng: RandomStream) -> float:
+    handles = ArrayR(size)
+    for event in range(size):
+        handles[event] = queue.add(event, size + rng.random() * size)
+    start = time.perf_counter()
+    for _ in range(OPERATIONS):
+        handle = handles[rng.randint(0, size - 1)]
+        queue.decrease_key(handle, queue.priority(handle) * 0.999)
+    return (time.perf_counter() - start) / OPERATIONS
+
+
+def main() -> None:
+    queues = (("binary heap", ArrayHeap), ("4-ary heap", lambda: DaryHeap(4)), ("8-ary heap", lambda: DaryHeap(8)),
+              ("sorted list", SortedListQueue))
+    for label, workload in (("hold (serve + schedule)", hold), ("decrease-key", updates)):
+        print(f"{label}, us per operation:")
+        print(f"{'':>16}" + "".join(f"{size:>10}" for size in SIZES))
+        for name, make in queues:
+            times = [workload(make(), size, RandomStream(size)) for size in SIZES]
+            print(f"{name:>16}" + "".join(f"{seconds * 1e6:10.2f}" for seconds in times))
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Throughput benchmark of BlockingCircularQueue under contention: several producer threads append integers while
+several consumer threads serve them, one at a time or in batches, compared with the standard library's queue.Queue.
+
+Usage (from the Assignment1A folder):
+    python -m benchmarks.bench_queue
+"""
+import queue
+import threading
+import time
+
+from data_structures.blocking_queue import BlockingCircularQueue, QueueClosed
+
+ITEMS_PER_PRODUCER = 50_000
+CAPACITY = 256
+STOP = object()
+
+
+def run(producers: int, consumers: int, batch: int) -> float:
+    q = BlockingCircularQueue(CAPACITY)
+
+    def produce(start: int) -> None:
+        if batch == 1:
+            for i in range(start, start + ITEMS_PER_PRODUCER):
+                q.append(i)
+        else:
+            for lo in range(start, start + ITEMS_PER_PRODUCER, batch):
+                q.append_many(range(lo, min(lo + batch, start + ITEMS_PER_PRODUCER)))
+
+    def consume() -> None:
+        try:
+            while True:
+                if batch == 1:
+                    q.serve()
+                else:
+                    q.serve_many(batch)
+        except QueueClosed:
+            pass
+
+    return timed(producers, consumers, produce, consume, q.close)
+
+
+def run_stdlib(producers: int, consumers: int) -> float:
+    q = queue.Queue(CAPACITY)
+
+    def produce(start: int) -> None:
+        for i in range(start, start + ITEMS_PER_PRODUCER):
+            q.put(i)
+
+    def consume() -> None:
+        while q.get() is not STOP:
+            pass
+
+    def close() -> None:
+        for _ in range(consumers):
+            q.put(STOP)
+
+    return timed(producers, consumers, produce, consume, close)
+
+
+def timed(producers: int, consumers: int, produce, consume, close) -> float:
+    producer_threads = [threading.Thread(target=produce, args=(p * ITEMS_PER_PRODUCER,)) for p in range(producers)]
+    consumer_threads = [threading.Thread(target=consume) for _ in range(consumers)]
+    start = time.perf_counter()
+    for thread in producer_threads + consumer_threads:
+        thread.start()
+    for thread in producer_threads:
+        thread.join()
+    close()
+    for thread in consumer_threads:
+        thread.join()
+    return producers * ITEMS_PER_PRODUCER / (time.perf_counter() - start)
+
+
+def main() -> None:
+    for producers, consumers in ((1, 1), (4, 4), (8, 2)):
+        print(f"{producers} producers, {consumers} consumers:")
+        print(f"{'queue.Queue':>24}: {run_stdlib(producers, consumers):12.0f} items/sec")
+        for batch in (1, 16, 64):
+            print(f"{f'blocking queue, batch {batch}':>24}: {run(producers, consumers, batch):12.0f} items/sec")
+
+
+if __name__ == '__main__':
+    main()
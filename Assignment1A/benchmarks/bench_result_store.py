@@ -0,0 +1,58 @@
+"""
+Benchmark of the columnar result store against a CSV file holding the same rows: time to write them, and time to
+load the turns column and compute its mean.
+
+Usage (from the Assignment1A folder):
+    python -m benchmarks.bench_result_store
+"""
+import csv
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from data_structures.referential_array import ArrayR
+from result_store import ResultAppender, ResultStore
+
+NUM_ROWS = 200_000
+NUM_PLAYERS = 4
+
+
+def main() -> None:
+    hands: ArrayR[int] = ArrayR(NUM_PLAYERS)
+    for seat in range(NUM_PLAYERS):
+        hands[seat] = seat
+    with tempfile.TemporaryDirectory() as directory:
+        store_path = os.path.join(directory, "store")
+        start = time.perf_counter()
+        with ResultAppender(store_path) as appender:
+            for i in range(NUM_ROWS):
+                appender.append(i, i % NUM_PLAYERS, i % 500, i % 3, hands)
+        written = time.perf_counter() - start
+
+        start = time.perf_counter()
+        mean = float(ResultStore(store_path).column("turns").mean())
+        loaded = time.perf_counter() - start
+        print(f"{'columnar store':>16}: write {NUM_ROWS / written:10.0f} rows/sec, load + mean {loaded * 1e3:8.2f} ms"
+              f" ({mean:.2f})")
+
+        csv_path = os.path.join(directory, "results.csv")
+        start = time.perf_counter()
+        with open(csv_path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["seed", "num_players", "winner", "turns", "recycles"]
+                            + [f"hand_{seat}" for seat in range(NUM_PLAYERS)])
+            for i in range(NUM_ROWS):
+                writer.writerow([i, NUM_PLAYERS, i % NUM_PLAYERS, i % 500, i % 3] + list(hands))
+        written = time.perf_counter() - start
+
+        start = time.perf_counter()
+        turns = np.loadtxt(csv_path, delimiter=",", skiprows=1, usecols=3, dtype=np.int32)
+        loaded = time.perf_counter() - start
+        print(f"{'csv':>16}: write {NUM_ROWS / written:10.0f} rows/sec, load + mean {loaded * 1e3:8.2f} ms"
+              f" ({float(turns.mean()):.2f})")
+
+
+if __name__ == '__main__':
+    main()
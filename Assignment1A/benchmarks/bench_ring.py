@@ -0,0 +1,75 @@
+"""
+Benchmark of turn order kept in a Ring (EliminationGame) against positions in the players' sorted list (Game),
+on tables of growing size: moving play on around the table with reverses mixed in, and taking players out of the
+game part way through, which a Game can only do by deleting from its sorted list and renumbering positions.
+
+Usage (from the Assignment1A folder):
+    python -m benchmarks.bench_ring
+"""
+import time
+
+from data_structures.referential_array import ArrayR
+from constants import Constants
+from elimination import EliminationGame
+from game import Game
+from player import Player
+from random_gen import RandomStream
+
+TABLE_SIZES = (4, 16, 64, 250)
+STEPS = 20000
+
+
+def new_game(cls, num_players: int) -> Game:
+    players: ArrayR[Player] = ArrayR(num_players)
+    for seat in range(num_players):
+        players[seat] = Player(str(seat), seat)
+    game = cls()
+    game.rng = RandomStream(1)
+    game.initialise_game(players)
+    return game
+
+
+def walk(game: Game) -> float:
+    # Move play on STEPS times, reversing the direction every seventh step
+    start = time.perf_counter()
+    for step in range(STEPS):
+        game.current_player = game.next_player()
+        if step % 7 == 0:
+            game.play_reverse()
+    return time.perf_counter() - start
+
+
+def remove_from_game(game: Game) -> float:
+    # Take every other player out of a Game: delete them from the sorted list and close the gap in positions
+    start = time.perf_counter()
+    for _ in range(len(game.players) // 2):
+        player = game.players.delete_at_index(len(game.players) // 2)
+        for other in game.players:
+            if other.position > player.position:
+                other.position -= 1
+    return time.perf_counter() - start
+
+
+def remove_from_ring(game: EliminationGame) -> float:
+    players = list(game.ring)
+    start = time.perf_counter()
+    for i in range(len(players) // 2):
+        game.leave(players[len(players) // 2 + i])
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    Constants.NUM_CARDS_AT_INIT = 0
+    print(f"{'players':>8} {'next (Game)':>14} {'next (Ring)':>14} {'leave (Game)':>14} {'leave (Ring)':>14}")
+    for num_players in TABLE_SIZES:
+        walk_game = walk(new_game(Game, num_players)) / STEPS
+        walk_ring = walk(new_game(EliminationGame, num_players)) / STEPS
+        leaving = num_players // 2
+        leave_game = remove_from_game(new_game(Game, num_players)) / leaving
+        leave_ring = remove_from_ring(new_game(EliminationGame, num_players)) / leaving
+        print(f"{num_players:>8} {walk_game * 1e6:11.2f} us {walk_ring * 1e6:11.2f} us "
+              f"{leave_game * 1e6:11.2f} us {leave_ring * 1e6:11.2f} us")
+
+
+if __name__ == '__main__':
+    main()
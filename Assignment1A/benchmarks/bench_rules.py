@@ -0,0 +1,94 @@
+"""
+Benchmark of the rule engine's effect dispatch against the string comparisons special_card_play() used to make,
+over the cards played in real games, and of whole games with the standard rules and the variants.
+
+Usage (from the Assignment1A folder):
+    python -m benchmarks.bench_rules
+"""
+import time
+
+from data_structures.referential_array import ArrayR
+from arena import new_table
+from card import Card
+from constants import Constants
+from game import Game
+from player import Player
+from rules import STANDARD_RULES, no_effect, with_draw_stacking, with_jump_in, with_seven_zero
+
+NUM_GAMES = 300
+
+
+def legacy_dispatch(game: Game, card: Card) -> None:
+    # special_card_play() before the rule engine, with the effects replaced by counters
+    if card.label.name == "REVERSE":
+        game.effects += 1
+    elif card.label.name == "SKIP":
+        game.effects += 1
+    elif card.color.name == "CRAZY":
+        game.effects += 1
+    elif card.label.name == "DRAW_TWO":
+        game.effects += 1
+    return None
+
+
+def count_effect(game: Game, card: Card) -> None:
+    game.effects += 1
+    return None
+
+
+def table_dispatch(game: Game, card: Card) -> None:
+    return game.table[card.label](game, card)
+
+
+def played_cards() -> ArrayR[Card]:
+    # Replay a game and keep the cards that reached the discard pile
+    players = ArrayR(4)
+    for p in range(4):
+        players[p] = Player(str(p), p)
+    game = new_table(players, 1)
+    game.play_game()
+    cards = ArrayR(len(game.discard_pile))
+    for i, card in enumerate(game.discard_pile):
+        cards[i] = card
+    return cards
+
+
+def play_games(rules=None) -> float:
+    start = time.perf_counter()
+    for seed in range(NUM_GAMES):
+        players = ArrayR(4)
+        for p in range(4):
+            players[p] = Player(str(p), p)
+        if rules is None:
+            new_table(players, seed).play_game()
+        else:
+            new_table(players, seed, rules=rules).play_game()
+    return NUM_GAMES / (time.perf_counter() - start)
+
+
+def main() -> None:
+    Constants.NUM_CARDS_AT_INIT = 7
+
+    # The standard table, with the same counters as legacy_dispatch() in place of the real effects
+    game = Game()
+    game.effects = 0
+    game.table = ArrayR(len(STANDARD_RULES.effects))
+    for label in range(len(game.table)):
+        game.table[label] = no_effect if STANDARD_RULES.effects[label] is no_effect else count_effect
+    cards = played_cards()
+    repeats = 2000
+    for name, dispatch in (("string compares", legacy_dispatch), ("label table", table_dispatch)):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for card in cards:
+                dispatch(game, card)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>32}: {elapsed / (repeats * len(cards)) * 1e9:8.1f} ns per played card")
+
+    print(f"{'standard rules':>32}: {play_games():8.1f} games/sec")
+    print(f"{'draw stacking':>32}: {play_games(with_draw_stacking()):8.1f} games/sec")
+    print(f"{'all variants':>32}: {play_games(with_jump_in(with_seven_zero(with_draw_stacking()))):8.1f} games/sec")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Throughput benchmark of the local game server, playing many games at once over a pool of connections.
+
+Usage (from the Assignment1A folder):
+    python -m benchmarks.bench_server
+"""
+import asyncio
+import time
+
+from constants import Constants
+from game_client import ClientPool, play_remote_game
+from game_server import GameServer
+
+NUM_GAMES = 500
+NUM_PLAYERS = 4
+
+
+async def run(pool_size: int) -> None:
+    server = GameServer()
+    await server.start()
+    pool = ClientPool(pool_size, port=server.port)
+    await pool.open()
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*[play_remote_game(pool, NUM_PLAYERS, seed) for seed in range(NUM_GAMES)])
+    elapsed = time.perf_counter() - start
+
+    await pool.close()
+    await server.close()
+
+    moves = sum(result.moves for result in results)
+    print(f"{pool_size:>3} connections: {NUM_GAMES / elapsed:8.1f} games/sec {moves / elapsed:10.1f} moves/sec")
+
+
+def main() -> None:
+    Constants.NUM_CARDS_AT_INIT = 7
+    for pool_size in (1, 4, 16):
+        asyncio.run(run(pool_size))
+
+
+if __name__ == '__main__':
+    main()
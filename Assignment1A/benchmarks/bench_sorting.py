@@ -0,0 +1,71 @@
+"""
+Benchmark of the sorting module against the built-in list sort that RandomGen.random_shuffle() relies on.
+
+Sorts the (random number, index) pairs random_shuffle() builds for a deck and for larger collections, and
+the cards of a deck by id.
+
+Usage (from the Assignment1A folder):
+    python -m benchmarks.bench_sorting
+"""
+import time
+
+from data_structures.referential_array import ArrayR
+from data_structures.sorting import merge_sort, counting_sort, radix_sort
+from card import CARDS_BY_ID
+from deck import STANDARD_DECK
+from random_gen import RandomStream
+
+REPEATS = 20
+
+
+def shuffle_pairs(size: int) -> ArrayR:
+    rng = RandomStream(size)
+    pairs = ArrayR(size)
+    for i in range(size):
+        pairs[i] = (rng.random(), i)
+    return pairs
+
+
+def timed(sort, make) -> float:
+    best = None
+    for _ in range(REPEATS):
+        array = make()
+        start = time.perf_counter()
+        sort(array)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1e6
+
+
+def list_sort(array: ArrayR) -> None:
+    # The path taken by RandomGen.random_shuffle()
+    positions = [array[i] for i in range(len(array))]
+    positions.sort()
+
+
+def pair_key(pair) -> int:
+    return pair[0]
+
+
+def card_id(card) -> int:
+    return card.id
+
+
+def main() -> None:
+    for size in (STANDARD_DECK.size, 1000, 10000):
+        print(f"shuffle keys, n = {size}")
+        make = lambda: shuffle_pairs(size)
+        print(f"{'list.sort (random_shuffle)':>32}: {timed(list_sort, make):10.1f} us")
+        print(f"{'merge_sort':>32}: {timed(merge_sort, make):10.1f} us")
+        print(f"{'radix_sort, 8 bit digits':>32}: {timed(lambda a: radix_sort(a, pair_key), make):10.1f} us")
+        print(f"{'radix_sort, 11 bit digits':>32}: {timed(lambda a: radix_sort(a, pair_key, 32, 11), make):10.1f} us")
+
+    rng = RandomStream(1)
+    print(f"cards by id, n = {STANDARD_DECK.size}")
+    make = lambda: STANDARD_DECK.new_deck(rng)
+    print(f"{'merge_sort':>32}: {timed(merge_sort, make):10.1f} us")
+    print(f"{'counting_sort':>32}: {timed(lambda a: counting_sort(a, card_id, len(CARDS_BY_ID)), make):10.1f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark of cold-start latency: how long the game's modules take to import in a fresh interpreter, and how long a
+new process pool takes to return its first game under each start method.
+
+Import times come from running `python -X importtime -c "import <module>"` in a subprocess and parsing the report it
+writes to stderr. The best of several runs is kept, since the first run also pays for reading the files from disk.
+With --budget, the benchmark exits with status 1 if any module takes longer than the budget, so it can guard the
+start-up of short-lived workers in CI.
+
+Usage (from the Assignment1A folder):
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --top 15 --detail batch
+    python -m benchmarks.bench_startup --budget 60
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+from batch import PRELOAD, play_recorded, worker_pool
+
+MODULES = ("game", "batch", "bounded", "outcome_cache", "stats", "result_store", "seed_search")
+REPEATS = 5
+
+
+def parse_importtime(report: str) -> list[tuple[str, int, int, int]]:
+    """
+    Parse the stderr of `python -X importtime` into (module, self us, cumulative us, depth), in import order.
+    Depth 0 is a module imported directly by the command, depth 1 one imported by it, and so on.
+    """
+    imports = []
+    for line in report.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # The header line
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        imports.append((stripped, int(fields[0]), int(fields[1]), (len(name) - len(stripped) - 1) // 2))
+    return imports
+
+
+def import_report(module: str) -> list[tuple[str, int, int, int]]:
+    """ Import a module in a fresh interpreter and return its parsed import time report. """
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                               capture_output=True, text=True, check=True,
+                               cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return parse_importtime(completed.stderr)
+
+
+def best_report(module: str) -> list[tuple[str, int, int, int]]:
+    """ The report of the fastest of REPEATS imports of a module. """
+    best = None
+    for _ in range(REPEATS):
+        report = import_report(module)
+        if best is None or report[-1][2] < best[-1][2]:
+            best = report
+    return best
+
+
+def first_game(start_method: str, preload: tuple[str, ...]) -> float:
+    """ Seconds from creating a one worker pool to getting back the result of its first game. """
+    start = time.perf_counter()
+    with worker_pool(1, preload, start_method) as executor:
+        executor.submit(play_recorded, 1, 4).result()
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Report import and worker start-up times.")
+    parser.add_argument("--top", type=int, default=10, help="number of slowest imports to list")
+    parser.add_argument("--detail", default="batch", help="module whose slowest imports are listed")
+    parser.add_argument("--budget", type=float, default=None, help="largest import time allowed, in ms")
+    args = parser.parse_args()
+
+    over_budget = []
+    print("Import time (best of {}):".format(REPEATS))
+    for module in MODULES:
+        report = best_report(module)
+        cumulative = report[-1][2] / 1000
+        print(f"{module:>16}: {cumulative:8.1f} ms")
+        if args.budget is not None and cumulative > args.budget:
+            over_budget.append(module)
+
+    print(f"\nSlowest imports of {args.detail} (cumulative ms, self ms):")
+    report = sorted(best_report(args.detail)[:-1], key=lambda entry: entry[2], reverse=True)
+    for name, own, cumulative, depth in report[:args.top]:
+        print(f"{name:>40}: {cumulative / 1000:8.1f} {own / 1000:8.1f}")
+
+    # The first forkserver pool also starts the fork server, which imports the preloaded modules once; later
+    # pools, and later workers of the same pool, are forked from it
+    print("\nFirst game from a new one worker pool (first pool, next pool):")
+    for start_method in ("fork", "forkserver", "spawn"):
+        if start_method == "fork" and sys.platform != "linux":
+            continue
+        first = first_game(start_method, PRELOAD)
+        then = min(first_game(start_method, PRELOAD) for _ in range(REPEATS))
+        print(f"{start_method:>16}: {first * 1000:8.1f} ms {then * 1000:8.1f} ms")
+
+    if over_budget:
+        print(f"\nOver the {args.budget} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark comparing the legacy hardcoded "first playable card" scan of play_game with the
+playable-mask + Strategy selection that replaced it.
+
+Usage (from the Assignment1A folder):
+    python -m benchmarks.bench_strategy
+"""
+import timeit
+
+from card import Card, CardColor, CardLabel
+from player import Player
+from random_gen import RandomGen
+from strategy import DEFAULT_STRATEGY, playable_ids, playable_mask
+
+NUM_STATES = 2000
+HAND_SIZE = 7
+REPEATS = 5
+
+
+def legacy_scan(player: Player, current_color: CardColor, current_label: CardLabel) -> int:
+    """ The scan play_game used before strategies were pluggable. """
+    for card in range(len(player.hand)):
+        if ((current_color == player.hand[card].color)
+                or (current_label == player.hand[card].label)
+                or (player.hand[card].color.name == "CRAZY")):
+            return card
+    return -1
+
+
+def strategy_scan(player: Player, current_color: CardColor, current_label: CardLabel) -> int:
+    """ The mask based selection play_game uses now. """
+    mask = playable_mask(player.hand, playable_ids(current_color, current_label))
+    if mask:
+        return player.strategy.choose_card(player, mask)
+    return -1
+
+
+def random_card() -> Card:
+    color = CardColor(RandomGen.randint(0, 4))
+    if color == CardColor.CRAZY:
+        return Card(color, CardLabel(RandomGen.randint(CardLabel.CRAZY, CardLabel.DRAW_FOUR)))
+    return Card(color, CardLabel(RandomGen.randint(0, CardLabel.DRAW_TWO)))
+
+
+def make_states():
+    states = []
+    for _ in range(NUM_STATES):
+        player = Player("P", 0, DEFAULT_STRATEGY)
+        for _ in range(HAND_SIZE):
+            player.add_card(random_card())
+        states.append((player, CardColor(RandomGen.randint(0, 3)), CardLabel(RandomGen.randint(0, 9))))
+    return states
+
+
+def run(scan, states) -> None:
+    for player, color, label in states:
+        scan(player, color, label)
+
+
+def main() -> None:
+    RandomGen.set_seed(2024)
+    states = make_states()
+
+    # Both selections must agree before their speed is worth comparing
+    for player, color, label in states:
+        assert legacy_scan(player, color, label) == strategy_scan(player, color, label)
+
+    for name, scan in (("legacy scan", legacy_scan), ("default strategy", strategy_scan)):
+        best = min(timeit.repeat(lambda: run(scan, states), number=1, repeat=REPEATS))
+        print(f"{name:>18}: {best / NUM_STATES * 1e6:7.3f} us per turn")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,418 @@
+"""
+Bounded games. A BoundedGame plays like a Game but always ends: after a turn limit, when the same position has been
+reached too many times, or when the cards run out, returning a GameResult instead of running forever or raising.
+
+Positions are compared by a Zobrist-style hash: every (seat, card id) in a hand and every (depth, card id) in a
+pile has a random 64 bit key, and the hash is the sum of the keys of the cards where they currently are, plus keys
+for the player to move, the color, the label and the direction of play. Sums rather than XOR keep equal cards in
+one hand from cancelling out. The hand and pile parts are updated as cards move, so hashing a turn costs O(1)
+instead of O(n).
+"""
+from enum import IntEnum, auto
+
+from data_structures.referential_array import ArrayR
+from card import Card, CardColor, CardLabel
+from constants import Constants
+from deck import DeckSpec, STANDARD_DECK
+from game import Game, PilesExhausted
+from player import Player
+from random_gen import RandomStream
+from rules import RuleSet, STANDARD_RULES
+
+HASH_MASK = (1 << 64) - 1
+NUM_IDS = Constants.NUM_COLORS * Constants.NUM_MAX_VALS
+KEY_SEED = 0x5EED
+
+
+class Outcome(IntEnum):
+    """
+    Enum class for the way a bounded game ended
+    """
+    WIN = 0
+    DRAW = auto()
+    ABORTED = auto()
+
+
+class GameResult:
+    """
+    Result of a bounded game
+    """
+
+    def __init__(self, outcome: Outcome, winner: Player | None, turns: int, reason: str) -> None:
+        """
+        Constructor for the GameResult class
+
+        Args:
+            outcome (Outcome): How the game ended
+            winner (Player | None): The winner, None unless the outcome is WIN
+            turns (int): Number of turns played
+            reason (str): Why the game ended
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.outcome = outcome
+        self.winner = winner
+        self.turns = turns
+        self.reason = reason
+
+
+class _Keys:
+    """
+    Random keys shared by every bounded game, extended when a game needs more
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for the _Keys class
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.rng = RandomStream(KEY_SEED)
+        self.keys: ArrayR[int] = ArrayR(1)
+        self.count = 0
+
+    def get(self, count: int) -> ArrayR[int]:
+        """
+        Method to get an array holding at least count keys. The same index always holds the same key.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(count)
+        """
+        if count > self.count:
+            keys: ArrayR[int] = ArrayR(count)
+            for i in range(self.count):
+                keys[i] = self.keys[i]
+            for i in range(self.count, count):
+                keys[i] = (self.rng.random() << 32) | self.rng.random()
+            self.keys, self.count = keys, count
+        return self.keys
+
+
+_HAND_KEYS = _Keys()
+_DRAW_KEYS = _Keys()
+_DISCARD_KEYS = _Keys()
+_TURN_KEYS = _Keys()
+# Layout of the turn keys: color, label (or none), direction, then player to move (or none) as many as the table needs
+_COLOR_BASE = 0
+_LABEL_BASE = _COLOR_BASE + len(CardColor)
+_DIRECTION_BASE = _LABEL_BASE + len(CardLabel) + 1
+_SEAT_BASE = _DIRECTION_BASE + 2
+
+
+class _PositionCounts:
+    """
+    Number of times each position of a game has been reached, in an open addressing table indexed by the low bits
+    of the position hashes. The hashes are already random, so they are used as they are.
+    """
+
+    def __init__(self, positions: int) -> None:
+        """
+        Constructor for the _PositionCounts class
+
+        Args:
+            positions (int): Maximum number of distinct positions that will be counted
+
+        Complexity:
+            Best Case Complexity: O(m) where m is the number of positions
+            Worst Case Complexity: O(m) where m is the number of positions
+        """
+        # At most half full, so probe sequences stay short
+        size = 1 << (2 * max(positions, 1)).bit_length()
+        self.mask = size - 1
+        self.hashes: ArrayR[int] = ArrayR(size)
+        self.counts: ArrayR[int] = ArrayR(size)
+
+    def add(self, position: int) -> int:
+        """
+        Method to count one more visit to a position
+
+        Args:
+            position (int): The position hash
+
+        Returns:
+            int: The number of visits to the position, including this one
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(m) where m is the number of positions, if every hash shares its low bits
+        """
+        hashes, counts = self.hashes.array, self.counts.array
+        slot = position & self.mask
+        while hashes[slot] is not None and hashes[slot] != position:
+            slot = (slot + 1) & self.mask
+        if hashes[slot] is None:
+            hashes[slot] = position
+            counts[slot] = 0
+        counts[slot] += 1
+        return counts[slot]
+
+
+class BoundedGame(Game):
+    """
+    Game that keeps a hash of its position up to date and is played with play_bounded()
+    """
+
+    def __init__(self, deck_spec: DeckSpec = STANDARD_DECK, rules: RuleSet = STANDARD_RULES,
+                 max_turns: int | None = None, repetitions: int = 3) -> None:
+        """
+        Constructor for the BoundedGame class
+
+        Args:
+            deck_spec (DeckSpec): The composition of the deck
+            rules (RuleSet): The effects of the cards
+            max_turns (int | None): Number of turns after which the game is aborted, MAX_ROUNDS_PER_PLAYER
+                turns per player if None
+            repetitions (int): Number of times the same position may be reached before the game is a draw
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(n * c) where n is the number of cards and c the number of card ids, the first
+                time a deck of this size is used
+        """
+        Game.__init__(self, deck_spec, rules)
+        self.max_turns = max_turns
+        self.repetitions = repetitions
+        self.turns = 0
+        self.hand_hash = 0
+        self.draw_hash = 0
+        self.discard_hash = 0
+        self._fetch_keys()
+
+    def _fetch_keys(self) -> None:
+        """
+        Method to get the shared key tables, large enough for this game's deck and players
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O((n + p) * c) where n is the number of cards, p the number of players and c the
+                number of card ids, the first time a deck or table of this size is used
+        """
+        num_players = 0 if self.players is None else len(self.players)
+        self.hand_keys = _HAND_KEYS.get(num_players * NUM_IDS)
+        self.draw_keys = _DRAW_KEYS.get(self.deck_spec.size * NUM_IDS)
+        self.discard_keys = _DISCARD_KEYS.get(self.deck_spec.size * NUM_IDS)
+        # One seat key per player and one for no player to move
+        self.turn_keys = _TURN_KEYS.get(_SEAT_BASE + num_players + 1)
+
+    def __getstate__(self) -> tuple:
+        """
+        Method to get the state pickled for the game, see Game.__getstate__(), leaving out the shared key tables
+
+        Complexity:
+            Best Case Complexity: O(n + p) where n is the number of cards and p is the number of players
+            Worst Case Complexity: O(n + p) where n is the number of cards and p is the number of players
+        """
+        state = Game.__getstate__(self)
+        extra = state[-1]
+        for name in ("hand_keys", "draw_keys", "discard_keys", "turn_keys"):
+            del extra[name]
+        return state
+
+    def __setstate__(self, state: tuple) -> None:
+        """
+        Method to restore a game pickled with __getstate__(), see Game.__setstate__()
+
+        Complexity:
+            Best Case Complexity: O(n + p) where n is the number of cards and p is the number of players
+            Worst Case Complexity: O(n + p) where n is the number of cards and p is the number of players
+        """
+        Game.__setstate__(self, state)
+        self._fetch_keys()
+
+    def initialise_game(self, players: ArrayR[Player], cards_at_init: int | None = None) -> None:
+        """
+        Method to initialise the game, see Game.initialise_game(), and hash the starting position
+
+        Complexity:
+            Best Case Complexity: O(n + p * log(p)) where n is the number of cards and p is the number of players
+            Worst Case Complexity: O(n + p * log(p)) where n is the number of cards and p is the number of players
+        """
+        Game.initialise_game(self, players, cards_at_init)
+        self._fetch_keys()
+        self.rehash()
+
+    @classmethod
+    def from_snapshot(cls, data: bytes, players: ArrayR[Player] | None = None,
+                      deck_spec: DeckSpec = STANDARD_DECK, rules: RuleSet = STANDARD_RULES) -> 'BoundedGame':
+        """
+        Method to rebuild a game from a snapshot, see Game.from_snapshot(), and hash its position
+
+        Complexity:
+            Best Case Complexity: O(n + p * log(p)) where n is the number of cards and p is the number of players
+            Worst Case Complexity: O(n + p * log(p)) where n is the number of cards and p is the number of players
+        """
+        game = super().from_snapshot(data, players, deck_spec, rules)
+        game._fetch_keys()
+        game.rehash()
+        return game
+
+    def _seat(self, player: Player) -> int:
+        """
+        Method to find the index of a player in self.players
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(p) where p is the number of players
+        """
+        seat = 0
+        for other in self.players:
+            if other is player:
+                return seat
+            seat += 1
+        return seat
+
+    def _pile_hash(self, pile, keys: ArrayR[int]) -> int:
+        """
+        Method to hash a pile from scratch
+
+        Complexity:
+            Best Case Complexity: O(n) where n is the number of cards in the pile
+            Worst Case Complexity: O(n) where n is the number of cards in the pile
+        """
+        value = 0
+        depth = 0
+        for card in pile:
+            value += keys[depth * NUM_IDS + card.id]
+            depth += 1
+        return value & HASH_MASK
+
+    def rehash(self) -> None:
+        """
+        Method to hash the hands and piles from scratch
+
+        Complexity:
+            Best Case Complexity: O(n) where n is the number of cards
+            Worst Case Complexity: O(n) where n is the number of cards
+        """
+        value = 0
+        seat = 0
+        for player in self.players:
+            for card in player.hand:
+                value += self.hand_keys[seat * NUM_IDS + card.id]
+            seat += 1
+        self.hand_hash = value & HASH_MASK
+        self.draw_hash = self._pile_hash(self.draw_pile, self.draw_keys)
+        self.discard_hash = self._pile_hash(self.discard_pile, self.discard_keys)
+
+    def position_hash(self) -> int:
+        """
+        Method to get the hash of the current position
+
+        Returns:
+            int: A 64 bit hash of the hands, the piles, the player to move, the color, the label and the direction
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(p) where p is the number of players
+        """
+        seat = len(self.players) if self.current_player is None else self._seat(self.current_player)
+        label = len(CardLabel) if self.current_label is None else self.current_label
+        # Reversing maps every position p to (players - 1) - p, so the first seat's position gives the direction
+        direction = 0 if self.players[0].position == 0 else 1
+        keys = self.turn_keys
+        value = (self.hand_hash + self.draw_hash + self.discard_hash + keys[_SEAT_BASE + seat]
+                 + keys[_COLOR_BASE + self.current_color] + keys[_LABEL_BASE + label]
+                 + keys[_DIRECTION_BASE + direction])
+        return value & HASH_MASK
+
+    def shuffle_pile(self) -> None:
+        """
+        Method to recycle the discard pile, see Game.shuffle_pile(), and hash both piles again
+
+        Complexity:
+            Best Case Complexity: O(n) where n is the number of cards in the discard pile
+            Worst Case Complexity: O(n * log(n)) where n is the number of cards in the discard pile
+        """
+        Game.shuffle_pile(self)
+        self.draw_hash = self._pile_hash(self.draw_pile, self.draw_keys)
+        self.discard_hash = self._pile_hash(self.discard_pile, self.discard_keys)
+
+    def draw_card(self, player: Player, playing: bool) -> Card | None:
+        """
+        Method to draw a card, see Game.draw_card(), moving its key from the draw pile to the hand
+
+        Complexity:
+            Best Case Complexity: O(log h + p) where h is the number of cards in the hand, p the number of players
+            Worst Case Complexity: O(h + n + p) where n is the number of cards in the discard pile
+        """
+        if len(self.draw_pile) == 0:
+            self.shuffle_pile()
+            if len(self.draw_pile) == 0:
+                raise PilesExhausted("no cards left to draw")
+        top = self.draw_pile.peek()
+        key = self.draw_keys[(len(self.draw_pile) - 1) * NUM_IDS + top.id]
+        self.draw_hash = (self.draw_hash - key) & HASH_MASK
+        card = Game.draw_card(self, player, playing)
+        if card is None:
+            self.hand_hash = (self.hand_hash + self.hand_keys[self._seat(player) * NUM_IDS + top.id]) & HASH_MASK
+        return card
+
+    def play_from_hand(self, index: int) -> Player | None:
+        """
+        Method to play a card from the current player's hand, see Game.play_from_hand(), removing its hand key
+
+        Complexity:
+            Best Case Complexity: O(h + p) where h is the number of cards in the hand, p the number of players
+            Worst Case Complexity: O(h + n + p) where n is the number of cards in the discard pile
+        """
+        card = self.current_player.hand[index]
+        key = self.hand_keys[self._seat(self.current_player) * NUM_IDS + card.id]
+        self.hand_hash = (self.hand_hash - key) & HASH_MASK
+        return Game.play_from_hand(self, index)
+
+    def play_card_object(self, card: Card) -> Player | None:
+        """
+        Method to put a card on the discard pile, see Game.play_card_object(), adding its pile key
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(h + n + p) see Game.play_card_object()
+        """
+        key = self.discard_keys[len(self.discard_pile) * NUM_IDS + card.id]
+        self.discard_hash = (self.discard_hash + key) & HASH_MASK
+        return Game.play_card_object(self, card)
+
+    def play_bounded(self) -> GameResult:
+        """
+        Method to play the game until it is won, a position repeats too often, the turn limit is reached or there
+        are no cards left to draw
+
+        Returns:
+            GameResult: How the game ended
+
+        Complexity:
+            Best Case Complexity: O(h + n + p) for a game won in one turn
+            Worst Case Complexity: O(t * (h + n + p)) where t is the turn limit
+        """
+        max_turns = self.max_turns
+        if max_turns is None:
+            max_turns = Constants.MAX_ROUNDS_PER_PLAYER * len(self.players)
+        # Variant rules move cards without going through the methods above, so their positions are hashed anew
+        incremental = self.rules is STANDARD_RULES
+        seen = _PositionCounts(max_turns - self.turns)
+
+        try:
+            while self.turns < max_turns:
+                winner = self.play_turn()
+                self.turns += 1
+                if winner is not None:
+                    return GameResult(Outcome.WIN, winner, self.turns, "won")
+                if not incremental:
+                    self.rehash()
+                if seen.add(self.position_hash()) >= self.repetitions:
+                    return GameResult(Outcome.DRAW, None, self.turns, "position repeated")
+        except PilesExhausted:
+            return GameResult(Outcome.ABORTED, None, self.turns, "no cards left to draw")
+
+        return GameResult(Outcome.ABORTED, None, self.turns, "turn limit reached")
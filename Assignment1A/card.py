@@ -1,5 +1,8 @@
 from enum import auto, IntEnum
 
+from constants import Constants
+from data_structures.referential_array import ArrayR
+
 
 class CardColor(IntEnum):
     """
@@ -42,6 +45,9 @@ class Card:
             color (CardColor): The color of the card
             label (CardLabel): The label of the card
 
+        The card's id packs its color and label into a single integer in the range
+        [0, NUM_COLORS * NUM_MAX_VALS), ordered the same way as the cards themselves.
+
         Returns:
             None
 
@@ -51,6 +57,7 @@ class Card:
         """
         self.color = color
         self.label = label
+        self.id = color * Constants.NUM_MAX_VALS + label
 
     def __lt__(self, other) -> bool:
         """
@@ -117,3 +124,56 @@ class Card:
             O(1)
         """
         return self.color.name + " " + self.label.name
+
+    def __reduce__(self) -> tuple:
+        """
+        Method to pickle the card as its id, so that unpickling gives back the shared card of CARDS_BY_ID
+
+        Returns:
+            tuple: The function rebuilding the card and its arguments
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return card_from_id, (self.id,)
+
+
+def _build_cards_by_id() -> ArrayR[Card]:
+    """
+    Method to create one shared Card object for every card id
+
+    Returns:
+        ArrayR[Card]: The card with id i at index i
+
+    Complexity:
+        Best Case Complexity: O(c * l) where c is the number of colors and l the number of labels
+        Worst Case Complexity: O(c * l) where c is the number of colors and l the number of labels
+    """
+    cards: ArrayR[Card] = ArrayR(Constants.NUM_COLORS * Constants.NUM_MAX_VALS)
+    for color in CardColor:
+        for label in CardLabel:
+            card = Card(color, label)
+            cards[card.id] = card
+    return cards
+
+
+# Cards are never modified once created, so rebuilt game states can share these instead of allocating new ones
+CARDS_BY_ID: ArrayR[Card] = _build_cards_by_id()
+
+
+def card_from_id(card_id: int) -> Card:
+    """
+    Method to get the shared card with the given id
+
+    Args:
+        card_id (int): The id of the card, see Card.__init__()
+
+    Returns:
+        Card: The card of CARDS_BY_ID with that id
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    return CARDS_BY_ID[card_id]
@@ -0,0 +1,151 @@
+""" Array-based implementation of the List ADT.
+
+The array doubles when it is full, so appending is O(1) amortised. Shifting for insert() and
+delete_at_index(), extend() and slice copies move the references in bulk with slice assignment
+on the underlying ctypes array instead of one __setitem__ call per element.
+"""
+__docformat__ = 'reStructuredText'
+
+from typing import Iterator
+
+from data_structures.abstract_list import List, T
+from data_structures.referential_array import ArrayR
+
+
+class ArrayList(List[T]):
+    """ List ADT implemented with arrays, growing as needed.
+
+    Attributes:
+         length (int): number of elements in the list (inherited)
+         array (ArrayR[T]): array storing the elements, of which the first length are in use
+
+    ArrayR cannot create empty arrays. So MIN_CAPACITY used to avoid this.
+    """
+    MIN_CAPACITY = 1
+
+    def __init__(self, max_capacity: int = MIN_CAPACITY) -> None:
+        List.__init__(self)
+        self.array = ArrayR(max(self.MIN_CAPACITY, max_capacity))
+
+    @classmethod
+    def from_items(cls, items) -> 'ArrayList[T]':
+        """ Build a list holding the items of an iterable, in order.
+        :complexity: O(n) where n is the number of items
+        """
+        array_list = cls()
+        array_list.extend(items)
+        return array_list
+
+    def __getitem__(self, index: int | slice) -> T:
+        """ Magic method. Return the element at a given position, or a new ArrayList copying a slice.
+        :raises IndexError: if the index is out of range
+        :complexity: O(1) for an index, O(k) for a slice of k elements
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            copied = self.array.array[start:stop:step]
+            result = ArrayList(len(copied))
+            result.array.array[:len(copied)] = copied
+            result.length = len(copied)
+            return result
+        self._check_index(index)
+        return self.array[index]
+
+    def __setitem__(self, index: int, item: T) -> None:
+        """ Magic method. Replace the element at a given position.
+        :raises IndexError: if the index is out of range
+        :complexity: O(1)
+        """
+        self._check_index(index)
+        self.array[index] = item
+
+    def __iter__(self) -> Iterator[T]:
+        """ Magic method. Iterate over the elements in order. """
+        return map(self.array.array.__getitem__, range(self.length))
+
+    def _check_index(self, index: int) -> None:
+        """ Raise IndexError if the index is not that of an element. """
+        if not 0 <= index < self.length:
+            raise IndexError('No such index in the list')
+
+    def _ensure_capacity(self, capacity: int) -> None:
+        """ Grow the array to hold at least capacity elements, at least doubling it.
+        :complexity: O(n) where n is the number of elements, O(1) if the array is large enough
+        """
+        if capacity <= len(self.array):
+            return
+        new_array = ArrayR(max(capacity, 2 * len(self.array)))
+        new_array.array[:self.length] = self.array.array[:self.length]
+        self.array = new_array
+
+    def append(self, item: T) -> None:
+        """ Append a new item to the end of the list.
+        :complexity: O(1) amortised
+        """
+        if self.length == len(self.array):
+            self._ensure_capacity(self.length + 1)
+        self.array.array[self.length] = item
+        self.length += 1
+
+    def extend(self, items) -> None:
+        """ Append the items of an iterable to the end of the list. The array grows at most once when the
+        number of items is known from len(), and doubles as needed otherwise.
+        :complexity: O(m) amortised, where m is the number of items
+        """
+        if isinstance(items, (ArrayList, ArrayR)):
+            # Copy the references in bulk from the other array
+            count = len(items)
+            self._ensure_capacity(self.length + count)
+            self.array.array[self.length:self.length + count] = items.array[:count]
+            self.length += count
+        elif hasattr(items, '__len__'):
+            self._ensure_capacity(self.length + len(items))
+            array = self.array.array
+            for item in items:
+                array[self.length] = item
+                self.length += 1
+        else:
+            for item in items:
+                self.append(item)
+
+    def insert(self, index: int, item: T) -> None:
+        """ Insert an item at a given position, shifting the following elements to the right.
+        :raises IndexError: if the index is out of range, len(self) being in range
+        :complexity: O(n - index) amortised
+        """
+        if not 0 <= index <= self.length:
+            raise IndexError('No such index in the list')
+        self._ensure_capacity(self.length + 1)
+        items = self.array.array
+        items[index + 1:self.length + 1] = items[index:self.length]
+        items[index] = item
+        self.length += 1
+
+    def delete_at_index(self, index: int) -> T:
+        """ Delete the item at a given position, shifting the following elements to the left.
+        :raises IndexError: if the index is out of range
+        :complexity: O(n - index)
+        """
+        self._check_index(index)
+        items = self.array.array
+        item = items[index]
+        items[index:self.length - 1] = items[index + 1:self.length]
+        self.length -= 1
+        items[self.length] = None
+        return item
+
+    def index(self, item: T) -> int:
+        """ Find the position of the first occurrence of an item.
+        :raises ValueError: if the item is not in the list
+        :complexity: O(n)
+        """
+        items = self.array.array
+        for i in range(self.length):
+            if items[i] == item:
+                return i
+        raise ValueError('item not in list')
+
+    def clear(self) -> None:
+        """ Clear the list, dropping its references to the elements. """
+        self.array.array[:self.length] = [None] * self.length
+        List.clear(self)
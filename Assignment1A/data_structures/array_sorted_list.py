@@ -1,7 +1,10 @@
 """ Array-based implementation of SortedList ADT. """
 
+from typing import Iterator
+
 from data_structures.referential_array import ArrayR
 from data_structures.sorted_list_adt import *
+from data_structures.sorting import merge_sort
 
 __author__ = 'Maria Garcia de la Banda and Brendon Taylor. Modified by Alexey Ignatiev and Graeme Gange'
 __docformat__ = 'reStructuredText'
@@ -21,6 +24,15 @@ class ArraySortedList(SortedList[T]):
         size = max(self.MIN_CAPACITY, max_capacity)
         self.array = ArrayR(size)
 
+    @classmethod
+    def from_array(cls, items: ArrayR[T]) -> 'ArraySortedList[T]':
+        """ Build a sorted list holding the given items.
+        :complexity: O(n log n) for best/worst case, where n is the number of items
+        """
+        sorted_list = cls(len(items))
+        sorted_list.add_many(items)
+        return sorted_list
+
     def reset(self) -> None:
         """ Reset the list. """
         SortedList.__init__(self)
@@ -47,6 +59,14 @@ class ArraySortedList(SortedList[T]):
             # the list isn't empty and the item's position is wrong wrt. its neighbours
             raise IndexError('Element should be inserted in sorted order')
 
+    def __iter__(self) -> Iterator[T]:
+        """ Magic method. Iterate over the items in sorted order. """
+        return map(self.array.array.__getitem__, range(self.length))
+
+    def __reversed__(self) -> Iterator[T]:
+        """ Magic method. Iterate over the items from the largest to the smallest. """
+        return map(self.array.array.__getitem__, range(self.length - 1, -1, -1))
+
     def __contains__(self, item: T) -> bool:
         """ Checks if value is in the list. """
         for i in range(len(self)):
@@ -107,6 +127,38 @@ class ArraySortedList(SortedList[T]):
         self[position] = item
         self.length += 1
 
+    def add_many(self, items: ArrayR[T]) -> None:
+        """ Add all the given items to the list. The items are sorted on their own,
+            then merged with the current contents in one pass from the back.
+            Items equal to ones already in the list are placed after them.
+        :complexity: O(m log m + n) for best/worst case, where m is the number of new items and n the length of the list
+        """
+        count = len(items)
+        new_items = ArrayR(count)
+        for i in range(count):
+            new_items[i] = items[i]
+        merge_sort(new_items)
+
+        if len(self) + count > len(self.array):
+            new_array = ArrayR(max(2 * len(self.array), len(self) + count))
+            for i in range(self.length):
+                new_array[i] = self.array[i]
+            self.array = new_array
+
+        # fill the free space at the back, so nothing is overwritten before it is moved
+        i = len(self) - 1
+        j = count - 1
+        for k in range(len(self) + count - 1, -1, -1):
+            if j < 0:
+                break
+            if i >= 0 and new_items[j] < self.array[i]:
+                self.array[k] = self.array[i]
+                i -= 1
+            else:
+                self.array[k] = new_items[j]
+                j -= 1
+        self.length += count
+
     def _index_to_add(self, item: T) -> int:
         """ Find the position where the new item should be placed. """
         low = 0
@@ -3,6 +3,7 @@
 """
 
 from __future__ import annotations
+from typing import Iterator
 from data_structures.set_adt import *
 from data_structures.referential_array import ArrayR
 
@@ -40,6 +41,14 @@ class ASet(Set[T]):
                 return True
         return False
 
+    def __iter__(self) -> Iterator[T]:
+        """ Iterates over the elements in the order they are stored. """
+        return map(self.array.array.__getitem__, range(self.size))
+
+    def __reversed__(self) -> Iterator[T]:
+        """ Iterates over the elements in the reverse of the order they are stored. """
+        return map(self.array.array.__getitem__, range(self.size - 1, -1, -1))
+
     def clear(self) -> None:
         """ Makes the set empty. """
         self.size = 0
@@ -0,0 +1,166 @@
+""" Thread-safe bounded blocking variant of CircularQueue.
+
+Producers block in append() while the queue is full and consumers block in serve() while it is empty,
+each for at most a timeout if one is given. append_many() and serve_many() move several items per lock
+acquisition. Once closed, a queue accepts no more items, but what is already in it can still be served:
+consumers get QueueClosed only when the queue is closed and empty.
+"""
+__docformat__ = 'reStructuredText'
+
+import threading
+import time
+from typing import Iterator
+
+from data_structures.array_list import ArrayList
+from data_structures.queue_adt import CircularQueue
+from data_structures.referential_array import T
+
+
+class QueueClosed(Exception):
+    """ Raised when appending to a closed queue, or serving from one that is closed and empty. """
+    pass
+
+
+class BlockingCircularQueue(CircularQueue[T]):
+    """ Circular queue whose operations are safe to call from several threads at once.
+
+    Attributes (in addition to those of CircularQueue):
+         lock (threading.Lock): held while the queue is read or changed
+         not_empty (threading.Condition): notified when items are appended or the queue is closed
+         not_full (threading.Condition): notified when items are served or the queue is closed
+         closed (bool): True once close() has been called
+    """
+
+    def __init__(self, max_capacity: int) -> None:
+        CircularQueue.__init__(self, max_capacity)
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+        self.closed = False
+
+    @staticmethod
+    def _wait(condition: threading.Condition, ready, deadline: float | None) -> None:
+        """ Wait on the condition, whose lock is held, until ready() is true.
+        :raises TimeoutError: if the deadline passes first
+        """
+        while not ready():
+            if deadline is None:
+                condition.wait()
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not condition.wait(remaining):
+                    if not ready():
+                        raise TimeoutError("Timed out waiting for the queue")
+
+    @staticmethod
+    def _deadline(timeout: float | None) -> float | None:
+        """ Turn a timeout in seconds into a time.monotonic() deadline. """
+        return None if timeout is None else time.monotonic() + timeout
+
+    def append(self, item: T, timeout: float | None = None) -> None:
+        """ Adds an element to the rear of the queue, waiting while the queue is full.
+        :raises QueueClosed: if the queue is closed
+        :raises TimeoutError: if the queue is still full after timeout seconds
+        :complexity: O(1) once there is room
+        """
+        with self.lock:
+            self._wait(self.not_full, lambda: self.closed or not self.is_full(), self._deadline(timeout))
+            if self.closed:
+                raise QueueClosed("Queue is closed")
+            CircularQueue.append(self, item)
+            self.not_empty.notify()
+
+    def append_many(self, items, timeout: float | None = None) -> None:
+        """ Adds the elements of an iterable to the rear of the queue in order, as many per lock
+            acquisition as there is room for. The timeout applies to each wait for room.
+        :raises QueueClosed: if the queue is closed before every element is appended
+        :raises TimeoutError: if the queue stays full for timeout seconds
+        :complexity: O(m) for m elements once there is room
+        """
+        iterator = iter(items)
+        item = next(iterator, _END)
+        while item is not _END:
+            with self.lock:
+                self._wait(self.not_full, lambda: self.closed or not self.is_full(), self._deadline(timeout))
+                if self.closed:
+                    raise QueueClosed("Queue is closed")
+                added = 0
+                while item is not _END and not self.is_full():
+                    CircularQueue.append(self, item)
+                    added += 1
+                    item = next(iterator, _END)
+                self.not_empty.notify(added)
+
+    def serve(self, timeout: float | None = None) -> T:
+        """ Deletes and returns the element at the queue's front, waiting while the queue is empty.
+        :raises QueueClosed: if the queue is closed and empty
+        :raises TimeoutError: if the queue is still empty after timeout seconds
+        :complexity: O(1) once there is an element
+        """
+        with self.lock:
+            self._wait(self.not_empty, lambda: self.closed or not self.is_empty(), self._deadline(timeout))
+            if self.is_empty():
+                raise QueueClosed("Queue is closed")
+            item = CircularQueue.serve(self)
+            self.not_full.notify()
+            return item
+
+    def serve_many(self, count: int, timeout: float | None = None) -> ArrayList[T]:
+        """ Deletes and returns up to count elements from the queue's front, waiting while the queue is empty.
+            Returns as soon as at least one element is available.
+        :raises QueueClosed: if the queue is closed and empty
+        :raises TimeoutError: if the queue is still empty after timeout seconds
+        :complexity: O(count) once there is an element
+        """
+        with self.lock:
+            self._wait(self.not_empty, lambda: self.closed or not self.is_empty(), self._deadline(timeout))
+            if self.is_empty():
+                raise QueueClosed("Queue is closed")
+            served = ArrayList(min(count, len(self)))
+            while len(served) < count and not self.is_empty():
+                served.append(CircularQueue.serve(self))
+            self.not_full.notify(len(served))
+            return served
+
+    def peek(self) -> T:
+        """ Returns the element at the queue's front without waiting.
+        :raises Exception: if the queue is empty
+        """
+        with self.lock:
+            return CircularQueue.peek(self)
+
+    def close(self) -> None:
+        """ Stops the queue accepting elements and wakes every waiting thread. Idempotent. """
+        with self.lock:
+            self.closed = True
+            self.not_empty.notify_all()
+            self.not_full.notify_all()
+
+    def drain(self) -> ArrayList[T]:
+        """ Deletes and returns every element in the queue without waiting, oldest first.
+        :complexity: O(n) where n is the number of elements
+        """
+        with self.lock:
+            served = ArrayList(len(self))
+            while not self.is_empty():
+                served.append(CircularQueue.serve(self))
+            self.not_full.notify_all()
+            return served
+
+    def clear(self) -> None:
+        """ Clears all elements from the queue, leaving it open or closed. """
+        with self.lock:
+            CircularQueue.clear(self)
+            self.not_full.notify_all()
+
+    def __iter__(self) -> Iterator[T]:
+        """ Serves elements until the queue is closed and empty. """
+        while True:
+            try:
+                yield self.serve()
+            except QueueClosed:
+                return
+
+
+# Marks the end of the items given to append_many(), which may include None
+_END = object()
@@ -0,0 +1,177 @@
+""" Doubly-linked implementation of the List ADT.
+
+Positional access walks from the nearer end of the list, so it is O(n). The nodes themselves
+are exposed as cursors: inserting or deleting at a node the caller already holds is O(1), as is
+splicing every node of another list into this one, since only the links at the joins change.
+"""
+__docformat__ = 'reStructuredText'
+
+from typing import Generic, Iterator
+
+from data_structures.abstract_list import List, T
+
+
+class ListNode(Generic[T]):
+    """ Node holding an element of a LinkedList, linked to the nodes before and after it. """
+    __slots__ = ('item', 'next', 'previous')
+
+    def __init__(self, item: T) -> None:
+        self.item = item
+        self.next = None
+        self.previous = None
+
+
+class LinkedList(List[T]):
+    """ List ADT implemented with doubly-linked nodes.
+
+    Attributes:
+         length (int): number of elements in the list (inherited)
+         head (ListNode[T] | None): node of the first element
+         rear (ListNode[T] | None): node of the last element
+    """
+
+    def __init__(self) -> None:
+        List.__init__(self)
+        self.head = None
+        self.rear = None
+
+    def __getitem__(self, index: int) -> T:
+        """ Magic method. Return the element at a given position.
+        :raises IndexError: if the index is out of range
+        :complexity: O(min(index, n - index))
+        """
+        return self.node_at(index).item
+
+    def __setitem__(self, index: int, item: T) -> None:
+        """ Magic method. Replace the element at a given position.
+        :raises IndexError: if the index is out of range
+        :complexity: O(min(index, n - index))
+        """
+        self.node_at(index).item = item
+
+    def __iter__(self) -> Iterator[T]:
+        """ Magic method. Iterate over the elements in order. """
+        node = self.head
+        while node is not None:
+            yield node.item
+            node = node.next
+
+    def node_at(self, index: int) -> ListNode[T]:
+        """ Return the node at a given position, walking from the nearer end.
+        :raises IndexError: if the index is out of range
+        :complexity: O(min(index, n - index))
+        """
+        if not 0 <= index < self.length:
+            raise IndexError('No such index in the list')
+        if index < self.length // 2:
+            node = self.head
+            for _ in range(index):
+                node = node.next
+        else:
+            node = self.rear
+            for _ in range(self.length - 1 - index):
+                node = node.previous
+        return node
+
+    def append(self, item: T) -> None:
+        """ Append a new item to the end of the list.
+        :complexity: O(1)
+        """
+        self.insert_after(self.rear, item)
+
+    def insert(self, index: int, item: T) -> None:
+        """ Insert an item at a given position.
+        :raises IndexError: if the index is out of range, len(self) being in range
+        :complexity: O(min(index, n - index))
+        """
+        if index == self.length:
+            self.insert_after(self.rear, item)
+        else:
+            self.insert_after(self.node_at(index).previous, item)
+
+    def insert_after(self, node: ListNode[T] | None, item: T) -> ListNode[T]:
+        """ Insert an item just after a node of the list, or at the front if the node is None.
+        :returns: the item's node
+        :complexity: O(1)
+        """
+        new_node = ListNode(item)
+        self._link(node, new_node, new_node)
+        self.length += 1
+        return new_node
+
+    def _link(self, node: ListNode[T] | None, first: ListNode[T], last: ListNode[T]) -> None:
+        """ Link the chain of nodes from first to last in just after a node, or at the front if it is None. """
+        following = self.head if node is None else node.next
+        first.previous = node
+        last.next = following
+        if node is None:
+            self.head = first
+        else:
+            node.next = first
+        if following is None:
+            self.rear = last
+        else:
+            following.previous = last
+
+    def delete_node(self, node: ListNode[T]) -> T:
+        """ Delete a node of the list.
+        :returns: the node's item
+        :complexity: O(1)
+        """
+        if node.previous is None:
+            self.head = node.next
+        else:
+            node.previous.next = node.next
+        if node.next is None:
+            self.rear = node.previous
+        else:
+            node.next.previous = node.previous
+        node.next = node.previous = None
+        self.length -= 1
+        return node.item
+
+    def delete_at_index(self, index: int) -> T:
+        """ Delete the item at a given position.
+        :raises IndexError: if the index is out of range
+        :complexity: O(min(index, n - index))
+        """
+        return self.delete_node(self.node_at(index))
+
+    def index(self, item: T) -> int:
+        """ Find the position of the first occurrence of an item.
+        :raises ValueError: if the item is not in the list
+        :complexity: O(n)
+        """
+        node = self.head
+        for i in range(self.length):
+            if node.item == item:
+                return i
+            node = node.next
+        raise ValueError('item not in list')
+
+    def splice(self, other: 'LinkedList[T]') -> None:
+        """ Move every node of another list to the end of this list, leaving the other list empty.
+        :raises ValueError: if the other list is this list
+        :complexity: O(1)
+        """
+        self.splice_after(self.rear, other)
+
+    def splice_after(self, node: ListNode[T] | None, other: 'LinkedList[T]') -> None:
+        """ Move every node of another list just after a node of this list, or to the front if the node
+            is None, leaving the other list empty.
+        :raises ValueError: if the other list is this list
+        :complexity: O(1)
+        """
+        if other is self:
+            raise ValueError('Cannot splice a list into itself')
+        if other.is_empty():
+            return
+        self._link(node, other.head, other.rear)
+        self.length += other.length
+        other.clear()
+
+    def clear(self) -> None:
+        """ Clear the list. """
+        List.clear(self)
+        self.head = None
+        self.rear = None
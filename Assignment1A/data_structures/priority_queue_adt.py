@@ -0,0 +1,299 @@
+""" Priority queue ADT and array-based heap implementations.
+
+Defines a generic abstract priority queue serving the element with the smallest priority first,
+and implements it with a binary heap (ArrayHeap) and a d-ary heap (DaryHeap) stored in arrays.
+Elements with equal priorities are served in the order they were added, so a queue of timed
+events is deterministic. add() returns an integer handle for the element, and an array indexed
+by handle keeps the heap slot of every element, so decrease_key() and remove() find an element in
+O(1) before restoring the heap in O(log n). The handle of an element that has been served or
+removed is given to a later element.
+"""
+__docformat__ = 'reStructuredText'
+
+from abc import ABC, abstractmethod
+from typing import Generic
+from data_structures.referential_array import ArrayR, T
+
+
+class PriorityQueue(ABC, Generic[T]):
+    """ Abstract class for a generic min-priority queue whose elements are found again by handle. """
+
+    def __init__(self) -> None:
+        self.length = 0
+
+    @abstractmethod
+    def add(self, item: T, priority) -> int:
+        """ Adds an element with a priority and returns its handle. Smaller priorities are served first. """
+        pass
+
+    @abstractmethod
+    def serve(self) -> T:
+        """ Deletes and returns the element with the smallest priority. """
+        pass
+
+    @abstractmethod
+    def peek(self) -> T:
+        """ Returns the element with the smallest priority. """
+        pass
+
+    @abstractmethod
+    def peek_priority(self):
+        """ Returns the smallest priority in the queue. """
+        pass
+
+    @abstractmethod
+    def decrease_key(self, handle: int, priority) -> None:
+        """ Lowers the priority of the element with a handle. """
+        pass
+
+    @abstractmethod
+    def __contains__(self, handle: int) -> bool:
+        """ True if the handle is that of an element in the queue. """
+        pass
+
+    def __len__(self) -> int:
+        """ Returns the number of elements in the queue. """
+        return self.length
+
+    def is_empty(self) -> bool:
+        """ True if the queue is empty. """
+        return len(self) == 0
+
+    def clear(self) -> None:
+        """ Clears all elements from the queue. """
+        self.length = 0
+
+
+class ArrayHeap(PriorityQueue[T]):
+    """ Min-heap implementation of a priority queue with arrays, growing as needed.
+
+    Attributes:
+         length (int): number of elements in the heap (inherited)
+         arity (int): number of children of every node, 2 for a binary heap
+         items (ArrayR[T]): the elements, in heap order
+         priorities (ArrayR): the priority of the element in the same slot of items
+         orders (ArrayR[int]): when the element in the same slot was added, to break ties
+         handles (ArrayR[int]): the handle of the element in the same slot; the slots past the
+            last element hold the free handles
+         slots (ArrayR[int]): the slot of the element with every handle, None for a free handle
+         added (int): number of elements added so far
+
+    A slot's key is its (priority, order) pair, so no two keys are equal. Handles run from 0 to
+    the capacity of the arrays, so slots is indexed by handle and no element needs to be hashed.
+    ArrayR cannot create empty arrays. So MIN_CAPACITY used to avoid this.
+    """
+    MIN_CAPACITY = 1
+    ARITY = 2
+
+    def __init__(self, capacity: int = MIN_CAPACITY) -> None:
+        PriorityQueue.__init__(self)
+        self.arity = self.ARITY
+        size = max(self.MIN_CAPACITY, capacity)
+        self.items = ArrayR(size)
+        self.priorities = ArrayR(size)
+        self.orders = ArrayR(size)
+        self.handles = ArrayR(size)
+        self.slots = ArrayR(size)
+        for handle in range(size):
+            self.handles[handle] = handle
+        self.added = 0
+
+    def add(self, item: T, priority) -> int:
+        """ Adds an element with a priority and returns its handle, valid until the element leaves the queue.
+        :complexity: O(log n) amortised, O(n) when the arrays are resized
+        """
+        if self.length == len(self.items):
+            self._resize()
+        handle = self.handles[self.length]
+        self.length += 1
+        self._sift_up(self.length - 1, item, priority, self.added, handle)
+        self.added += 1
+        return handle
+
+    def serve(self) -> T:
+        """ Deletes and returns the element with the smallest priority.
+        :raises Exception: if the queue is empty
+        :complexity: O(d log n / log d) where d is the arity
+        """
+        if self.is_empty():
+            raise Exception("Priority queue is empty")
+        item = self.items[0]
+        self._delete_slot(0)
+        return item
+
+    def peek(self) -> T:
+        """ Returns the element with the smallest priority.
+        :raises Exception: if the queue is empty
+        """
+        if self.is_empty():
+            raise Exception("Priority queue is empty")
+        return self.items[0]
+
+    def peek_priority(self):
+        """ Returns the smallest priority in the queue.
+        :raises Exception: if the queue is empty
+        """
+        if self.is_empty():
+            raise Exception("Priority queue is empty")
+        return self.priorities[0]
+
+    def item(self, handle: int) -> T:
+        """ Returns the element with a handle.
+        :raises KeyError: if the handle is not that of an element in the queue
+        """
+        return self.items[self._slot(handle)]
+
+    def priority(self, handle: int):
+        """ Returns the priority of the element with a handle.
+        :raises KeyError: if the handle is not that of an element in the queue
+        """
+        return self.priorities[self._slot(handle)]
+
+    def decrease_key(self, handle: int, priority) -> None:
+        """ Lowers the priority of an element, keeping its place among elements of equal priority.
+        :raises KeyError: if the handle is not that of an element in the queue
+        :raises ValueError: if the new priority is greater than the element's priority
+        :complexity: O(log n / log d) where d is the arity
+        """
+        slot = self._slot(handle)
+        if self.priorities[slot] < priority:
+            raise ValueError("New priority is greater than the current one")
+        self._sift_up(slot, self.items[slot], priority, self.orders[slot], handle)
+
+    def remove(self, handle: int) -> None:
+        """ Deletes an element from anywhere in the queue, e.g. an event that has been cancelled.
+        :raises KeyError: if the handle is not that of an element in the queue
+        :complexity: O(d log n / log d) where d is the arity
+        """
+        self._delete_slot(self._slot(handle))
+
+    def __contains__(self, handle: int) -> bool:
+        """ True if the handle is that of an element in the queue.
+        :complexity: O(1)
+        """
+        return 0 <= handle < len(self.slots) and self.slots[handle] is not None
+
+    def clear(self) -> None:
+        """ Clears all elements from the queue, dropping its references to them.
+        :complexity: O(n)
+        """
+        for slot in range(self.length):
+            self.slots[self.handles[slot]] = None
+        self.items.array[:self.length] = [None] * self.length
+        self.priorities.array[:self.length] = [None] * self.length
+        PriorityQueue.clear(self)
+
+    def _slot(self, handle: int) -> int:
+        """ Returns the slot of the element with a handle.
+        :raises KeyError: if the handle is not that of an element in the queue
+        """
+        if handle not in self:
+            raise KeyError(handle)
+        return self.slots[handle]
+
+    def _delete_slot(self, slot: int) -> None:
+        """ Deletes the element in a slot, filling the slot with the last element and freeing its handle. """
+        handle = self.handles[slot]
+        self.slots[handle] = None
+        self.length -= 1
+        last = self.length
+        item, priority, order, moved = self.items[last], self.priorities[last], self.orders[last], self.handles[last]
+        self.items[last] = self.priorities[last] = None
+        self.handles[last] = handle
+        if slot == last:
+            return
+        # The last element can belong above or below the slot it fills
+        parent = (slot - 1) // self.arity
+        if slot > 0 and self._before(priority, order, parent):
+            self._sift_up(slot, item, priority, order, moved)
+        else:
+            self._sift_down(slot, item, priority, order, moved)
+
+    def _before(self, priority, order: int, slot: int) -> bool:
+        """ True if the key (priority, order) comes before the key of a slot. """
+        other = self.priorities[slot]
+        return priority < other or (priority == other and order < self.orders[slot])
+
+    def _sift_up(self, slot: int, item: T, priority, order: int, handle: int) -> None:
+        """ Places an element at a slot or above it, moving the parents it comes before down.
+        :complexity: O(log n / log d) where d is the arity
+        """
+        arity = self.arity
+        items, priorities, orders = self.items.array, self.priorities.array, self.orders.array
+        handles, slots = self.handles.array, self.slots.array
+        while slot > 0:
+            parent = (slot - 1) // arity
+            other = priorities[parent]
+            if priority < other or (priority == other and order < orders[parent]):
+                moved = handles[parent]
+                items[slot], priorities[slot], orders[slot] = items[parent], other, orders[parent]
+                handles[slot] = moved
+                slots[moved] = slot
+                slot = parent
+            else:
+                break
+        items[slot], priorities[slot], orders[slot] = item, priority, order
+        handles[slot] = handle
+        slots[handle] = slot
+
+    def _sift_down(self, slot: int, item: T, priority, order: int, handle: int) -> None:
+        """ Places an element at a slot or below it, moving the smallest children that come before it up.
+        :complexity: O(d log n / log d) where d is the arity
+        """
+        arity, length = self.arity, self.length
+        items, priorities, orders = self.items.array, self.priorities.array, self.orders.array
+        handles, slots = self.handles.array, self.slots.array
+        while True:
+            first = arity * slot + 1
+            if first >= length:
+                break
+            best, best_priority, best_order = first, priorities[first], orders[first]
+            for child in range(first + 1, min(first + arity, length)):
+                other = priorities[child]
+                if other < best_priority or (other == best_priority and orders[child] < best_order):
+                    best, best_priority, best_order = child, other, orders[child]
+            if best_priority < priority or (best_priority == priority and best_order < order):
+                moved = handles[best]
+                items[slot], priorities[slot], orders[slot] = items[best], best_priority, best_order
+                handles[slot] = moved
+                slots[moved] = slot
+                slot = best
+            else:
+                break
+        items[slot], priorities[slot], orders[slot] = item, priority, order
+        handles[slot] = handle
+        slots[handle] = slot
+
+    def _resize(self) -> None:
+        """ Doubles the capacity of the arrays, adding the new handles to the free ones.
+        Only called when the heap is full, so every old handle is in use.
+        """
+        old = len(self.items)
+        size = 2 * old
+        items, priorities, orders, handles, slots = ArrayR(size), ArrayR(size), ArrayR(size), ArrayR(size), \
+            ArrayR(size)
+        for i in range(self.length):
+            items[i], priorities[i], orders[i] = self.items[i], self.priorities[i], self.orders[i]
+            handles[i], slots[i] = self.handles[i], self.slots[i]
+        for handle in range(old, size):
+            handles[handle] = handle
+        self.items, self.priorities, self.orders = items, priorities, orders
+        self.handles, self.slots = handles, slots
+
+
+class DaryHeap(ArrayHeap[T]):
+    """ Min-heap implementation of a priority queue in which every node has d children.
+
+    A wider heap is shallower, so adding an element and decreasing a key compare fewer keys,
+    while serving compares up to d children per level: wider heaps suit queues that are added
+    to and reprioritised more often than they are served.
+    """
+
+    def __init__(self, arity: int, capacity: int = ArrayHeap.MIN_CAPACITY) -> None:
+        """ DaryHeap object initialiser.
+        :raises ValueError: if the arity is less than 2
+        """
+        if arity < 2:
+            raise ValueError("A heap needs at least 2 children per node")
+        ArrayHeap.__init__(self, capacity)
+        self.arity = arity
@@ -17,7 +17,7 @@ __author__ = "Julian Garcia for the __init__ code, Maria Garcia de la Banda for
 __docformat__ = 'reStructuredText'
 
 from ctypes import py_object
-from typing import TypeVar, Generic
+from typing import Generic, Iterator, TypeVar
 
 T = TypeVar('T')
 
@@ -53,6 +53,24 @@ class ArrayR(Generic[T]):
         """
         self.array[index] = value
     
+    def __iter__(self) -> Iterator[T]:
+        """ Returns an iterator over the objects, in position order
+        :complexity: O(1) to create, O(1) per object
+        """
+        return iter(self.array)
+
+    def __reversed__(self) -> Iterator[T]:
+        """ Returns an iterator over the objects, from the last position to the first
+        :complexity: O(1) to create, O(1) per object
+        """
+        return reversed(self.array)
+
+    def __reduce__(self) -> tuple:
+        """ Pickles the array as a tuple of its objects, since ctypes arrays of py_object cannot be pickled
+        :complexity: O(length) for best/worst case
+        """
+        return _rebuild_array, (tuple(self.array),)
+
     def index(self, item: T) -> int:
         for index, arr_item in enumerate(self.array):
             if arr_item == item:
@@ -68,3 +86,12 @@ class ArrayR(Generic[T]):
         
         ret_str = ret_str[:-2] + "]"
         return ret_str
+
+
+def _rebuild_array(items: tuple) -> ArrayR:
+    """ Rebuilds an array pickled by ArrayR.__reduce__
+    :complexity: O(length) for best/worst case
+    """
+    array = ArrayR(len(items))
+    array.array[:] = items
+    return array
@@ -0,0 +1,131 @@
+""" Circular doubly-linked ring, e.g. of the players seated around a table.
+
+Every item is held in a RingNode linked to the nodes on either side of it, so moving to the
+next or previous item, removing an item and reversing the direction of travel are all O(1):
+none of them renumbers or moves the other items. The direction is a flag that swaps the roles
+of the two links, rather than a change to the links themselves.
+"""
+__docformat__ = 'reStructuredText'
+
+from typing import Generic, Iterator
+
+from data_structures.referential_array import T
+
+
+class RingNode(Generic[T]):
+    """ Node holding an item of a Ring, linked to the nodes before and after it. """
+    __slots__ = ('item', 'next', 'previous', 'linked')
+
+    def __init__(self, item: T) -> None:
+        self.item = item
+        self.next = self
+        self.previous = self
+        self.linked = False
+
+
+class Ring(Generic[T]):
+    """ Circular doubly-linked list of items with a direction of travel.
+
+    Attributes:
+         head (RingNode[T] | None): node of the first item added that is still in the ring
+         length (int): number of items in the ring
+         reversed (bool): True if after() follows the previous links instead of the next ones
+    """
+
+    def __init__(self) -> None:
+        self.head = None
+        self.length = 0
+        self.reversed = False
+
+    def __len__(self) -> int:
+        """ Returns the number of items in the ring. """
+        return self.length
+
+    def is_empty(self) -> bool:
+        """ True if the ring holds no items. """
+        return self.length == 0
+
+    def append(self, item: T) -> RingNode[T]:
+        """ Adds an item just before the head, so items appended in turn follow each other forwards.
+        :returns: the item's node
+        :complexity: O(1)
+        """
+        node = RingNode(item)
+        if self.head is None:
+            self.head = node
+        else:
+            self._link(self.head.previous, node)
+        node.linked = True
+        self.length += 1
+        return node
+
+    def insert_after(self, node: RingNode[T], item: T) -> RingNode[T]:
+        """ Adds an item just after a node in the current direction.
+        :returns: the item's node
+        :raises ValueError: if the node is not in the ring
+        :complexity: O(1)
+        """
+        self._check(node)
+        new_node = RingNode(item)
+        self._link(node.previous if self.reversed else node, new_node)
+        new_node.linked = True
+        self.length += 1
+        return new_node
+
+    @staticmethod
+    def _link(node: RingNode[T], new_node: RingNode[T]) -> None:
+        """ Links a new node in just after a node, following the next links. """
+        new_node.previous = node
+        new_node.next = node.next
+        node.next.previous = new_node
+        node.next = new_node
+
+    def remove(self, node: RingNode[T]) -> T:
+        """ Removes a node from the ring. Its neighbours are linked to each other and the head moves
+            on if it was the head. The node keeps its links but can no longer be used with the ring.
+        :returns: the node's item
+        :raises ValueError: if the node is not in the ring
+        :complexity: O(1)
+        """
+        self._check(node)
+        node.previous.next = node.next
+        node.next.previous = node.previous
+        node.linked = False
+        self.length -= 1
+        if self.head is node:
+            self.head = None if self.length == 0 else node.next
+        return node.item
+
+    def after(self, node: RingNode[T]) -> RingNode[T]:
+        """ Returns the node after a node in the current direction.
+        :raises ValueError: if the node is not in the ring
+        :complexity: O(1)
+        """
+        self._check(node)
+        return node.previous if self.reversed else node.next
+
+    def before(self, node: RingNode[T]) -> RingNode[T]:
+        """ Returns the node before a node in the current direction.
+        :raises ValueError: if the node is not in the ring
+        :complexity: O(1)
+        """
+        self._check(node)
+        return node.next if self.reversed else node.previous
+
+    def reverse(self) -> None:
+        """ Reverses the direction of travel.
+        :complexity: O(1)
+        """
+        self.reversed = not self.reversed
+
+    def _check(self, node: RingNode[T]) -> None:
+        """ Raises ValueError if the node is not in a ring. """
+        if not node.linked:
+            raise ValueError("Node is not in the ring")
+
+    def __iter__(self) -> Iterator[T]:
+        """ Iterates over the items in the current direction, starting at the head. """
+        node = self.head
+        for _ in range(self.length):
+            yield node.item
+            node = node.previous if self.reversed else node.next
@@ -0,0 +1,147 @@
+""" Sorting algorithms over ArrayR, for use where the built-in sorts are not allowed. """
+
+from typing import Callable, TypeVar
+
+from data_structures.referential_array import ArrayR
+
+__docformat__ = 'reStructuredText'
+
+T = TypeVar('T')
+K = TypeVar('K')
+
+
+def merge_sort(array: ArrayR[T], key: Callable[[T], K] | None = None) -> None:
+    """ Sort the array in place with a stable bottom-up merge sort.
+        Items (or their keys, if a key function is given) only need to support <.
+    :complexity: O(n log n) comparisons for best/worst case, plus O(n) calls to key
+    """
+    n = len(array)
+    if n < 2:
+        return
+
+    items = array.array
+    spare = ArrayR(n).array
+    keys = items
+    spare_keys = None
+    if key is not None:
+        keys = ArrayR(n).array
+        spare_keys = ArrayR(n).array
+        for i in range(n):
+            keys[i] = key(items[i])
+
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            _merge(items, keys, spare, spare_keys, lo, mid, hi)
+        items, spare = spare, items
+        if key is not None:
+            keys, spare_keys = spare_keys, keys
+        else:
+            keys = items
+        width *= 2
+
+    # the sorted run ended up in the spare buffer
+    if items is not array.array:
+        array.array[:] = items[:]
+
+
+def _merge(src, src_keys, dst, dst_keys, lo: int, mid: int, hi: int) -> None:
+    """ Merge the sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi].
+        Ties are taken from the left run, which keeps the sort stable.
+        dst_keys is None when the items are their own keys.
+    :complexity: O(hi - lo) for best/worst case
+    """
+    i, j = lo, mid
+    for k in range(lo, hi):
+        if j < hi and (i >= mid or src_keys[j] < src_keys[i]):
+            dst[k] = src[j]
+            if dst_keys is not None:
+                dst_keys[k] = src_keys[j]
+            j += 1
+        else:
+            dst[k] = src[i]
+            if dst_keys is not None:
+                dst_keys[k] = src_keys[i]
+            i += 1
+
+
+def count_keys(array: ArrayR[T], key: Callable[[T], int], num_keys: int) -> ArrayR[int]:
+    """ Count how many items have each key in range(num_keys).
+    :complexity: O(n + k) for best/worst case, where k is num_keys
+    """
+    counts = ArrayR(num_keys)
+    for k in range(num_keys):
+        counts[k] = 0
+    items = array.array
+    for i in range(len(array)):
+        counts[key(items[i])] += 1
+    return counts
+
+
+def counting_sort(array: ArrayR[T], key: Callable[[T], int], num_keys: int) -> None:
+    """ Sort the array in place by integer keys in range(num_keys). The sort is stable.
+    :complexity: O(n + k) for best/worst case, where k is num_keys
+    """
+    n = len(array)
+    if n < 2:
+        return
+    items = array.array
+    keys = ArrayR(n).array
+    for i in range(n):
+        keys[i] = key(items[i])
+    counts = ArrayR(num_keys).array
+    for k in range(num_keys):
+        counts[k] = 0
+    for i in range(n):
+        counts[keys[i]] += 1
+    # turn the counts into the first position of each key
+    position = 0
+    for k in range(num_keys):
+        counts[k], position = position, position + counts[k]
+    spare = ArrayR(n).array
+    for i in range(n):
+        spare[counts[keys[i]]] = items[i]
+        counts[keys[i]] += 1
+    items[:] = spare[:]
+
+
+def radix_sort(array: ArrayR[T], key: Callable[[T], int], key_bits: int = 32, radix_bits: int = 8) -> None:
+    """ Sort the array in place by non-negative integer keys below 2 ** key_bits,
+        with one stable counting sort pass per radix_bits bits, least significant first.
+    :complexity: O((n + 2 ** radix_bits) * key_bits / radix_bits) for best/worst case
+    """
+    n = len(array)
+    if n < 2:
+        return
+    items = array.array
+    keys = ArrayR(n).array
+    for i in range(n):
+        keys[i] = key(items[i])
+    spare = ArrayR(n).array
+    spare_keys = ArrayR(n).array
+    mask = (1 << radix_bits) - 1
+
+    counts = ArrayR(mask + 1).array
+    for shift in range(0, key_bits, radix_bits):
+        for d in range(mask + 1):
+            counts[d] = 0
+        for i in range(n):
+            counts[(keys[i] >> shift) & mask] += 1
+        # turn the counts into the first position of each digit
+        position = 0
+        for d in range(mask + 1):
+            counts[d], position = position, position + counts[d]
+        for i in range(n):
+            d = (keys[i] >> shift) & mask
+            spare[counts[d]] = items[i]
+            spare_keys[counts[d]] = keys[i]
+            counts[d] += 1
+        items, spare = spare, items
+        keys, spare_keys = spare_keys, keys
+
+    # an odd number of passes leaves the result in the spare buffer
+    if items is not array.array:
+        array.array[:] = items[:]
+
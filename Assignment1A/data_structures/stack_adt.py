@@ -1,14 +1,13 @@
 """ Stack ADT and an array implementation.
 
 Defines a generic abstract stack with the usual methods, and implements
-a stack using arrays. Also defines UnitTests for the class.
+a stack using arrays. Its unit tests are in tests/test_stack_adt.py.
 """
 __author__ = "Maria Garcia de la Banda for the base"+"XXXXX student for"
 __docformat__ = 'reStructuredText'
 
-import unittest
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic
+from typing import Generic, Iterator, TypeVar
 from data_structures.referential_array import ArrayR, T
 
 
@@ -91,6 +90,18 @@ class ArrayStack(Stack[T]):
         self.length -= 1
         return self.array[self.length]
 
+    def __iter__(self) -> Iterator[T]:
+        """ Iterates over the elements from the bottom of the stack to the top, without removing them.
+        :complexity: O(1) to create, O(1) per element
+        """
+        return map(self.array.array.__getitem__, range(self.length))
+
+    def __reversed__(self) -> Iterator[T]:
+        """ Iterates over the elements from the top of the stack to the bottom, without removing them.
+        :complexity: O(1) to create, O(1) per element
+        """
+        return map(self.array.array.__getitem__, range(self.length - 1, -1, -1))
+
     def peek(self) -> T:
         """ Returns the element at the top, without popping it from stack.
         :pre: stack is not empty
@@ -99,94 +110,3 @@ class ArrayStack(Stack[T]):
         if self.is_empty():
             raise Exception("Stack is empty")
         return self.array[self.length-1]
-
-
-class TestStack(unittest.TestCase):
-    """ Tests for the above class."""
-    EMPTY = 0
-    ROOMY = 5
-    LARGE = 10
-    CAPACITY = 20
-
-    def setUp(self) -> None:
-        self.lengths = [self.EMPTY, self.ROOMY, self.LARGE, self.ROOMY, self.LARGE]
-        self.stacks = [ArrayStack(self.CAPACITY) for i in range(len(self.lengths))]
-        for stack, length in zip(self.stacks, self.lengths):
-            for i in range(length):
-                stack.push(i)
-        self.empty_stack = self.stacks[0]
-        self.roomy_stack = self.stacks[1]
-        self.large_stack = self.stacks[2]
-        #we build empty stacks from clear.
-        #this is an indirect way of testing if clear works!
-        #(perhaps not the best)
-        self.clear_stack = self.stacks[3]
-        self.clear_stack.clear()
-        self.lengths[3] = 0
-        self.stacks[4].clear()
-        self.lengths[4] = 0
-
-    def tearDown(self) -> None:
-        for s in self.stacks:
-            s.clear()
-
-    def test_init(self) -> None:
-        self.assertTrue(self.empty_stack.is_empty())
-        self.assertEqual(len(self.empty_stack), 0)
-
-    def test_len(self) -> None:
-        """ Tests the length of all stacks created during setup."""
-        for stack, length in zip(self.stacks, self.lengths):
-            self.assertEqual(len(stack), length)
-
-    def test_is_empty_add(self) -> None:
-        """ Tests stacks that have been created empty/non-empty."""
-        self.assertTrue(self.empty_stack.is_empty())
-        self.assertFalse(self.roomy_stack.is_empty())
-        self.assertFalse(self.large_stack.is_empty())
-
-    def test_is_empty_clear(self) -> None:
-        """ Tests stacks that have been cleared."""
-        for stack in self.stacks:
-            stack.clear()
-            self.assertTrue(stack.is_empty())
-
-    def test_is_empty_pop(self) -> None:
-        """ Tests stacks that have been popped completely."""
-        for stack in self.stacks:
-            #we empty the stack
-            try:
-                while True:
-                    was_empty = stack.is_empty()
-                    stack.pop()
-                    #if we have popped without raising an assertion,
-                    #then the stack was not empty.
-                    self.assertFalse(was_empty)
-            except:
-                self.assertTrue(stack.is_empty())
-
-    def test_is_full_add(self) -> None:
-        """ Tests stacks that have been created not full."""
-        self.assertFalse(self.empty_stack.is_full())
-        self.assertFalse(self.roomy_stack.is_full())
-        self.assertFalse(self.large_stack.is_full())
-
-    def test_push_and_pop(self) -> None:
-        for stack in self.stacks:
-            nitems = self.ROOMY
-            for i in range(nitems):
-                stack.push(i)
-            for i in range(nitems-1, -1, -1):
-                self.assertEqual(stack.pop(), i)
-
-    def test_clear(self) -> None:
-        for stack in self.stacks:
-            stack.clear()
-            self.assertEqual(len(stack), 0)
-            self.assertTrue(stack.is_empty())
-
-
-if __name__ == '__main__':
-    testtorun = TestStack()
-    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
-    unittest.TextTestRunner().run(suite)
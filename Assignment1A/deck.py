@@ -0,0 +1,178 @@
+"""
+Deck compositions. A DeckSpec describes how many of each card a deck holds and builds the deck once, in the
+order Game.generate_cards() has always produced it, so each game only copies and shuffles the shared template.
+"""
+from card import Card, CardColor, CardLabel, CARDS_BY_ID
+from constants import Constants
+from data_structures.referential_array import ArrayR
+from data_structures.sorting import count_keys
+
+
+class DeckSpec:
+    """
+    Composition of the deck used by a game. A spec is not changed once created, so games can share it.
+    """
+
+    def __init__(self, decks: int = 1, number_copies: int = 2, action_copies: int = 2, crazy_copies: int = 4,
+                 draw_four_copies: int = 4) -> None:
+        """
+        Constructor for the DeckSpec class
+
+        Args:
+            decks (int): Number of full decks shuffled together
+            number_copies (int): Copies of each number card (ZERO to NINE) per color in one deck
+            action_copies (int): Copies of each SKIP, REVERSE and DRAW_TWO card per color in one deck
+            crazy_copies (int): Copies of the CRAZY card in one deck
+            draw_four_copies (int): Copies of the DRAW_FOUR card in one deck
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If a count is negative, the deck would be empty, it has no number cards or it cannot be
+                dealt to a full table, see can_deal()
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if min(decks, number_copies, action_copies, crazy_copies, draw_four_copies) < 0:
+            raise ValueError("Card counts cannot be negative.")
+        self.decks = decks
+        self.number_copies = number_copies
+        self.action_copies = action_copies
+        self.crazy_copies = crazy_copies
+        self.draw_four_copies = draw_four_copies
+        colors = len(CardColor) - 1
+        self.size = decks * (colors * (10 * number_copies + 3 * action_copies) + crazy_copies + draw_four_copies)
+        if self.size == 0:
+            raise ValueError("A deck needs at least one card.")
+        if number_copies == 0:
+            raise ValueError("A deck needs number cards to start the discard pile.")
+        if not self.can_deal(Constants.MAX_PLAYERS, Constants.NUM_CARDS_AT_INIT):
+            raise ValueError(f"A deck of {self.size} cards cannot deal {Constants.NUM_CARDS_AT_INIT} cards to "
+                             f"{Constants.MAX_PLAYERS} players.")
+        self._template: ArrayR[Card] | None = None
+
+    def can_deal(self, num_players: int, cards_at_init: int) -> bool:
+        """
+        Method to check that a game can always be started with this deck: after every hand is dealt, a number card
+        is left for the discard pile however the deck was shuffled
+
+        Args:
+            num_players (int): Number of players at the table
+            cards_at_init (int): Cards dealt to every player
+
+        Returns:
+            bool: True if there are more number cards than cards dealt
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        numbers = self.decks * (len(CardColor) - 1) * 10 * self.number_copies
+        return numbers > num_players * cards_at_init
+
+    def __reduce__(self) -> tuple | str:
+        """
+        Method to pickle the spec as its card counts, without the template, or as a reference to STANDARD_DECK
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if self is STANDARD_DECK:
+            return "STANDARD_DECK"
+        return DeckSpec, (self.decks, self.number_copies, self.action_copies, self.crazy_copies,
+                          self.draw_four_copies)
+
+    def template(self) -> ArrayR[Card]:
+        """
+        Method to get the unshuffled deck, built on first use. The array is shared and must not be modified.
+
+        Returns:
+            ArrayR[Card]: The cards of the deck, sharing the Card objects of CARDS_BY_ID
+
+        Complexity:
+            Best Case Complexity: O(1) once built
+            Worst Case Complexity: O(n) where n is the number of cards in the deck, the first time
+        """
+        if self._template is None:
+            self._template = self._build()
+        return self._template
+
+    def _build(self) -> ArrayR[Card]:
+        """
+        Method to lay out the deck in the order Game.generate_cards() has always created it
+
+        Complexity:
+            Best Case Complexity: O(n) where n is the number of cards in the deck
+            Worst Case Complexity: O(n) where n is the number of cards in the deck
+        """
+        cards: ArrayR[Card] = ArrayR(self.size)
+        idx = 0
+        for _ in range(self.decks):
+            for color in CardColor:
+                if color != CardColor.CRAZY:
+                    for i in range(10):
+                        for _ in range(self.number_copies):
+                            cards[idx] = CARDS_BY_ID[color * Constants.NUM_MAX_VALS + i]
+                            idx += 1
+                    for _ in range(self.action_copies):
+                        for label in (CardLabel.SKIP, CardLabel.REVERSE, CardLabel.DRAW_TWO):
+                            cards[idx] = CARDS_BY_ID[color * Constants.NUM_MAX_VALS + label]
+                            idx += 1
+                else:
+                    # Crazy cards alternate with draw fours while both remain
+                    for i in range(max(self.crazy_copies, self.draw_four_copies)):
+                        if i < self.crazy_copies:
+                            cards[idx] = CARDS_BY_ID[color * Constants.NUM_MAX_VALS + CardLabel.CRAZY]
+                            idx += 1
+                        if i < self.draw_four_copies:
+                            cards[idx] = CARDS_BY_ID[color * Constants.NUM_MAX_VALS + CardLabel.DRAW_FOUR]
+                            idx += 1
+        return cards
+
+    def new_deck(self, rng) -> ArrayR[Card]:
+        """
+        Method to deal a shuffled copy of the template
+
+        Args:
+            rng: The random number generator to shuffle with, RandomGen or a RandomStream
+
+        Returns:
+            ArrayR[Card]: A new array holding the deck's cards in a random order
+
+        Complexity:
+            Best Case Complexity: O(n * log(n)) where n is the number of cards in the deck
+            Worst Case Complexity: O(n * log(n)) where n is the number of cards in the deck
+        """
+        cards: ArrayR[Card] = ArrayR(self.size)
+        cards.array[:] = self.template().array[:]
+        rng.random_shuffle(cards)
+        return cards
+
+
+def _card_id(card: Card) -> int:
+    """ Key of a card for count_keys. """
+    return card.id
+
+
+def composition(cards: ArrayR[Card]) -> ArrayR[int]:
+    """
+    Method to count the cards of a collection by id
+
+    Args:
+        cards (ArrayR[Card]): The cards to count
+
+    Returns:
+        ArrayR[int]: The number of cards with id i at index i
+
+    Complexity:
+        Best Case Complexity: O(n + c) where n is the number of cards and c the number of card ids
+        Worst Case Complexity: O(n + c) where n is the number of cards and c the number of card ids
+    """
+    return count_keys(cards, _card_id, len(CARDS_BY_ID))
+
+
+STANDARD_DECK = DeckSpec()
@@ -0,0 +1,172 @@
+"""
+Elimination games: instead of ending when the first player empties their hand, play goes on without them until
+only one player is left holding cards, and the players are ranked in the order they went out.
+
+Turn order is kept in a Ring of the players still in the game rather than in their positions, so finding the next
+player, reversing the direction of play and taking a player out of the game all cost O(1) whatever the size of the
+table, with no renumbering of positions or rebuilding of the players' sorted list. Players may also leave a game
+part way through with leave(), e.g. when they disconnect, and their cards go back to the piles.
+
+Only rules whose effects move play with next_player(), play_skip() and play_reverse() are supported, such as the
+standard and stacking rules. The 7-0 rules pass hands by position, which an elimination game does not keep up to
+date, and so do snapshots.
+"""
+from data_structures.referential_array import ArrayR
+from data_structures.ring import Ring, RingNode
+from deck import DeckSpec, STANDARD_DECK
+from game import Game
+from player import Player
+from rules import RuleSet, STANDARD_RULES
+
+
+class EliminationGame(Game):
+    """
+    Game played until one player is left holding cards
+    """
+
+    def __init__(self, deck_spec: DeckSpec = STANDARD_DECK, rules: RuleSet = STANDARD_RULES) -> None:
+        """
+        Constructor for the EliminationGame class
+
+        Args:
+            deck_spec (DeckSpec): The composition of the deck
+            rules (RuleSet): The effects of the cards, see the module docstring for those supported
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        Game.__init__(self, deck_spec, rules)
+        self.ring: Ring[Player] = Ring()
+        self.seats: ArrayR[RingNode[Player]] | None = None
+
+    def initialise_game(self, players: ArrayR[Player], cards_at_init: int | None = None) -> None:
+        """
+        Method to initialise the game, see Game.initialise_game(), and seat the players in turn order
+
+        Complexity:
+            Best Case Complexity: O(n + p * log(p)) where n is the number of cards and p is the number of players
+            Worst Case Complexity: O(n + p * log(p)) where n is the number of cards and p is the number of players
+        """
+        Game.initialise_game(self, players, cards_at_init)
+        self.ring = Ring()
+        self.seats = ArrayR(len(self.players))
+        # self.players is sorted by position, which is turn order at the start of the game. Positions are not
+        # changed afterwards, as play_reverse() reverses the ring instead, so they index the players' ring nodes
+        for player in self.players:
+            self.seats[player.position] = self.ring.append(player)
+
+    def next_player(self) -> Player:
+        """
+        Method to get the next player still in the game
+
+        Returns:
+            Player: The next player
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if self.current_player is None:
+            return self.ring.head.item
+        return self.ring.after(self.seats[self.current_player.position]).item
+
+    def play_reverse(self) -> None:
+        """
+        Method to play a reverse card
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.ring.reverse()
+        return None
+
+    def is_playing(self, player: Player) -> bool:
+        """
+        Method to check if a player is still in the game
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if self.seats is None or not 0 <= player.position < len(self.seats):
+            return False
+        node = self.seats[player.position]
+        return node.item is player and node.linked
+
+    def leave(self, player: Player) -> None:
+        """
+        Method to take a player out of the game. Any cards they hold are put back under the top card of the
+        discard pile. If it was their turn, play carries on with the player after them.
+
+        Args:
+            player (Player): A player still in the game
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the player is not in the game, or is the last player in it
+
+        Complexity:
+            Best Case Complexity: O(1) for a player without cards
+            Worst Case Complexity: O(h) where h is the number of cards in the player's hand
+        """
+        if not self.is_playing(player):
+            raise ValueError(f"Player {player.name} is not in the game")
+        if len(self.ring) == 1:
+            raise ValueError("The last player cannot leave the game")
+
+        node = self.seats[player.position]
+        # The player before them in turn order takes over their turn, so next_player() is the player after them
+        if player is self.current_player:
+            self.current_player = self.ring.before(node).item
+        self.ring.remove(node)
+
+        if len(player.hand) > 0:
+            top = self.discard_pile.peek()
+            self.discard_pile.pop()
+            while len(player.hand) > 0:
+                self.discard_pile.push(player.play_card(len(player.hand) - 1))
+            self.discard_pile.push(top)
+        return None
+
+    def play_elimination(self) -> ArrayR[Player]:
+        """
+        Method to play the game until one player is left holding cards
+
+        Returns:
+            ArrayR[Player]: The players still in the game when it started, in the order they went out, with the
+                player left holding cards last
+
+        Raises:
+            PilesExhausted: If a card must be drawn when there are none left, as in Game.play_game()
+
+        Complexity:
+            Best Case Complexity: O(p * (h + n)) where p is the number of players, h the number of cards in a hand
+                and n the number of cards in the draw pile, see Game.play_turn()
+            Worst Case Complexity: O(k * (h + n)) where k is the number of turns played
+        """
+        ranking: ArrayR[Player] = ArrayR(len(self.ring))
+        out = 0
+        while len(self.ring) > 1:
+            player = self.play_turn()
+            if player is not None:
+                self.leave(player)
+                ranking[out] = player
+                out += 1
+        ranking[out] = self.ring.head.item
+        return ranking
+
+    def snapshot(self) -> bytes:
+        """
+        Method overridden to refuse snapshots, whose positions an elimination game does not keep up to date
+
+        Raises:
+            NotImplementedError: Always
+        """
+        raise NotImplementedError("Elimination games cannot be snapshotted")
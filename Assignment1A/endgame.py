@@ -0,0 +1,539 @@
+"""
+Win probability estimator for end-game positions.
+
+Instead of simulating a game to completion, the position is evaluated by dynamic programming over a compact
+state: every hand as a sorted string of card ids, the number of each card id left in the draw pile, the top of
+the discard pile, the current color and label, the turn order and whose turn it was. Cards are drawn from the
+draw pile in proportion to how many of each are left, crazy cards pick each color with probability 1/4, and
+players play their first playable card like the default strategy.
+
+Values are memoised per state in a fixed-size table, in which a new entry replaces the one in its slot, and the
+table lives in the EndgameSolver so it is shared by every position evaluated with that solver. The search looks ahead through at most `horizon` random events (a card drawn or a color
+chosen). Positions that are not decided by then are scored by a heuristic in which each player's chance is
+proportional to the inverse of their hand size, counting cards they still have to draw.
+"""
+from data_structures.referential_array import ArrayR
+from card import CardColor, CardLabel
+from constants import Constants
+from game import Game
+from strategy import playable_ids
+
+NO_SEAT = Game.NO_SEAT
+NO_LABEL = Game.NO_LABEL
+
+# Kinds of state the evaluation can be in
+TURN = 0        # the next player is about to take their turn
+FORCED = 1      # the next player still has to draw some cards, then loses their turn
+COLOR = 2       # a crazy card has been played and its color is being chosen
+
+
+class EndgameState:
+    """
+    Compact, copyable description of a game position
+    """
+
+    def __init__(self, num_players: int) -> None:
+        """
+        Constructor for the EndgameState class, the fields are filled in by from_game() or copy()
+
+        Args:
+            num_players (int): Number of players
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(p) where p is the number of players
+            Worst Case Complexity: O(p) where p is the number of players
+        """
+        self.hands: ArrayR[bytes] = ArrayR(num_players)
+        self.positions = bytearray(num_players)
+        self.draw_counts = bytearray(Constants.NUM_COLORS * Constants.NUM_MAX_VALS)
+        self.draw_size = 0
+        self.top = 0
+        self.color = 0
+        self.label = NO_LABEL
+        self.current = NO_SEAT
+        self.phase = TURN
+        self.pending = 0
+        self.then_color = False
+
+    @classmethod
+    def from_game(cls, game: Game) -> 'EndgameState':
+        """
+        Method to describe a game between turns
+
+        Args:
+            game (Game): The game, with no turn in progress
+
+        Returns:
+            EndgameState: The description
+
+        Complexity:
+            Best Case Complexity: O(n + p) where n is the number of cards and p is the number of players
+            Worst Case Complexity: O(n + p) where n is the number of cards and p is the number of players
+        """
+        num_players = len(game.players)
+        state = cls(num_players)
+        for seat in range(num_players):
+            player = game.players[seat]
+            state.positions[seat] = player.position
+            hand = bytearray(len(player.hand))
+            for i in range(len(player.hand)):
+                hand[i] = player.hand[i].id
+            state.hands[seat] = bytes(hand)
+            if player is game.current_player:
+                state.current = seat
+        for i in range(len(game.draw_pile)):
+            state.draw_counts[game.draw_pile.array[i].id] += 1
+        state.draw_size = len(game.draw_pile)
+        state.top = game.discard_pile.peek().id
+        state.color = game.current_color
+        state.label = NO_LABEL if game.current_label is None else game.current_label
+        return state
+
+    def copy(self) -> 'EndgameState':
+        """
+        Method to copy the state, hands are immutable so they are shared
+
+        Complexity:
+            Best Case Complexity: O(p + c) where p is the number of players and c the number of card ids
+            Worst Case Complexity: O(p + c) where p is the number of players and c the number of card ids
+        """
+        other = EndgameState(len(self.hands))
+        for seat in range(len(self.hands)):
+            other.hands[seat] = self.hands[seat]
+        other.positions[:] = self.positions
+        other.draw_counts[:] = self.draw_counts
+        other.draw_size = self.draw_size
+        other.top = self.top
+        other.color = self.color
+        other.label = self.label
+        other.current = self.current
+        other.phase = self.phase
+        other.pending = self.pending
+        other.then_color = self.then_color
+        return other
+
+    def key(self, depth: int) -> bytes:
+        """
+        Method to encode the state and the remaining search depth, from 0 to 255, as a memo key
+
+        Complexity:
+            Best Case Complexity: O(h + p + c) where h is the total number of cards in hand
+            Worst Case Complexity: O(h + p + c) where h is the total number of cards in hand
+        """
+        data = bytearray((depth, self.phase, self.pending, self.then_color, self.current, self.color, self.label,
+                          self.top))
+        data += self.positions
+        for seat in range(len(self.hands)):
+            data.append(len(self.hands[seat]))
+            data += self.hands[seat]
+        data += self.draw_counts
+        return bytes(data)
+
+    def next_seat(self) -> int:
+        """
+        Method to get the seat of the next player, following Game.next_player()
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(p) where p is the number of players
+        """
+        target = 0 if self.current == NO_SEAT else (self.positions[self.current] + 1) % len(self.positions)
+        for seat in range(len(self.positions)):
+            if self.positions[seat] == target:
+                return seat
+        return NO_SEAT
+
+
+class _Memo:
+    """
+    Values of evaluated states, in a table indexed by the low bits of the hashes of their keys. A new entry
+    replaces the entry already in its slot, so the table never grows and never has to be cleared when it fills up.
+    """
+
+    def __init__(self, entries: int) -> None:
+        """
+        Constructor for the _Memo class
+
+        Args:
+            entries (int): Least number of slots
+
+        Complexity:
+            Best Case Complexity: O(m) where m is the number of slots
+            Worst Case Complexity: O(m) where m is the number of slots
+        """
+        size = 1 << (max(entries, 1) - 1).bit_length()
+        self.mask = size - 1
+        self.keys: ArrayR[bytes] = ArrayR(size)
+        self.values: ArrayR[tuple] = ArrayR(size)
+
+    def get(self, key: bytes) -> tuple | None:
+        """
+        Method to look up the values of a state
+
+        Args:
+            key (bytes): The key of the state, see EndgameState.key()
+
+        Returns:
+            tuple | None: The values, None if they are not in the table
+
+        Complexity:
+            Best Case Complexity: O(k) where k is the length of the key
+            Worst Case Complexity: O(k) where k is the length of the key
+        """
+        slot = hash(key) & self.mask
+        if self.keys[slot] == key:
+            return self.values[slot]
+        return None
+
+    def put(self, key: bytes, values: tuple) -> None:
+        """
+        Method to store the values of a state, replacing the entry in its slot
+
+        Complexity:
+            Best Case Complexity: O(k) where k is the length of the key
+            Worst Case Complexity: O(k) where k is the length of the key
+        """
+        slot = hash(key) & self.mask
+        self.keys[slot] = key
+        self.values[slot] = values
+
+
+class EndgameSolver:
+    """
+    Memoised evaluator of end-game positions
+    """
+
+    def __init__(self, horizon: int = 3, max_entries: int = 1 << 20) -> None:
+        """
+        Constructor for the EndgameSolver class
+
+        Args:
+            horizon (int): Number of random events looked ahead before falling back on the hand size heuristic
+            max_entries (int): Number of slots of the memo table, rounded up to a power of two
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If horizon is not from 0 to 255, the depths that fit in a memo key
+
+        Complexity:
+            Best Case Complexity: O(m) where m is max_entries
+            Worst Case Complexity: O(m) where m is max_entries
+        """
+        if not 0 <= horizon <= 255:
+            raise ValueError(f"horizon must be from 0 to 255, not {horizon}")
+        self.horizon = horizon
+        self.max_entries = max_entries
+        self.memo = _Memo(max_entries)
+        self.deck_counts = None
+        self.hits = 0
+        self.misses = 0
+
+    def win_probabilities(self, game: Game) -> ArrayR[float]:
+        """
+        Method to evaluate a position
+
+        Args:
+            game (Game): The game, with no turn in progress
+
+        Returns:
+            ArrayR[float]: The probability of each player winning, in the order of game.players. The probabilities
+                add up to less than 1 when the game can get stuck with no cards left to draw.
+
+        Complexity:
+            Best Case Complexity: O(n + p) when the position is already in the memo table
+            Worst Case Complexity: O(b^d) where b is the number of distinct cards that can be drawn and d the
+                horizon
+        """
+        state = EndgameState.from_game(game)
+        deck_counts = bytearray(state.draw_counts)
+        for seat in range(len(state.hands)):
+            for card_id in state.hands[seat]:
+                deck_counts[card_id] += 1
+        for i in range(len(game.discard_pile)):
+            deck_counts[game.discard_pile.array[i].id] += 1
+
+        # Values are only comparable between positions played with the same cards
+        if deck_counts != self.deck_counts:
+            if self.deck_counts is not None:
+                self.memo = _Memo(self.max_entries)
+            self.deck_counts = deck_counts
+
+        values = self._evaluate(state, self.horizon)
+        result: ArrayR[float] = ArrayR(len(values))
+        for seat in range(len(values)):
+            result[seat] = values[seat]
+        return result
+
+    def _evaluate(self, state: EndgameState, depth: int) -> tuple:
+        """
+        Method to compute the win probabilities of a state, using the memo table
+
+        Complexity:
+            Best Case Complexity: O(h + p + c) on a memo hit
+            Worst Case Complexity: O(b^d) see win_probabilities()
+        """
+        key = state.key(depth)
+        values = self.memo.get(key)
+        if values is not None:
+            self.hits += 1
+            return values
+        self.misses += 1
+
+        if depth == 0:
+            values = self._heuristic(state)
+        elif state.phase == TURN:
+            values = self._turn(state, depth)
+        elif state.phase == FORCED:
+            values = self._forced_draw(state, depth)
+        else:
+            values = self._choose_color(state, depth)
+
+        self.memo.put(key, values)
+        return values
+
+    def _turn(self, state: EndgameState, depth: int) -> tuple:
+        """
+        Method to evaluate the start of a turn, following Game.play_turn()
+
+        Complexity:
+            Best Case Complexity: O(h + p) where h is the number of cards in the current player's hand
+            Worst Case Complexity: O(b * ...) for a draw, see win_probabilities()
+        """
+        state = state.copy()
+        if state.draw_size == 0 and not self._recycle(state):
+            return self._stuck(state)
+        state.current = state.next_seat()
+
+        # The default strategy plays the first playable card of the sorted hand
+        ids = playable_ids(state.color, None if state.label == NO_LABEL else state.label)
+        hand = state.hands[state.current]
+        for i in range(len(hand)):
+            if (ids >> hand[i]) & 1:
+                state.hands[state.current] = hand[:i] + hand[i + 1:]
+                if len(hand) == 1:
+                    return self._win(state, state.current)
+                return self._play(state, hand[i], depth)
+
+        # Draw a card, play it if possible, otherwise keep it
+        total = 0.0
+        values = self._zeros(state)
+        for card_id in range(len(state.draw_counts)):
+            count = state.draw_counts[card_id]
+            if count:
+                drawn = state.copy()
+                drawn.draw_counts[card_id] -= 1
+                drawn.draw_size -= 1
+                if (ids >> card_id) & 1:
+                    outcome = self._play(drawn, card_id, depth - 1)
+                else:
+                    drawn.hands[drawn.current] = self._insert(hand, card_id)
+                    outcome = self._evaluate(drawn, depth - 1)
+                values = self._add(values, outcome, count)
+                total += count
+        return self._scale(values, 1 / total)
+
+    def _play(self, state: EndgameState, card_id: int, depth: int) -> tuple:
+        """
+        Method to put a card on the discard pile and apply its effects, following Game.special_card_play()
+
+        Complexity:
+            Best Case Complexity: O(p) where p is the number of players
+            Worst Case Complexity: O(b * ...) for the cards drawn, see win_probabilities()
+        """
+        state.top = card_id
+        color, label = card_id // Constants.NUM_MAX_VALS, card_id % Constants.NUM_MAX_VALS
+        state.color, state.label = color, label
+        state.phase = TURN
+
+        if label == CardLabel.REVERSE:
+            last = len(state.positions) - 1
+            for seat in range(len(state.positions)):
+                state.positions[seat] = last - state.positions[seat]
+        elif label == CardLabel.SKIP:
+            state.current = state.next_seat()
+        elif color == CardColor.CRAZY:
+            if label == CardLabel.DRAW_FOUR:
+                state.phase, state.pending, state.then_color = FORCED, 4, True
+            else:
+                state.phase = COLOR
+        elif label == CardLabel.DRAW_TWO:
+            state.phase, state.pending, state.then_color = FORCED, 2, False
+
+        return self._evaluate(state, depth)
+
+    def _forced_draw(self, state: EndgameState, depth: int) -> tuple:
+        """
+        Method to evaluate the next player drawing one of the cards they are forced to draw
+
+        Complexity:
+            Best Case Complexity: O(p + c) where c is the number of card ids
+            Worst Case Complexity: O(b * ...) see win_probabilities()
+        """
+        state = state.copy()
+        victim = state.next_seat()
+        if state.pending == 0:
+            # All cards drawn, the victim's turn is skipped
+            state.current = victim
+            state.phase = COLOR if state.then_color else TURN
+            return self._evaluate(state, depth)
+
+        if state.draw_size == 0 and not self._recycle(state):
+            return self._stuck(state)
+
+        state.pending -= 1
+        total = 0.0
+        values = self._zeros(state)
+        for card_id in range(len(state.draw_counts)):
+            count = state.draw_counts[card_id]
+            if count:
+                drawn = state.copy()
+                drawn.draw_counts[card_id] -= 1
+                drawn.draw_size -= 1
+                drawn.hands[victim] = self._insert(drawn.hands[victim], card_id)
+                values = self._add(values, self._evaluate(drawn, depth - 1), count)
+                total += count
+        return self._scale(values, 1 / total)
+
+    def _choose_color(self, state: EndgameState, depth: int) -> tuple:
+        """
+        Method to evaluate each of the colors a crazy card can pick, following Strategy.choose_color()
+
+        Complexity:
+            Best Case Complexity: O(p + c) where c is the number of card ids
+            Worst Case Complexity: O(4 * ...) see win_probabilities()
+        """
+        values = self._zeros(state)
+        for color in range(CardColor.CRAZY):
+            chosen = state.copy()
+            chosen.color, chosen.label, chosen.phase = color, NO_LABEL, TURN
+            values = self._add(values, self._evaluate(chosen, depth - 1), 1)
+        return self._scale(values, 1 / CardColor.CRAZY)
+
+    def _recycle(self, state: EndgameState) -> bool:
+        """
+        Method to turn the discard pile, except its top card, into the draw pile
+
+        Returns:
+            bool: False if there were no cards to recycle
+
+        Complexity:
+            Best Case Complexity: O(h + c) where h is the total number of cards in hand and c the number of card ids
+            Worst Case Complexity: O(h + c) where h is the total number of cards in hand and c the number of card ids
+        """
+        counts = bytearray(self.deck_counts)
+        for seat in range(len(state.hands)):
+            for card_id in state.hands[seat]:
+                counts[card_id] -= 1
+        counts[state.top] -= 1
+        size = 0
+        for card_id in range(len(counts)):
+            size += counts[card_id]
+        state.draw_counts[:] = counts
+        state.draw_size = size
+        return size > 0
+
+    def _heuristic(self, state: EndgameState) -> tuple:
+        """
+        Method to score a position at the horizon, each player's chance being proportional to 1 / hand size
+
+        Complexity:
+            Best Case Complexity: O(p) where p is the number of players
+            Worst Case Complexity: O(p) where p is the number of players
+        """
+        sizes = bytearray(len(state.hands))
+        for seat in range(len(state.hands)):
+            sizes[seat] = len(state.hands[seat])
+        if state.phase == FORCED:
+            sizes[state.next_seat()] += state.pending
+
+        total = 0.0
+        for seat in range(len(sizes)):
+            total += 1 / sizes[seat]
+        return tuple(1 / sizes[seat] / total for seat in range(len(sizes)))
+
+    @staticmethod
+    def _win(state: EndgameState, seat: int) -> tuple:
+        """ The values of a game won by the given seat. """
+        return tuple(1.0 if i == seat else 0.0 for i in range(len(state.hands)))
+
+    @staticmethod
+    def _stuck(state: EndgameState) -> tuple:
+        """ The values of a game that cannot continue as there are no cards left to draw. """
+        return EndgameSolver._zeros(state)
+
+    @staticmethod
+    def _zeros(state: EndgameState) -> tuple:
+        """ Values of zero for every player. """
+        return tuple(0.0 for _ in range(len(state.hands)))
+
+    @staticmethod
+    def _add(values: tuple, other: tuple, weight: float) -> tuple:
+        """ Adds weight * other to values. """
+        return tuple(values[i] + weight * other[i] for i in range(len(values)))
+
+    @staticmethod
+    def _scale(values: tuple, factor: float) -> tuple:
+        """ Multiplies values by factor. """
+        return tuple(value * factor for value in values)
+
+    @staticmethod
+    def _insert(hand: bytes, card_id: int) -> bytes:
+        """
+        Method to add a card id to a sorted hand
+
+        Complexity:
+            Best Case Complexity: O(h) where h is the number of cards in the hand
+            Worst Case Complexity: O(h) where h is the number of cards in the hand
+        """
+        i = 0
+        while i < len(hand) and hand[i] <= card_id:
+            i += 1
+        return hand[:i] + bytes((card_id,)) + hand[i:]
+
+
+def is_endgame(game: Game, max_hand: int = 2) -> bool:
+    """
+    Method to check whether a game has reached an end-game, where some player holds at most max_hand cards
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(p) where p is the number of players
+    """
+    for seat in range(len(game.players)):
+        if len(game.players[seat].hand) <= max_hand:
+            return True
+    return False
+
+
+def estimate_outcome(game: Game, solver: EndgameSolver, max_hand: int = 2) -> ArrayR[float]:
+    """
+    Method to play a game until it reaches an end-game, then evaluate it instead of playing it out
+
+    Args:
+        game (Game): The game to play, modified in place
+        solver (EndgameSolver): The solver whose memo table is used
+        max_hand (int): Hand size at which the end-game starts, see is_endgame()
+
+    Returns:
+        ArrayR[float]: The probability of each player winning, in the order of game.players
+
+    Complexity:
+        Best Case Complexity: O(k * (h + p + n)) for the turns played, see Game.play_game(), plus the evaluation
+        Worst Case Complexity: O(k * (h + p + n)) for the turns played, see Game.play_game(), plus the evaluation
+    """
+    winner = None
+    while winner is None and not is_endgame(game, max_hand):
+        winner = game.play_turn()
+
+    if winner is None:
+        return solver.win_probabilities(game)
+
+    result: ArrayR[float] = ArrayR(len(game.players))
+    for seat in range(len(game.players)):
+        result[seat] = 1.0 if game.players[seat] is winner else 0.0
+    return result
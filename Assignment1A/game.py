@@ -2,22 +2,37 @@ from data_structures.referential_array import ArrayR
 from data_structures.stack_adt import ArrayStack
 from data_structures.array_sorted_list import ArraySortedList
 from player import Player
-from card import CardColor, CardLabel, Card
-from random_gen import RandomGen
+from card import CardColor, CardLabel, Card, CARDS_BY_ID
+from random_gen import RandomGen, RandomStream
 from constants import Constants
+from deck import DeckSpec, STANDARD_DECK
+from rules import RuleSet, STANDARD_RULES
+from strategy import DEFAULT_STRATEGY, playable_ids, playable_mask
+
+
+class PilesExhausted(Exception):
+    """ Raised when a card must be drawn but the draw pile is empty and the discard pile holds only its top card. """
+    pass
 
 
 class Game:
     """
     Game class to play the game
     """
+    NO_SEAT = 255
+    NO_LABEL = 255
+    # Attributes pickled through the snapshot or explicitly by __getstate__()
+    _PICKLED = frozenset(("players", "draw_pile", "discard_pile", "current_player", "current_color",
+                          "current_label", "rng", "deck_spec", "rules"))
 
-    def __init__(self) -> None:
+    def __init__(self, deck_spec: DeckSpec = STANDARD_DECK, rules: RuleSet = STANDARD_RULES) -> None:
         """
         Constructor for the Game class
 
         Args:
             self
+            deck_spec (DeckSpec): The composition of the deck
+            rules (RuleSet): The effects of the cards
 
         Returns:
             None
@@ -32,6 +47,9 @@ class Game:
         self.current_player = None
         self.current_color = None
         self.current_label = None
+        self.rng = RandomGen
+        self.deck_spec = deck_spec
+        self.rules = rules
 
     def generate_cards(self) -> ArrayR[Card]:
         """
@@ -44,49 +62,20 @@ class Game:
             ArrayR[Card]: The array of Card objects generated
 
         Complexity:
-            Best Case Complexity: O(N) - Where N is the number of cards in the deck
-            Worst Case Complexity: O(N) - Where N is the number of cards in the deck
-        """
-        list_of_cards: ArrayR[Card] = ArrayR(Constants.DECK_SIZE)
-        idx: int = 0
-
-        for color in CardColor:
-            if color != CardColor.CRAZY:
-                # Generate 4 sets of cards from 0 to 9 for each color
-                for i in range(10):
-                    list_of_cards[idx] = Card(color, CardLabel(i))
-                    idx += 1
-                    list_of_cards[idx] = Card(color, CardLabel(i))
-                    idx += 1
-
-                # Generate 2 of each special card for each color
-                for i in range(2):
-                    list_of_cards[idx] = Card(color, CardLabel.SKIP)
-                    idx += 1
-                    list_of_cards[idx] = Card(color, CardLabel.REVERSE)
-                    idx += 1
-                    list_of_cards[idx] = Card(color, CardLabel.DRAW_TWO)
-                    idx += 1
-            else:
-                # Generate the crazy and crazy draw 4 cards
-                for i in range(4):
-                    list_of_cards[idx] = Card(CardColor.CRAZY, CardLabel.CRAZY)
-                    idx += 1
-                    list_of_cards[idx] = Card(CardColor.CRAZY, CardLabel.DRAW_FOUR)
-                    idx += 1
-
-                # Randomly shuffle the cards
-                RandomGen.random_shuffle(list_of_cards)
-
-                return list_of_cards
+            Best Case Complexity: O(N * log(N)) - Where N is the number of cards in the deck
+            Worst Case Complexity: O(N * log(N)) - Where N is the number of cards in the deck
+        """
+        # The deck is laid out once per composition, so only a copy of it is shuffled here
+        return self.deck_spec.new_deck(self.rng)
 
-    def initialise_game(self, players: ArrayR[Player]) -> None:
+    def initialise_game(self, players: ArrayR[Player], cards_at_init: int | None = None) -> None:
         """
         Method to initialise the game
 
         Args:
             self
             players (ArrayR[Player]): The array of players
+            cards_at_init (int | None): Cards dealt to every player, Constants.NUM_CARDS_AT_INIT if None
 
         Returns:
             None
@@ -96,34 +85,37 @@ class Game:
             Worst Case Complexity:  O(n + p * log(p)) where n is the number of cards and p is the number of players
         """
 
-        # Initialize an iterator to avoid creating a new array each time a card is transferred
-        index_iterator = 0
-        self.players = ArraySortedList(len(players))
-
         # Add players to the sorted list. A sorted list is used to simplify the play_reverse() method,
         # though it makes the next_player() method less straightforward.
+        self.players = ArraySortedList.from_array(players)
         for player in players:
-            self.players.add(player)
+            player.strategy.attach(self)
 
         # Generate the cards for the game
         generated_cards = self.generate_cards()
 
-        # Distribute cards to players. Use index_iterator to ensure each player receives cards in sequence.
-        for card_num in range(Constants.NUM_CARDS_AT_INIT):
-            for player in self.players:
-                card = generated_cards[index_iterator]
-                player.add_card(card)
-                index_iterator += 1
+        # Distribute cards to players. Cards are dealt one at a time around the table, so the i-th player
+        # receives every len(players)-th card starting at card i, and adds their whole hand at once.
+        num_players = len(self.players)
+        if cards_at_init is None:
+            cards_at_init = Constants.NUM_CARDS_AT_INIT
+        if cards_at_init > 0:
+            for i, player in enumerate(self.players):
+                dealt: ArrayR[Card] = ArrayR(cards_at_init)
+                for card_num in range(cards_at_init):
+                    dealt[card_num] = generated_cards[card_num * num_players + i]
+                player.add_cards(dealt)
+        index_iterator = cards_at_init * num_players
 
         # Initialize the draw pile as a stack, as we only need to access the top of the deck.
         self.draw_pile = ArrayStack(len(generated_cards))
 
         # Add the remaining cards to the draw pile
-        for card in generated_cards[index_iterator:]:
-            self.draw_pile.push(card)
+        for card_num in range(index_iterator, len(generated_cards)):
+            self.draw_pile.push(generated_cards[card_num])
 
         # Initialize discard pile and place the top card from the draw pile onto it.
-        self.discard_pile = ArrayStack(Constants.DECK_SIZE)
+        self.discard_pile = ArrayStack(self.deck_spec.size)
         self.discard_pile.push(self.draw_pile.peek())
         self.draw_pile.pop()
 
@@ -155,8 +147,12 @@ class Game:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(n + p) where n is the number of cards in the hand and p is the number of players
         """
+        # The player who played the card chooses the color, even if their turn has been moved on by the skip below
+        player = self.current_player
+        strategy = DEFAULT_STRATEGY if player is None else player.strategy
+
         # Check if the played card is a "DRAW_FOUR" card
-        if card.label.name == "DRAW_FOUR":
+        if card.label == CardLabel.DRAW_FOUR:
             # Identify the next player in sequence
             next_player = self.next_player()
 
@@ -167,8 +163,8 @@ class Game:
             # Skip the turn of the next player
             self.play_skip()
 
-        # Set the current color to a random value from CardColor
-        self.current_color = CardColor(RandomGen.randint(0, 3))
+        # Let the player's strategy choose the new color, by default a random value from CardColor
+        self.current_color = strategy.choose_color(player, self.rng)
 
         # Reset the current label to None, as you can only play a certain color onto the crazy card
         self.current_label = None
@@ -189,13 +185,15 @@ class Game:
             Best Case Complexity: O(p) where p is the number of players
             Worst Case Complexity: O(p) where p is the number of players
         """
+        last_position = len(self.players) - 1
+
         # Iterate through each player in the sorted list
         for player in self.players:
             # Update the player's position to reflect the reverse of the order
             # The new position is calculated by reversing the current position
             # Formula: (current_position - (total_players - 1)) * -1
             # e.g. current_pos = 0, total_players = 5  ||  (0 - (5-1)) * -1 = 4, and 4 is the last position
-            player.position = (player.position - ((len(self.players)) - 1)) * -1
+            player.position = (player.position - last_position) * -1
 
         return None
 
@@ -231,10 +229,19 @@ class Game:
         Returns:
             Card - When drawing a playable card, other return None
 
+        Raises:
+            PilesExhausted: If there is no card left to draw, even after recycling the discard pile
+
         Complexity:
             Best Case Complexity: O(log n) where n is the number of cards in the hand
             Worst Case Complexity: O(n) where n is the number of cards in the hand
         """
+        # Recycle the discard pile if an earlier draw this turn emptied the draw pile
+        if len(self.draw_pile) == 0:
+            self.shuffle_pile()
+            if len(self.draw_pile) == 0:
+                raise PilesExhausted("no cards left to draw")
+
         # get the top card from the draw pile
         card = self.draw_pile.peek()
 
@@ -244,7 +251,7 @@ class Game:
         # Check if the drawn card matches the current game conditions
         # Conditions: card color matches current color, or card label matches current label, or card is a "CRAZY" card
         # Also, ensure that the player is allowed to play (playing == True) (meaning it is not from a draw 2 or 4)
-        if (((self.current_color == card.color) or (self.current_label == card.label) or (card.color.name == "CRAZY"))
+        if (((self.current_color == card.color) or (self.current_label == card.label) or (card.color == CardColor.CRAZY))
                 and playing is True):
             # If conditions are met, return the drawn card
             return card
@@ -282,6 +289,179 @@ class Game:
                 if player.position == next_position:
                     return player  # Return the player with the next position as the next player
 
+    def special_card_play(self, card: Card) -> Player | None:
+        """
+        Method to apply the effect of a played card with the game's rules, implemented so there is no duplicate code
+
+        Args:
+            card (Card): The card to be played
+
+        Returns:
+            Player | None: A player who won while the effect was applied, which only some rule variants allow
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(n + p) where n is the number of cards in hand and p is the number of players,
+                for the standard rules
+        """
+        # Every label has its handler in the rule set's table, number cards map to a handler doing nothing
+        return self.rules.effects[card.label](self, card)
+
+    def shuffle_pile(self) -> None:
+        """
+        Method to shuffle the discard pile, and add the cards to the draw pile
+
+        Args:
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(n) where n is the number of cards in the discard pile
+            Worst Case Complexity: O(n) where n is the number of cards in the discard pile
+        """
+        # Peek at the top card of the discard pile and store it
+        top_of_discard_pile = self.discard_pile.peek()
+        self.discard_pile.pop()  # Remove the top card from the discard pile
+
+        # Nothing to shuffle if the top card was the only card in the discard pile
+        if len(self.discard_pile) == 0:
+            self.discard_pile.push(top_of_discard_pile)
+            return None
+
+        # Create a list to hold the remaining cards in the discard pile, sized to the cards so no empty
+        # slots are shuffled in with them
+        discard_pile_shuffle = ArrayR(len(self.discard_pile))
+
+        # Iterate over the discard pile and move all cards to the shuffle list
+        for idx in range(len(self.discard_pile)):
+            card = self.discard_pile.peek()  # Peek at the top card of the discard pile
+            self.discard_pile.pop()  # Remove the top card from the discard pile
+            discard_pile_shuffle[idx] = card  # Add the card to the shuffle list
+
+        # Randomly shuffle the cards in the discard pile
+        self.rng.random_shuffle(discard_pile_shuffle)
+
+        # Push the shuffled cards back onto the draw pile
+        for card in discard_pile_shuffle:
+            self.draw_pile.push(card)
+
+        # Push the original top card back onto the discard pile
+        self.discard_pile.push(top_of_discard_pile)
+
+        # Return None to conclude the function
+        return None
+
+    def play_card_object(self, card: Card) -> Player | None:
+        """
+        Method to put a card on the discard pile and apply its effects
+
+        Args:
+            card (Card): The card being played
+
+        Returns:
+            Player | None: A player who won while the effect was applied, see special_card_play()
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(n + p) where n is the number of cards in hand and p is the number of players
+        """
+        # Add the card to the discard pile and update the current color and label
+        self.discard_pile.push(card)
+        self.current_color, self.current_label = card.color, card.label
+
+        # Handle any special actions associated with the card
+        return self.special_card_play(card)
+
+    def play_from_hand(self, index: int) -> Player | None:
+        """
+        Method for the current player to play the card at the given index of their hand
+
+        Args:
+            index (int): The index of a playable card in the current player's hand
+
+        Returns:
+            Player: The current player if they have won by playing the card, or a player who won while its
+                effect was applied, None otherwise
+
+        Complexity:
+            Best Case Complexity: O(h) where h is the number of cards in the current player's hand
+            Worst Case Complexity: O(h + n + p) where n is the number of cards in the next player's hand
+                and p is the number of players
+        """
+        player = self.current_player
+        card_object = player.play_card(index)  # Play the selected card
+
+        # Check if the current player has no cards left, the card's effects still apply before the game ends
+        winner = player if len(player.hand) == 0 else None
+        effect_winner = self.play_card_object(card_object)
+        return effect_winner if winner is None else winner
+
+    def begin_turn(self) -> int:
+        """
+        Method to move play on to the next player and work out which of their cards can be played
+
+        Args:
+
+        Returns:
+            int: Bitmask with bit i set if the new current player's hand[i] is playable
+
+        Complexity:
+            Best Case Complexity: O(h + p) where 'p' is the number of players, 'h' is the number of cards in
+                the current player's hand
+            Worst Case Complexity: O(h + n + p) where 'n' is the number of cards in the discard_pile
+        """
+        # Check if the draw pile is empty and shuffle the discard pile back into the draw pile if needed
+        if len(self.draw_pile) == 0:
+            self.shuffle_pile()
+
+        self.current_player = self.next_player()  # Get the next player in the game
+        return playable_mask(self.current_player.hand, playable_ids(self.current_color, self.current_label))
+
+    def draw_turn(self) -> Player | None:
+        """
+        Method for the current player to draw a card when they have nothing to play, playing it if possible
+
+        Args:
+
+        Returns:
+            Player | None: A player who won while the effect of the played card was applied, see
+                special_card_play()
+
+        Complexity:
+            Best Case Complexity: O(log h) where 'h' is the number of cards in the current player's hand
+            Worst Case Complexity: O(h + n + p) where 'p' is the number of players, 'n' is the number of cards in
+                the discard_pile
+        """
+        card = self.draw_card(self.current_player, True)
+        if card is not None:
+            return self.play_card_object(card)
+        return None
+
+    def play_turn(self) -> Player | None:
+        """
+        Method to play a single turn for the next player
+
+        Args:
+
+        Returns:
+            Player: The winner if the turn ended the game, None otherwise
+
+        Complexity:
+            Best Case Complexity: O(h + p) where 'p' is the number of players, 'h' is the number of cards in
+                the current player's hand
+
+            Worst Case Complexity: O(h + n + p) where 'p' is the number of players, 'h' is the number of cards in
+                the current player's hand, 'n' is the number of cards in the discard_pile
+        """
+        # Let the current player's strategy pick one of their playable cards
+        mask = self.begin_turn()
+        if mask:
+            return self.play_from_hand(self.current_player.strategy.choose_card(self.current_player, mask))
+
+        # If no card can be played, the player draws a card and plays it if possible
+        return self.draw_turn()
+
     def play_game(self) -> Player:
         """
         Method to play the game
@@ -291,6 +471,10 @@ class Game:
         Returns:
             Player: The winner of the game
 
+        Raises:
+            PilesExhausted: If a card must be drawn when there are none left, see bounded.BoundedGame for a mode
+                that ends such games instead
+
         Complexity:
             Best Case Complexity: O(h + n + p) where 'p' is the number of players, 'h' is the number of cards in
                 the current player's hand, 'n' is the number of cards in the draw_pile
@@ -300,121 +484,250 @@ class Game:
                 iterations that the while loop executes until the winner is decided
         """
         winner = None
+        while winner is None:
+            winner = self.play_turn()
+        return winner
 
-        def special_card_play(card: Card) -> None:
-            """
-            Method to play any non-number card, implemented so there is no duplicate code
+    def snapshot(self, hands: bool = True) -> bytes:
+        """
+        Method to encode the state of the game as a compact byte string of card ids
 
-            Args:
-                card (Card): The card to be played
+        Layout: player count, current player's seat (NO_SEAT if None), current color, current label (NO_LABEL if
+        None), then for every seat in the order of self.players its position, hand size and hand card ids,
+        followed by the draw pile and the discard pile, each as a two byte size and card ids from bottom to top.
 
-            Returns:
-                None
+        Args:
+            hands (bool): False to leave the hands out, writing every hand size as 0, for a state restored with
+                players who still hold their cards
 
-            Complexity:
-                Best Case Complexity: O(1)
-                Worst Case Complexity: O(n + p) where n is the number of cards in hand and p is the number of players
-            """
-            if card.label.name == "REVERSE":
-                self.play_reverse()  # Call play_reverse to reverse the turn order
+        Returns:
+            bytes: The encoded state
+
+        Complexity:
+            Best Case Complexity: O(n + p) where n is the number of cards and p is the number of players
+            Worst Case Complexity: O(n + p) where n is the number of cards and p is the number of players
+        """
+        data = bytearray()
+        num_players = len(self.players)
+        seat = Game.NO_SEAT
+        for i in range(num_players):
+            if self.players[i] is self.current_player:
+                seat = i
+        data.append(num_players)
+        data.append(seat)
+        data.append(self.current_color)
+        data.append(Game.NO_LABEL if self.current_label is None else self.current_label)
+
+        for i in range(num_players):
+            player = self.players[i]
+            data.append(player.position)
+            if not hands:
+                data.append(0)
+                continue
+            data.append(len(player.hand))
+            items = player.hand.array.array
+            for j in range(len(player.hand)):
+                data.append(items[j].id)
+
+        Game._write_pile(data, self.draw_pile)
+        Game._write_pile(data, self.discard_pile)
+
+        return bytes(data)
+
+    @staticmethod
+    def _write_pile(data: bytearray, pile: ArrayStack[Card]) -> None:
+        """
+        Method to encode a pile as a two byte size followed by its card ids from bottom to top
 
-            # Check if the card label is "SKIP"
-            elif card.label.name == "SKIP":
-                self.play_skip()  # Call play_skip to skip the next player's turn
+        Args:
+            data (bytearray): The buffer to append to
+            pile (ArrayStack[Card]): The pile to encode
 
-            # Check if the card color is "CRAZY"
-            elif card.color.name == "CRAZY":
-                self.crazy_play(card)  # Call crazy_play to handle the effects of a crazy card
+        Returns:
+            None
 
-            # Check if the card label is "DRAW_TWO"
-            elif card.label.name == "DRAW_TWO":
-                next_player = self.next_player()  # Determine the next player
-                for _ in range(2):
-                    self.draw_card(next_player, False)  # Make the next player draw two cards
-                self.play_skip()  # Skip the next player's turn after they draw two cards
+        Complexity:
+            Best Case Complexity: O(n) where n is the number of cards in the pile
+            Worst Case Complexity: O(n) where n is the number of cards in the pile
+        """
+        data += len(pile).to_bytes(2, 'little')
+        items = pile.array.array
+        for j in range(len(pile)):
+            data.append(items[j].id)
+        return None
 
-            return None  # Return None at the end of the function
+    @classmethod
+    def from_snapshot(cls, data: bytes, players: ArrayR[Player] | None = None,
+                      deck_spec: DeckSpec = STANDARD_DECK, rules: RuleSet = STANDARD_RULES) -> 'Game':
+        """
+        Method to rebuild a game from a byte string produced by snapshot()
 
-        def shuffle_pile():
-            """
-            Method to shuffle the discard pile, and add the cards to the draw pile
+        Args:
+            data (bytes): The encoded state
+            players (ArrayR[Player] | None): The players to seat, in the order of the original game's players.
+                Their hands are replaced. If None, anonymous players using the default strategy are created.
+            deck_spec (DeckSpec): The composition of the original game's deck
+            rules (RuleSet): The effects of the cards in the original game
 
-            Args:
+        Returns:
+            Game: A new game in the encoded state, sharing the Card objects of CARDS_BY_ID
 
-            Returns:
-                None
+        Complexity:
+            Best Case Complexity: O(n + p * log(p)) where n is the number of cards and p is the number of players
+            Worst Case Complexity: O(n + p * log(p)) where n is the number of cards and p is the number of players
+        """
+        game = cls(deck_spec, rules)
+        game._restore(data, players)
+        return game
 
-            Complexity:
-                Best Case Complexity: O(n) where n is the number of cards in the discard pile
-                Worst Case Complexity: O(n) where n is the number of cards in the discard pile
-            """
-            # Peek at the top card of the discard pile and store it
-            top_of_discard_pile = self.discard_pile.peek()
-            self.discard_pile.pop()  # Remove the top card from the discard pile
+    def _restore(self, data: bytes, players: ArrayR[Player] | None, hands: bool = True) -> None:
+        """
+        Method to put the game in the state encoded by snapshot(), see from_snapshot()
 
-            # Create a list to hold the remaining cards in the discard pile
-            discard_pile_shuffle = ArrayR(Constants.DECK_SIZE)
+        Args:
+            data (bytes): The encoded state
+            players (ArrayR[Player] | None): The players to seat, anonymous players if None
+            hands (bool): False for a state encoded by snapshot(hands=False), the players keeping their hands
 
-            # Iterate over the discard pile and move all cards to the shuffle list
-            for idx in range(len(self.discard_pile)):
-                card = self.discard_pile.peek()  # Peek at the top card of the discard pile
-                self.discard_pile.pop()  # Remove the top card from the discard pile
-                discard_pile_shuffle[idx] = card  # Add the card to the shuffle list
+        Returns:
+            None
 
-            # Randomly shuffle the cards in the discard pile
-            RandomGen.random_shuffle(discard_pile_shuffle)
+        Complexity:
+            Best Case Complexity: O(n + p) where n is the number of cards and p is the number of players
+            Worst Case Complexity: O(n + p) where n is the number of cards and p is the number of players
+        """
+        num_players, seat = data[0], data[1]
+        self.current_color = CardColor(data[2])
+        self.current_label = None if data[3] == Game.NO_LABEL else CardLabel(data[3])
+        self.players = ArraySortedList(num_players)
+
+        offset = 4
+        in_hands = 0
+        for i in range(num_players):
+            player = Player(str(i), 0) if players is None else players[i]
+            player.position = data[offset]
+            size = data[offset + 1]
+            offset += 2
+            if not hands:
+                in_hands += len(player.hand)
+            else:
+                player.hand = ArraySortedList(max(Constants.NUM_MAX_VALS, size))
+                items = player.hand.array.array
+                for j in range(size):
+                    items[j] = CARDS_BY_ID[data[offset + j]]
+                player.hand.length = size
+                offset += size
+                in_hands += size
+            # Players are kept in seat order, which the sorted list cannot infer from positions after a reverse
+            self.players.array[i] = player
+            self.players.length += 1
+            if i == seat:
+                self.current_player = player
+
+        # Either pile may end up holding every card not in a hand
+        draw_size = int.from_bytes(data[offset:offset + 2], 'little')
+        discard_offset = offset + 2 + draw_size
+        capacity = in_hands + draw_size + int.from_bytes(data[discard_offset:discard_offset + 2], 'little')
+        self.draw_pile = Game._read_pile(data, offset, capacity)
+        self.discard_pile = Game._read_pile(data, discard_offset, capacity)
+        return None
 
-            # Push the shuffled cards back onto the draw pile
-            for card in discard_pile_shuffle:
-                self.draw_pile.push(card)
+    @staticmethod
+    def _read_pile(data: bytes, offset: int, capacity: int) -> ArrayStack[Card]:
+        """
+        Method to decode a pile written by snapshot()
 
-            # Push the original top card back onto the discard pile
-            self.discard_pile.push(top_of_discard_pile)
+        Args:
+            data (bytes): The encoded state
+            offset (int): The position of the pile's two byte size in data
+            capacity (int): The number of cards the pile must be able to hold
 
-            # Return None to conclude the function
-            return None
+        Returns:
+            ArrayStack[Card]: The decoded pile
 
-        while True:
-            # Check if the draw pile is empty and shuffle the discard pile back into the draw pile if needed
-            if len(self.draw_pile) == 0:
-                shuffle_pile()
-
-            card_played = False  # Flag to check if a card has been played in this turn
-            self.current_player = self.next_player()  # Get the next player in the game
-
-            # Loop through the current player's hand to find a playable card
-            for card in range(len(self.current_player.hand)):
-                if ((self.current_color == self.current_player.hand[card].color)
-                        or (self.current_label == self.current_player.hand[card].label)
-                        or (self.current_player.hand[card].color.name == "CRAZY")):
-                    card_played = True  # Mark that a card has been played
-                    card_object = self.current_player.play_card(card)  # Play the selected card
-
-                    # Check if the current player has no cards left and declare them as the winner
-                    if len(self.current_player.hand) == 0:
-                        winner = self.current_player
-
-                    # Add the played card to the discard pile and update the current color and label
-                    self.discard_pile.push(card_object)
-                    self.current_color, self.current_label = card_object.color, card_object.label
-
-                    # Handle any special actions associated with the played card
-                    special_card_play(card_object)
-                    break  # Exit the loop after playing a card
-
-            # If no card was played, the player draws a card
-            if card_played is False:
-                card = self.draw_card(self.current_player, True)
-                if card is not None:
-                    # Add the drawn card to the discard pile and update the current color and label
-                    self.discard_pile.push(card)
-                    self.current_color, self.current_label = card.color, card.label
-                    # Handle any special actions associated with the drawn card
-                    special_card_play(card)
-
-            # If there's a winner, return the winner and end the game
-            if winner is not None:
-                return winner
+        Complexity:
+            Best Case Complexity: O(n) where n is the number of cards in the pile
+            Worst Case Complexity: O(n) where n is the number of cards in the pile
+        """
+        size = int.from_bytes(data[offset:offset + 2], 'little')
+        offset += 2
+        pile = ArrayStack(capacity)
+        items = pile.array.array
+        for j in range(size):
+            items[j] = CARDS_BY_ID[data[offset + j]]
+        pile.length = size
+        return pile
+
+    def __getstate__(self) -> tuple:
+        """
+        Method to get the state pickled for the game: the players, who pickle their hands as card ids, a snapshot
+        of the rest of the table without the hands, the random number generator, deck and rules, and any
+        attributes added by subclasses. The hands are pickled with the players rather than in the snapshot so that
+        attributes of subclasses referring to the players unpickle as the same objects.
+
+        RandomGen keeps its seed in the class, which pickle does not copy, so a game drawing from RandomGen is
+        pickled with a RandomStream at RandomGen's current seed: the copy draws the numbers the original would
+        draw next, without moving RandomGen in the process it is unpickled in.
+
+        Returns:
+            tuple: The state, restored by __setstate__()
+
+        Complexity:
+            Best Case Complexity: O(n + p) where n is the number of cards and p is the number of players
+            Worst Case Complexity: O(n + p) where n is the number of cards and p is the number of players
+        """
+        extra = {}
+        for name, value in self.__dict__.items():
+            if name not in Game._PICKLED:
+                extra[name] = value
+        players = None if self.players is None else tuple(self.players)
+        data = None if self.players is None else self.snapshot(hands=False)
+        rng = RandomStream(RandomGen.seed) if self.rng is RandomGen else self.rng
+        return data, players, rng, self.deck_spec, self.rules, extra
+
+    def __setstate__(self, state: tuple) -> None:
+        """
+        Method to restore a game pickled with __getstate__(), sharing the Card objects of CARDS_BY_ID
+
+        Args:
+            state (tuple): The state returned by __getstate__()
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(n + p) where n is the number of cards and p is the number of players
+            Worst Case Complexity: O(n + p) where n is the number of cards and p is the number of players
+        """
+        data, players, rng, deck_spec, rules, extra = state
+        Game.__init__(self, deck_spec, rules)
+        if data is not None:
+            seated: ArrayR[Player] = ArrayR(len(players))
+            for i in range(len(players)):
+                seated[i] = players[i]
+            self._restore(data, seated, hands=False)
+        self.rng = rng
+        self.__dict__.update(extra)
+
+    def clone(self) -> 'Game':
+        """
+        Method to copy the game, with new players of the same names and strategies
+
+        Args:
+
+        Returns:
+            Game: An independent copy of the game sharing this game's random number generator
+
+        Complexity:
+            Best Case Complexity: O(n + p) where n is the number of cards and p is the number of players
+            Worst Case Complexity: O(n + p) where n is the number of cards and p is the number of players
+        """
+        players: ArrayR[Player] = ArrayR(len(self.players))
+        for i in range(len(self.players)):
+            players[i] = Player(self.players[i].name, 0, self.players[i].strategy)
+        game = Game.from_snapshot(self.snapshot(), players, self.deck_spec, self.rules)
+        game.rng = self.rng
+        return game
 
 
 def test_case():
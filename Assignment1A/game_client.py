@@ -0,0 +1,317 @@
+"""
+Client library for game_server, with pipelined requests and a pool of connections.
+"""
+import asyncio
+
+from data_structures.queue_adt import CircularQueue
+from data_structures.referential_array import ArrayR
+from game_server import NONE
+
+
+class ServerError(Exception):
+    """ Raised when the server answers a request with ERR, or the connection closes before it answers. """
+    pass
+
+
+class TurnResult:
+    """
+    Outcome of a PLAY or DRAW request
+    """
+
+    def __init__(self, winner: int, turn_seat: int, mask: int) -> None:
+        """
+        Constructor for the TurnResult class
+
+        Args:
+            winner (int): Seat of the winner, NONE while the game is running
+            turn_seat (int): Seat of the player whose turn it is now, NONE once the game is over
+            mask (int): Playable card bitmask of that player
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.winner = winner
+        self.turn_seat = turn_seat
+        self.mask = mask
+
+
+class TableState(TurnResult):
+    """
+    Outcome of a STATE request
+    """
+
+    def __init__(self, winner: int, turn_seat: int, mask: int, color: int, label: int, hand: ArrayR[int] | None) -> None:
+        """
+        Constructor for the TableState class
+
+        Args:
+            color (int): The current color
+            label (int): The current label, NONE after a crazy card
+            hand (ArrayR[int] | None): Card ids of the requested seat's hand, None if it is empty
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        TurnResult.__init__(self, winner, turn_seat, mask)
+        self.color = color
+        self.label = label
+        self.hand = hand
+
+
+class RemoteGameResult:
+    """
+    Outcome of a game played with play_remote_game()
+    """
+
+    def __init__(self, winner: int, moves: int) -> None:
+        """
+        Constructor for the RemoteGameResult class
+
+        Args:
+            winner (int): Seat of the winner
+            moves (int): Number of PLAY and DRAW requests made
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.winner = winner
+        self.moves = moves
+
+
+class GameClient:
+    """
+    One connection to a game server. Requests are written as soon as they are made and matched to responses in
+    order, so many requests can be in flight at once.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, max_in_flight: int = 64) -> None:
+        """
+        Constructor for the GameClient class, use connect() to open a connection
+
+        Args:
+            reader (asyncio.StreamReader): The connection's reader
+            writer (asyncio.StreamWriter): The connection's writer
+            max_in_flight (int): Maximum number of requests waiting for a response
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(m) where m is max_in_flight
+            Worst Case Complexity: O(m) where m is max_in_flight
+        """
+        self.reader = reader
+        self.writer = writer
+        self.pending = CircularQueue(max_in_flight)
+        self.slots = asyncio.Semaphore(max_in_flight)
+        self.next_id = 0
+        self.receiver = asyncio.get_running_loop().create_task(self._receive())
+
+    @classmethod
+    async def connect(cls, host: str = '127.0.0.1', port: int = 0, path: str | None = None,
+                      max_in_flight: int = 64) -> 'GameClient':
+        """ Opens a TCP connection, or a Unix socket connection if path is given. """
+        if path is None:
+            reader, writer = await asyncio.open_connection(host, port)
+        else:
+            reader, writer = await asyncio.open_unix_connection(path)
+        return cls(reader, writer, max_in_flight)
+
+    async def close(self) -> None:
+        """ Closes the connection, failing any requests still in flight. """
+        self.writer.close()
+        await self.receiver
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    async def _receive(self) -> None:
+        """
+        Method resolving the pending requests in order as their responses arrive, and failing those still
+        pending when the connection closes
+
+        Complexity:
+            Best Case Complexity: O(r) where r is the number of responses
+            Worst Case Complexity: O(r) where r is the number of responses
+        """
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                request_id, future = self.pending.serve()
+                self.slots.release()
+                parts = line.decode().split()
+                if parts[0] != request_id:
+                    future.set_exception(ServerError(f"response {parts[0]} does not match request {request_id}"))
+                elif parts[1] == "OK":
+                    future.set_result(parts[2:])
+                else:
+                    future.set_exception(ServerError(" ".join(parts[2:])))
+        except ConnectionError:
+            pass
+        finally:
+            while not self.pending.is_empty():
+                request_id, future = self.pending.serve()
+                self.slots.release()
+                if not future.done():
+                    future.set_exception(ServerError("connection closed"))
+
+    async def request(self, *args) -> list:
+        """
+        Method to send a request and wait for its results
+
+        Args:
+            args: The command and its arguments
+
+        Returns:
+            list: The result fields of the response
+
+        Raises:
+            ServerError: If the server could not carry out the request
+
+        Complexity:
+            Best Case Complexity: O(a) where a is the size of the request and response
+            Worst Case Complexity: O(a) where a is the size of the request and response
+        """
+        await self.slots.acquire()
+        # Once the receiver has stopped nothing would ever resolve the request
+        if self.receiver.done():
+            self.slots.release()
+            raise ServerError("connection closed")
+        request_id = str(self.next_id)
+        self.next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        # Queueing and writing happen together, so responses arrive in the order of the queue
+        self.pending.append((request_id, future))
+        self.writer.write((request_id + " " + " ".join(str(arg) for arg in args) + "\n").encode())
+        return await future
+
+    async def create_table(self, seats: int, seed: int) -> int:
+        """ Creates a table and returns its id. """
+        return int((await self.request("CREATE", seats, seed))[0])
+
+    async def join(self, table: int, name: str) -> int:
+        """ Joins a table and returns the seat. """
+        return int((await self.request("JOIN", table, name))[0])
+
+    async def state(self, table: int, seat: int) -> TableState:
+        """ Returns the state of a table as seen from a seat. """
+        fields = await self.request("STATE", table, seat)
+        hand = None
+        if fields[5] != "-":
+            ids = fields[5].split(",")
+            hand = ArrayR(len(ids))
+            for i in range(len(ids)):
+                hand[i] = int(ids[i])
+        return TableState(int(fields[4]), int(fields[0]), int(fields[3]), int(fields[1]), int(fields[2]), hand)
+
+    async def play(self, table: int, seat: int, index: int) -> TurnResult:
+        """ Plays the card at an index of the seat's hand. """
+        fields = await self.request("PLAY", table, seat, index)
+        return TurnResult(int(fields[0]), int(fields[1]), int(fields[2]))
+
+    async def draw(self, table: int, seat: int) -> TurnResult:
+        """ Draws a card for the seat, playing it if possible. """
+        fields = await self.request("DRAW", table, seat)
+        return TurnResult(int(fields[0]), int(fields[1]), int(fields[2]))
+
+
+class ClientPool:
+    """
+    A fixed set of connections to one server. Requests for a table always use the same connection, so that
+    pipelined requests for it are carried out in order.
+    """
+
+    def __init__(self, size: int, host: str = '127.0.0.1', port: int = 0, path: str | None = None,
+                 max_in_flight: int = 64) -> None:
+        """
+        Constructor for the ClientPool class, use open() to connect
+
+        Args:
+            size (int): Number of connections
+            host (str): Address of the server
+            port (int): Port of the server
+            path (str | None): Unix socket path of the server, used instead of TCP if given
+            max_in_flight (int): Maximum number of requests waiting for a response on each connection
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(s) where s is the number of connections
+            Worst Case Complexity: O(s) where s is the number of connections
+        """
+        self.clients: ArrayR[GameClient] = ArrayR(size)
+        self.host = host
+        self.port = port
+        self.path = path
+        self.max_in_flight = max_in_flight
+        self.next_client = 0
+
+    async def open(self) -> None:
+        """ Opens every connection. """
+        for i in range(len(self.clients)):
+            self.clients[i] = await GameClient.connect(self.host, self.port, self.path, self.max_in_flight)
+
+    async def close(self) -> None:
+        """ Closes every connection. """
+        for i in range(len(self.clients)):
+            await self.clients[i].close()
+
+    def client_for(self, table: int) -> GameClient:
+        """ Returns the connection used for a table. """
+        return self.clients[table % len(self.clients)]
+
+    async def create_table(self, seats: int, seed: int) -> int:
+        """ Creates a table, spreading the requests over the connections. """
+        client = self.clients[self.next_client]
+        self.next_client = (self.next_client + 1) % len(self.clients)
+        return await client.create_table(seats, seed)
+
+
+async def play_remote_game(pool: ClientPool, seats: int, seed: int) -> RemoteGameResult:
+    """
+    Method to create a table and play it to the end through the server, every seat playing its first playable
+    card like the default strategy
+
+    Args:
+        pool (ClientPool): The connections to use
+        seats (int): Number of players
+        seed (int): Seed for the table's random numbers
+
+    Returns:
+        RemoteGameResult: The winning seat and the number of moves made
+
+    Complexity:
+        Best Case Complexity: O(k) requests where k is the number of turns
+        Worst Case Complexity: O(k) requests where k is the number of turns
+    """
+    table = await pool.create_table(seats, seed)
+    client = pool.client_for(table)
+    # Joins are pipelined, and the seats are given out in the order the requests arrive
+    await asyncio.gather(*[client.join(table, str(seat)) for seat in range(seats)])
+
+    state: TurnResult = await client.state(table, 0)
+    moves = 0
+    while state.winner == NONE:
+        if state.mask:
+            state = await client.play(table, state.turn_seat, (state.mask & -state.mask).bit_length() - 1)
+        else:
+            state = await client.draw(table, state.turn_seat)
+        moves += 1
+
+    return RemoteGameResult(state.winner, moves)
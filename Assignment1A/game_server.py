@@ -0,0 +1,375 @@
+"""
+Local game server exposing Game over a line based socket protocol (TCP or Unix socket, stdlib asyncio only).
+
+Every request is one line `<request id> <command> <arguments...>` and gets one response line, in request order,
+`<request id> OK <results...>` or `<request id> ERR <message>`. Clients may send many requests before reading
+the responses (pipelining), and a connection can act on any number of tables.
+
+Commands:
+    CREATE <seats> <seed>           -> <table>
+    JOIN <table> <name>             -> <seat>               the game starts when the last seat is taken
+    STATE <table> <seat>            -> <turn seat> <color> <label> <mask> <winner> <hand>
+    PLAY <table> <seat> <index>     -> <winner> <turn seat> <mask>
+    DRAW <table> <seat>             -> <winner> <turn seat> <mask>
+
+<label> is -1 when there is no current label, <winner> is -1 while the game is running, <mask> is the playable
+card bitmask of the player whose turn it is and <hand> the comma separated card ids of the requested seat's hand
+(or - when empty). A player with a zero mask must DRAW.
+"""
+import asyncio
+
+from data_structures.referential_array import ArrayR
+from arena import new_table
+from constants import Constants
+from deck import STANDARD_DECK
+from game import Game, PilesExhausted
+from player import Player
+
+NONE = -1
+
+
+class ProtocolError(Exception):
+    """ Raised for requests that cannot be carried out, and reported to the client as an ERR response. """
+    pass
+
+
+class Table:
+    """
+    A game being played through the server, with the players that have joined it so far
+    """
+
+    def __init__(self, seats: int, seed: int) -> None:
+        """
+        Constructor for the Table class
+
+        Args:
+            seats (int): Number of players at the table
+            seed (int): Seed for the table's random numbers
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(p) where p is the number of seats
+            Worst Case Complexity: O(p) where p is the number of seats
+        """
+        self.seed = seed
+        self.players: ArrayR[Player] = ArrayR(seats)
+        self.joined = 0
+        self.game: Game | None = None
+        self.mask = 0
+        self.winner = NONE
+        self.exhausted = False
+
+    def join(self, name: str) -> int:
+        """
+        Method to seat a player, starting the game once every seat is taken
+
+        Args:
+            name (str): The name of the player
+
+        Returns:
+            int: The seat of the player
+
+        Raises:
+            ProtocolError: If every seat is taken
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(n + p * log(p)) when the game starts
+        """
+        if self.joined == len(self.players):
+            raise ProtocolError("table is full")
+        seat = self.joined
+        self.players[seat] = Player(name, seat)
+        if seat + 1 == len(self.players):
+            game = new_table(self.players, self.seed)
+            self.mask = game.begin_turn()
+            self.game = game
+        # The seat is only taken once the game has been dealt, so a failed deal leaves it free
+        self.joined = seat + 1
+        return seat
+
+    def turn_seat(self) -> int:
+        """
+        Method to get the seat of the player whose turn it is
+
+        Returns:
+            int: The seat, NONE if the game has not started
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(p) where p is the number of seats
+        """
+        if self.game is None:
+            return NONE
+        return self._seat_of(self.game.current_player)
+
+    def _seat_of(self, player: Player) -> int:
+        """
+        Method to find the seat of a player, positions change when the direction of play is reversed
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(p) where p is the number of seats
+        """
+        for seat in range(len(self.players)):
+            if self.players[seat] is player:
+                return seat
+        return NONE
+
+    def check_turn(self, seat: int) -> None:
+        """
+        Method to check that the game is running and it is the given seat's turn
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(p) where p is the number of seats
+        """
+        if self.game is None:
+            raise ProtocolError("game has not started")
+        if self.winner != NONE:
+            raise ProtocolError("game is over")
+        if self.exhausted:
+            raise ProtocolError("no cards left to draw")
+        if self.turn_seat() != seat:
+            raise ProtocolError("not your turn")
+
+    def play(self, seat: int, index: int) -> None:
+        """
+        Method for the given seat to play the card at an index of their hand, then move to the next turn
+
+        Complexity:
+            Best Case Complexity: O(h + p) where h is the number of cards in the hand, p the number of players
+            Worst Case Complexity: O(h + n + p) where n is the number of cards in the discard pile
+        """
+        self.check_turn(seat)
+        if index < 0 or not (self.mask >> index) & 1:
+            raise ProtocolError("card is not playable")
+        try:
+            self.end_turn(self.game.play_from_hand(index))
+        except PilesExhausted:
+            self.exhausted = True
+            raise ProtocolError("no cards left to draw")
+
+    def draw(self, seat: int) -> None:
+        """
+        Method for the given seat to draw a card, playing it if possible, then move to the next turn
+
+        Complexity:
+            Best Case Complexity: O(h + p) where h is the number of cards in the hand, p the number of players
+            Worst Case Complexity: O(h + n + p) where n is the number of cards in the discard pile
+        """
+        self.check_turn(seat)
+        if self.mask:
+            raise ProtocolError("a card can be played")
+        try:
+            self.end_turn(self.game.draw_turn())
+        except PilesExhausted:
+            self.exhausted = True
+            raise ProtocolError("no cards left to draw")
+
+    def end_turn(self, winner: Player | None) -> None:
+        """
+        Method to record the winner or start the next player's turn
+
+        Complexity:
+            Best Case Complexity: O(p) where p is the number of players
+            Worst Case Complexity: O(h + n + p) see Game.begin_turn()
+        """
+        if winner is not None:
+            self.winner = self._seat_of(winner)
+            self.mask = 0
+        else:
+            self.mask = self.game.begin_turn()
+
+
+class GameServer:
+    """
+    Serves tables to any number of connections
+    """
+    MIN_CAPACITY = 16
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, path: str | None = None) -> None:
+        """
+        Constructor for the GameServer class
+
+        Args:
+            host (str): Address to listen on for TCP connections
+            port (int): Port to listen on, 0 to pick a free one
+            path (str | None): Unix socket path to listen on instead of TCP
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.host = host
+        self.port = port
+        self.path = path
+        self.tables: ArrayR[Table] = ArrayR(self.MIN_CAPACITY)
+        self.num_tables = 0
+        self.server = None
+
+    async def start(self) -> None:
+        """ Starts listening. The chosen port is stored in self.port. """
+        if self.path is None:
+            self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+            self.port = self.server.sockets[0].getsockname()[1]
+        else:
+            self.server = await asyncio.start_unix_server(self.handle_connection, self.path)
+
+    async def close(self) -> None:
+        """ Stops listening and waits for the server to shut down. """
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Method to answer the requests of one connection in order until it is closed
+
+        Complexity:
+            Best Case Complexity: O(r) where r is the number of requests, plus the cost of each request
+            Worst Case Complexity: O(r) where r is the number of requests, plus the cost of each request
+        """
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                writer.write(self.handle_line(line))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def handle_line(self, line: bytes) -> bytes:
+        """
+        Method to carry out one request line and encode its response line
+
+        Args:
+            line (bytes): The request
+
+        Returns:
+            bytes: The response
+
+        Complexity:
+            Best Case Complexity: O(1) plus the cost of the command
+            Worst Case Complexity: O(1) plus the cost of the command
+        """
+        parts = line.split()
+        if len(parts) < 2:
+            return b'- ERR malformed request\n'
+        request_id = parts[0].decode()
+        try:
+            result = self.handle_command(parts[1].decode(), parts)
+        except ProtocolError as e:
+            return f"{request_id} ERR {e}\n".encode()
+        except (ValueError, IndexError):
+            return f"{request_id} ERR bad arguments\n".encode()
+        except Exception as e:
+            # Any other failure of the engine is reported like a refused request, so the connection and the
+            # requests pipelined behind this one carry on
+            return f"{request_id} ERR internal error: {type(e).__name__}\n".encode()
+        return f"{request_id} OK {result}\n".encode()
+
+    def handle_command(self, command: str, parts) -> str:
+        """
+        Method to carry out one command
+
+        Args:
+            command (str): The command name
+            parts: The split request line, arguments start at index 2
+
+        Returns:
+            str: The results of the command
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(h + n + p) see Table.play()
+        """
+        if command == "CREATE":
+            return str(self.create_table(int(parts[2]), int(parts[3])))
+        if command == "JOIN":
+            return str(self.get_table(int(parts[2])).join(parts[3].decode()))
+
+        table = self.get_table(int(parts[2]))
+        seat = int(parts[3])
+        if command == "STATE":
+            return self.encode_state(table, seat)
+        if command == "PLAY":
+            table.play(seat, int(parts[4]))
+        elif command == "DRAW":
+            table.draw(seat)
+        else:
+            raise ProtocolError(f"unknown command {command}")
+        return f"{table.winner} {table.turn_seat() if table.winner == NONE else NONE} {table.mask}"
+
+    def create_table(self, seats: int, seed: int) -> int:
+        """
+        Method to create a table
+
+        Args:
+            seats (int): Number of players at the table
+            seed (int): Seed for the table's random numbers
+
+        Returns:
+            int: The id of the table
+
+        Raises:
+            ProtocolError: If the number of seats is below 2, above Constants.MAX_PLAYERS or more than the deck
+                can deal to
+
+        Complexity:
+            Best Case Complexity: O(p) where p is the number of seats
+            Worst Case Complexity: O(t + p) where t is the number of tables, when the table array is resized
+        """
+        if seats < 2:
+            raise ProtocolError("a table needs at least 2 seats")
+        if seats > Constants.MAX_PLAYERS:
+            raise ProtocolError(f"a table has at most {Constants.MAX_PLAYERS} seats")
+        if not STANDARD_DECK.can_deal(seats, Constants.NUM_CARDS_AT_INIT):
+            raise ProtocolError("the deck is too small to deal to every seat")
+        if self.num_tables == len(self.tables):
+            new_tables = ArrayR(2 * len(self.tables))
+            for i in range(self.num_tables):
+                new_tables[i] = self.tables[i]
+            self.tables = new_tables
+        self.tables[self.num_tables] = Table(seats, seed)
+        self.num_tables += 1
+        return self.num_tables - 1
+
+    def get_table(self, table_id: int) -> Table:
+        """
+        Method to look up a table by id
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if not 0 <= table_id < self.num_tables:
+            raise ProtocolError("no such table")
+        return self.tables[table_id]
+
+    @staticmethod
+    def encode_state(table: Table, seat: int) -> str:
+        """
+        Method to describe a table as seen from a seat
+
+        Complexity:
+            Best Case Complexity: O(h + p) where h is the number of cards in the seat's hand
+            Worst Case Complexity: O(h + p) where h is the number of cards in the seat's hand
+        """
+        game = table.game
+        if game is None:
+            raise ProtocolError("game has not started")
+        if not 0 <= seat < len(table.players):
+            raise ProtocolError("no such seat")
+        hand = table.players[seat].hand
+        ids = ",".join(str(hand[i].id) for i in range(len(hand))) or "-"
+        label = NONE if game.current_label is None else int(game.current_label)
+        turn = table.turn_seat() if table.winner == NONE else NONE
+        return f"{turn} {int(game.current_color)} {label} {table.mask} {table.winner} {ids}"
@@ -0,0 +1,458 @@
+"""
+Elo rating ladder for ranking strategies (or any other entrants) by the games they win.
+
+Ratings are updated after every game from the ratings before it, so standings never have to be recomputed from
+the history of results. The leaderboard is an ArraySortedList of Rating entries, best first. After an update the
+changed entries are found by binary search and moved only past the entries they overtake, so re-ranking costs
+O(log n + d) for an entry moving d places instead of O(n) for a delete and insert.
+
+A game with several players counts as the winner beating each other player, with the K factor shared out over
+those pairwise results so a game moves the winner's rating as much as a two player game would.
+"""
+from data_structures.array_list import ArrayList
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.referential_array import ArrayR
+from player import Player
+
+INITIAL_RATING = 1500.0
+K_FACTOR = 32.0
+
+
+class Rating:
+    """
+    An entrant's rating. Ratings order best first, entrants with equal ratings by name.
+    """
+
+    def __init__(self, name: str, rating: float = INITIAL_RATING, games: int = 0) -> None:
+        """
+        Constructor for the Rating class
+
+        Args:
+            name (str): The entrant's name, unique in a ladder
+            rating (float): The entrant's rating
+            games (int): Number of games the entrant has played
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.name = name
+        self.rating = rating
+        self.games = games
+
+    def __lt__(self, other: 'Rating') -> bool:
+        """
+        Method to check if this entrant ranks above the other
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.rating > other.rating or (self.rating == other.rating and self.name < other.name)
+
+    def __gt__(self, other: 'Rating') -> bool:
+        """
+        Method to check if this entrant ranks below the other
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return other < self
+
+    def __le__(self, other: 'Rating') -> bool:
+        """
+        Method to check if this entrant ranks above the other or is the other
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return not other < self
+
+    def __str__(self) -> str:
+        """
+        Method to return a string when print(Rating) is called
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return f"{self.name} {self.rating:.1f} ({self.games} games)"
+
+
+class _Keyed:
+    """
+    A value filed under a string key, for the ladder's name and checkpoint indexes. Entries order by key only.
+    """
+
+    def __init__(self, key: str, value=None) -> None:
+        """
+        Constructor for the _Keyed class
+
+        Args:
+            key (str): The key the value is filed under, unique in an index
+            value: The value, None for an entry only used to search an index
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.key = key
+        self.value = value
+
+    def __eq__(self, other: '_Keyed') -> bool:
+        """
+        Method to check if this entry has the same key as the other
+
+        Complexity:
+            Best Case Complexity: O(1) for keys of bounded length
+            Worst Case Complexity: O(1) for keys of bounded length
+        """
+        return self.key == other.key
+
+    def __lt__(self, other: '_Keyed') -> bool:
+        """
+        Method to check if this entry files before the other
+
+        Complexity:
+            Best Case Complexity: O(1) for keys of bounded length
+            Worst Case Complexity: O(1) for keys of bounded length
+        """
+        return self.key < other.key
+
+    def __le__(self, other: '_Keyed') -> bool:
+        """
+        Method to check if this entry files before the other or under the same key
+
+        Complexity:
+            Best Case Complexity: O(1) for keys of bounded length
+            Worst Case Complexity: O(1) for keys of bounded length
+        """
+        return self.key <= other.key
+
+    def __gt__(self, other: '_Keyed') -> bool:
+        """
+        Method to check if this entry files after the other
+
+        Complexity:
+            Best Case Complexity: O(1) for keys of bounded length
+            Worst Case Complexity: O(1) for keys of bounded length
+        """
+        return self.key > other.key
+
+
+def _lookup(index: ArraySortedList[_Keyed], key: str):
+    """
+    Method to find the value filed under a key by binary search
+
+    Args:
+        index (ArraySortedList[_Keyed]): The index to search
+        key (str): The key to look for
+
+    Returns:
+        The value filed under the key, None if there is none
+
+    Complexity:
+        Best Case Complexity: O(1) when the key is in the middle of the index
+        Worst Case Complexity: O(log n) where n is the length of the index
+    """
+    try:
+        return index[index.index(_Keyed(key))].value
+    except ValueError:
+        return None
+
+
+def expected_score(rating: float, opponent: float) -> float:
+    """
+    Method to get the expected score of a player against an opponent under the Elo model
+
+    Args:
+        rating (float): The player's rating
+        opponent (float): The opponent's rating
+
+    Returns:
+        float: The probability of the player winning, between 0 and 1
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    return 1.0 / (1.0 + 10.0 ** ((opponent - rating) / 400.0))
+
+
+class Ladder:
+    """
+    Leaderboard of entrants kept in rank order as game results come in
+    """
+
+    def __init__(self, k_factor: float = K_FACTOR, initial_rating: float = INITIAL_RATING) -> None:
+        """
+        Constructor for the Ladder class
+
+        Args:
+            k_factor (float): Largest change of rating a game can make
+            initial_rating (float): Rating of new entrants
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.k_factor = k_factor
+        self.initial_rating = initial_rating
+        self.standings: ArraySortedList[Rating] = ArraySortedList(1)
+        self.entrants: ArraySortedList[_Keyed] = ArraySortedList(1)
+        self.games = 0
+        self.checkpoints: ArraySortedList[_Keyed] = ArraySortedList(1)
+
+    def __len__(self) -> int:
+        """
+        Method to get the number of entrants
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return len(self.standings)
+
+    def entrant(self, name: str) -> Rating:
+        """
+        Method to get an entrant's rating, adding them to the ladder first if they are new
+
+        Args:
+            name (str): The entrant's name
+
+        Returns:
+            Rating: The entrant's rating, which must not be changed directly
+
+        Complexity:
+            Best Case Complexity: O(log n) for a known entrant, where n is the number of entrants
+            Worst Case Complexity: O(n) where n is the number of entrants, to insert a new entrant
+        """
+        entry = _lookup(self.entrants, name)
+        if entry is None:
+            entry = Rating(name, self.initial_rating)
+            self.entrants.add(_Keyed(name, entry))
+            self.standings.add(entry)
+        return entry
+
+    def rank(self, name: str) -> int:
+        """
+        Method to get an entrant's place on the ladder
+
+        Args:
+            name (str): The entrant's name
+
+        Returns:
+            int: The entrant's place, 0 for the best rated
+
+        Raises:
+            KeyError: If the entrant is not on the ladder
+
+        Complexity:
+            Best Case Complexity: O(log n) where n is the number of entrants
+            Worst Case Complexity: O(log n) where n is the number of entrants
+        """
+        entry = _lookup(self.entrants, name)
+        if entry is None:
+            raise KeyError(name)
+        return self.standings.index(entry)
+
+    def record(self, winner: str, losers) -> None:
+        """
+        Method to update the ratings after a game, as the winner beating every loser. New entrants are added.
+
+        Args:
+            winner (str): Name of the winner
+            losers: Names of the other players of the game, any iterable
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(p * log n) where p is the number of players and n the number of entrants
+            Worst Case Complexity: O(p * n) when the players move across the whole ladder
+        """
+        winning = self.entrant(winner)
+        losing: ArrayList[Rating] = ArrayList()
+        for name in losers:
+            losing.append(self.entrant(name))
+        count = len(losing)
+        if count == 0:
+            return
+        k = self.k_factor / count
+
+        # Every change is worked out from the ratings before the game, the winner's last
+        changed: ArrayR[Rating] = ArrayR(count + 1)
+        ratings: ArrayR[float] = ArrayR(count + 1)
+        gained = 0.0
+        for i in range(count):
+            entry = losing[i]
+            change = k * (1.0 - expected_score(winning.rating, entry.rating))
+            gained += change
+            changed[i] = entry
+            ratings[i] = entry.rating - change
+        changed[count] = winning
+        ratings[count] = winning.rating + gained
+
+        for i in range(count + 1):
+            entry = changed[i]
+            self._rerate(entry, ratings[i])
+            entry.games += 1
+        self.games += 1
+
+    def record_table(self, players: ArrayR[Player], winner: Player) -> None:
+        """
+        Method to update the ratings after a game of the Game class, with the players' names as entrants
+
+        Args:
+            players (ArrayR[Player]): The players of the game
+            winner (Player): The winner of the game
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(p * log n) where p is the number of players and n the number of entrants
+            Worst Case Complexity: O(p * n) when the players move across the whole ladder
+        """
+        count = 0
+        for player in players:
+            if player is not winner:
+                count += 1
+        losers: ArrayR[str] = ArrayR(max(1, count))
+        count = 0
+        for player in players:
+            if player is not winner:
+                losers[count] = player.name
+                count += 1
+        self.record(winner.name, losers if count > 0 else ())
+
+    def _rerate(self, entry: Rating, rating: float) -> None:
+        """
+        Method to change an entrant's rating and move them to their new place
+
+        Complexity:
+            Best Case Complexity: O(log n) where n is the number of entrants, if the entrant keeps their place
+            Worst Case Complexity: O(log n + d) where d is the number of places the entrant moves
+        """
+        standings = self.standings
+        items = standings.array
+        index = standings.index(entry)
+        entry.rating = rating
+        # Shift the entries the entrant overtakes (or falls behind) by one place, then put the entrant in the gap
+        while index > 0 and entry < items[index - 1]:
+            items[index] = items[index - 1]
+            index -= 1
+        while index < len(standings) - 1 and items[index + 1] < entry:
+            items[index] = items[index + 1]
+            index += 1
+        items[index] = entry
+
+    def top(self, count: int) -> ArrayR[Rating]:
+        """
+        Method to get the best rated entrants
+
+        Args:
+            count (int): Number of entrants wanted
+
+        Returns:
+            ArrayR[Rating]: The best min(count, number of entrants) entrants, best first
+
+        Complexity:
+            Best Case Complexity: O(c) where c is count
+            Worst Case Complexity: O(c) where c is count
+        """
+        count = min(count, len(self.standings))
+        leaders: ArrayR[Rating] = ArrayR(max(1, count))
+        for i in range(count):
+            leaders[i] = self.standings[i]
+        return leaders
+
+    def snapshot(self) -> tuple[tuple[str, float, int], ...]:
+        """
+        Method to copy the ladder's standings
+
+        Returns:
+            tuple[tuple[str, float, int], ...]: The name, rating and number of games of every entrant, best first
+
+        Complexity:
+            Best Case Complexity: O(n) where n is the number of entrants
+            Worst Case Complexity: O(n) where n is the number of entrants
+        """
+        return tuple((entry.name, entry.rating, entry.games) for entry in self.standings)
+
+    def checkpoint(self, label: str) -> None:
+        """
+        Method to keep a snapshot of the standings under a label, replacing any earlier one with that label
+
+        Complexity:
+            Best Case Complexity: O(n + log c) where n is the number of entrants and c the number of checkpoints
+            Worst Case Complexity: O(n + c) where n is the number of entrants and c the number of checkpoints
+        """
+        kept = _Keyed(label, self.snapshot())
+        try:
+            self.checkpoints[self.checkpoints.index(kept)].value = kept.value
+        except ValueError:
+            self.checkpoints.add(kept)
+
+    def checkpointed(self, label: str) -> tuple[tuple[str, float, int], ...]:
+        """
+        Method to get the snapshot kept under a label
+
+        Args:
+            label (str): The label given to checkpoint()
+
+        Returns:
+            tuple[tuple[str, float, int], ...]: The standings when the checkpoint was made
+
+        Raises:
+            KeyError: If there is no checkpoint with the label
+
+        Complexity:
+            Best Case Complexity: O(1) when the label is in the middle of the checkpoints
+            Worst Case Complexity: O(log c) where c is the number of checkpoints
+        """
+        snapshot = _lookup(self.checkpoints, label)
+        if snapshot is None:
+            raise KeyError(label)
+        return snapshot
+
+    @classmethod
+    def from_snapshot(cls, snapshot: tuple[tuple[str, float, int], ...], k_factor: float = K_FACTOR,
+                      initial_rating: float = INITIAL_RATING) -> 'Ladder':
+        """
+        Method to rebuild a ladder from a snapshot
+
+        Args:
+            snapshot (tuple[tuple[str, float, int], ...]): Standings returned by snapshot()
+            k_factor (float): Largest change of rating a game can make
+            initial_rating (float): Rating of new entrants
+
+        Returns:
+            Ladder: A new ladder with the snapshot's standings
+
+        Complexity:
+            Best Case Complexity: O(n) where n is the number of entrants
+            Worst Case Complexity: O(n * log n) where n is the number of entrants
+        """
+        ladder = cls(k_factor, initial_rating)
+        entries: ArrayR[Rating] = ArrayR(max(1, len(snapshot)))
+        names: ArrayR[_Keyed] = ArrayR(max(1, len(snapshot)))
+        for i in range(len(snapshot)):
+            name, rating, games = snapshot[i]
+            entries[i] = Rating(name, rating, games)
+            names[i] = _Keyed(name, entries[i])
+        if len(snapshot) > 0:
+            ladder.standings = ArraySortedList.from_array(entries)
+            ladder.entrants = ArraySortedList.from_array(names)
+        return ladder
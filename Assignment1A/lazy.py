@@ -0,0 +1,50 @@
+"""
+Lazy imports for modules that only some code paths need, such as NumPy for reading results as arrays.
+
+A module imported with lazy_import() is only run the first time one of its attributes is used, so a process that
+never uses it, like a batch worker that only writes records, does not pay for importing it. Whether the module is
+installed is still known at once: lazy_import() returns None for a missing module, so the usual
+
+    np = lazy_import("numpy")
+    ...
+    if np is None:
+        raise ImportError(...)
+
+works like the try/except ImportError pattern it replaces.
+"""
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType | None:
+    """
+    Method to import a module without running it until it is used
+
+    Args:
+        name (str): Absolute name of the module
+
+    Returns:
+        ModuleType | None: The module, None if it is not installed. A module that is already imported is returned
+            as it is.
+
+    Complexity:
+        Best Case Complexity: O(1) if the module is already imported
+        Worst Case Complexity: O(d) where d is the number of directories on the module search path
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or spec.loader is None:
+        return None
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,321 @@
+"""
+Lockstep engine simulating many games at once as NumPy arrays (struct-of-arrays).
+
+Every game keeps the same state as a `Game`: hands as card-id count matrices, the draw and discard piles as
+arrays of card ids with their sizes, the current color and label, every seat's position in the turn order and
+the current seat. `step()` plays one turn of every unfinished game with vectorised operations, masking out
+finished games, and follows the rules of `Game.play_game` with every player using the default strategy.
+
+Each game draws its random numbers from its own LCG stream, equal to `RandomStream(seed)`, so game i plays
+exactly like `arena.new_table(players, seeds[i]).play_game()`. NumPy is an optional dependency only needed
+for this module.
+"""
+import numpy as np
+
+from card import CardColor, CardLabel
+from constants import Constants
+from deck import DeckSpec, STANDARD_DECK
+from random_gen import RandomGen
+
+NONE = -1
+MASK_48 = np.uint64(RandomGen.MOD - 1)
+LCG_A = np.uint64(RandomGen.A)
+LCG_C = np.uint64(RandomGen.C)
+
+NUM_IDS = Constants.NUM_COLORS * Constants.NUM_MAX_VALS
+ID_COLORS = np.arange(NUM_IDS) // Constants.NUM_MAX_VALS
+ID_LABELS = np.arange(NUM_IDS) % Constants.NUM_MAX_VALS
+
+
+def canonical_deck(deck_spec: DeckSpec = STANDARD_DECK) -> np.ndarray:
+    """
+    Method to list the card ids of a deck in the order Game.generate_cards() lays them out before shuffling
+
+    Args:
+        deck_spec (DeckSpec): The composition of the deck
+
+    Returns:
+        np.ndarray: The card ids
+
+    Complexity:
+        Best Case Complexity: O(n) where n is the number of cards in the deck
+        Worst Case Complexity: O(n) where n is the number of cards in the deck
+    """
+    template = deck_spec.template()
+    return np.fromiter((template[i].id for i in range(deck_spec.size)), dtype=np.int64, count=deck_spec.size)
+
+
+class LockstepEngine:
+    """
+    Plays N games with the same number of players in lockstep
+    """
+
+    def __init__(self, seeds, num_players: int, cards_at_init: int = None,
+                 deck_spec: DeckSpec = STANDARD_DECK) -> None:
+        """
+        Constructor for the LockstepEngine class, deals every game like Game.initialise_game()
+
+        Args:
+            seeds: One seed per game
+            num_players (int): Number of players in every game
+            cards_at_init (int): Cards dealt to each player, Constants.NUM_CARDS_AT_INIT if None
+            deck_spec (DeckSpec): The composition of the deck
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(N * n * log(n)) where N is the number of games and n the number of cards
+            Worst Case Complexity: O(N * n * log(n)) where N is the number of games and n the number of cards
+        """
+        cards_at_init = Constants.NUM_CARDS_AT_INIT if cards_at_init is None else cards_at_init
+        self.seeds = np.asarray(seeds, dtype=np.uint64) & MASK_48
+        n = len(self.seeds)
+        p = num_players
+        deck_size = deck_spec.size
+        self.num_games = n
+        self.num_players = p
+        rows = np.arange(n)
+        self.rows = rows
+
+        # Shuffle the deck of every game
+        deck = self._shuffle(rows, np.broadcast_to(canonical_deck(deck_spec), (n, deck_size)), np.full(n, deck_size))
+
+        # Deal one card at a time to each seat in turn
+        dealt = p * cards_at_init
+        self.hands = np.zeros((n, p, NUM_IDS), dtype=np.int16)
+        self.hand_sizes = np.full((n, p), cards_at_init, dtype=np.int64)
+        for k in range(dealt):
+            np.add.at(self.hands, (rows, k % p, deck[:, k]), 1)
+
+        # The rest of the deck becomes the draw pile, with its last card on top
+        self.draw = np.zeros((n, deck_size), dtype=np.int64)
+        self.draw_len = np.full(n, deck_size - dealt, dtype=np.int64)
+        self.draw[:, :deck_size - dealt] = deck[:, dealt:]
+        self.discard = np.zeros((n, deck_size), dtype=np.int64)
+        self.discard_len = np.zeros(n, dtype=np.int64)
+
+        # Turn the top card over until it is a number card
+        needs = np.ones(n, dtype=bool)
+        while needs.any():
+            g = rows[needs]
+            self.discard[g, self.discard_len[g]] = self.draw[g, self.draw_len[g] - 1]
+            self.discard_len[g] += 1
+            self.draw_len[g] -= 1
+            needs[g] = ID_LABELS[self.discard[g, self.discard_len[g] - 1]] >= 10
+
+        top = self.discard[rows, self.discard_len - 1]
+        self.color = ID_COLORS[top].copy()
+        self.label = ID_LABELS[top].copy()
+        self.positions = np.broadcast_to(np.arange(p), (n, p)).copy()
+        self.current = np.full(n, NONE, dtype=np.int64)
+        self.winner = np.full(n, NONE, dtype=np.int64)
+        self.active = np.ones(n, dtype=bool)
+        self.stuck = np.zeros(n, dtype=bool)
+        self.turns = np.zeros(n, dtype=np.int64)
+        self.recycles = np.zeros(n, dtype=np.int64)
+
+    def _random(self, g: np.ndarray) -> np.ndarray:
+        """
+        Method to advance the random stream of the given games, like RandomStream.random()
+
+        Complexity:
+            Best Case Complexity: O(g) where g is the number of games
+            Worst Case Complexity: O(g) where g is the number of games
+        """
+        seeds = (self.seeds[g] * LCG_A + LCG_C) & MASK_48
+        self.seeds[g] = seeds
+        return (seeds >> np.uint64(16)).astype(np.int64)
+
+    def _shuffle(self, g: np.ndarray, cards: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        """
+        Method to shuffle the first counts[i] cards of every row like RandomStream.random_shuffle(), which sorts
+        the cards by a random number each, ties going to the earlier card
+
+        Args:
+            g (np.ndarray): The games whose random streams are used
+            cards (np.ndarray): One row of card ids per game
+            counts (np.ndarray): Number of cards to shuffle in each row
+
+        Returns:
+            np.ndarray: The shuffled rows, cards past the counts are left in place
+
+        Complexity:
+            Best Case Complexity: O(g * m * log(m)) where m is the largest count
+            Worst Case Complexity: O(g * m * log(m)) where m is the largest count
+        """
+        width = cards.shape[1]
+        keys = np.full((len(g), width), np.iinfo(np.int64).max, dtype=np.int64)
+        for i in range(int(counts.max(initial=0))):
+            drawing = counts > i
+            keys[drawing, i] = self._random(g[drawing])
+        order = np.argsort(keys, axis=1, kind='stable')
+        return np.take_along_axis(np.asarray(cards), order, axis=1)
+
+    def _next_seat(self, g: np.ndarray, current: np.ndarray) -> np.ndarray:
+        """
+        Method to get the next seat after current in each of the given games, like Game.next_player()
+
+        Complexity:
+            Best Case Complexity: O(g * p) where g is the number of games and p the number of players
+            Worst Case Complexity: O(g * p) where g is the number of games and p the number of players
+        """
+        target = np.where(current == NONE, 0,
+                          (self.positions[g, np.maximum(current, 0)] + 1) % self.num_players)
+        return np.argmax(self.positions[g] == target[:, None], axis=1)
+
+    def _recycle(self, g: np.ndarray) -> None:
+        """
+        Method to shuffle the discard pile except its top card back into the empty draw pile, like
+        Game.shuffle_pile(). Only called when a card has to be drawn, as games with nothing to recycle are marked
+        as stuck, like Game.draw_card() raising PilesExhausted.
+
+        Complexity:
+            Best Case Complexity: O(g * n * log(n)) where n is the number of cards
+            Worst Case Complexity: O(g * n * log(n)) where n is the number of cards
+        """
+        if len(g) == 0:
+            return
+        counts = self.discard_len[g] - 1
+        top = self.discard[g, counts]
+
+        # The discard pile is emptied from the top into the array that is shuffled
+        width = self.discard.shape[1]
+        index = counts[:, None] - 1 - np.arange(width)[None, :]
+        unstacked = np.where(index >= 0, np.take_along_axis(self.discard[g], np.maximum(index, 0), axis=1), 0)
+        shuffled = self._shuffle(g, unstacked, counts)
+
+        self.draw[g] = shuffled
+        self.draw_len[g] = counts
+        self.discard[g, 0] = top
+        self.discard_len[g] = 1
+        self.recycles[g] += counts > 0
+        empty = g[counts == 0]
+        self.stuck[empty] = True
+        self.active[empty] = False
+
+    def _draw(self, g: np.ndarray) -> tuple:
+        """
+        Method to take the top card of the draw pile of each of the given games, recycling empty draw piles first
+
+        Returns:
+            tuple: The games that could draw, and the card each of them drew
+
+        Complexity:
+            Best Case Complexity: O(g) where g is the number of games
+            Worst Case Complexity: O(g * n * log(n)) when piles are recycled
+        """
+        self._recycle(g[self.draw_len[g] == 0])
+        g = g[self.active[g]]
+        self.draw_len[g] -= 1
+        return g, self.draw[g, self.draw_len[g]]
+
+    def _force_draw(self, g: np.ndarray, victims: np.ndarray, count: int) -> None:
+        """
+        Method for the victim of each of the given games to draw cards they cannot play
+
+        Complexity:
+            Best Case Complexity: O(count * g) where g is the number of games
+            Worst Case Complexity: O(count * g * n * log(n)) when piles are recycled
+        """
+        for _ in range(count):
+            drawn, cards = self._draw(g)
+            keep = np.isin(g, drawn)
+            g, victims = g[keep], victims[keep]
+            self.hands[g, victims, cards] += 1
+            self.hand_sizes[g, victims] += 1
+
+    def _play(self, g: np.ndarray, cards: np.ndarray) -> None:
+        """
+        Method to put a card on the discard pile of each of the given games and apply its effects, like
+        Game.play_card_object()
+
+        Complexity:
+            Best Case Complexity: O(g * p) where g is the number of games and p the number of players
+            Worst Case Complexity: O(g * (p + n * log(n))) when piles are recycled
+        """
+        self.discard[g, self.discard_len[g]] = cards
+        self.discard_len[g] += 1
+        colors, labels = ID_COLORS[cards], ID_LABELS[cards]
+        self.color[g], self.label[g] = colors, labels
+
+        reverse = g[labels == CardLabel.REVERSE]
+        self.positions[reverse] = self.num_players - 1 - self.positions[reverse]
+
+        skip = g[labels == CardLabel.SKIP]
+        self.current[skip] = self._next_seat(skip, self.current[skip])
+
+        for label, count in ((CardLabel.DRAW_TWO, 2), (CardLabel.DRAW_FOUR, 4)):
+            drawing = g[labels == label]
+            victims = self._next_seat(drawing, self.current[drawing])
+            self._force_draw(drawing, victims, count)
+            self.current[drawing] = victims
+
+        crazy = g[(colors == CardColor.CRAZY) & self.active[g]]
+        self.color[crazy] = self._random(crazy) % 4
+        self.label[crazy] = NONE
+
+    def step(self) -> None:
+        """
+        Method to play one turn of every unfinished game, like Game.play_turn()
+
+        Complexity:
+            Best Case Complexity: O(N * (p + c)) where N is the number of unfinished games and c the number of ids
+            Worst Case Complexity: O(N * (p + c + n * log(n))) when piles are recycled
+        """
+        # Like Game.begin_turn(), which recycles an empty draw pile but does not fail if there is nothing to
+        # recycle: the player may still have a card to play, and a draw recycles again in _draw()
+        self._recycle(self.rows[self.active & (self.draw_len == 0) & (self.discard_len > 1)])
+        g = self.rows[self.active]
+        if len(g) == 0:
+            return
+        self.turns[g] += 1
+        current = self._next_seat(g, self.current[g])
+        self.current[g] = current
+
+        # The first playable card of the sorted hand is the one with the lowest id
+        playable = ((ID_COLORS[None, :] == self.color[g, None]) | (ID_LABELS[None, :] == self.label[g, None])
+                    | (ID_COLORS[None, :] == CardColor.CRAZY))
+        options = (self.hands[g, current] > 0) & playable
+        can_play = options.any(axis=1)
+
+        players = g[can_play]
+        seats = current[can_play]
+        cards = np.argmax(options[can_play], axis=1)
+        self.hands[players, seats, cards] -= 1
+        self.hand_sizes[players, seats] -= 1
+        won = self.hand_sizes[players, seats] == 0
+        self.winner[players[won]] = seats[won]
+
+        # Everyone else draws a card, and plays it if they can
+        drawers, drawn = self._draw(g[~can_play])
+        seats = self.current[drawers]
+        ok = ((ID_COLORS[drawn] == self.color[drawers]) | (ID_LABELS[drawn] == self.label[drawers])
+              | (ID_COLORS[drawn] == CardColor.CRAZY))
+        self.hands[drawers[~ok], seats[~ok], drawn[~ok]] += 1
+        self.hand_sizes[drawers[~ok], seats[~ok]] += 1
+
+        order = np.argsort(np.concatenate((players, drawers[ok])), kind='stable')
+        self._play(np.concatenate((players, drawers[ok]))[order], np.concatenate((cards, drawn[ok]))[order])
+
+        self.active[self.winner != NONE] = False
+
+    def run(self, max_turns: int = None) -> np.ndarray:
+        """
+        Method to play every game to the end
+
+        Args:
+            max_turns (int): Number of turns after which unfinished games are left unfinished, None for no limit
+
+        Returns:
+            np.ndarray: The winning seat of every game, NONE for games that did not finish
+
+        Complexity:
+            Best Case Complexity: O(k * N * (p + c)) where k is the number of turns of the longest game
+            Worst Case Complexity: O(k * N * (p + c + n * log(n))) when piles are recycled
+        """
+        turns = 0
+        while self.active.any() and (max_turns is None or turns < max_turns):
+            self.step()
+            turns += 1
+        return self.winner
@@ -0,0 +1,321 @@
+"""
+Monte-Carlo Tree Search player.
+
+The player searches over the playable cards of its hand. Every iteration picks a card with UCB1, fills in the
+cards it cannot see with a Determiniser, plays the card on a copy of the game and plays the rest of the game out
+with a fast rollout strategy. The most visited card is played. Rollouts never touch `RandomGen`, so adding a
+searching player to a seeded game does not change the random numbers the game itself draws.
+"""
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from math import log, sqrt
+import time
+
+from data_structures.referential_array import ArrayR
+from data_structures.sorting import counting_sort
+from card import Card, CARDS_BY_ID
+from constants import Constants
+from deck import DeckSpec, STANDARD_DECK
+from game import Game, PilesExhausted
+from player import Player
+from random_gen import RandomStream
+from rules import RuleSet, STANDARD_RULES
+from strategy import Strategy, MostFrequentColorStrategy, DEFAULT_STRATEGY
+
+
+def _card_id(card: Card) -> int:
+    """ Sort key of a card for counting_sort. """
+    return card.id
+
+
+class Determiniser(ABC):
+    """
+    Abstract class for filling in the cards a player cannot see before a rollout
+    """
+
+    @abstractmethod
+    def determinise(self, game: Game, seat: int, rng: RandomStream) -> None:
+        """
+        Method to replace the hidden information of a game with a plausible guess
+
+        Args:
+            game (Game): A copy of the game, modified in place
+            seat (int): The index in game.players of the player who is searching
+            rng (RandomStream): The random number generator to use
+
+        Returns:
+            None
+        """
+        pass
+
+
+class OpenHandDeterminiser(Determiniser):
+    """
+    Determiniser that leaves the game untouched, letting the search see every hand and the draw pile
+    """
+
+    def determinise(self, game: Game, seat: int, rng: RandomStream) -> None:
+        """
+        Method to leave the game as is
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return None
+
+
+class ShuffleDeterminiser(Determiniser):
+    """
+    Determiniser that shuffles the opponents' hands and the draw pile together and deals them back out,
+    keeping every hand size the same
+    """
+
+    def determinise(self, game: Game, seat: int, rng: RandomStream) -> None:
+        """
+        Method to redeal the cards the searching player cannot see
+
+        Complexity:
+            Best Case Complexity: O(n) where n is the number of cards in the game
+            Worst Case Complexity: O(n * log(h)) where n is the number of cards in the game and h is the largest
+                hand size
+        """
+        count = len(game.draw_pile)
+        for i in range(len(game.players)):
+            if i != seat:
+                count += len(game.players[i].hand)
+
+        unseen: ArrayR = ArrayR(max(1, count))
+        index = 0
+        for i in range(len(game.players)):
+            if i != seat:
+                hand = game.players[i].hand
+                for j in range(len(hand)):
+                    unseen[index] = hand[j]
+                    index += 1
+        for j in range(len(game.draw_pile)):
+            unseen[index] = game.draw_pile.array[j]
+            index += 1
+        if count > 0:
+            rng.random_shuffle(unseen)
+
+        index = 0
+        for i in range(len(game.players)):
+            if i != seat:
+                # Card ids follow the card order, so a counting sort rebuilds the hand in one pass
+                hand = game.players[i].hand
+                size = len(hand)
+                if size > 0:
+                    dealt: ArrayR = ArrayR(size)
+                    for j in range(size):
+                        dealt[j] = unseen[index]
+                        index += 1
+                    counting_sort(dealt, _card_id, len(CARDS_BY_ID))
+                    items = hand.array.array
+                    for j in range(size):
+                        items[j] = dealt[j]
+        game.draw_pile.clear()
+        while index < count:
+            game.draw_pile.push(unseen[index])
+            index += 1
+
+        return None
+
+
+def _rollout(snapshot: bytes, seat: int, index: int, seed: int, determiniser: Determiniser,
+             rollout_strategy: Strategy, deck_spec: DeckSpec, rules: RuleSet) -> bool:
+    """
+    Method to play one game out after the searching player plays a card
+
+    Args:
+        snapshot (bytes): The game state, as returned by Game.snapshot(), before the searching player's move
+        seat (int): The index in game.players of the searching player
+        index (int): The index in the searching player's hand of the card to play
+        seed (int): Seed for the random numbers of the rollout
+        determiniser (Determiniser): Fills in the cards the searching player cannot see
+        rollout_strategy (Strategy): Strategy every player uses during the rollout
+        deck_spec (DeckSpec): The composition of the searched game's deck
+        rules (RuleSet): The effects of the cards in the searched game
+
+    Returns:
+        bool: True if the searching player won the rollout, games reaching the turn limit or running out of cards
+            count as losses
+
+    Complexity:
+        Best Case Complexity: O(n + p) where n is the number of cards and p is the number of players
+        Worst Case Complexity: O(k * (h + p + n)) where k is the turn limit and h is the largest hand size
+    """
+    game = Game.from_snapshot(snapshot, None, deck_spec, rules)
+    for i in range(len(game.players)):
+        game.players[i].strategy = rollout_strategy
+    game.rng = RandomStream(seed)
+    determiniser.determinise(game, seat, game.rng)
+
+    game.current_player = game.players[seat]
+    winner = game.play_from_hand(index)
+    turns = 0
+    turn_limit = Constants.MAX_ROUNDS_PER_PLAYER * len(game.players)
+    try:
+        while winner is None and turns < turn_limit:
+            winner = game.play_turn()
+            turns += 1
+    except PilesExhausted:
+        return False
+
+    return winner is game.players[seat]
+
+
+def search(snapshot: bytes, seat: int, mask: int, iterations: int | None, time_limit: float | None, seed: int,
+           exploration: float, determiniser: Determiniser, rollout_strategy: Strategy,
+           deck_spec: DeckSpec = STANDARD_DECK, rules: RuleSet = STANDARD_RULES) -> tuple:
+    """
+    Method to run UCB1 over the playable cards of the searching player until the budget is spent.
+    This is a module level function so that it can be sent to a process pool.
+
+    Args:
+        snapshot (bytes): The game state, as returned by Game.snapshot(), before the searching player's move
+        seat (int): The index in game.players of the searching player
+        mask (int): Bitmask with bit i set if the searching player's hand[i] is playable
+        iterations (int | None): Number of rollouts to run, None for no limit
+        time_limit (float | None): Number of seconds to search for, None for no limit
+        seed (int): Seed for the random numbers of the search
+        exploration (float): The UCB1 exploration constant
+        determiniser (Determiniser): Fills in the cards the searching player cannot see
+        rollout_strategy (Strategy): Strategy every player uses during rollouts
+        deck_spec (DeckSpec): The composition of the searched game's deck
+        rules (RuleSet): The effects of the cards in the searched game
+
+    Returns:
+        tuple: Pairs of (visits, wins) flattened, for every index of the searching player's hand
+
+    Complexity:
+        Best Case Complexity: O(i * r) where i is the number of iterations and r the cost of a rollout
+        Worst Case Complexity: O(i * (m + r)) where m is the number of playable cards
+    """
+    hand_size = mask.bit_length()
+    visits: ArrayR[int] = ArrayR(hand_size)
+    wins: ArrayR[int] = ArrayR(hand_size)
+    for i in range(hand_size):
+        visits[i] = 0
+        wins[i] = 0
+
+    rng = RandomStream(seed)
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    total = 0
+    while (iterations is None or total < iterations) and (deadline is None or time.perf_counter() < deadline):
+        # Try every card once, then pick the card with the best upper confidence bound
+        best, best_score = -1, -1.0
+        for i in range(hand_size):
+            if (mask >> i) & 1:
+                if visits[i] == 0:
+                    best = i
+                    break
+                score = wins[i] / visits[i] + exploration * sqrt(log(total) / visits[i])
+                if score > best_score:
+                    best, best_score = i, score
+
+        visits[best] += 1
+        if _rollout(snapshot, seat, best, rng.random(), determiniser, rollout_strategy, deck_spec, rules):
+            wins[best] += 1
+        total += 1
+
+    result = ArrayR(2 * hand_size)
+    for i in range(hand_size):
+        result[2 * i] = visits[i]
+        result[2 * i + 1] = wins[i]
+    return tuple(result.array)
+
+
+class MCTSStrategy(MostFrequentColorStrategy):
+    """
+    Strategy that chooses cards with Monte-Carlo Tree Search, and colors like MostFrequentColorStrategy.
+
+    The budget is given as a number of iterations, a time limit in seconds, or both (whichever runs out first).
+    With an executor, the budget is split over `workers` independent searches whose statistics are summed.
+    Both thread and process pools can be used, as searches only exchange snapshots and plain statistics.
+    """
+
+    def __init__(self, iterations: int | None = 200, time_limit: float | None = None,
+                 determiniser: Determiniser = None, rollout_strategy: Strategy = DEFAULT_STRATEGY,
+                 executor: Executor = None, workers: int = 1, exploration: float = 1.4, seed: int = None) -> None:
+        """
+        Constructor for the MCTSStrategy class
+
+        Args:
+            iterations (int | None): Number of rollouts per decision, None for no limit
+            time_limit (float | None): Number of seconds per decision, None for no limit
+            determiniser (Determiniser): Fills in hidden cards, ShuffleDeterminiser if None
+            rollout_strategy (Strategy): Strategy every player uses during rollouts
+            executor (Executor): Thread or process pool to run searches on, None to search in this thread
+            workers (int): Number of searches to split each decision over when an executor is given
+            exploration (float): The UCB1 exploration constant
+            seed (int): Seed for the random numbers of the search
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if iterations is None and time_limit is None:
+            raise ValueError("MCTSStrategy needs an iteration count or a time limit")
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.determiniser = ShuffleDeterminiser() if determiniser is None else determiniser
+        self.rollout_strategy = rollout_strategy
+        self.executor = executor
+        self.workers = workers if executor is not None else 1
+        self.exploration = exploration
+        self.rng = RandomStream(seed)
+        self.game = None
+
+    def attach(self, game: Game) -> None:
+        """
+        Method to remember the game the player is in, so its state can be searched
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.game = game
+
+    def choose_card(self, player: Player, mask: int) -> int:
+        """
+        Method to choose the playable card with the most visits after searching
+
+        Complexity:
+            Best Case Complexity: O(1) when only one card is playable
+            Worst Case Complexity: O(i * r) where i is the number of iterations and r the cost of a rollout
+        """
+        if mask & (mask - 1) == 0 or self.game is None:
+            return DEFAULT_STRATEGY.choose_card(player, mask)
+
+        seat = 0
+        while self.game.players[seat] is not player:
+            seat += 1
+        snapshot = self.game.snapshot()
+
+        if self.executor is None:
+            stats = search(snapshot, seat, mask, self.iterations, self.time_limit, self.rng.random(),
+                           self.exploration, self.determiniser, self.rollout_strategy, self.game.deck_spec,
+                           self.game.rules)
+        else:
+            futures = ArrayR(self.workers)
+            for w in range(self.workers):
+                share = None
+                if self.iterations is not None:
+                    share = self.iterations // self.workers + (1 if w < self.iterations % self.workers else 0)
+                futures[w] = self.executor.submit(search, snapshot, seat, mask, share, self.time_limit,
+                                                  self.rng.random(), self.exploration, self.determiniser,
+                                                  self.rollout_strategy, self.game.deck_spec, self.game.rules)
+            stats = futures[0].result()
+            for w in range(1, self.workers):
+                other = futures[w].result()
+                stats = tuple(stats[i] + other[i] for i in range(len(stats)))
+
+        best, best_visits = DEFAULT_STRATEGY.choose_card(player, mask), -1
+        for i in range(mask.bit_length()):
+            if (mask >> i) & 1 and stats[2 * i] > best_visits:
+                best, best_visits = i, stats[2 * i]
+        return best
@@ -0,0 +1,381 @@
+"""
+Persistent cache of game outcomes (stdlib sqlite3 only).
+
+A game is fully determined by its seed and its configuration (number of players, cards dealt, deck and rules), so
+its outcome only has to be simulated once. OutcomeCache stores the winner's seat, the number of turns and the final
+hand sizes of every game it simulates, keyed by a fingerprint of the configuration and the seed, in an sqlite
+database that survives between runs.
+
+Writes are buffered and committed in batches. The cache holds at most max_entries outcomes: when a batch takes it
+over the limit, the least recently used outcomes are deleted. Buffered outcomes are written into the open
+transaction before a lookup, so outcomes that are not yet committed are never simulated twice. A seed stored or
+used more than once in a batch is written more than once, the last write replacing the earlier ones.
+"""
+import struct
+
+from data_structures.array_list import ArrayList
+from data_structures.referential_array import ArrayR
+from bounded import BoundedGame, Outcome
+from constants import Constants
+from deck import DeckSpec, STANDARD_DECK
+from lazy import lazy_import
+from player import Player
+from random_gen import RandomStream
+from rules import RuleSet, STANDARD_RULES
+
+# Only OutcomeCache needs sqlite3; code using GameOutcome alone, like stats, does not import it
+sqlite3 = lazy_import("sqlite3")
+
+NO_WINNER = -1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outcomes (
+    fingerprint TEXT NOT NULL,
+    seed INTEGER NOT NULL,
+    winner INTEGER NOT NULL,
+    turns INTEGER NOT NULL,
+    hand_sizes BLOB NOT NULL,
+    used INTEGER NOT NULL,
+    PRIMARY KEY (fingerprint, seed)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS outcomes_used ON outcomes (used);
+"""
+
+
+class GameConfig:
+    """
+    Everything apart from the seed that decides how a simulated game plays out
+    """
+
+    def __init__(self, num_players: int, cards_at_init: int | None = None, deck_spec: DeckSpec = STANDARD_DECK,
+                 rules: RuleSet = STANDARD_RULES, variant: str | None = None) -> None:
+        """
+        Constructor for the GameConfig class
+
+        Args:
+            num_players (int): Number of players at the table, all using the default strategy
+            cards_at_init (int | None): Cards dealt to every player, Constants.NUM_CARDS_AT_INIT if None
+            deck_spec (DeckSpec): The composition of the deck
+            rules (RuleSet): The effects of the cards
+            variant (str | None): Name of the rules, part of the fingerprint since rule sets cannot be compared,
+                "standard" if None
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the rules are not STANDARD_RULES and no variant is named, as their games would share
+                the fingerprint of standard games
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if variant is None:
+            if rules is not STANDARD_RULES:
+                raise ValueError("Rules other than STANDARD_RULES need a variant name")
+            variant = "standard"
+        self.num_players = num_players
+        self.cards_at_init = Constants.NUM_CARDS_AT_INIT if cards_at_init is None else cards_at_init
+        self.deck_spec = deck_spec
+        self.rules = rules
+        self.variant = variant
+
+    def fingerprint(self) -> str:
+        """
+        Method to describe the configuration as a string, equal for configurations whose games play out the same
+
+        Returns:
+            str: The fingerprint
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        spec = self.deck_spec
+        return (f"p{self.num_players}:h{self.cards_at_init}:d{spec.decks}.{spec.number_copies}."
+                f"{spec.action_copies}.{spec.crazy_copies}.{spec.draw_four_copies}:{self.variant}")
+
+
+class GameOutcome:
+    """
+    How a simulated game ended
+    """
+
+    def __init__(self, winner: int, turns: int, hand_sizes: ArrayR[int]) -> None:
+        """
+        Constructor for the GameOutcome class
+
+        Args:
+            winner (int): Seat of the winner, NO_WINNER if the game was a draw or was aborted
+            turns (int): Number of turns played
+            hand_sizes (ArrayR[int]): Number of cards left in every seat's hand
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.winner = winner
+        self.turns = turns
+        self.hand_sizes = hand_sizes
+
+    def encode_hands(self) -> bytes:
+        """
+        Method to pack the hand sizes into bytes
+
+        Complexity:
+            Best Case Complexity: O(p) where p is the number of players
+            Worst Case Complexity: O(p) where p is the number of players
+        """
+        return struct.pack(f"<{len(self.hand_sizes)}H", *self.hand_sizes)
+
+    @staticmethod
+    def decode_hands(data: bytes) -> ArrayR[int]:
+        """
+        Method to unpack hand sizes packed by encode_hands()
+
+        Complexity:
+            Best Case Complexity: O(p) where p is the number of players
+            Worst Case Complexity: O(p) where p is the number of players
+        """
+        sizes = struct.unpack(f"<{len(data) // 2}H", data)
+        hand_sizes: ArrayR[int] = ArrayR(len(sizes))
+        for seat in range(len(sizes)):
+            hand_sizes[seat] = sizes[seat]
+        return hand_sizes
+
+
+def simulate(config: GameConfig, seed: int) -> GameOutcome:
+    """
+    Method to play one game of a configuration with default players
+
+    Args:
+        config (GameConfig): The configuration of the game
+        seed (int): Seed for the game's random numbers
+
+    Returns:
+        GameOutcome: How the game ended
+
+    Complexity:
+        Best Case Complexity: O(n + p * log(p)) for a game won on the first turn, see BoundedGame.play_bounded()
+        Worst Case Complexity: O(t * (h + n + p)) where t is the turn limit, see BoundedGame.play_bounded()
+    """
+    players: ArrayR[Player] = ArrayR(config.num_players)
+    for seat in range(config.num_players):
+        players[seat] = Player(str(seat), seat)
+
+    game = BoundedGame(config.deck_spec, config.rules)
+    game.rng = RandomStream(seed)
+    game.initialise_game(players, config.cards_at_init)
+    result = game.play_bounded()
+
+    winner = NO_WINNER
+    hand_sizes: ArrayR[int] = ArrayR(config.num_players)
+    for seat in range(config.num_players):
+        hand_sizes[seat] = len(players[seat].hand)
+        if result.outcome == Outcome.WIN and players[seat] is result.winner:
+            winner = seat
+    return GameOutcome(winner, result.turns, hand_sizes)
+
+
+class OutcomeCache:
+    """
+    Size-bounded, least recently used cache of game outcomes in an sqlite database
+    """
+
+    def __init__(self, path: str = ":memory:", max_entries: int = 1_000_000, batch_size: int = 1024) -> None:
+        """
+        Constructor for the OutcomeCache class, creating the database if it does not exist
+
+        Args:
+            path (str): Path of the database file, ":memory:" for a cache that is not kept
+            max_entries (int): Maximum number of outcomes kept
+            batch_size (int): Number of outcomes buffered before they are written
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(log e) where e is the number of outcomes stored
+        """
+        self.max_entries = max(1, max_entries)
+        self.batch_size = max(1, batch_size)
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(_SCHEMA)
+        (last_used,) = self.connection.execute("SELECT COALESCE(MAX(used), 0) FROM outcomes").fetchone()
+        self.clock = last_used
+        # Rows to insert and (used, fingerprint, seed) updates not written yet, and the number written but not
+        # committed
+        self.pending: ArrayList[tuple] = ArrayList(self.batch_size)
+        self.touched: ArrayList[tuple[int, str, int]] = ArrayList(self.batch_size)
+        self.uncommitted = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self) -> 'OutcomeCache':
+        """ Method to use the cache in a with statement, closing it at the end. """
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """ Method to close the cache at the end of a with statement, see close(). """
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Method to count the outcomes stored, including those not written yet
+
+        Complexity:
+            Best Case Complexity: O(e) where e is the number of outcomes stored
+            Worst Case Complexity: O(e) where e is the number of outcomes stored
+        """
+        self.flush()
+        (count,) = self.connection.execute("SELECT COUNT(*) FROM outcomes").fetchone()
+        return count
+
+    def get_many(self, config: GameConfig, seeds: ArrayR[int]) -> ArrayR[GameOutcome | None]:
+        """
+        Method to look up the outcomes of many games of one configuration, marking them as recently used
+
+        Args:
+            config (GameConfig): The configuration of the games
+            seeds (ArrayR[int]): The seeds of the games
+
+        Returns:
+            ArrayR[GameOutcome | None]: The outcome of every seed, None for seeds that are not cached
+
+        Complexity:
+            Best Case Complexity: O(s * log e) where s is the number of seeds and e the number of outcomes stored
+            Worst Case Complexity: O(s * log e) where s is the number of seeds and e the number of outcomes stored
+        """
+        fingerprint = config.fingerprint()
+        outcomes: ArrayR[GameOutcome | None] = ArrayR(len(seeds))
+        query = "SELECT winner, turns, hand_sizes FROM outcomes WHERE fingerprint = ? AND seed = ?"
+        self._write()
+        for i in range(len(seeds)):
+            row = self.connection.execute(query, (fingerprint, seeds[i])).fetchone()
+            if row is None:
+                self.misses += 1
+                outcomes[i] = None
+            else:
+                self.hits += 1
+                self.clock += 1
+                self.touched.append((self.clock, fingerprint, seeds[i]))
+                outcomes[i] = GameOutcome(row[0], row[1], GameOutcome.decode_hands(row[2]))
+        if self.uncommitted + len(self.touched) >= self.batch_size:
+            self.flush()
+        return outcomes
+
+    def put_many(self, config: GameConfig, seeds: ArrayR[int], outcomes: ArrayR[GameOutcome]) -> None:
+        """
+        Method to store the outcomes of many games of one configuration, written once a batch is full
+
+        Args:
+            config (GameConfig): The configuration of the games
+            seeds (ArrayR[int]): The seeds of the games
+            outcomes (ArrayR[GameOutcome]): The outcome of every seed
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(s) where s is the number of seeds
+            Worst Case Complexity: O(s + b * log e) when batches of b outcomes are written, see flush()
+        """
+        fingerprint = config.fingerprint()
+        for i in range(len(seeds)):
+            outcome = outcomes[i]
+            self.clock += 1
+            self.pending.append((fingerprint, seeds[i], outcome.winner, outcome.turns, outcome.encode_hands(),
+                                 self.clock))
+            if self.uncommitted + len(self.pending) >= self.batch_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """
+        Method to write the buffered outcomes and recent uses in one transaction, then delete the least recently
+        used outcomes if there are more than max_entries
+
+        Complexity:
+            Best Case Complexity: O(1) when nothing is buffered
+            Worst Case Complexity: O((b + d) * log e) where b is the number of buffered changes, d the number of
+                outcomes deleted and e the number of outcomes stored
+        """
+        self._write()
+        if self.uncommitted == 0:
+            return
+        with self.connection:
+            (count,) = self.connection.execute("SELECT COUNT(*) FROM outcomes").fetchone()
+            if count > self.max_entries:
+                self.connection.execute(
+                    "DELETE FROM outcomes WHERE used <= "
+                    "(SELECT used FROM outcomes ORDER BY used LIMIT 1 OFFSET ?)", (count - self.max_entries - 1,))
+        self.uncommitted = 0
+
+    def _write(self) -> None:
+        """
+        Method to write the buffered outcomes and recent uses into the open transaction, without committing it
+
+        Complexity:
+            Best Case Complexity: O(1) when nothing is buffered
+            Worst Case Complexity: O(b * log e) where b is the number of buffered changes and e the number of
+                outcomes stored
+        """
+        if self.pending.is_empty() and self.touched.is_empty():
+            return
+        # A use is always buffered after the row it updates was written, and rows buffered after it are newer, so
+        # the uses go first
+        self.connection.executemany("UPDATE outcomes SET used = ? WHERE fingerprint = ? AND seed = ?", self.touched)
+        self.connection.executemany("INSERT OR REPLACE INTO outcomes VALUES (?, ?, ?, ?, ?, ?)", self.pending)
+        self.uncommitted += len(self.pending) + len(self.touched)
+        self.pending.clear()
+        self.touched.clear()
+
+    def outcomes(self, config: GameConfig, seeds: ArrayR[int]) -> ArrayR[GameOutcome]:
+        """
+        Method to get the outcomes of many games of one configuration, simulating only those not cached
+
+        Args:
+            config (GameConfig): The configuration of the games
+            seeds (ArrayR[int]): The seeds of the games
+
+        Returns:
+            ArrayR[GameOutcome]: The outcome of every seed
+
+        Complexity:
+            Best Case Complexity: O(s * log e) when every seed is cached, see get_many()
+            Worst Case Complexity: O(s * log e + m * g) where m is the number of seeds simulated and g the cost of
+                a game, see simulate()
+        """
+        outcomes = self.get_many(config, seeds)
+        missing = 0
+        for outcome in outcomes:
+            if outcome is None:
+                missing += 1
+        if missing == 0:
+            return outcomes
+
+        missed_seeds: ArrayR[int] = ArrayR(missing)
+        simulated: ArrayR[GameOutcome] = ArrayR(missing)
+        j = 0
+        for i in range(len(seeds)):
+            if outcomes[i] is None:
+                outcomes[i] = simulated[j] = simulate(config, seeds[i])
+                missed_seeds[j] = seeds[i]
+                j += 1
+        self.put_many(config, missed_seeds, simulated)
+        return outcomes
+
+    def close(self) -> None:
+        """
+        Method to write anything buffered and close the database
+
+        Complexity:
+            Best Case Complexity: O(1) when nothing is buffered
+            Worst Case Complexity: O((b + d) * log e), see flush()
+        """
+        self.flush()
+        self.connection.close()
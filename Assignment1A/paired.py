@@ -0,0 +1,503 @@
+"""
+Paired comparisons of two strategies with common random numbers.
+
+Comparing two strategies by their win rates over separate batches of games needs many games, because most of the
+spread in the results comes from the deals rather than from the strategies. Here both strategies play the same
+deals from the same seats: for every seed the candidate sits in each seat in turn, once with strategy A and once
+with strategy B, against the same opponents, and only the differences between the paired games are measured.
+
+For the paired games to stay aligned, every source of randomness in a game draws from its own RandomStream
+spawned from the seed: one for the order of the deck, one for reshuffling the discard pile and one for the colour
+choices of each seat. A strategy that chooses colours differently, or makes a seat draw more cards, then does not
+shift the random numbers used by the rest of the table. Strategies with random numbers of their own, such as
+MCTSStrategy, stay repeatable from their own seeds but are not aligned by the pairing.
+
+Rotations of one deal are not independent of each other, so the confidence interval is taken over the mean
+difference of every deal, with the normal approximation.
+
+Usage (from the Assignment1A folder):
+    python -m paired most-frequent-color first-playable --deals 500 --players 4 --workers 4
+"""
+import argparse
+from concurrent.futures import Executor
+from math import ceil, sqrt
+from statistics import NormalDist
+
+from data_structures.referential_array import ArrayR
+from batch import worker_pool
+from bounded import BoundedGame, Outcome
+from constants import Constants
+from deck import DeckSpec, STANDARD_DECK
+from player import Player
+from random_gen import RandomStream
+from rules import RuleSet, STANDARD_RULES
+from stats import RunningStats
+from strategy import (Strategy, DEFAULT_STRATEGY, FirstPlayableStrategy, HoldDrawFourStrategy,
+                      MostFrequentColorStrategy)
+
+STRATEGIES = {
+    "first-playable": FirstPlayableStrategy(),
+    "most-frequent-color": MostFrequentColorStrategy(),
+    "hold-draw-four": HoldDrawFourStrategy(),
+}
+
+
+class PairedStreams:
+    """
+    Random number generator of a PairedGame, which keeps a separate stream for every source of randomness. It
+    offers the methods of RandomGen: shuffles draw from the reshuffle stream, and every other method from the
+    colour stream of the seat of the player whose turn it is.
+    """
+
+    def __init__(self, seed: int, num_players: int) -> None:
+        """
+        Constructor for the PairedStreams class
+
+        Args:
+            seed (int): Seed of the deal
+            num_players (int): Number of seats at the table
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(p) where p is the number of players
+            Worst Case Complexity: O(p) where p is the number of players
+        """
+        root = RandomStream(seed)
+        self.deck = root.spawn()
+        self.shuffles = root.spawn()
+        # Colours chosen outside of a turn, for a crazy card turned up at the start of the game
+        self.table = root.spawn()
+        self.seats: ArrayR[RandomStream] = ArrayR(num_players)
+        for seat in range(num_players):
+            self.seats[seat] = root.spawn()
+        self.game = None
+
+    def stream(self) -> RandomStream:
+        """
+        Method to get the colour stream of the player whose turn it is
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        player = None if self.game is None else self.game.current_player
+        if player is None:
+            return self.table
+        return self.seats[self.game.seat_at[player.position]]
+
+    def random(self) -> int:
+        """Returns a random integer from 0 to 2^32-1 from the current seat's stream"""
+        return self.stream().random()
+
+    def random_float(self) -> float:
+        """Returns a random floating point number in the range 0 to 1 from the current seat's stream"""
+        return self.stream().random_float()
+
+    def randint(self, lo: int, hi: int) -> int:
+        """Returns a random integer from `lo` to `hi` inclusive from the current seat's stream"""
+        return self.stream().randint(lo, hi)
+
+    def random_chance(self, ratio: float) -> bool:
+        """Returns random()/2^32 < ratio from the current seat's stream"""
+        return self.stream().random_chance(ratio)
+
+    def random_choice(self, collection):
+        """Returns a random choice from a collection from the current seat's stream"""
+        return self.stream().random_choice(collection)
+
+    def random_shuffle(self, collection) -> None:
+        """
+        Randomly shuffles a collection with the reshuffle stream
+        :complexity: O(len(collection))
+        """
+        self.shuffles.random_shuffle(collection)
+
+
+class PairedGame(BoundedGame):
+    """
+    Bounded game whose random numbers come from PairedStreams, so that games with the same seed and seating are
+    dealt the same cards and draw the same random numbers at every seat
+    """
+
+    def __init__(self, seed: int, deck_spec: DeckSpec = STANDARD_DECK, rules: RuleSet = STANDARD_RULES,
+                 max_turns: int | None = None) -> None:
+        """
+        Constructor for the PairedGame class
+
+        Args:
+            seed (int): Seed of the deal
+            deck_spec (DeckSpec): The composition of the deck
+            rules (RuleSet): The effects of the cards
+            max_turns (int | None): Number of turns after which the game is aborted, see BoundedGame
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        BoundedGame.__init__(self, deck_spec, rules, max_turns)
+        self.seed = seed
+        self.seat_at: ArrayR[int] | None = None
+
+    def initialise_game(self, players: ArrayR[Player], cards_at_init: int | None = None) -> None:
+        """
+        Method to initialise the game, see BoundedGame.initialise_game(), giving every player the colour stream of
+        their index in players. The seats are kept by position, so the players must have positions 0 to p - 1.
+
+        Complexity:
+            Best Case Complexity: O(n + p * log(p)) where n is the number of cards and p is the number of players
+            Worst Case Complexity: O(n + p * log(p)) where n is the number of cards and p is the number of players
+        """
+        self.seat_at = ArrayR(len(players))
+        for seat in range(len(players)):
+            self.seat_at[players[seat].position] = seat
+        self.rng = PairedStreams(self.seed, len(players))
+        self.rng.game = self
+        BoundedGame.initialise_game(self, players, cards_at_init)
+
+    def play_reverse(self) -> None:
+        """
+        Method to play a reverse card, see Game.play_reverse(), keeping every player's seat under their new position
+
+        Complexity:
+            Best Case Complexity: O(p) where p is the number of players
+            Worst Case Complexity: O(p) where p is the number of players
+        """
+        BoundedGame.play_reverse(self)
+        # Every position p became last - p
+        seat_at, last = self.seat_at, len(self.seat_at) - 1
+        for position in range(len(seat_at) // 2):
+            seat_at[position], seat_at[last - position] = seat_at[last - position], seat_at[position]
+
+    def generate_cards(self) -> ArrayR:
+        """
+        Method to generate the deck, shuffled with the deck stream
+
+        Complexity:
+            Best Case Complexity: O(n) where n is the number of cards
+            Worst Case Complexity: O(n * log(n)) where n is the number of cards
+        """
+        return self.deck_spec.new_deck(self.rng.deck)
+
+
+class PairedComparison:
+    """
+    Results of paired games between a strategy A and a strategy B, as the win rate of A minus that of B
+    """
+
+    def __init__(self, rotations: int) -> None:
+        """
+        Constructor for the PairedComparison class
+
+        Args:
+            rotations (int): Number of seats the candidate is played from on every deal
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.rotations = rotations
+        self.wins_a = RunningStats()
+        self.wins_b = RunningStats()
+        self.difference = RunningStats()
+
+    def add_deal(self, wins_a: ArrayR[int], wins_b: ArrayR[int]) -> None:
+        """
+        Method to add the games of one deal
+
+        Args:
+            wins_a (ArrayR[int]): 1 if A won from the seat, 0 otherwise, for every rotation
+            wins_b (ArrayR[int]): 1 if B won from the seat, 0 otherwise, for every rotation
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(r) where r is the number of rotations
+            Worst Case Complexity: O(r) where r is the number of rotations
+        """
+        total = 0
+        for seat in range(self.rotations):
+            self.wins_a.add(wins_a[seat])
+            self.wins_b.add(wins_b[seat])
+            total += wins_a[seat] - wins_b[seat]
+        self.difference.add(total / self.rotations)
+
+    def merge(self, other: 'PairedComparison') -> None:
+        """
+        Method to add the deals of another comparison with the same rotations
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.wins_a.merge(other.wins_a)
+        self.wins_b.merge(other.wins_b)
+        self.difference.merge(other.difference)
+
+    @property
+    def deals(self) -> int:
+        """
+        Number of deals played
+        """
+        return self.difference.count
+
+    @property
+    def games(self) -> int:
+        """
+        Number of games played, by both strategies
+        """
+        return self.wins_a.count + self.wins_b.count
+
+    def mean_difference(self) -> float:
+        """
+        Method to get the win rate of A minus the win rate of B
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.difference.mean
+
+    @staticmethod
+    def _z(confidence: float) -> float:
+        """
+        Method to get the two sided normal quantile for a confidence level
+        """
+        return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+    def interval(self, confidence: float = 0.95) -> tuple[float, float]:
+        """
+        Method to get the confidence interval of the mean difference over the deals
+
+        Args:
+            confidence (float): Confidence level of the interval
+
+        Returns:
+            tuple[float, float]: The lower and upper bounds
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        mean = self.mean_difference()
+        if self.deals == 0:
+            return mean, mean
+        half_width = self._z(confidence) * sqrt(self.difference.variance() / self.deals)
+        return mean - half_width, mean + half_width
+
+    def independent_interval(self, confidence: float = 0.95) -> tuple[float, float]:
+        """
+        Method to estimate the confidence interval that comparing separate batches of games, with as many games
+        as were played here, would have given
+
+        Args:
+            confidence (float): Confidence level of the interval
+
+        Returns:
+            tuple[float, float]: The lower and upper bounds
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        mean = self.mean_difference()
+        if self.games == 0:
+            return mean, mean
+        # Each strategy gets half of the games
+        spread = self.wins_a.variance() + self.wins_b.variance()
+        half_width = self._z(confidence) * sqrt(spread / (self.games / 2))
+        return mean - half_width, mean + half_width
+
+    def games_needed(self, half_width: float, confidence: float = 0.95) -> int:
+        """
+        Method to estimate the number of paired games needed for a confidence interval of a given half width
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        deals = self._z(confidence) ** 2 * self.difference.variance() / half_width ** 2
+        return 2 * self.rotations * ceil(deals)
+
+    def independent_games_needed(self, half_width: float, confidence: float = 0.95) -> int:
+        """
+        Method to estimate the number of games separate batches would need for a confidence interval of a given
+        half width
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        spread = self.wins_a.variance() + self.wins_b.variance()
+        return 2 * ceil(self._z(confidence) ** 2 * spread / half_width ** 2)
+
+    def efficiency(self) -> float:
+        """
+        Method to get how many times fewer games the pairing needs than separate batches for the same precision
+
+        Returns:
+            float: The ratio of the games needed, inf if the paired differences do not vary
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        paired = self.rotations * self.difference.variance()
+        spread = self.wins_a.variance() + self.wins_b.variance()
+        if paired == 0:
+            return float("inf") if spread > 0 else 1.0
+        return spread / paired
+
+
+def play_seat(candidate: Strategy, seat: int, opponent: Strategy, seed: int, num_players: int,
+              cards_at_init: int | None = None) -> int:
+    """
+    Method to play one paired game, with the candidate strategy in one seat and the opponent in the others
+
+    Args:
+        candidate (Strategy): The strategy of the player in the seat
+        seat (int): The candidate's seat
+        opponent (Strategy): The strategy of every other player
+        seed (int): Seed of the deal
+        num_players (int): Number of players at the table
+        cards_at_init (int | None): Cards dealt to every player, Constants.NUM_CARDS_AT_INIT if None
+
+    Returns:
+        int: 1 if the candidate won, 0 if another player won or the game was a draw or was aborted
+
+    Complexity:
+        Best Case Complexity: O(n + p * log(p)) for a game won on the first turn, see BoundedGame.play_bounded()
+        Worst Case Complexity: O(t * (h + n + p)) where t is the turn limit, see BoundedGame.play_bounded()
+    """
+    players: ArrayR[Player] = ArrayR(num_players)
+    for i in range(num_players):
+        players[i] = Player(str(i), i, candidate if i == seat else opponent)
+    game = PairedGame(seed)
+    game.initialise_game(players, cards_at_init)
+    result = game.play_bounded()
+    return int(result.outcome == Outcome.WIN and result.winner is players[seat])
+
+
+def play_deals(strategy_a: Strategy, strategy_b: Strategy, opponent: Strategy, seeds: tuple[int, ...],
+               num_players: int, cards_at_init: int) -> PairedComparison:
+    """
+    Method run by a worker to play a chunk of deals, each from every seat with both strategies
+
+    Args:
+        strategy_a (Strategy): The first strategy compared
+        strategy_b (Strategy): The second strategy compared
+        opponent (Strategy): The strategy of the other players
+        seeds (tuple[int, ...]): Seeds of the deals
+        num_players (int): Number of players at every table
+        cards_at_init (int): Number of cards dealt to every player
+
+    Returns:
+        PairedComparison: The results of the chunk
+
+    Complexity:
+        Best Case Complexity: O(s * p * g) where s is the number of seeds, p the number of players and g the
+            cost of a game
+        Worst Case Complexity: O(s * p * g) where s is the number of seeds, p the number of players and g the
+            cost of a game
+    """
+    comparison = PairedComparison(num_players)
+    wins_a: ArrayR[int] = ArrayR(num_players)
+    wins_b: ArrayR[int] = ArrayR(num_players)
+    for seed in seeds:
+        for seat in range(num_players):
+            wins_a[seat] = play_seat(strategy_a, seat, opponent, seed, num_players, cards_at_init)
+            wins_b[seat] = play_seat(strategy_b, seat, opponent, seed, num_players, cards_at_init)
+        comparison.add_deal(wins_a, wins_b)
+    return comparison
+
+
+def compare_paired(strategy_a: Strategy, strategy_b: Strategy, seeds: range, num_players: int,
+                   opponent: Strategy = DEFAULT_STRATEGY, executor: Executor | None = None, chunks: int = 1,
+                   cards_at_init: int | None = None) -> PairedComparison:
+    """
+    Method to compare two strategies on the same deals, playing each deal from every seat with both of them
+
+    Args:
+        strategy_a (Strategy): The first strategy compared
+        strategy_b (Strategy): The second strategy compared
+        seeds (range): Seeds of the deals
+        num_players (int): Number of players at every table
+        opponent (Strategy): The strategy of the other players
+        executor (Executor | None): Process pool to play the deals on, None to play them in this process
+        chunks (int): Number of contiguous ranges of deals handed to the executor
+        cards_at_init (int | None): Cards dealt to every player, Constants.NUM_CARDS_AT_INIT if None
+
+    Returns:
+        PairedComparison: The results, the same however the deals are split into chunks up to rounding
+
+    Complexity:
+        Best Case Complexity: O(s * p * g) where s is the number of seeds, p the number of players and g the
+            cost of a game
+        Worst Case Complexity: O(s * p * g) where s is the number of seeds, p the number of players and g the
+            cost of a game
+    """
+    cards_at_init = Constants.NUM_CARDS_AT_INIT if cards_at_init is None else cards_at_init
+    if executor is None:
+        chunks = 1
+    chunks = max(1, min(chunks, len(seeds)))
+    parts = ArrayR(chunks)
+    for c in range(chunks):
+        chunk = tuple(seeds[c * len(seeds) // chunks:(c + 1) * len(seeds) // chunks])
+        args = (strategy_a, strategy_b, opponent, chunk, num_players, cards_at_init)
+        if executor is None:
+            parts[c] = play_deals(*args)
+        else:
+            parts[c] = executor.submit(play_deals, *args)
+
+    comparison = PairedComparison(num_players)
+    for part in parts:
+        comparison.merge(part if executor is None else part.result())
+    return comparison
+
+
+def main() -> None:
+    """
+    Method to compare two strategies from the command line
+    """
+    parser = argparse.ArgumentParser(description="Compare two strategies on the same deals.")
+    parser.add_argument("strategy_a", choices=sorted(STRATEGIES))
+    parser.add_argument("strategy_b", choices=sorted(STRATEGIES))
+    parser.add_argument("--opponent", choices=sorted(STRATEGIES), default="first-playable")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--deals", type=int, default=500)
+    parser.add_argument("--start", type=int, default=0)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--workers", type=int, default=0, help="process pool size, 0 to play in this process")
+    args = parser.parse_args()
+
+    seeds = range(args.start, args.start + args.deals)
+    compared = (STRATEGIES[args.strategy_a], STRATEGIES[args.strategy_b], seeds, args.players,
+                  STRATEGIES[args.opponent])
+    if args.workers > 0:
+        with worker_pool(args.workers, ("paired",)) as pool:
+            comparison = compare_paired(*compared, executor=pool, chunks=4 * args.workers)
+    else:
+        comparison = compare_paired(*compared)
+
+    low, high = comparison.interval(args.confidence)
+    independent_low, independent_high = comparison.independent_interval(args.confidence)
+    print(f"{comparison.deals} deals, {comparison.games} games")
+    print(f"win rate {args.strategy_a}: {comparison.wins_a.mean:.4f}  {args.strategy_b}: {comparison.wins_b.mean:.4f}")
+    print(f"difference {comparison.mean_difference():+.4f}  paired {args.confidence:.0%} CI "
+          f"[{low:+.4f}, {high:+.4f}]  separate batches [{independent_low:+.4f}, {independent_high:+.4f}]")
+    if comparison.efficiency() == float("inf"):
+        print("the strategies played every deal the same way")
+    else:
+        print(f"the pairing needs {comparison.efficiency():.1f}x fewer games for the same precision")
+
+
+if __name__ == "__main__":
+    main()
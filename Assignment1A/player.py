@@ -1,12 +1,14 @@
-from card import Card
+from card import Card, CARDS_BY_ID
 from constants import Constants
 from data_structures.array_sorted_list import ArraySortedList
+from data_structures.referential_array import ArrayR
+from strategy import Strategy, DEFAULT_STRATEGY
 
 class Player:
     """
     Player class to store the player details
     """
-    def __init__(self, name: str, position: int) -> None:
+    def __init__(self, name: str, position: int, strategy: Strategy = None) -> None:
 
         """
         Constructor for the Player class
@@ -14,6 +16,7 @@ class Player:
         Args:
             name (str): The name of the player
             position (int): The position of the player
+            strategy (Strategy): The strategy used to make the player's decisions, DEFAULT_STRATEGY if None
 
         Returns:
             None
@@ -25,6 +28,7 @@ class Player:
         self.name = name
         self.position = position
         self.hand = ArraySortedList(Constants.NUM_MAX_VALS)
+        self.strategy = DEFAULT_STRATEGY if strategy is None else strategy
 
     def add_card(self, card: Card) -> None:
         """
@@ -44,6 +48,23 @@ class Player:
 
         return None
 
+    def add_cards(self, cards: ArrayR[Card]) -> None:
+        """
+        Method to add several cards to the player's hand at once
+
+        Args:
+            cards (ArrayR[Card]): The cards to be added to the player's hand
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(m * log(m) + n) where m is the number of cards added and n the size of the hand
+            Worst Case Complexity: O(m * log(m) + n) where m is the number of cards added and n the size of the hand
+        """
+        self.hand.add_many(cards)
+        return None
+
     def play_card(self, index: int) -> Card:
         """
         Method to play a card from the player's hand
@@ -96,6 +117,43 @@ class Player:
         card = self.hand[index]
         return card
 
+    def __getstate__(self) -> tuple:
+        """
+        Method to get the state pickled for the player, with the hand packed into a byte string of card ids
+
+        Returns:
+            tuple: The name, position, hand and strategy
+
+        Complexity:
+            Best Case Complexity: O(h) where h is the number of cards in the hand
+            Worst Case Complexity: O(h) where h is the number of cards in the hand
+        """
+        items = self.hand.array.array
+        hand = bytes(items[i].id for i in range(len(self.hand)))
+        return self.name, self.position, hand, self.strategy
+
+    def __setstate__(self, state: tuple) -> None:
+        """
+        Method to restore a player pickled with __getstate__(), sharing the Card objects of CARDS_BY_ID
+
+        Args:
+            state (tuple): The name, position, hand and strategy
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(h) where h is the number of cards in the hand
+            Worst Case Complexity: O(h) where h is the number of cards in the hand
+        """
+        self.name, self.position, hand, self.strategy = state
+        # The ids were written in hand order, so the cards are already sorted
+        self.hand = ArraySortedList(max(Constants.NUM_MAX_VALS, len(hand)))
+        items = self.hand.array.array
+        for i in range(len(hand)):
+            items[i] = CARDS_BY_ID[hand[i]]
+        self.hand.length = len(hand)
+
     def __lt__(self, other) -> bool:
         """
         Method to compare two player's positions
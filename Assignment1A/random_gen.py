@@ -5,6 +5,9 @@ __author__ = "Jackson Goerner"
 
 import time
 
+from data_structures.referential_array import ArrayR
+from data_structures.sorting import merge_sort
+
 
 class RandomGen:
     """
@@ -70,3 +73,76 @@ class RandomGen:
         tmp = [collection[p[1]] for p in positions]
         for x in range(len(collection)):
             collection[x] = tmp[x]
+
+
+class RandomStream:
+    """
+    Independent random number stream using the same LCG as `RandomGen`.
+
+    `RandomGen` keeps a single seed shared by the whole program. A `RandomStream` keeps its own seed, so that
+    work such as search rollouts can draw random numbers without disturbing the sequence of the game being
+    played. It offers the same methods as `RandomGen`, so either can be used wherever a generator is expected.
+
+    Usage:
+    ```
+    rng = RandomStream(123)
+    rng.randint(1, 10)       # Same value as RandomGen.randint(1, 10) after RandomGen.set_seed(123)
+    ```
+    """
+
+    def __init__(self, seed: int = None) -> None:
+        self.set_seed(seed)
+
+    def set_seed(self, seed: int = None) -> None:
+        """Seed all future calls to `random` on this stream."""
+        self.seed = time.time_ns() if seed is None else seed
+
+    def random(self) -> int:
+        """Returns a random integer from 0 to 2^32-1"""
+        self.seed = (RandomGen.A * self.seed + RandomGen.C) % RandomGen.MOD
+        return self.seed >> 16
+
+    def random_float(self) -> float:
+        """Returns a random floating point integer in the range 0 to 1."""
+        return self.random() / (1 << 32)
+
+    def randint(self, lo: int, hi: int) -> int:
+        """Returns a random integer from `lo` to `hi` inclusive on both ends."""
+        return (self.random() % (hi - lo + 1)) + lo
+
+    def random_chance(self, ratio: float) -> bool:
+        """Returns random()/2^32 < ratio"""
+        return self.random_float() < ratio
+
+    def random_choice(self, collection):
+        """Returns a random choice from a collection that supports __getitem__ and __len__"""
+        return collection[self.randint(0, len(collection)-1)]
+
+    def random_shuffle(self, collection) -> None:
+        """
+        Randomly shuffles a collection that supports __getitem__, __setitem__ and __len__. Gives the same order
+        as `RandomGen.random_shuffle` from the same seed: positions are sorted by a random key each, with a stable
+        merge sort so equal keys keep their positions in order.
+        :complexity: O(n log n) where n is len(collection)
+        """
+        n = len(collection)
+        if n == 0:
+            return
+        keys = ArrayR(n)
+        positions = ArrayR(n)
+        tmp = ArrayR(n)
+        for i in range(n):
+            keys[i] = self.random()
+            positions[i] = i
+        merge_sort(positions, keys.__getitem__)
+        for x in range(n):
+            tmp[x] = collection[positions[x]]
+        for x in range(n):
+            collection[x] = tmp[x]
+
+    def spawn(self) -> 'RandomStream':
+        """
+        Returns a new stream seeded from the next two values of this one. Streams spawned in turn from
+        streams with the same seed have the same seeds, so each can drive one source of randomness repeatably.
+        """
+        return RandomStream((self.random() << 32) | self.random())
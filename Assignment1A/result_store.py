@@ -0,0 +1,352 @@
+"""
+Append-only columnar store of per-game results, one memory-mapped file per column.
+
+A store is a directory holding a small JSON header (HEADER_FILE) and one file per column of COLUMNS. Every column
+file is a flat array of fixed-width little endian values, row i at byte i * width, so a reader can map it straight
+into a NumPy array without parsing and loading a large store costs no more than opening its files.
+
+Column files grow in chunks and are trimmed to the committed rows when the appender is closed. The header's row
+count is only written by flush() and close(), after the column data, so a reader never sees a row whose columns
+are not all written, even while an appender is still adding to the store.
+"""
+import json
+import mmap
+import os
+import struct
+
+from data_structures.referential_array import ArrayR
+from batch import play_recorded
+from constants import Constants
+from lazy import lazy_import
+
+np = lazy_import("numpy")
+
+HEADER_FILE = "header.json"
+FORMAT = "uno-results"
+VERSION = 1
+NO_HAND = 0xFFFF
+
+# Column name, struct format of one value, values per row. Seats beyond the number of players hold NO_HAND.
+COLUMNS = (
+    ("seed", "q", 1),
+    ("num_players", "B", 1),
+    ("winner", "b", 1),
+    ("turns", "i", 1),
+    ("recycles", "i", 1),
+    ("hand_sizes", "H", Constants.MAX_PLAYERS),
+)
+
+
+def _column_file(path: str, name: str) -> str:
+    """
+    Method to get the path of a column's file
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    return os.path.join(path, name + ".col")
+
+
+def _read_header(path: str) -> dict:
+    """
+    Method to read and check a store's header
+
+    Raises:
+        ValueError: If the directory does not hold a store of this format and version
+
+    Complexity:
+        Best Case Complexity: O(c) where c is the number of columns
+        Worst Case Complexity: O(c) where c is the number of columns
+    """
+    with open(os.path.join(path, HEADER_FILE)) as file:
+        header = json.load(file)
+    if header.get("format") != FORMAT or header.get("version") != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} result store.")
+    return header
+
+
+def _write_header(path: str, rows: int) -> None:
+    """
+    Method to write a store's header, replacing the old one in one step
+
+    Complexity:
+        Best Case Complexity: O(c) where c is the number of columns
+        Worst Case Complexity: O(c) where c is the number of columns
+    """
+    header = {
+        "format": FORMAT,
+        "version": VERSION,
+        "rows": rows,
+        "columns": [{"name": name, "format": "<" + code, "count": count} for name, code, count in COLUMNS],
+    }
+    temporary = os.path.join(path, HEADER_FILE + ".tmp")
+    with open(temporary, "w") as file:
+        json.dump(header, file)
+    os.replace(temporary, os.path.join(path, HEADER_FILE))
+
+
+class _Column:
+    """
+    A column file mapped for writing, with room for a number of rows
+    """
+
+    def __init__(self, path: str, code: str, count: int, rows: int, capacity: int) -> None:
+        """
+        Constructor for the _Column class, opening (or creating) the file with room for capacity rows
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        row = struct.Struct(f"<{count}{code}")
+        value = struct.Struct("<" + code)
+        self.pack_into = row.pack_into
+        self.width = row.size
+        self.pack_value_into = value.pack_into
+        self.value_width = value.size
+        self.file = open(path, "r+b" if os.path.exists(path) else "w+b")
+        self.capacity = 0
+        self.map = None
+        self.reserve(max(capacity, rows))
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Method to grow the file and its mapping to hold capacity rows
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1), the file system allocates the new space lazily
+        """
+        if capacity <= self.capacity:
+            return
+        if self.map is not None:
+            self.map.close()
+        os.ftruncate(self.file.fileno(), capacity * self.width)
+        self.map = mmap.mmap(self.file.fileno(), capacity * self.width)
+        self.capacity = capacity
+
+    def close(self, rows: int) -> None:
+        """
+        Method to write the mapping back, trim the file to rows and close it
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(r) where r is the number of rows, to write them back
+        """
+        self.map.flush()
+        self.map.close()
+        os.ftruncate(self.file.fileno(), rows * self.width)
+        self.file.close()
+
+
+class ResultAppender:
+    """
+    Writer adding rows to the end of a store, creating the store if it does not exist.
+    Only one appender may write to a store at a time.
+    """
+
+    def __init__(self, path: str, chunk_rows: int = 1 << 16) -> None:
+        """
+        Constructor for the ResultAppender class
+
+        Args:
+            path (str): Directory of the store
+            chunk_rows (int): Number of rows the column files grow by at a time
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the directory holds something other than a store of this format
+
+        Complexity:
+            Best Case Complexity: O(c) where c is the number of columns
+            Worst Case Complexity: O(c) where c is the number of columns
+        """
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.chunk_rows = max(1, chunk_rows)
+        if os.path.exists(os.path.join(path, HEADER_FILE)):
+            self.rows = _read_header(path)["rows"]
+        else:
+            self.rows = 0
+            _write_header(path, 0)
+        self.columns: ArrayR[_Column] = ArrayR(len(COLUMNS))
+        for i in range(len(COLUMNS)):
+            name, code, count = COLUMNS[i]
+            self.columns[i] = _Column(_column_file(path, name), code, count, self.rows,
+                                      self.rows + self.chunk_rows)
+
+    def __enter__(self) -> 'ResultAppender':
+        """ Method to use the appender in a with statement, closing it at the end. """
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """ Method to close the appender at the end of a with statement, see close(). """
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Method to get the number of rows appended so far, including those not yet flushed
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.rows
+
+    def append(self, seed: int, winner: int, turns: int, recycles: int, hand_sizes: ArrayR[int]) -> None:
+        """
+        Method to add the result of a game
+
+        Args:
+            seed (int): The game's seed
+            winner (int): Seat of the winner, -1 if there is none
+            turns (int): Number of turns played
+            recycles (int): Number of times the discard pile was recycled
+            hand_sizes (ArrayR[int]): Final number of cards of every seat, one per player
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(p) where p is the number of players
+            Worst Case Complexity: O(p) where p is the number of players
+        """
+        num_players = len(hand_sizes)
+        if num_players > Constants.MAX_PLAYERS:
+            raise ValueError("Too many players for the hand size column.")
+        if self.rows == self.columns[0].capacity:
+            for column in self.columns:
+                column.reserve(self.rows + self.chunk_rows)
+
+        row = self.rows
+        seed_column, players_column, winner_column, turns_column, recycles_column, hands_column = self.columns
+        seed_column.pack_into(seed_column.map, row * seed_column.width, seed)
+        players_column.pack_into(players_column.map, row, num_players)
+        winner_column.pack_into(winner_column.map, row, winner)
+        turns_column.pack_into(turns_column.map, row * turns_column.width, turns)
+        recycles_column.pack_into(recycles_column.map, row * recycles_column.width, recycles)
+        offset = row * hands_column.width
+        for seat in range(Constants.MAX_PLAYERS):
+            size = hand_sizes[seat] if seat < num_players else NO_HAND
+            hands_column.pack_value_into(hands_column.map, offset, size)
+            offset += hands_column.value_width
+        self.rows += 1
+
+    def flush(self) -> None:
+        """
+        Method to make the rows appended so far visible to readers
+
+        Complexity:
+            Best Case Complexity: O(c) where c is the number of columns
+            Worst Case Complexity: O(r) where r is the number of rows written since the last flush
+        """
+        for column in self.columns:
+            column.map.flush()
+        _write_header(self.path, self.rows)
+
+    def close(self) -> None:
+        """
+        Method to flush the rows and trim the column files to them
+
+        Complexity:
+            Best Case Complexity: O(c) where c is the number of columns
+            Worst Case Complexity: O(r) where r is the number of rows written since the last flush
+        """
+        for column in self.columns:
+            column.close(self.rows)
+        _write_header(self.path, self.rows)
+
+
+def append_games(appender: ResultAppender, seeds: ArrayR[int], num_players: int) -> None:
+    """
+    Method to play one bounded game per seed with default players and append their results
+
+    Args:
+        appender (ResultAppender): The store to write to
+        seeds (ArrayR[int]): Seeds of the games, in row order
+        num_players (int): Number of players at every table
+
+    Returns:
+        None
+
+    Complexity:
+        Best Case Complexity: O(s * g) where s is the number of seeds and g the cost of a game
+        Worst Case Complexity: O(s * g) where s is the number of seeds and g the cost of a game
+    """
+    hand_sizes: ArrayR[int] = ArrayR(num_players)
+    for seed in seeds:
+        game, winner, turns = play_recorded(seed, num_players)
+        for seat in range(num_players):
+            hand_sizes[seat] = len(game.players[seat].hand)
+        appender.append(seed, winner, turns, game.recycles, hand_sizes)
+
+
+class ResultStore:
+    """
+    Reader exposing the columns of a store as read-only NumPy arrays mapped from their files
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Constructor for the ResultStore class, reading the header. Rows appended later are not seen.
+
+        Args:
+            path (str): Directory of the store
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the directory does not hold a store of this format
+
+        Complexity:
+            Best Case Complexity: O(c) where c is the number of columns
+            Worst Case Complexity: O(c) where c is the number of columns
+        """
+        self.path = path
+        self.rows = _read_header(path)["rows"]
+
+    def __len__(self) -> int:
+        """
+        Method to get the number of rows
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.rows
+
+    def column(self, name: str):
+        """
+        Method to map a column as a NumPy array, of shape (rows,) or (rows, values per row)
+
+        Args:
+            name (str): Name of the column, see COLUMNS
+
+        Returns:
+            numpy.ndarray: The column, read-only and not loaded until its values are used
+
+        Raises:
+            KeyError: If there is no such column
+            ImportError: If numpy is not installed
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(c) where c is the number of columns
+        """
+        if np is None:
+            raise ImportError("Reading a result store needs numpy.")
+        for i in range(len(COLUMNS)):
+            if COLUMNS[i][0] == name:
+                break
+        else:
+            raise KeyError(name)
+        _, code, count = COLUMNS[i]
+        code = "<" + code
+        shape = (self.rows,) if count == 1 else (self.rows, count)
+        if self.rows == 0:
+            return np.zeros(shape, dtype=code)
+        return np.memmap(_column_file(self.path, name), dtype=code, mode="r", shape=shape)
@@ -0,0 +1,329 @@
+"""
+Rule engine. A RuleSet maps every CardLabel to the handler applying that card's effect, so playing a card costs
+one table lookup instead of a chain of comparisons. Handlers take the game and the card that was just put on the
+discard pile, and return a player who won while the effect was applied (only possible with some variants) or None.
+
+Optional variants build new rule sets from existing ones by replacing or wrapping handlers, so the standard rules
+never check whether a variant is enabled:
+    with_draw_stacking(rules)   a player hit by a draw card passes the penalty on by playing a card of the same label
+    with_seven_zero(rules)      SEVEN swaps hands with the opponent holding the fewest cards, ZERO passes every hand on
+    with_jump_in(rules)         a player holding a card identical to the one just played plays it out of turn
+"""
+from __future__ import annotations
+
+from typing import Callable, TYPE_CHECKING
+
+from data_structures.referential_array import ArrayR
+from card import Card, CardLabel
+from player import Player
+from strategy import DEFAULT_STRATEGY
+
+if TYPE_CHECKING:
+    from game import Game
+
+Effect = Callable[['Game', Card], Player | None]
+
+
+def no_effect(game: Game, card: Card) -> Player | None:
+    """ Effect of a number card. """
+    return None
+
+
+def reverse_effect(game: Game, card: Card) -> Player | None:
+    """ Effect of a REVERSE card, see Game.play_reverse(). """
+    game.play_reverse()
+    return None
+
+
+def skip_effect(game: Game, card: Card) -> Player | None:
+    """ Effect of a SKIP card, see Game.play_skip(). """
+    game.play_skip()
+    return None
+
+
+def draw_two_effect(game: Game, card: Card) -> Player | None:
+    """ Effect of a DRAW_TWO card: the next player draws two cards and misses their turn. """
+    next_player = game.next_player()
+    for _ in range(2):
+        game.draw_card(next_player, False)
+    game.play_skip()
+    return None
+
+
+def crazy_effect(game: Game, card: Card) -> Player | None:
+    """ Effect of a CRAZY or DRAW_FOUR card, see Game.crazy_play(). """
+    game.crazy_play(card)
+    return None
+
+
+class RuleSet:
+    """
+    Table of the effect handler of every card label. A rule set is not changed once created, so games can share it.
+    """
+
+    def __init__(self, effects: ArrayR[Effect]) -> None:
+        """
+        Constructor for the RuleSet class
+
+        Args:
+            effects (ArrayR[Effect]): The handler of every label, indexed by the label's value
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.effects = effects
+
+    def __reduce__(self) -> tuple | str:
+        """
+        Method to pickle the standard rules as a reference to STANDARD_RULES, so unpickled games share them.
+        Other rule sets are pickled by their handlers, which fails for variants built from nested functions.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(l) where l is the number of labels
+        """
+        if self is STANDARD_RULES:
+            return "STANDARD_RULES"
+        return RuleSet, (self.effects,)
+
+    def replace(self, label: CardLabel, effect: Effect) -> RuleSet:
+        """
+        Method to create a rule set with a different handler for one label
+
+        Args:
+            label (CardLabel): The label whose effect changes
+            effect (Effect): The new handler
+
+        Returns:
+            RuleSet: A new rule set, this one is left unchanged
+
+        Complexity:
+            Best Case Complexity: O(l) where l is the number of labels
+            Worst Case Complexity: O(l) where l is the number of labels
+        """
+        effects: ArrayR[Effect] = ArrayR(len(self.effects))
+        for i in range(len(self.effects)):
+            effects[i] = self.effects[i]
+        effects[label] = effect
+        return RuleSet(effects)
+
+
+def _standard_effects() -> ArrayR[Effect]:
+    """
+    Method to build the handler table of the standard rules
+
+    Complexity:
+        Best Case Complexity: O(l) where l is the number of labels
+        Worst Case Complexity: O(l) where l is the number of labels
+    """
+    effects: ArrayR[Effect] = ArrayR(len(CardLabel))
+    for label in CardLabel:
+        effects[label] = no_effect
+    effects[CardLabel.SKIP] = skip_effect
+    effects[CardLabel.REVERSE] = reverse_effect
+    effects[CardLabel.DRAW_TWO] = draw_two_effect
+    effects[CardLabel.CRAZY] = crazy_effect
+    effects[CardLabel.DRAW_FOUR] = crazy_effect
+    return effects
+
+
+STANDARD_RULES = RuleSet(_standard_effects())
+
+
+def _find_label(player: Player, label: CardLabel) -> int:
+    """
+    Method to find a card with the given label in a player's hand
+
+    Returns:
+        int: The index of the first such card, -1 if there is none
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(h) where h is the number of cards in the hand
+    """
+    index = 0
+    for card in player.hand:
+        if card.label == label:
+            return index
+        index += 1
+    return -1
+
+
+def _stacking_draw(count: int) -> Effect:
+    """
+    Method to create the handler of a draw card when draw stacking is allowed. Every player hit by the penalty
+    who holds a card with the same label plays it, adding to the penalty and passing it on, until someone cannot.
+    That player draws the whole penalty and misses their turn. After a DRAW_FOUR the last player to stack chooses
+    the color.
+
+    Complexity:
+        Best Case Complexity: O(h + p) where h is the number of cards in a hand and p the number of players
+        Worst Case Complexity: O(s * (h + p) + c) for s stacked cards and a penalty of c cards
+    """
+
+    def effect(game: Game, card: Card) -> Player | None:
+        winner = None
+        penalty = count
+        victim = game.next_player()
+        index = _find_label(victim, card.label)
+        while index >= 0 and winner is None:
+            # The victim stacks, becoming the player the penalty is passed on from
+            stacked = victim.play_card(index)
+            game.discard_pile.push(stacked)
+            game.current_color, game.current_label = stacked.color, stacked.label
+            if len(victim.hand) == 0:
+                winner = victim
+            game.current_player = victim
+            penalty += count
+            victim = game.next_player()
+            index = _find_label(victim, card.label)
+
+        chooser = game.current_player
+        for _ in range(penalty):
+            game.draw_card(victim, False)
+        game.play_skip()
+
+        if card.label == CardLabel.DRAW_FOUR:
+            strategy = DEFAULT_STRATEGY if chooser is None else chooser.strategy
+            game.current_color = strategy.choose_color(chooser, game.rng)
+            game.current_label = None
+        return winner
+
+    return effect
+
+
+def with_draw_stacking(rules: RuleSet = STANDARD_RULES) -> RuleSet:
+    """
+    Method to allow DRAW_TWO cards to be stacked on DRAW_TWO cards and DRAW_FOUR cards on DRAW_FOUR cards
+
+    Complexity:
+        Best Case Complexity: O(l) where l is the number of labels
+        Worst Case Complexity: O(l) where l is the number of labels
+    """
+    return rules.replace(CardLabel.DRAW_TWO, _stacking_draw(2)).replace(CardLabel.DRAW_FOUR, _stacking_draw(4))
+
+
+def seven_effect(game: Game, card: Card) -> Player | None:
+    """
+    Effect of a SEVEN with the 7-0 variant: the player swaps hands with the opponent holding the fewest cards,
+    the first in turn order on ties. Nothing happens if the player has just won.
+
+    Complexity:
+        Best Case Complexity: O(p) where p is the number of players
+        Worst Case Complexity: O(p^2) where p is the number of players
+    """
+    player = game.current_player
+    if player is None or len(player.hand) == 0:
+        return None
+    target = None
+    other = game.next_player()
+    while other is not player:
+        if target is None or len(other.hand) < len(target.hand):
+            target = other
+        other = game.players[_seat_after(game, other)]
+    if target is not None:
+        player.hand, target.hand = target.hand, player.hand
+    return None
+
+
+def _seat_after(game: Game, player: Player) -> int:
+    """
+    Method to find the seat of the player after the given one in turn order
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(p) where p is the number of players
+    """
+    next_position = (player.position + 1) % len(game.players)
+    seat = 0
+    for other in game.players:
+        if other.position == next_position:
+            return seat
+        seat += 1
+    return seat
+
+
+def zero_effect(game: Game, card: Card) -> Player | None:
+    """
+    Effect of a ZERO with the 7-0 variant: every player passes their hand to the next player in turn order.
+    Nothing happens if the player has just won.
+
+    Complexity:
+        Best Case Complexity: O(p) where p is the number of players
+        Worst Case Complexity: O(p) where p is the number of players
+    """
+    player = game.current_player
+    if player is None or len(player.hand) == 0:
+        return None
+    num_players = len(game.players)
+    hands = ArrayR(num_players)
+    for other in game.players:
+        hands[other.position] = other.hand
+    for other in game.players:
+        other.hand = hands[(other.position - 1) % num_players]
+    return None
+
+
+def with_seven_zero(rules: RuleSet = STANDARD_RULES) -> RuleSet:
+    """
+    Method to make SEVEN cards swap hands and ZERO cards pass every hand on
+
+    Complexity:
+        Best Case Complexity: O(l) where l is the number of labels
+        Worst Case Complexity: O(l) where l is the number of labels
+    """
+    return rules.replace(CardLabel.SEVEN, seven_effect).replace(CardLabel.ZERO, zero_effect)
+
+
+def _jump_in(effect: Effect) -> Effect:
+    """
+    Method to wrap a handler so that, once the card's effect is applied, the first player in turn order holding
+    an identical card plays it out of turn. Play then carries on from them.
+
+    Complexity:
+        Best Case Complexity: O(p * h) plus the cost of the handler, where p is the number of players and h the
+            largest hand size
+        Worst Case Complexity: O(p * h) per card played in a chain of jump-ins
+    """
+
+    def jump_in(game: Game, card: Card) -> Player | None:
+        player = game.current_player
+        winner = effect(game, card)
+        if winner is not None or player is None or len(player.hand) == 0:
+            return winner
+
+        other = game.next_player()
+        for _ in range(len(game.players)):
+            index = 0
+            for held in other.hand:
+                if held.id == card.id and other is not player:
+                    game.current_player = other
+                    other.play_card(index)
+                    if len(other.hand) == 0:
+                        # Winning by jumping in ends the game, the card's effect still applies
+                        game.play_card_object(held)
+                        return other
+                    return game.play_card_object(held)
+                index += 1
+            other = game.players[_seat_after(game, other)]
+        return None
+
+    return jump_in
+
+
+def with_jump_in(rules: RuleSet = STANDARD_RULES) -> RuleSet:
+    """
+    Method to let players jump in with a card identical to the one just played
+
+    Complexity:
+        Best Case Complexity: O(l) where l is the number of labels
+        Worst Case Complexity: O(l) where l is the number of labels
+    """
+    effects: ArrayR[Effect] = ArrayR(len(rules.effects))
+    for label in CardLabel:
+        effects[label] = _jump_in(rules.effects[label])
+    return RuleSet(effects)
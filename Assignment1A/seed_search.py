@@ -0,0 +1,353 @@
+"""
+Search for seeds whose games have rare properties, e.g. to build seeded regression scenarios.
+
+A TurnPredicate watches the stream of turns of a game and answers MATCH, IMPOSSIBLE or UNDECIDED after each one.
+A game stops as soon as the answer is decided, so predicates about the first few turns cost only those turns.
+Seeds are scanned in chunks, on an Executor if one is given. The search stops once the K lowest matching seeds
+of the range are known: chunks still running are cancelled and no more are started, and the result is the same
+however many workers are used.
+
+Predicates are pickled to process pool workers, so they must be defined at module level there.
+
+Usage (from the Assignment1A folder):
+    python -m seed_search last-card-draw-four --players 4 --hits 3 --stop 100000 --workers 4
+    python -m seed_search recycle-within 40 --players 2
+"""
+from abc import ABC, abstractmethod
+import argparse
+from concurrent.futures import Executor, FIRST_COMPLETED, wait
+from enum import IntEnum, auto
+
+from data_structures.array_list import ArrayList
+from data_structures.referential_array import ArrayR
+from batch import NO_WINNER, RecordingGame, worker_pool
+from card import Card, CardLabel
+from constants import Constants
+from game import Game, PilesExhausted
+from player import Player
+from random_gen import RandomStream
+
+
+class Verdict(IntEnum):
+    """
+    Enum class for a predicate's answer after a turn
+    """
+    UNDECIDED = 0
+    MATCH = auto()
+    IMPOSSIBLE = auto()
+
+
+class Turn:
+    """
+    What happened during one turn of a searched game
+    """
+
+    def __init__(self, game: Game, number: int, seat: int, played: Card | None, drawn: int, recycled: bool,
+                 winner: int) -> None:
+        """
+        Constructor for the Turn class
+
+        Args:
+            game (Game): The game, in its state after the turn
+            number (int): Number of the turn, from 1
+            seat (int): Seat of the player whose turn it was
+            played (Card | None): The last card played during the turn, None if none was
+            drawn (int): Number of cards drawn during the turn
+            recycled (bool): Whether the discard pile was shuffled back into the draw pile during the turn
+            winner (int): Seat of the winner if the turn ended the game, NO_WINNER otherwise
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.game = game
+        self.number = number
+        self.seat = seat
+        self.played = played
+        self.drawn = drawn
+        self.recycled = recycled
+        self.winner = winner
+
+
+class TurnPredicate(ABC):
+    """
+    Abstract class for properties of a game decided from its turns
+    """
+
+    def reset(self) -> None:
+        """
+        Method called before every game, for predicates that keep state between turns
+        """
+        pass
+
+    @abstractmethod
+    def observe(self, turn: Turn) -> Verdict:
+        """
+        Method to decide the property after a turn. A game that ends, or is aborted, while the answer is still
+        UNDECIDED does not match.
+
+        Args:
+            turn (Turn): The turn just played
+
+        Returns:
+            Verdict: Whether the game has the property, does not, or it is too early to tell
+        """
+        pass
+
+
+class LastCardIs(TurnPredicate):
+    """
+    Games won by playing a card with a given label
+    """
+
+    def __init__(self, label: CardLabel) -> None:
+        """
+        Constructor for the LastCardIs class
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.label = label
+
+    def observe(self, turn: Turn) -> Verdict:
+        """
+        Method to decide the property once the game is won
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if turn.winner == NO_WINNER:
+            return Verdict.UNDECIDED
+        return Verdict.MATCH if turn.played is not None and turn.played.label == self.label else Verdict.IMPOSSIBLE
+
+
+class RecycleWithin(TurnPredicate):
+    """
+    Games in which the discard pile is recycled within a number of turns
+    """
+
+    def __init__(self, turns: int) -> None:
+        """
+        Constructor for the RecycleWithin class
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.turns = turns
+
+    def observe(self, turn: Turn) -> Verdict:
+        """
+        Method to decide the property at the first recycle, or once the turn limit is reached
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if turn.recycled:
+            return Verdict.MATCH
+        return Verdict.IMPOSSIBLE if turn.number >= self.turns else Verdict.UNDECIDED
+
+
+class _SearchGame(RecordingGame):
+    """
+    Game remembering the last card played, for building Turn records
+    """
+
+    def play_card_object(self, card: Card) -> Player | None:
+        """
+        Method to play a card, see BoundedGame.play_card_object(), remembering it
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(h + n + p) see Game.play_card_object()
+        """
+        self.last_played = card
+        return RecordingGame.play_card_object(self, card)
+
+
+def play_until_decided(predicate: TurnPredicate, seed: int, num_players: int, cards_at_init: int | None = None) \
+        -> int:
+    """
+    Method to play a game only until the predicate is decided
+
+    Args:
+        predicate (TurnPredicate): The property searched for
+        seed (int): Seed for the game's random numbers
+        num_players (int): Number of players at the table
+        cards_at_init (int | None): Cards dealt to every player, Constants.NUM_CARDS_AT_INIT if None
+
+    Returns:
+        int: The number of the turn the game matched on, 0 if it does not match
+
+    Complexity:
+        Best Case Complexity: O(n + p * log(p)) when the first turn decides, see Game.initialise_game()
+        Worst Case Complexity: O(t * (h + n + p)) where t is the turn limit, see Game.play_turn()
+    """
+    players: ArrayR[Player] = ArrayR(num_players)
+    for seat in range(num_players):
+        players[seat] = Player(str(seat), seat)
+    game = _SearchGame()
+    game.rng = RandomStream(seed)
+    game.initialise_game(players, cards_at_init)
+    predicate.reset()
+
+    for number in range(1, Constants.MAX_ROUNDS_PER_PLAYER * num_players + 1):
+        # A skip moves current_player past the player whose turn it was, so find their seat first
+        seat = game._seat(game.next_player())
+        drawn, recycles = game.cards_drawn, game.recycles
+        game.last_played = None
+        try:
+            winner = game.play_turn()
+        except PilesExhausted:
+            return 0
+        winner_seat = NO_WINNER if winner is None else game._seat(winner)
+        turn = Turn(game, number, seat, game.last_played, game.cards_drawn - drawn,
+                    game.recycles > recycles, winner_seat)
+        verdict = predicate.observe(turn)
+        if verdict != Verdict.UNDECIDED:
+            return number if verdict == Verdict.MATCH else 0
+        if winner is not None:
+            return 0
+    return 0
+
+
+def scan_seeds(predicate: TurnPredicate, seeds: tuple[int, ...], num_players: int, cards_at_init: int,
+               limit: int) -> ArrayList[tuple[int, int]]:
+    """
+    Method run by a worker to test a chunk of seeds, stopping after limit matches
+
+    Args:
+        predicate (TurnPredicate): The property searched for
+        seeds (tuple[int, ...]): The seeds to test, in order
+        num_players (int): Number of players at every table
+        cards_at_init (int): Number of cards dealt to every player
+        limit (int): Number of matches after which the rest of the chunk is skipped
+
+    Returns:
+        ArrayList[tuple[int, int]]: The matching seeds, with the turn each matched on, in seed order
+
+    Complexity:
+        Best Case Complexity: O(s * g) where s is the number of seeds tested and g the cost of a game
+        Worst Case Complexity: O(s * g) where s is the number of seeds tested and g the cost of a game
+    """
+    hits: ArrayList[tuple[int, int]] = ArrayList()
+    for seed in seeds:
+        turn = play_until_decided(predicate, seed, num_players, cards_at_init)
+        if turn > 0:
+            hits.append((seed, turn))
+            if len(hits) >= limit:
+                break
+    return hits
+
+
+def search_seeds(predicate: TurnPredicate, seeds: range, num_players: int, hits: int = 1,
+                 executor: Executor | None = None, chunk_size: int = 256, in_flight: int = 8,
+                 cards_at_init: int | None = None) -> ArrayList[tuple[int, int]]:
+    """
+    Method to find the first seeds of a range whose games match a predicate
+
+    Args:
+        predicate (TurnPredicate): The property searched for
+        seeds (range): The seeds to scan, in order
+        num_players (int): Number of players at every table
+        hits (int): Number of matching seeds wanted
+        executor (Executor | None): Pool to scan chunks on, None to scan them in this process
+        chunk_size (int): Number of seeds per chunk
+        in_flight (int): Number of chunks submitted to the executor at a time
+        cards_at_init (int | None): Cards dealt to every player, Constants.NUM_CARDS_AT_INIT if None
+
+    Returns:
+        ArrayList[tuple[int, int]]: The first min(hits, matches) matching seeds of the range, with the turn each
+            matched on, in seed order
+
+    Complexity:
+        Best Case Complexity: O(c * g) where c is chunk_size and g the cost of a game, if the first chunk has
+            enough matches
+        Worst Case Complexity: O(s * g) where s is the number of seeds
+    """
+    cards_at_init = Constants.NUM_CARDS_AT_INIT if cards_at_init is None else cards_at_init
+    num_chunks = (len(seeds) + chunk_size - 1) // chunk_size
+    found: ArrayList[tuple[int, int]] = ArrayList()
+
+    def chunk(index: int) -> tuple:
+        return predicate, tuple(seeds[index * chunk_size:(index + 1) * chunk_size]), num_players, cards_at_init, hits
+
+    if executor is None:
+        for index in range(num_chunks):
+            found.extend(scan_seeds(*chunk(index)))
+            if len(found) >= hits:
+                break
+        return found[:hits]
+
+    # Chunks can finish in any order; matches are only final once every earlier chunk has finished too. Chunks
+    # from done to next_chunk have been submitted, and a chunk's result is None until it has been collected.
+    futures = ArrayR(max(1, num_chunks))
+    results: ArrayR[ArrayList[tuple[int, int]] | None] = ArrayR(max(1, num_chunks))
+    next_chunk = 0
+    done = 0
+    running = 0
+    try:
+        while done < num_chunks and len(found) < hits:
+            while next_chunk < num_chunks and running < max(1, in_flight):
+                futures[next_chunk] = executor.submit(scan_seeds, *chunk(next_chunk))
+                next_chunk += 1
+                running += 1
+            wait((futures[i] for i in range(done, next_chunk) if results[i] is None), return_when=FIRST_COMPLETED)
+            for i in range(done, next_chunk):
+                if results[i] is None and futures[i].done():
+                    results[i] = futures[i].result()
+                    running -= 1
+            while done < next_chunk and results[done] is not None:
+                found.extend(results[done])
+                results[done] = futures[done] = None
+                done += 1
+    finally:
+        for i in range(done, next_chunk):
+            futures[i].cancel()
+    return found[:hits]
+
+
+PREDICATES = {
+    "last-card-draw-four": lambda argument: LastCardIs(CardLabel.DRAW_FOUR),
+    "last-card-crazy": lambda argument: LastCardIs(CardLabel.CRAZY),
+    "recycle-within": lambda argument: RecycleWithin(int(argument)),
+}
+
+
+def main() -> None:
+    """
+    Method to search for seeds from the command line
+    """
+    parser = argparse.ArgumentParser(description="Find seeds whose games have a property.")
+    parser.add_argument("predicate", choices=sorted(PREDICATES))
+    parser.add_argument("argument", nargs="?", default="", help="argument of the predicate, e.g. a turn count")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--cards", type=int, default=Constants.NUM_CARDS_AT_INIT)
+    parser.add_argument("--start", type=int, default=0)
+    parser.add_argument("--stop", type=int, default=100_000)
+    parser.add_argument("--hits", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=0, help="number of worker processes, 0 for none")
+    args = parser.parse_args()
+
+    predicate = PREDICATES[args.predicate](args.argument)
+    seeds = range(args.start, args.stop)
+    if args.workers > 0:
+        with worker_pool(args.workers, ("seed_search",)) as executor:
+            found = search_seeds(predicate, seeds, args.players, args.hits, executor, in_flight=2 * args.workers,
+                                 cards_at_init=args.cards)
+    else:
+        found = search_seeds(predicate, seeds, args.players, args.hits, cards_at_init=args.cards)
+    for seed, turn in found:
+        print(f"seed {seed} matched on turn {turn}")
+    if len(found) == 0:
+        print("no matching seed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,478 @@
+"""
+Streaming statistics over simulation batches, in memory that does not grow with the number of games.
+
+    RunningStats    count, mean, variance, minimum and maximum, updated with Welford's method
+    Histogram       counts of values in fixed-width buckets, plus values below and above them
+    QuantileSketch  quantiles with a bounded relative error, from logarithmically sized buckets
+    GameStats       win counts per seat, game lengths and final hand sizes of a batch of games
+
+Every aggregator has a merge() method, so workers can each aggregate a share of a batch and the parent combine
+them. Histograms and sketches merge exactly: the merged counts are the counts of the combined stream. This still holds
+once a sketch has more than max_buckets buckets, because combining them keeps the max_buckets highest keys ever
+counted and folds every lower bucket into the lowest of those, whatever order the values and sketches came in.
+RunningStats merges with the pairwise update of Chan et al., which matches aggregating the combined stream up to
+rounding.
+"""
+from math import ceil, log, sqrt
+
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.referential_array import ArrayR
+from outcome_cache import GameOutcome, NO_WINNER
+
+
+class RunningStats:
+    """
+    Count, mean, variance, minimum and maximum of a stream of numbers
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for the RunningStats class
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value: float) -> None:
+        """
+        Method to add a value to the stream
+
+        Args:
+            value (float): The value
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: 'RunningStats') -> None:
+        """
+        Method to add the values aggregated by another RunningStats
+
+        Args:
+            other (RunningStats): The other aggregator, left unchanged
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2, self.min, self.max = other.count, other.mean, other.m2, other.min, other.max
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def variance(self, sample: bool = True) -> float:
+        """
+        Method to get the variance of the values
+
+        Args:
+            sample (bool): True for the sample variance (dividing by count - 1), False for the population variance
+
+        Returns:
+            float: The variance, 0.0 if there are too few values
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        divisor = self.count - 1 if sample else self.count
+        return self.m2 / divisor if divisor > 0 else 0.0
+
+    def stddev(self, sample: bool = True) -> float:
+        """
+        Method to get the standard deviation of the values, see variance()
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return sqrt(self.variance(sample))
+
+
+class Histogram:
+    """
+    Counts of values in buckets [low + i * width, low + (i + 1) * width)
+    """
+
+    def __init__(self, low: float, width: float, buckets: int) -> None:
+        """
+        Constructor for the Histogram class
+
+        Args:
+            low (float): Lower end of the first bucket
+            width (float): Width of every bucket
+            buckets (int): Number of buckets
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(b) where b is the number of buckets
+            Worst Case Complexity: O(b) where b is the number of buckets
+        """
+        if width <= 0 or buckets <= 0:
+            raise ValueError("A histogram needs a positive bucket width and at least one bucket.")
+        self.low = low
+        self.width = width
+        self.counts: ArrayR[int] = ArrayR(buckets)
+        for i in range(buckets):
+            self.counts[i] = 0
+        self.below = 0
+        self.above = 0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """
+        Method to count a value
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.count += 1
+        bucket = int((value - self.low) // self.width)
+        if bucket < 0:
+            self.below += 1
+        elif bucket >= len(self.counts):
+            self.above += 1
+        else:
+            self.counts[bucket] += 1
+
+    def merge(self, other: 'Histogram') -> None:
+        """
+        Method to add the counts of another histogram with the same buckets
+
+        Raises:
+            ValueError: If the histograms' buckets differ
+
+        Complexity:
+            Best Case Complexity: O(b) where b is the number of buckets
+            Worst Case Complexity: O(b) where b is the number of buckets
+        """
+        if (self.low, self.width, len(self.counts)) != (other.low, other.width, len(other.counts)):
+            raise ValueError("Only histograms with the same buckets can be merged.")
+        for i in range(len(self.counts)):
+            self.counts[i] += other.counts[i]
+        self.below += other.below
+        self.above += other.above
+        self.count += other.count
+
+    def quantile(self, q: float) -> float:
+        """
+        Method to estimate a quantile by the lower end of the bucket holding it
+
+        Args:
+            q (float): The quantile, between 0 and 1
+
+        Returns:
+            float: The estimate, -inf or inf if it falls below or above the buckets
+
+        Raises:
+            ValueError: If nothing has been counted
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(b) where b is the number of buckets
+        """
+        if self.count == 0:
+            raise ValueError("Quantile of an empty histogram.")
+        rank = q * (self.count - 1)
+        seen = self.below
+        if rank < seen:
+            return float("-inf")
+        for i in range(len(self.counts)):
+            seen += self.counts[i]
+            if rank < seen:
+                return self.low + i * self.width
+        return float("inf")
+
+
+class _Bucket:
+    """
+    Count of the values of a QuantileSketch in one bucket, ordered by the bucket's key
+    """
+    __slots__ = ("key", "count")
+
+    def __init__(self, key: int, count: int) -> None:
+        """
+        Constructor for the _Bucket class
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.key = key
+        self.count = count
+
+    def __lt__(self, other: '_Bucket') -> bool:
+        return self.key < other.key
+
+    def __le__(self, other: '_Bucket') -> bool:
+        return self.key <= other.key
+
+    def __gt__(self, other: '_Bucket') -> bool:
+        return self.key > other.key
+
+    def __eq__(self, other: '_Bucket') -> bool:
+        return self.key == other.key
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch of non-negative values, with logarithmic buckets (as in DDSketch): a value v > 0 is
+    counted in bucket ceil(log(v) / log(gamma)), so every estimate is within relative_accuracy of a value of the
+    stream at the right rank. Values up to min_value share a single bucket.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-9, max_buckets: int = 2048) -> None:
+        """
+        Constructor for the QuantileSketch class
+
+        Args:
+            relative_accuracy (float): Largest relative error of an estimate, between 0 and 1
+            min_value (float): Values up to this are counted together as the smallest values
+            max_buckets (int): Most buckets kept, the lowest ones being combined beyond that
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("The relative accuracy must be between 0 and 1.")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = log(self.gamma)
+        self.min_value = min_value
+        self.max_buckets = max_buckets
+        self.buckets: ArraySortedList[_Bucket] = ArraySortedList(1)
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """
+        Method to count a value
+
+        Raises:
+            ValueError: If the value is negative
+
+        Complexity:
+            Best Case Complexity: O(log k) where k is the number of buckets, when the value's bucket exists
+            Worst Case Complexity: O(k * log k) when buckets have to be combined
+        """
+        if value < 0:
+            raise ValueError("A quantile sketch only counts non-negative values.")
+        self.count += 1
+        if value <= self.min_value:
+            self.zero_count += 1
+            return
+        bucket = _Bucket(ceil(log(value) / self.log_gamma), 1)
+        try:
+            self.buckets[self.buckets.index(bucket)].count += 1
+        except ValueError:
+            self.buckets.add(bucket)
+            if len(self.buckets) > self.max_buckets:
+                self._collapse()
+
+    def _collapse(self) -> None:
+        """
+        Method to combine the lowest buckets until there are max_buckets left, giving up accuracy on the smallest
+        values only. The buckets left are the max_buckets highest keys ever counted, so the result does not depend
+        on the order the values or sketches were added in.
+
+        Complexity:
+            Best Case Complexity: O(k * log k) where k is the number of buckets
+            Worst Case Complexity: O(k * log k) where k is the number of buckets
+        """
+        excess = len(self.buckets) - self.max_buckets
+        if excess <= 0:
+            return
+        lowest = self.buckets[excess]
+        for i in range(excess):
+            lowest.count += self.buckets[i].count
+        kept: ArraySortedList[_Bucket] = ArraySortedList(self.max_buckets)
+        for i in range(excess, len(self.buckets)):
+            kept.add(self.buckets[i])
+        self.buckets = kept
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """
+        Method to add the counts of another sketch with the same accuracy
+
+        Raises:
+            ValueError: If the sketches' accuracy or minimum value differ
+
+        Complexity:
+            Best Case Complexity: O(k * log k) where k is the number of buckets of both sketches
+            Worst Case Complexity: O(k * log k) where k is the number of buckets of both sketches
+        """
+        if (self.gamma, self.min_value) != (other.gamma, other.min_value):
+            raise ValueError("Only sketches with the same accuracy can be merged.")
+        # Both lists are in key order, so they are merged in one pass, adding the counts of equal keys
+        ours, theirs = self.buckets, other.buckets
+        merged: ArraySortedList[_Bucket] = ArraySortedList(len(ours) + len(theirs))
+        i = j = 0
+        while i < len(ours) or j < len(theirs):
+            if j == len(theirs) or (i < len(ours) and ours[i] < theirs[j]):
+                merged.add(ours[i])
+                i += 1
+            elif i == len(ours) or theirs[j] < ours[i]:
+                merged.add(_Bucket(theirs[j].key, theirs[j].count))
+                j += 1
+            else:
+                merged.add(_Bucket(ours[i].key, ours[i].count + theirs[j].count))
+                i += 1
+                j += 1
+        self.buckets = merged
+        self.zero_count += other.zero_count
+        self.count += other.count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def quantile(self, q: float) -> float:
+        """
+        Method to estimate a quantile
+
+        Args:
+            q (float): The quantile, between 0 and 1
+
+        Returns:
+            float: The estimate, 0.0 if the quantile falls among the values up to min_value
+
+        Raises:
+            ValueError: If nothing has been counted
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(k) where k is the number of buckets
+        """
+        if self.count == 0:
+            raise ValueError("Quantile of an empty sketch.")
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for bucket in self.buckets:
+            seen += bucket.count
+            if rank < seen:
+                # The middle of the bucket (gamma^(key-1), gamma^key] in relative terms
+                return 2 * self.gamma ** bucket.key / (self.gamma + 1)
+        return 2 * self.gamma ** self.buckets[len(self.buckets) - 1].key / (self.gamma + 1)
+
+
+class GameStats:
+    """
+    Statistics of a batch of games with the same number of players
+    """
+
+    def __init__(self, num_players: int, max_turns: int = 1000, turn_bucket: int = 10) -> None:
+        """
+        Constructor for the GameStats class
+
+        Args:
+            num_players (int): Number of players at every table
+            max_turns (int): Game lengths above this are counted as one group in the histogram
+            turn_bucket (int): Width of the buckets of the game length histogram
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(p + t) where p is the number of players and t the number of turn buckets
+            Worst Case Complexity: O(p + t) where p is the number of players and t the number of turn buckets
+        """
+        self.num_players = num_players
+        self.games = 0
+        self.unfinished = 0
+        self.wins: ArrayR[int] = ArrayR(num_players)
+        for seat in range(num_players):
+            self.wins[seat] = 0
+        self.turns = RunningStats()
+        self.turn_histogram = Histogram(0, turn_bucket, max(1, ceil(max_turns / turn_bucket)))
+        self.hand_sizes = QuantileSketch()
+
+    def add(self, outcome: GameOutcome) -> None:
+        """
+        Method to count the outcome of a game
+
+        Args:
+            outcome (GameOutcome): How the game ended
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(p) where p is the number of players
+            Worst Case Complexity: O(p) where p is the number of players
+        """
+        self.games += 1
+        if outcome.winner == NO_WINNER:
+            self.unfinished += 1
+        else:
+            self.wins[outcome.winner] += 1
+        self.turns.add(outcome.turns)
+        self.turn_histogram.add(outcome.turns)
+        for seat in range(len(outcome.hand_sizes)):
+            if seat != outcome.winner:
+                self.hand_sizes.add(outcome.hand_sizes[seat])
+
+    def merge(self, other: 'GameStats') -> None:
+        """
+        Method to add the games counted by another GameStats with the same number of players
+
+        Raises:
+            ValueError: If the number of players differs
+
+        Complexity:
+            Best Case Complexity: O(p + t + k) where k is the number of sketch buckets
+            Worst Case Complexity: O(p + t + k * log k) where k is the number of sketch buckets
+        """
+        if self.num_players != other.num_players:
+            raise ValueError("Only statistics of games with the same number of players can be merged.")
+        self.games += other.games
+        self.unfinished += other.unfinished
+        for seat in range(self.num_players):
+            self.wins[seat] += other.wins[seat]
+        self.turns.merge(other.turns)
+        self.turn_histogram.merge(other.turn_histogram)
+        self.hand_sizes.merge(other.hand_sizes)
+
+    def win_rate(self, seat: int) -> float:
+        """
+        Method to get the fraction of the games won by a seat
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.wins[seat] / self.games if self.games > 0 else 0.0
@@ -0,0 +1,247 @@
+from abc import ABC, abstractmethod
+
+from data_structures.referential_array import ArrayR
+from card import CardColor, CardLabel
+from random_gen import RandomGen
+from constants import Constants
+
+
+def _build_color_masks() -> ArrayR[int]:
+    """
+    Method to precompute, for every color, the set of card ids of that color
+
+    Returns:
+        ArrayR[int]: Bitmask over card ids for each color
+
+    Complexity:
+        Best Case Complexity: O(c * l) where c is the number of colors and l the number of labels
+        Worst Case Complexity: O(c * l) where c is the number of colors and l the number of labels
+    """
+    masks: ArrayR[int] = ArrayR(Constants.NUM_COLORS)
+    for color in CardColor:
+        mask = 0
+        for label in CardLabel:
+            mask |= 1 << (color * Constants.NUM_MAX_VALS + label)
+        masks[color] = mask
+    return masks
+
+
+def _build_label_masks() -> ArrayR[int]:
+    """
+    Method to precompute, for every label, the set of card ids with that label
+
+    Returns:
+        ArrayR[int]: Bitmask over card ids for each label
+
+    Complexity:
+        Best Case Complexity: O(c * l) where c is the number of colors and l the number of labels
+        Worst Case Complexity: O(c * l) where c is the number of colors and l the number of labels
+    """
+    masks: ArrayR[int] = ArrayR(Constants.NUM_MAX_VALS)
+    for label in CardLabel:
+        mask = 0
+        for color in CardColor:
+            mask |= 1 << (color * Constants.NUM_MAX_VALS + label)
+        masks[label] = mask
+    return masks
+
+
+def _build_playable_ids() -> ArrayR[int]:
+    """
+    Method to precompute the set of playable card ids for every color and label the game can be in.
+    Row c holds the entries for color c, with the last column used when there is no current label.
+
+    Returns:
+        ArrayR[int]: Bitmask over card ids for each (color, label) pair
+
+    Complexity:
+        Best Case Complexity: O(c * l) where c is the number of colors and l the number of labels
+        Worst Case Complexity: O(c * l) where c is the number of colors and l the number of labels
+    """
+    color_masks = _build_color_masks()
+    label_masks = _build_label_masks()
+    table: ArrayR[int] = ArrayR(Constants.NUM_COLORS * _ROW)
+    for color in CardColor:
+        row = color * _ROW
+        table[row + Constants.NUM_MAX_VALS] = color_masks[color] | color_masks[CardColor.CRAZY]
+        for label in CardLabel:
+            table[row + label] = color_masks[color] | label_masks[label] | color_masks[CardColor.CRAZY]
+    return table
+
+
+_ROW: int = Constants.NUM_MAX_VALS + 1
+_PLAYABLE_IDS = _build_playable_ids().array
+
+
+def playable_ids(color: CardColor, label: CardLabel | None) -> int:
+    """
+    Method to get the set of card ids that can be played onto the given color and label
+
+    Args:
+        color (CardColor): The current color of the game
+        label (CardLabel | None): The current label of the game, None after a crazy card
+
+    Returns:
+        int: Bitmask with bit i set if a card with id i is playable
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    if label is None:
+        return _PLAYABLE_IDS[color * _ROW + Constants.NUM_MAX_VALS]
+    return _PLAYABLE_IDS[color * _ROW + label]
+
+
+def playable_mask(hand, ids: int) -> int:
+    """
+    Method to compute which cards of a hand are playable
+
+    Args:
+        hand (ArraySortedList[Card]): The hand of the player
+        ids (int): The set of playable card ids, as returned by playable_ids()
+
+    Returns:
+        int: Bitmask with bit i set if hand[i] is playable
+
+    Complexity:
+        Best Case Complexity: O(h) where h is the number of cards in the hand
+        Worst Case Complexity: O(h) where h is the number of cards in the hand
+    """
+    # Read straight from the ctypes buffer behind the hand's ArrayR, as this runs on every turn
+    mask = 0
+    items = hand.array.array
+    for i in range(hand.length):
+        if (ids >> items[i].id) & 1:
+            mask |= 1 << i
+    return mask
+
+
+class Strategy(ABC):
+    """
+    Abstract class for the decisions a player makes during the game
+    """
+
+    def attach(self, game) -> None:
+        """
+        Method called when a game is initialised with a player using this strategy, for strategies that
+        need to look at the game state when making decisions
+
+        Args:
+            game (Game): The game being played
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return None
+
+    @abstractmethod
+    def choose_card(self, player, mask: int) -> int:
+        """
+        Method to choose which playable card to play
+
+        Args:
+            player (Player): The player making the decision
+            mask (int): Non-zero bitmask with bit i set if player.hand[i] is playable
+
+        Returns:
+            int: The index in the player's hand of the card to play, must have its bit set in mask
+        """
+        pass
+
+    def choose_color(self, player, rng=RandomGen) -> CardColor:
+        """
+        Method to choose the color to continue play with after a crazy card
+
+        Args:
+            player (Player | None): The player who played the crazy card, None outside of a turn
+            rng (RandomGen | RandomStream): The random number generator of the game
+
+        Returns:
+            CardColor: The new current color
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return CardColor(rng.randint(0, 3))
+
+
+class FirstPlayableStrategy(Strategy):
+    """
+    Default strategy: play the first playable card in sorted order and pick a random color
+    """
+
+    def choose_card(self, player, mask: int) -> int:
+        """
+        Method to choose the lowest indexed playable card
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return (mask & -mask).bit_length() - 1
+
+
+class MostFrequentColorStrategy(FirstPlayableStrategy):
+    """
+    Strategy that plays like the default, but picks the color it holds most of after a crazy card
+    """
+
+    def choose_color(self, player, rng=RandomGen) -> CardColor:
+        """
+        Method to choose the most frequent non-crazy color in the player's hand, ties going to the lowest color
+
+        Complexity:
+            Best Case Complexity: O(h) where h is the number of cards in the hand
+            Worst Case Complexity: O(h) where h is the number of cards in the hand
+        """
+        if player is None or len(player.hand) == 0:
+            return FirstPlayableStrategy.choose_color(self, player, rng)
+
+        # The hand is sorted by color, so colors appear in runs
+        best_color, best_count = None, 0
+        run_color, run_count = None, 0
+        for i in range(len(player.hand)):
+            color = player.hand[i].color
+            if color == CardColor.CRAZY:
+                break
+            if color == run_color:
+                run_count += 1
+            else:
+                run_color, run_count = color, 1
+            if run_count > best_count:
+                best_color, best_count = run_color, run_count
+
+        if best_color is None:
+            return FirstPlayableStrategy.choose_color(self, player, rng)
+        return best_color
+
+
+class HoldDrawFourStrategy(FirstPlayableStrategy):
+    """
+    Strategy that only plays a DRAW_FOUR when no other card is playable
+    """
+
+    def choose_card(self, player, mask: int) -> int:
+        """
+        Method to choose the first playable card that is not a DRAW_FOUR, if there is one
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(h) where h is the number of cards in the hand
+        """
+        remaining = mask
+        while remaining:
+            index = (remaining & -remaining).bit_length() - 1
+            if player.hand[index].label != CardLabel.DRAW_FOUR:
+                return index
+            remaining &= remaining - 1
+        return FirstPlayableStrategy.choose_card(self, player, mask)
+
+
+DEFAULT_STRATEGY: Strategy = FirstPlayableStrategy()
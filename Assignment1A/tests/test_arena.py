@@ -0,0 +1,84 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from arena import Arena, DelayedStrategy, new_table
+from card import Card, CardColor, CardLabel
+from data_structures.stack_adt import ArrayStack
+from game import Game
+from random_gen import RandomStream
+from player import Player
+from constants import Constants
+
+
+class TestArena(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+
+    def make_players(self, strategy=None) -> ArrayR[Player]:
+        players: ArrayR[Player] = ArrayR(3)
+        players[0] = Player("Alice", 0, strategy)
+        players[1] = Player("Bob", 1)
+        players[2] = Player("Charlie", 2)
+        return players
+
+    @number("7.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_tables_match_sequential_games(self) -> None:
+        num_tables = 50
+        games: ArrayR[Game] = ArrayR(num_tables)
+        for i in range(num_tables):
+            games[i] = new_table(self.make_players(), i)
+        winners = Arena(yield_every=3).run(games)
+
+        for i in range(num_tables):
+            game = Game()
+            game.rng = RandomStream(i)
+            game.initialise_game(self.make_players())
+            self.assertEqual(winners[i].name, game.play_game().name, f"Table {i} should have the same winner as a sequential game")
+
+    @number("7.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_slow_player_falls_back(self) -> None:
+        games: ArrayR[Game] = ArrayR(2)
+        games[0] = new_table(self.make_players(DelayedStrategy(1.0)), 5)
+        games[1] = new_table(self.make_players(), 5)
+        arena = Arena(move_timeout=0.001)
+        winners = arena.run(games)
+
+        # A timed out choice is replaced by the default choice, so both tables play the same game
+        self.assertGreater(arena.fallbacks, 0)
+        self.assertEqual(winners[0].name, winners[1].name)
+
+    @number("7.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_concurrency_limit(self) -> None:
+        games: ArrayR[Game] = ArrayR(20)
+        for i in range(len(games)):
+            games[i] = new_table(self.make_players(DelayedStrategy(0)), i)
+        winners = Arena(max_concurrent_tables=4).run(games)
+        for i in range(len(games)):
+            self.assertEqual(len(winners[i]), 0)
+
+    @number("7.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_stuck_table(self) -> None:
+        games: ArrayR[Game] = ArrayR(3)
+        for i in range(len(games)):
+            games[i] = new_table(self.make_players(), i)
+        # Nobody can play and there is nothing left to draw
+        stuck = games[1]
+        stuck.draw_pile = ArrayStack(1)
+        stuck.discard_pile = ArrayStack(1)
+        stuck.discard_pile.push(Card(CardColor.RED, CardLabel.ONE))
+        stuck.current_color, stuck.current_label = CardColor.RED, CardLabel.ONE
+        for player in stuck.players:
+            player.hand.clear()
+            player.hand.add(Card(CardColor.BLUE, CardLabel.TWO))
+
+        winners = Arena().run(games)
+        self.assertIsNone(winners[1], "A stuck table should have no winner")
+        for i in (0, 2):
+            self.assertEqual(len(winners[i]), 0, "The other tables should still be played to the end")
@@ -0,0 +1,78 @@
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase, skipIf
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from arena import new_table
+from batch import NO_WINNER, RECORD, ResultsBuffer, play_recorded, run_batch
+from constants import Constants
+from player import Player
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def seed_range(start: int, stop: int) -> ArrayR[int]:
+    seeds: ArrayR[int] = ArrayR(stop - start)
+    for i in range(stop - start):
+        seeds[i] = start + i
+    return seeds
+
+
+def reference_winner(seed: int, num_players: int) -> int:
+    players: ArrayR[Player] = ArrayR(num_players)
+    for seat in range(num_players):
+        players[seat] = Player(str(seat), seat)
+    return int(new_table(players, seed).play_game().name)
+
+
+class TestBatch(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+
+    @number("18.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_buffer(self) -> None:
+        with ResultsBuffer(3) as results:
+            self.assertEqual(results.record(1), (0, 0, 0, 0, 0))
+            results.write(2, 1 << 40, NO_WINNER, 9, 30, 1)
+            attached = ResultsBuffer(3, results.name)
+            self.assertEqual(attached.record(2), (1 << 40, NO_WINNER, 9, 30, 1))
+            attached.close()
+            with self.assertRaises(IndexError):
+                results.write(3, 0, 0, 0, 0, 0)
+        self.assertEqual(RECORD.size, 24)
+
+    @number("18.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_in_process(self) -> None:
+        with run_batch(seed_range(10, 16), 3, cards_at_init=5) as results:
+            self.assertEqual(Constants.NUM_CARDS_AT_INIT, 7, "The batch should not change the constant")
+            for i in range(6):
+                seed, winner, turns, cards_drawn, recycles = results.record(i)
+                self.assertEqual(seed, 10 + i)
+                self.assertNotEqual(winner, NO_WINNER)
+                self.assertGreater(turns, 0)
+                self.assertGreaterEqual(cards_drawn, 15, "The deal counts as drawn cards")
+                self.assertGreaterEqual(recycles, 0)
+                game, expected_winner, expected_turns = play_recorded(10 + i, 3, 5)
+                self.assertEqual((winner, turns, cards_drawn), (expected_winner, expected_turns, game.cards_drawn))
+
+    @number("18.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @skipIf(numpy is None, "numpy is not installed")
+    def test_process_pool(self) -> None:
+        with ProcessPoolExecutor(2) as executor:
+            results = run_batch(seed_range(0, 20), 4, executor, chunks=3)
+        records = results.as_array()
+        self.assertEqual(list(records["seed"]), list(range(20)))
+        for i in range(20):
+            self.assertEqual(records["winner"][i], reference_winner(i, 4), f"Seed {i}: a different player won")
+        results.write(0, 99, 0, 0, 0, 0)
+        self.assertEqual(records["seed"][0], 99, "The array should view the shared memory, not a copy")
+        del records
+        results.close()
@@ -0,0 +1,113 @@
+import threading
+import time
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from data_structures.blocking_queue import BlockingCircularQueue, QueueClosed
+
+
+class TestBlockingQueue(TestCase):
+
+    @number("21.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_single_thread(self) -> None:
+        queue = BlockingCircularQueue(3)
+        queue.append_many([1, None, 3])
+        self.assertTrue(queue.is_full())
+        with self.assertRaises(TimeoutError):
+            queue.append(4, timeout=0.01)
+        self.assertEqual(queue.serve(), 1)
+        served = queue.serve_many(5)
+        self.assertEqual(len(served), 2)
+        self.assertIsNone(served[0])
+        self.assertEqual(served[1], 3)
+        with self.assertRaises(TimeoutError):
+            queue.serve(timeout=0.01)
+        with self.assertRaises(TimeoutError):
+            queue.serve_many(2, timeout=0)
+
+    @number("21.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_close_and_drain(self) -> None:
+        queue = BlockingCircularQueue(4)
+        queue.append_many(range(3))
+        queue.close()
+        queue.close()
+        with self.assertRaises(QueueClosed):
+            queue.append(9)
+        self.assertEqual(queue.serve(), 0, "Items appended before closing can still be served")
+        drained = queue.drain()
+        self.assertEqual((len(drained), drained[0], drained[1]), (2, 1, 2))
+        self.assertEqual(len(queue.drain()), 0)
+        with self.assertRaises(QueueClosed):
+            queue.serve()
+        with self.assertRaises(QueueClosed):
+            queue.serve_many(3)
+
+    @number("21.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_blocking(self) -> None:
+        queue = BlockingCircularQueue(1)
+        served = []
+
+        def consume() -> None:
+            served.extend(queue)
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        time.sleep(0.01)
+        for i in range(50):
+            queue.append(i, timeout=5)
+        queue.close()
+        consumer.join(5)
+        self.assertFalse(consumer.is_alive(), "Closing should wake the waiting consumer")
+        self.assertEqual(served, list(range(50)))
+
+        # A producer blocked on a full queue is woken by closing it
+        queue = BlockingCircularQueue(1)
+        queue.append(0)
+        errors = []
+
+        def produce() -> None:
+            try:
+                queue.append(1)
+            except QueueClosed as error:
+                errors.append(error)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        time.sleep(0.01)
+        queue.close()
+        producer.join(5)
+        self.assertEqual(len(errors), 1)
+
+    @number("21.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_contention(self) -> None:
+        queue = BlockingCircularQueue(8)
+        totals = []
+        lock = threading.Lock()
+
+        def produce(start: int) -> None:
+            queue.append_many(range(start, start + 1000))
+
+        def consume() -> None:
+            total = 0
+            try:
+                while True:
+                    total += sum(queue.serve_many(16))
+            except QueueClosed:
+                with lock:
+                    totals.append(total)
+
+        producers = [threading.Thread(target=produce, args=(i * 1000,)) for i in range(4)]
+        consumers = [threading.Thread(target=consume) for _ in range(3)]
+        for thread in producers + consumers:
+            thread.start()
+        for thread in producers:
+            thread.join(10)
+        queue.close()
+        for thread in consumers:
+            thread.join(10)
+        self.assertEqual(sum(totals), sum(range(4000)), "Every item should be served exactly once")
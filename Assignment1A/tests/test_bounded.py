@@ -0,0 +1,123 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+from data_structures.stack_adt import ArrayStack
+
+from arena import new_table
+from bounded import BoundedGame, Outcome
+from card import Card, CardColor, CardLabel
+from constants import Constants
+from game import PilesExhausted
+from player import Player
+from random_gen import RandomStream
+
+
+def new_players(count: int) -> ArrayR[Player]:
+    players: ArrayR[Player] = ArrayR(count)
+    for seat in range(count):
+        players[seat] = Player(str(seat), seat)
+    return players
+
+
+def new_bounded_table(players: ArrayR[Player], seed: int, **kwargs) -> BoundedGame:
+    game = BoundedGame(**kwargs)
+    game.rng = RandomStream(seed)
+    game.initialise_game(players)
+    return game
+
+
+class TestBounded(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+
+    @number("15.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_incremental_hash(self) -> None:
+        for seed in range(5):
+            game = new_bounded_table(new_players(3), seed)
+            for turn in range(200):
+                if game.play_turn() is not None:
+                    break
+                hashes = (game.hand_hash, game.draw_hash, game.discard_hash)
+                game.rehash()
+                self.assertEqual(hashes, (game.hand_hash, game.draw_hash, game.discard_hash),
+                                 f"Seed {seed}: the hash drifted on turn {turn}")
+
+    @number("15.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_same_winner(self) -> None:
+        for seed in range(10):
+            expected = new_table(new_players(4), seed).play_game()
+            result = new_bounded_table(new_players(4), seed).play_bounded()
+            self.assertEqual(result.outcome, Outcome.WIN)
+            self.assertEqual(result.winner.name, expected.name, f"Seed {seed}: a different player won")
+            self.assertGreater(result.turns, 0)
+
+    @number("15.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_turn_limit(self) -> None:
+        result = new_bounded_table(new_players(4), 0, max_turns=3).play_bounded()
+        self.assertEqual(result.outcome, Outcome.ABORTED)
+        self.assertIsNone(result.winner)
+        self.assertEqual(result.turns, 3)
+
+    @number("15.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_piles_exhausted(self) -> None:
+        game = new_bounded_table(new_players(2), 0)
+        game.draw_pile = ArrayStack(1)
+        game.discard_pile = ArrayStack(1)
+        game.discard_pile.push(Card(CardColor.RED, CardLabel.ONE))
+        game.current_color, game.current_label = CardColor.RED, CardLabel.ONE
+        for player in game.players:
+            player.hand.clear()
+            player.hand.add(Card(CardColor.BLUE, CardLabel.TWO))
+        game.rehash()
+
+        with self.assertRaises(PilesExhausted):
+            game.clone().play_game()
+        result = game.play_bounded()
+        self.assertEqual(result.outcome, Outcome.ABORTED)
+        self.assertEqual(result.turns, 0)
+
+    @number("15.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_repetition(self) -> None:
+        game = new_bounded_table(new_players(3), 1)
+        copy = BoundedGame.from_snapshot(game.snapshot())
+        self.assertEqual(game.position_hash(), copy.position_hash())
+        game.play_reverse()
+        self.assertNotEqual(game.position_hash(), copy.position_hash(), "The direction should be hashed")
+        game.play_reverse()
+        self.assertEqual(game.position_hash(), copy.position_hash())
+
+        game.repetitions = 1
+        result = game.play_bounded()
+        self.assertEqual(result.outcome, Outcome.DRAW)
+        self.assertEqual(result.turns, 1)
+
+    @number("15.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_large_table(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 5
+        num_players = Constants.MAX_PLAYERS + 4
+        game = new_bounded_table(new_players(num_players), 3)
+        hashes = set()
+        for player in game.players:
+            game.current_player = player
+            hashes.add(game.position_hash())
+        game.current_player = None
+        hashes.add(game.position_hash())
+        self.assertEqual(len(hashes), num_players + 1, "Every player to move should hash differently")
+
+        for turn in range(100):
+            if game.play_turn() is not None:
+                break
+            hashes = (game.hand_hash, game.draw_hash, game.discard_hash)
+            game.rehash()
+            self.assertEqual(hashes, (game.hand_hash, game.draw_hash, game.discard_hash),
+                             f"The hash drifted on turn {turn}")
+        result = new_bounded_table(new_players(num_players), 3).play_bounded()
+        self.assertGreater(result.turns, 0)
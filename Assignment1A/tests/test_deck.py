@@ -0,0 +1,80 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from arena import new_table
+from card import CardColor, CardLabel
+from constants import Constants
+from deck import DeckSpec, STANDARD_DECK
+from player import Player
+from random_gen import RandomStream
+
+
+class TestDeck(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+
+    def count(self, cards: ArrayR, color: CardColor, label: CardLabel) -> int:
+        return sum(1 for i in range(len(cards)) if cards[i].color == color and cards[i].label == label)
+
+    @number("11.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_standard_layout(self) -> None:
+        template = STANDARD_DECK.template()
+        self.assertEqual(STANDARD_DECK.size, 112)
+        self.assertEqual(len(template), 112)
+        self.assertEqual((template[0].color, template[0].label), (CardColor.RED, CardLabel.ZERO))
+        self.assertEqual((template[20].label, template[21].label, template[22].label),
+                         (CardLabel.SKIP, CardLabel.REVERSE, CardLabel.DRAW_TWO))
+        self.assertEqual((template[26].color, template[26].label), (CardColor.BLUE, CardLabel.ZERO))
+        self.assertEqual((template[104].label, template[105].label), (CardLabel.CRAZY, CardLabel.DRAW_FOUR))
+        self.assertIs(STANDARD_DECK.template(), template, "The template should only be built once")
+
+    @number("11.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_new_deck_leaves_template_alone(self) -> None:
+        before = [STANDARD_DECK.template()[i] for i in range(STANDARD_DECK.size)]
+        deck = STANDARD_DECK.new_deck(RandomStream(5))
+        for i in range(STANDARD_DECK.size):
+            self.assertIs(STANDARD_DECK.template()[i], before[i])
+        self.assertEqual(sorted(deck[i].id for i in range(len(deck))), sorted(card.id for card in before))
+
+    @number("11.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_custom_composition(self) -> None:
+        spec = DeckSpec(decks=2, action_copies=1, draw_four_copies=0)
+        self.assertEqual(spec.size, 2 * (4 * (20 + 3) + 4))
+        cards = spec.template()
+        self.assertEqual(self.count(cards, CardColor.CRAZY, CardLabel.DRAW_FOUR), 0)
+        self.assertEqual(self.count(cards, CardColor.CRAZY, CardLabel.CRAZY), 8)
+        self.assertEqual(self.count(cards, CardColor.GREEN, CardLabel.SKIP), 2)
+        self.assertEqual(self.count(cards, CardColor.GREEN, CardLabel.SEVEN), 4)
+
+        players: ArrayR[Player] = ArrayR(6)
+        for seat in range(6):
+            players[seat] = Player(str(seat), seat)
+        game = new_table(players, 3, spec)
+        self.assertEqual(len(game.draw_pile) + len(game.discard_pile) + 6 * 7, spec.size)
+        game.play_game()
+        total = len(game.draw_pile) + len(game.discard_pile)
+        for seat in range(6):
+            total += len(game.players[seat].hand)
+        self.assertEqual(total, spec.size)
+        self.assertIs(game.clone().deck_spec, spec)
+
+    @number("11.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_invalid_spec(self) -> None:
+        with self.assertRaises(ValueError):
+            DeckSpec(number_copies=-1)
+        with self.assertRaises(ValueError):
+            DeckSpec(decks=0)
+        with self.assertRaises(ValueError, msg="A deck without number cards cannot start a game"):
+            DeckSpec(number_copies=0)
+        with self.assertRaises(ValueError, msg="40 number cards cannot be left over after dealing 8 hands of 7"):
+            DeckSpec(number_copies=1)
+        spec = DeckSpec(decks=2, number_copies=1)
+        self.assertTrue(spec.can_deal(Constants.MAX_PLAYERS, Constants.NUM_CARDS_AT_INIT))
+        self.assertFalse(spec.can_deal(Constants.MAX_PLAYERS, 10))
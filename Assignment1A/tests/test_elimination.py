@@ -0,0 +1,107 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from card import CardColor, CardLabel, CARDS_BY_ID
+from constants import Constants
+from elimination import EliminationGame
+from game import Game
+from player import Player
+from random_gen import RandomStream
+
+
+def seat_table(num_players: int) -> ArrayR[Player]:
+    players: ArrayR[Player] = ArrayR(num_players)
+    for seat in range(num_players):
+        players[seat] = Player(str(seat), seat)
+    return players
+
+
+def new_game(cls, seed: int, num_players: int):
+    game = cls()
+    game.rng = RandomStream(seed)
+    game.initialise_game(seat_table(num_players))
+    return game
+
+
+class TestElimination(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+
+    @number("26.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_same_turns_as_game(self) -> None:
+        for seed in range(30):
+            num_players = 2 + seed % 5
+            game = new_game(Game, seed, num_players)
+            elimination = new_game(EliminationGame, seed, num_players)
+            winner = None
+            while winner is None:
+                winner = game.play_turn()
+                first_out = elimination.play_turn()
+                self.assertEqual(elimination.current_player.name, game.current_player.name)
+            self.assertEqual(first_out.name, winner.name)
+
+    @number("26.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_play_elimination(self) -> None:
+        for seed in range(20):
+            num_players = 2 + seed % 5
+            winner = new_game(Game, seed, num_players).play_game()
+            game = new_game(EliminationGame, seed, num_players)
+            ranking = game.play_elimination()
+            self.assertEqual(len(ranking), num_players)
+            self.assertEqual(sorted(player.name for player in ranking), [str(i) for i in range(num_players)])
+            self.assertEqual(ranking[0].name, winner.name)
+            self.assertGreater(len(ranking[num_players - 1].hand), 0)
+            for i in range(num_players - 1):
+                self.assertEqual(len(ranking[i].hand), 0)
+                self.assertFalse(game.is_playing(ranking[i]))
+            self.assertEqual(len(game.ring), 1)
+
+    @number("26.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_leave(self) -> None:
+        game = new_game(EliminationGame, 3, 4)
+        players = list(game.ring)
+        cards = len(game.draw_pile) + len(game.discard_pile) + sum(len(player.hand) for player in players)
+
+        game.play_turn()
+        self.assertIs(game.current_player, players[0])
+        top = game.discard_pile.peek()
+        game.leave(players[0])
+        self.assertFalse(game.is_playing(players[0]))
+        self.assertFalse(game.is_playing(Player("stranger", 1)), "Only the players seated in the game are playing")
+        self.assertEqual(len(players[0].hand), 0)
+        self.assertIs(game.discard_pile.peek(), top, "The top card stays on top")
+        self.assertIs(game.next_player(), players[1], "Play carries on after the player who left")
+        self.assertEqual(len(game.draw_pile) + len(game.discard_pile) + sum(len(p.hand) for p in players), cards)
+
+        # The player before the one who left has taken over their turn
+        self.assertIs(game.current_player, players[3])
+        game.play_reverse()
+        self.assertIs(game.next_player(), players[2])
+        game.leave(players[2])
+        game.leave(players[3])
+        self.assertIs(game.next_player(), players[1])
+        with self.assertRaises(ValueError):
+            game.leave(players[1])
+        with self.assertRaises(ValueError):
+            game.leave(players[2])
+        with self.assertRaises(NotImplementedError):
+            game.snapshot()
+
+    @number("26.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_reverse_as_last_card(self) -> None:
+        game = new_game(EliminationGame, 0, 4)
+        players = list(game.ring)
+        game.current_player = players[2]
+        players[2].hand.reset()
+        players[2].add_card(CARDS_BY_ID[CardColor.RED * Constants.NUM_MAX_VALS + CardLabel.REVERSE])
+        game.current_color = CardColor.RED
+        self.assertIs(game.play_from_hand(0), players[2])
+        game.leave(players[2])
+        self.assertIs(game.next_player(), players[1], "Play goes back the other way from the player who left")
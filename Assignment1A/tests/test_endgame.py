@@ -0,0 +1,100 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from arena import new_table
+from card import Card, CardColor, CardLabel
+from constants import Constants
+from endgame import EndgameSolver, is_endgame, estimate_outcome
+from game import Game
+from player import Player
+from random_gen import RandomStream
+
+
+class TestEndgame(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+        self.players: ArrayR[Player] = ArrayR(3)
+        for seat in range(3):
+            self.players[seat] = Player(str(seat), seat)
+        self.game: Game = new_table(self.players, 0)
+        while not is_endgame(self.game, 1):
+            self.game.play_turn()
+
+    @number("9.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_playable_last_card_wins(self) -> None:
+        game = self.game.clone()
+        player = game.next_player()
+        player.hand.clear()
+        player.add_card(Card(CardColor.CRAZY, CardLabel.CRAZY))
+        probabilities = EndgameSolver().win_probabilities(game)
+        for seat in range(len(game.players)):
+            expected = 1.0 if game.players[seat] is player else 0.0
+            self.assertAlmostEqual(probabilities[seat], expected)
+
+    @number("9.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_matches_simulation(self) -> None:
+        solver = EndgameSolver(horizon=3)
+        probabilities = solver.win_probabilities(self.game)
+
+        # Simulate the same position with the draw pile in a random order
+        samples = 600
+        wins = ArrayR(3)
+        for seat in range(3):
+            wins[seat] = 0
+        for sample in range(samples):
+            game = self.game.clone()
+            game.rng = RandomStream(sample)
+            size = len(game.draw_pile)
+            cards = ArrayR(size)
+            for i in range(size):
+                cards[i] = game.draw_pile.array[i]
+            game.rng.random_shuffle(cards)
+            for i in range(size):
+                game.draw_pile.array[i] = cards[i]
+            wins[int(game.play_game().name)] += 1
+
+        for seat in range(3):
+            self.assertAlmostEqual(probabilities[seat], wins[seat] / samples, delta=0.05)
+
+    @number("9.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_memo_is_shared(self) -> None:
+        solver = EndgameSolver()
+        first = solver.win_probabilities(self.game)
+        misses = solver.misses
+        second = solver.win_probabilities(self.game.clone())
+        self.assertEqual(solver.misses, misses, "A position seen before should be answered from the memo table")
+        for seat in range(3):
+            self.assertEqual(first[seat], second[seat])
+
+    @number("9.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_estimate_outcome(self) -> None:
+        players: ArrayR[Player] = ArrayR(3)
+        for seat in range(3):
+            players[seat] = Player(str(seat), seat)
+        game = new_table(players, 3)
+        probabilities = estimate_outcome(game, EndgameSolver(horizon=2), max_hand=2)
+        total = 0.0
+        for seat in range(3):
+            self.assertGreaterEqual(probabilities[seat], 0.0)
+            total += probabilities[seat]
+        self.assertLessEqual(total, 1.0 + 1e-9)
+
+    @number("9.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_small_memo(self) -> None:
+        expected = EndgameSolver(horizon=3).win_probabilities(self.game)
+        solver = EndgameSolver(horizon=3, max_entries=4)
+        self.assertEqual(len(solver.memo.keys), 4)
+        probabilities = solver.win_probabilities(self.game)
+        for seat in range(3):
+            self.assertAlmostEqual(probabilities[seat], expected[seat], msg="Replaced entries should be recomputed")
+        for horizon in (-1, 256):
+            with self.assertRaises(ValueError):
+                EndgameSolver(horizon=horizon)
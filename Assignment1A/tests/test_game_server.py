@@ -0,0 +1,151 @@
+import asyncio
+import os
+import tempfile
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from arena import new_table
+from constants import Constants
+from game_client import GameClient, ClientPool, ServerError, play_remote_game
+from game_server import GameServer, NONE
+from player import Player
+
+
+class TestGameServer(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+
+    def local_winner(self, seats: int, seed: int) -> int:
+        players: ArrayR[Player] = ArrayR(seats)
+        for seat in range(seats):
+            players[seat] = Player(str(seat), seat)
+        return int(new_table(players, seed).play_game().name)
+
+    @number("8.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_remote_games_match_local_games(self) -> None:
+        async def run() -> ArrayR:
+            server = GameServer()
+            await server.start()
+            pool = ClientPool(3, port=server.port)
+            await pool.open()
+            results = await asyncio.gather(*[play_remote_game(pool, 3, seed) for seed in range(12)])
+            await pool.close()
+            await server.close()
+            return results
+
+        results = asyncio.run(run())
+        for seed in range(12):
+            self.assertEqual(results[seed].winner, self.local_winner(3, seed), f"Table with seed {seed} should have the same winner as a local game")
+            self.assertGreater(results[seed].moves, 0)
+
+    @number("8.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_errors(self) -> None:
+        async def run() -> None:
+            server = GameServer()
+            await server.start()
+            client = await GameClient.connect(port=server.port)
+            table = await client.create_table(2, 1)
+            await client.join(table, "Alice")
+            with self.assertRaises(ServerError):
+                await client.state(table, 0)
+            await client.join(table, "Bob")
+            with self.assertRaises(ServerError):
+                await client.join(table, "Charlie")
+
+            state = await client.state(table, 0)
+            self.assertEqual(state.winner, NONE)
+            self.assertEqual(state.turn_seat, 0)
+            self.assertEqual(len(state.hand), 7)
+            with self.assertRaises(ServerError):
+                await client.draw(table, 1)
+            await client.close()
+            await server.close()
+
+        asyncio.run(run())
+
+    @number("8.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_unix_socket(self) -> None:
+        async def run() -> int:
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, "game.sock")
+                server = GameServer(path=path)
+                await server.start()
+                pool = ClientPool(1, path=path)
+                await pool.open()
+                result = await play_remote_game(pool, 4, 9)
+                await pool.close()
+                await server.close()
+                return result.winner
+
+        self.assertEqual(asyncio.run(run()), self.local_winner(4, 9))
+
+    @number("8.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_seat_limits(self) -> None:
+        async def run() -> None:
+            server = GameServer()
+            await server.start()
+            client = await GameClient.connect(port=server.port)
+            for seats in (1, Constants.MAX_PLAYERS + 1, 20, 10 ** 9):
+                with self.assertRaises(ServerError):
+                    await client.create_table(seats, 1)
+            Constants.NUM_CARDS_AT_INIT = 20
+            with self.assertRaises(ServerError, msg="Six hands of 20 cards do not fit in the deck"):
+                await client.create_table(6, 1)
+            Constants.NUM_CARDS_AT_INIT = 7
+            table = await client.create_table(Constants.MAX_PLAYERS, 1)
+            for seat in range(Constants.MAX_PLAYERS):
+                self.assertEqual(await client.join(table, str(seat)), seat)
+            state = await client.state(table, 0)
+            self.assertEqual(len(state.hand), 7)
+            await client.close()
+            await server.close()
+
+        asyncio.run(run())
+
+    @number("8.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_engine_errors_keep_connection(self) -> None:
+        async def run() -> None:
+            server = GameServer()
+            await server.start()
+            client = await GameClient.connect(port=server.port)
+            table = await client.create_table(2, 1)
+            await client.join(table, "Alice")
+            await client.join(table, "Bob")
+            state = await client.state(table, 0)
+            index = (state.mask & -state.mask).bit_length() - 1
+            # Break the engine so that playing a card raises
+            server.get_table(table).game.rules = None
+            pipelined = [client.play(table, 0, index), client.state(table, 0)]
+            results = await asyncio.gather(*pipelined, return_exceptions=True)
+            self.assertIsInstance(results[0], ServerError)
+            self.assertEqual(results[1].turn_seat, 0, "Requests after a failed one should still be answered")
+            await client.close()
+            await server.close()
+
+        asyncio.run(run())
+
+    @number("8.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_closed_connection(self) -> None:
+        async def hang_up(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            writer.close()
+
+        async def run() -> None:
+            server = await asyncio.start_server(hang_up, '127.0.0.1', 0)
+            client = await GameClient.connect(port=server.sockets[0].getsockname()[1])
+            await asyncio.wait_for(asyncio.shield(client.receiver), 5)
+            with self.assertRaises(ServerError):
+                await asyncio.wait_for(client.create_table(2, 1), 5)
+            await client.close()
+            server.close()
+            await server.wait_closed()
+
+        asyncio.run(run())
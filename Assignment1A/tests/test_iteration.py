@@ -0,0 +1,66 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.aset import ASet
+from data_structures.referential_array import ArrayR
+from data_structures.stack_adt import ArrayStack
+
+from game import Game
+from player import Player
+
+
+class TestIteration(TestCase):
+
+    @number("13.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_sorted_list(self) -> None:
+        sorted_list = ArraySortedList(10)
+        for item in (5, 1, 4):
+            sorted_list.add(item)
+        # the unused slots of the backing array are never visited
+        self.assertEqual(list(sorted_list), [1, 4, 5])
+        self.assertEqual(list(reversed(sorted_list)), [5, 4, 1])
+        sorted_list.delete_at_index(0)
+        self.assertEqual(list(sorted_list), [4, 5])
+        self.assertEqual(list(ArraySortedList(3)), [])
+
+    @number("13.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_stack(self) -> None:
+        stack = ArrayStack(8)
+        for item in range(3):
+            stack.push(item)
+        stack.pop()
+        self.assertEqual(list(stack), [0, 1])
+        self.assertEqual(list(reversed(stack)), [1, 0])
+        self.assertEqual(len(stack), 2, "Iterating should not remove elements")
+
+    @number("13.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_set_and_array(self) -> None:
+        aset = ASet(6)
+        for item in (3, 9, 3, 7):
+            aset.add(item)
+        aset.remove(3)
+        self.assertEqual(sorted(aset), [7, 9])
+        self.assertEqual(list(reversed(aset)), list(aset)[::-1])
+
+        array = ArrayR(3)
+        for i in range(3):
+            array[i] = i * i
+        self.assertEqual(list(array), [0, 1, 4])
+        self.assertEqual(list(reversed(array)), [4, 1, 0])
+
+    @number("13.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_game_with_spare_capacity(self) -> None:
+        game = Game()
+        game.players = ArraySortedList(8)
+        for position in range(3):
+            game.players.add(Player(str(position), position))
+        self.assertEqual(game.next_player().name, "0")
+        game.play_reverse()
+        self.assertEqual([player.position for player in game.players], [2, 1, 0])
+        game.current_player = game.players[2]
+        self.assertEqual(game.next_player().name, "1")
@@ -0,0 +1,94 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from arena import new_table
+from constants import Constants
+from ladder import Ladder, expected_score
+from player import Player
+from random_gen import RandomStream
+from strategy import MostFrequentColorStrategy
+
+
+class TestLadder(TestCase):
+
+    def assertRanked(self, ladder: Ladder) -> None:
+        for i in range(len(ladder) - 1):
+            self.assertLess(ladder.standings[i], ladder.standings[i + 1], "The standings are out of order")
+        self.assertEqual(len(ladder.entrants), len(ladder))
+        for keyed in ladder.entrants:
+            self.assertIs(ladder.standings[ladder.rank(keyed.key)], keyed.value)
+
+    @number("20.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_two_players(self) -> None:
+        ladder = Ladder(k_factor=32)
+        ladder.record("a", ["b"])
+        self.assertAlmostEqual(ladder.entrant("a").rating, 1516)
+        self.assertAlmostEqual(ladder.entrant("b").rating, 1484)
+        self.assertEqual((ladder.rank("a"), ladder.rank("b")), (0, 1))
+        self.assertAlmostEqual(expected_score(1900, 1500) + expected_score(1500, 1900), 1)
+
+        ladder.record("b", ["a"])
+        self.assertGreater(ladder.entrant("b").rating, 1500, "Beating a better rated player gains more")
+        self.assertEqual(ladder.entrant("a").games, 2)
+        self.assertEqual(ladder.games, 2)
+
+    @number("20.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_reranking(self) -> None:
+        ladder = Ladder()
+        rng = RandomStream(3)
+        names = [f"s{i}" for i in range(12)]
+        total = 0.0
+        for _ in range(300):
+            table = [names[rng.random() % len(names)] for _ in range(4)]
+            if len(set(table)) < 4:
+                continue
+            ladder.record(table[0], table[1:])
+            self.assertRanked(ladder)
+        for entry in ladder.standings:
+            total += entry.rating
+        self.assertAlmostEqual(total, 1500 * len(ladder), msg="Ratings should only move between entrants")
+
+    @number("20.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_snapshots(self) -> None:
+        ladder = Ladder()
+        ladder.record("a", ["b", "c"])
+        ladder.checkpoint("first")
+        ladder.record("c", ["a", "b"])
+        self.assertNotEqual(ladder.checkpointed("first"), ladder.snapshot())
+
+        restored = Ladder.from_snapshot(ladder.checkpointed("first"))
+        self.assertEqual(restored.snapshot(), ladder.checkpointed("first"))
+        self.assertRanked(restored)
+        restored.record("c", ["a", "b"])
+        self.assertEqual(restored.snapshot(), ladder.snapshot(), "Replaying from a checkpoint should agree")
+        self.assertEqual(len(Ladder.from_snapshot(()).snapshot()), 0)
+
+        ladder.checkpoint("first")
+        self.assertEqual(ladder.checkpointed("first"), ladder.snapshot(), "A checkpoint should replace its label")
+        self.assertEqual(len(ladder.checkpoints), 1)
+        with self.assertRaises(KeyError):
+            ladder.checkpointed("second")
+        with self.assertRaises(KeyError):
+            ladder.rank("nobody")
+
+    @number("20.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_tables(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+        ladder = Ladder()
+        for seed in range(20):
+            players: ArrayR[Player] = ArrayR(3)
+            players[0] = Player("default", 0)
+            players[1] = Player("frequent", 1, MostFrequentColorStrategy())
+            players[2] = Player("other", 2)
+            game = new_table(players, seed)
+            ladder.record_table(players, game.play_game())
+        self.assertEqual(ladder.games, 20)
+        self.assertEqual(len(ladder), 3)
+        self.assertEqual(ladder.top(5)[0].name, ladder.snapshot()[0][0])
+        self.assertRanked(ladder)
@@ -0,0 +1,126 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from data_structures.array_list import ArrayList
+from data_structures.referential_array import ArrayR
+from data_structures.linked_list import LinkedList
+from random_gen import RandomStream
+
+
+class TestLists(TestCase):
+
+    @number("28.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_list_operations(self) -> None:
+        for cls in (ArrayList, LinkedList):
+            items = cls()
+            self.assertTrue(items.is_empty())
+            for i in range(5):
+                items.append(i)
+            items.insert(0, 10)
+            items.insert(3, 11)
+            items.insert(len(items), 12)
+            self.assertEqual(list(items), [10, 0, 1, 11, 2, 3, 4, 12])
+            self.assertEqual(items[3], 11)
+            self.assertEqual(items[7], 12)
+            items[3] = 13
+            self.assertEqual(items.index(13), 3)
+            self.assertEqual(items.delete_at_index(0), 10)
+            self.assertEqual(items.delete_at_index(len(items) - 1), 12)
+            items.remove(13)
+            self.assertEqual(list(items), [0, 1, 2, 3, 4])
+            self.assertEqual(len(items), 5)
+            self.assertEqual(str(items), "[0, 1, 2, 3, 4]")
+            for bad in (-1, 5):
+                with self.assertRaises(IndexError):
+                    items[bad]
+                with self.assertRaises(IndexError):
+                    items.delete_at_index(bad)
+            with self.assertRaises(IndexError):
+                items.insert(7, 0)
+            with self.assertRaises(ValueError):
+                items.index(99)
+            items.clear()
+            self.assertEqual(list(items), [])
+            items.append(1)
+            self.assertEqual(list(items), [1])
+
+    @number("28.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_array_list_bulk(self) -> None:
+        items = ArrayList.from_items(range(10))
+        self.assertEqual(len(items), 10)
+        items.extend(i * i for i in range(3))
+        items.extend(ArrayList.from_items("ab"))
+        self.assertEqual(list(items), list(range(10)) + [0, 1, 4, "a", "b"])
+        copy = items[2:6]
+        self.assertIsInstance(copy, ArrayList)
+        self.assertEqual(list(copy), [2, 3, 4, 5])
+        copy[0] = 99
+        self.assertEqual(items[2], 2, "A slice is a copy")
+        self.assertEqual(list(items[::5]), [0, 5, 0])
+        self.assertEqual(len(items[20:30]), 0)
+        items.extend([])
+        self.assertEqual(len(items), 15)
+
+        array = ArrayR(3)
+        for i in range(3):
+            array[i] = -i
+        items = ArrayList()
+        items.extend(array)
+        items.extend(dict.fromkeys("vwxyz").keys())
+        self.assertEqual(len(items.array), 8, "The array should grow once to fit a sized iterable")
+        items.extend(items)
+        self.assertEqual(list(items), 2 * [0, -1, -2, "v", "w", "x", "y", "z"])
+
+    @number("28.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_linked_list_cursors(self) -> None:
+        items = LinkedList()
+        first = items.insert_after(None, "b")
+        items.insert_after(None, "a")
+        last = items.insert_after(first, "d")
+        items.insert_after(first, "c")
+        self.assertEqual(list(items), ["a", "b", "c", "d"])
+        self.assertIs(items.node_at(3), last)
+        self.assertEqual(items.delete_node(first), "b")
+        self.assertEqual(list(items), ["a", "c", "d"])
+
+        other = LinkedList()
+        for item in "xyz":
+            other.append(item)
+        items.splice_after(items.node_at(0), other)
+        self.assertEqual(list(items), ["a", "x", "y", "z", "c", "d"])
+        self.assertTrue(other.is_empty())
+        self.assertEqual(list(other), [])
+
+        other.append("e")
+        items.splice(other)
+        other.append("_")
+        items.splice_after(None, other)
+        self.assertEqual(list(items), ["_", "a", "x", "y", "z", "c", "d", "e"])
+        self.assertEqual(len(items), 8)
+        self.assertEqual(items.rear.item, "e")
+        with self.assertRaises(ValueError):
+            items.splice(items)
+
+    @number("28.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_random_operations(self) -> None:
+        rng = RandomStream(5)
+        array_list, linked_list, reference = ArrayList(), LinkedList(), []
+        for step in range(2000):
+            action = rng.randint(0, 3)
+            if action < 2 or len(reference) == 0:
+                index = rng.randint(0, len(reference))
+                for items in (array_list, linked_list, reference):
+                    items.insert(index, step)
+            else:
+                index = rng.randint(0, len(reference) - 1)
+                expected = reference.pop(index)
+                self.assertEqual(array_list.delete_at_index(index), expected)
+                self.assertEqual(linked_list.delete_at_index(index), expected)
+        self.assertEqual(list(array_list), reference)
+        self.assertEqual(list(linked_list), reference)
+        self.assertEqual(list(reversed([linked_list[i] for i in range(len(reference))])), reference[::-1])
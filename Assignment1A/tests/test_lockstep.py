@@ -0,0 +1,85 @@
+from unittest import TestCase, skipIf
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from arena import new_table
+from constants import Constants
+from deck import DeckSpec
+from game import Game
+from player import Player
+from random_gen import RandomStream
+
+try:
+    import numpy
+    from lockstep import LockstepEngine, canonical_deck
+except ImportError:
+    numpy = None
+
+
+@skipIf(numpy is None, "numpy is not installed")
+class TestLockstep(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+
+    def reference(self, seed: int, num_players: int):
+        players: ArrayR[Player] = ArrayR(num_players)
+        for seat in range(num_players):
+            players[seat] = Player(str(seat), seat)
+        game = new_table(players, seed)
+        return int(game.play_game().name), game
+
+    @number("10.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_canonical_deck(self) -> None:
+        players: ArrayR[Player] = ArrayR(2)
+        for seat in range(2):
+            players[seat] = Player(str(seat), seat)
+        cards = new_table(players, 0).generate_cards()
+        self.assertEqual(sorted(card.id for card in cards), sorted(canonical_deck().tolist()))
+
+    @number("10.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_same_winners_as_reference(self) -> None:
+        for num_players in (2, 3, 4):
+            seeds = range(60)
+            engine = LockstepEngine(seeds, num_players)
+            winners = engine.run()
+            for i in range(len(seeds)):
+                winner, game = self.reference(seeds[i], num_players)
+                self.assertEqual(winners[i], winner, f"Seed {seeds[i]} with {num_players} players")
+                for seat in range(num_players):
+                    self.assertEqual(engine.hand_sizes[i, seat], len(game.players[seat].hand))
+
+    @number("10.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_finished_games_are_masked(self) -> None:
+        engine = LockstepEngine(range(20), 3)
+        while engine.active.any():
+            winners = engine.winner.copy()
+            turns = engine.turns.copy()
+            engine.step()
+            finished = winners != -1
+            self.assertTrue((engine.winner[finished] == winners[finished]).all())
+            self.assertTrue((engine.turns[finished] == turns[finished]).all())
+        self.assertTrue((engine.winner != -1).all())
+
+    @number("10.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_empty_draw_pile_at_turn_start(self) -> None:
+        # Numbers only and nearly the whole deck dealt: in game 19 a turn starts with no cards to draw or recycle,
+        # and the player plays from their hand instead
+        deck_spec = DeckSpec(action_copies=0, crazy_copies=0, draw_four_copies=0)
+        seed = 19
+        players: ArrayR[Player] = ArrayR(6)
+        for seat in range(6):
+            players[seat] = Player(str(seat), seat)
+        game = Game(deck_spec)
+        game.rng = RandomStream(seed)
+        game.initialise_game(players, 13)
+        winner = int(game.play_game().name)
+
+        engine = LockstepEngine([seed], 6, 13, deck_spec)
+        self.assertEqual(engine.run()[0], winner)
+        self.assertFalse(engine.stuck[0])
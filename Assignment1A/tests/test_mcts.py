@@ -0,0 +1,144 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from game import Game
+from random_gen import RandomGen, RandomStream
+from player import Player
+from constants import Constants
+from deck import DeckSpec, STANDARD_DECK
+from mcts import MCTSStrategy, ShuffleDeterminiser
+from rules import with_draw_stacking
+
+
+class SpyDeterminiser(ShuffleDeterminiser):
+    """ Determiniser remembering the deck and rules of the games it fills in. """
+
+    def __init__(self) -> None:
+        self.games = []
+
+    def determinise(self, game: Game, seat: int, rng: RandomStream) -> None:
+        self.games.append((game.deck_spec, game.rules))
+        ShuffleDeterminiser.determinise(self, game, seat, rng)
+
+
+class TestMCTS(TestCase):
+
+    def setUp(self) -> None:
+        RandomGen.set_seed(123)
+        Constants.NUM_CARDS_AT_INIT = 7
+        self.players: ArrayR[Player] = ArrayR(3)
+        self.players[0] = Player("Alice", 0)
+        self.players[1] = Player("Bob", 1)
+        self.players[2] = Player("Charlie", 2)
+        self.game: Game = Game()
+        self.game.initialise_game(self.players)
+
+    def count_cards(self, game: Game) -> int:
+        total = len(game.draw_pile) + len(game.discard_pile)
+        for i in range(len(game.players)):
+            total += len(game.players[i])
+        return total
+
+    @number("6.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_snapshot_round_trip(self) -> None:
+        for _ in range(10):
+            self.game.play_turn()
+        snapshot = self.game.snapshot()
+        rebuilt = Game.from_snapshot(snapshot)
+        self.assertEqual(rebuilt.snapshot(), snapshot)
+        self.assertEqual(rebuilt.current_color, self.game.current_color)
+        self.assertEqual(rebuilt.current_label, self.game.current_label)
+        self.assertEqual(len(rebuilt.draw_pile), len(self.game.draw_pile))
+
+    @number("6.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_clone_is_independent(self) -> None:
+        snapshot = self.game.snapshot()
+        clone = self.game.clone()
+        clone.rng = RandomStream(1)
+        clone.play_game()
+        self.assertEqual(self.game.snapshot(), snapshot, "Playing a clone should not change the original game")
+        self.assertEqual(clone.players[0].name, "Alice")
+
+    @number("6.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_shuffle_determiniser(self) -> None:
+        clone = self.game.clone()
+        ShuffleDeterminiser().determinise(clone, 0, RandomStream(7))
+        self.assertEqual(self.count_cards(clone), STANDARD_DECK.size)
+        self.assertEqual(str(clone.players[0].hand), str(self.game.players[0].hand), "The searching player's hand should not change")
+        for i in range(len(self.game.players)):
+            self.assertEqual(len(clone.players[i]), len(self.game.players[i]))
+        self.assertEqual(len(clone.draw_pile), len(self.game.draw_pile))
+
+    @number("6.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_shuffle_pile_keeps_cards(self) -> None:
+        while len(self.game.draw_pile) > 0:
+            self.game.play_turn()
+        self.game.shuffle_pile()
+        self.assertEqual(self.count_cards(self.game), STANDARD_DECK.size)
+        for i in range(len(self.game.draw_pile)):
+            self.assertIsNotNone(self.game.draw_pile.array[i], "The draw pile should only contain cards after a shuffle")
+
+    @number("6.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_mcts_does_not_disturb_random_gen(self) -> None:
+        strategy = MCTSStrategy(iterations=20, seed=1)
+        self.players[0].strategy = strategy
+        strategy.attach(self.game)
+        seed = RandomGen.seed
+        strategy.choose_card(self.players[0], 0b11)
+        self.assertEqual(RandomGen.seed, seed, "Searching should not draw from RandomGen")
+
+    @number("6.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_mcts_game_finishes(self) -> None:
+        self.players[0].strategy = MCTSStrategy(iterations=10, seed=1)
+        self.players[0].strategy.attach(self.game)
+        winner: Player = self.game.play_game()
+        self.assertEqual(len(winner), 0)
+
+    @number("6.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_mcts_searches_same_variant(self) -> None:
+        deck_spec, rules = DeckSpec(decks=2), with_draw_stacking()
+        players: ArrayR[Player] = ArrayR(2)
+        players[0], players[1] = Player("Alice", 0), Player("Bob", 1)
+        game = Game(deck_spec, rules)
+        game.rng = RandomStream(5)
+        game.initialise_game(players)
+        spy = SpyDeterminiser()
+        strategy = MCTSStrategy(iterations=6, determiniser=spy, seed=1)
+        strategy.attach(game)
+        strategy.choose_card(players[0], 0b11)
+        self.assertEqual(len(spy.games), 6)
+        for searched_deck, searched_rules in spy.games:
+            self.assertIs(searched_deck, deck_spec, "Rollouts should use the searched game's deck")
+            self.assertIs(searched_rules, rules, "Rollouts should use the searched game's rules")
+
+    @number("6.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_stream_shuffle_matches_random_gen(self) -> None:
+        for seed in (0, 7, 123):
+            shuffled: ArrayR[int] = ArrayR(108)
+            expected: ArrayR[int] = ArrayR(108)
+            for i in range(108):
+                shuffled[i] = expected[i] = i
+            RandomStream(seed).random_shuffle(shuffled)
+            RandomGen.set_seed(seed)
+            RandomGen.random_shuffle(expected)
+            self.assertEqual(list(shuffled), list(expected), "A stream should shuffle like RandomGen")
+
+        class Constant(RandomStream):
+            def random(self) -> int:
+                return 0
+
+        unchanged: ArrayR[int] = ArrayR(5)
+        for i in range(5):
+            unchanged[i] = i
+        Constant(0).random_shuffle(unchanged)
+        self.assertEqual(list(unchanged), [0, 1, 2, 3, 4], "Equal keys should keep their order")
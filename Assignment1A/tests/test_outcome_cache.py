@@ -0,0 +1,123 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from bounded import BoundedGame
+from constants import Constants
+from outcome_cache import GameConfig, NO_WINNER, OutcomeCache, simulate
+from player import Player
+from random_gen import RandomStream
+from rules import with_draw_stacking
+
+
+def seed_array(*seeds: int) -> ArrayR[int]:
+    array: ArrayR[int] = ArrayR(len(seeds))
+    for i in range(len(seeds)):
+        array[i] = seeds[i]
+    return array
+
+
+class TestOutcomeCache(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+        self.config = GameConfig(3)
+
+    @number("16.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_simulate(self) -> None:
+        outcome = simulate(self.config, 4)
+        self.assertNotEqual(outcome.winner, NO_WINNER)
+        self.assertEqual(outcome.hand_sizes[outcome.winner], 0, "The winner should have no cards left")
+        again = simulate(self.config, 4)
+        self.assertEqual((again.winner, again.turns, list(again.hand_sizes)),
+                         (outcome.winner, outcome.turns, list(outcome.hand_sizes)))
+        self.assertEqual(Constants.NUM_CARDS_AT_INIT, 7)
+
+        small = GameConfig(3, cards_at_init=2)
+        self.assertNotEqual(small.fingerprint(), self.config.fingerprint())
+        simulate(small, 4)
+        self.assertEqual(Constants.NUM_CARDS_AT_INIT, 7, "Simulating should leave the constant unchanged")
+
+    @number("16.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_only_misses_simulated(self) -> None:
+        with OutcomeCache(batch_size=2) as cache:
+            first = cache.outcomes(self.config, seed_array(0, 1, 2))
+            self.assertEqual((cache.hits, cache.misses), (0, 3))
+            second = cache.outcomes(self.config, seed_array(2, 3, 0))
+            self.assertEqual((cache.hits, cache.misses), (2, 4))
+            self.assertEqual(second[0].turns, first[2].turns)
+            self.assertEqual(second[2].winner, first[0].winner)
+            self.assertEqual(len(cache), 4)
+
+            cache.outcomes(GameConfig(4), seed_array(0))
+            self.assertEqual((cache.hits, cache.misses), (2, 5), "Configurations should not share outcomes")
+
+    @number("16.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_persistent(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "outcomes.db")
+            with OutcomeCache(path) as cache:
+                expected = cache.outcomes(self.config, seed_array(5, 6))
+            with OutcomeCache(path) as cache:
+                outcomes = cache.get_many(self.config, seed_array(5, 6, 7))
+                self.assertIsNone(outcomes[2])
+                for i in range(2):
+                    self.assertEqual(outcomes[i].winner, expected[i].winner)
+                    self.assertEqual(list(outcomes[i].hand_sizes), list(expected[i].hand_sizes))
+
+    @number("16.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_least_recently_used_evicted(self) -> None:
+        with OutcomeCache(max_entries=3, batch_size=1) as cache:
+            cache.outcomes(self.config, seed_array(0, 1, 2))
+            cache.get_many(self.config, seed_array(0))
+            cache.outcomes(self.config, seed_array(3))
+            self.assertEqual(len(cache), 3)
+            cached = cache.get_many(self.config, seed_array(0, 1, 2, 3))
+            self.assertIsNotNone(cached[0], "Seed 0 was used recently")
+            self.assertIsNone(cached[1], "Seed 1 was the least recently used")
+            self.assertIsNotNone(cached[2])
+            self.assertIsNotNone(cached[3])
+
+    @number("16.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_rules_in_fingerprint(self) -> None:
+        stacking = with_draw_stacking()
+        with self.assertRaises(ValueError, msg="Variant rules without a name would share standard outcomes"):
+            GameConfig(3, rules=stacking)
+        named = GameConfig(3, rules=stacking, variant="stacking")
+        self.assertNotEqual(named.fingerprint(), self.config.fingerprint())
+
+    @number("16.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_cards_dealt_per_game(self) -> None:
+        players: ArrayR[Player] = ArrayR(3)
+        for seat in range(3):
+            players[seat] = Player(str(seat), seat)
+        game = BoundedGame()
+        game.rng = RandomStream(4)
+        game.initialise_game(players, 2)
+        for seat in range(3):
+            self.assertEqual(len(players[seat].hand), 2, "The deal should not read the shared constant")
+        self.assertEqual(simulate(GameConfig(3, cards_at_init=2), 4).turns,
+                         game.play_bounded().turns)
+
+    @number("16.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_buffered_writes(self) -> None:
+        with OutcomeCache(batch_size=100) as cache:
+            outcomes = cache.outcomes(self.config, seed_array(0, 1))
+            self.assertEqual(len(cache.pending), 2, "Outcomes should be buffered until the batch is full")
+            again = cache.outcomes(self.config, seed_array(1, 0, 1))
+            self.assertEqual((cache.hits, cache.misses), (3, 2), "Buffered outcomes should not be simulated again")
+            self.assertEqual(again[1].turns, outcomes[0].turns)
+            cache.put_many(self.config, seed_array(0), seed_array(outcomes[0]))
+            self.assertEqual(len(cache), 2, "Storing a seed again should replace it")
+            self.assertTrue(cache.pending.is_empty() and cache.touched.is_empty())
+            self.assertEqual(cache.uncommitted, 0)
@@ -0,0 +1,115 @@
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from data_structures.referential_array import ArrayR
+from constants import Constants
+from paired import PairedComparison, PairedGame, PairedStreams, compare_paired, play_seat
+from player import Player
+from random_gen import RandomStream
+from strategy import DEFAULT_STRATEGY, FirstPlayableStrategy, MostFrequentColorStrategy
+
+
+def seated(strategies: list) -> ArrayR[Player]:
+    """ New players with the given strategies, seated in order. """
+    players = ArrayR(len(strategies))
+    for seat, strategy in enumerate(strategies):
+        players[seat] = Player(str(seat), seat, strategy)
+    return players
+
+
+class TestPaired(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+
+    @number("29.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_substreams(self) -> None:
+        first, second = RandomStream(9), RandomStream(9)
+        spawned = [first.spawn() for _ in range(3)]
+        again = [second.spawn() for _ in range(3)]
+        self.assertEqual([s.seed for s in spawned], [s.seed for s in again], "Spawning should be repeatable")
+        self.assertEqual(len({s.random() for s in spawned}), 3, "Spawned streams should differ")
+
+        streams = PairedStreams(9, 3)
+        game = PairedGame(9)
+        game.initialise_game(seated([DEFAULT_STRATEGY] * 3))
+        expected = RandomStream(streams.seats[1].seed).randint(0, 3)
+        # Draws at other seats and reshuffles do not move a seat's colour stream
+        game.current_player = game.players[0]
+        for _ in range(5):
+            game.rng.randint(0, 3)
+        game.rng.random_shuffle(ArrayR(10))
+        game.current_player = [p for p in game.players if p.name == "1"][0]
+        self.assertEqual(game.rng.randint(0, 3), expected)
+
+        # A reverse moves the players to new positions but not to new seats
+        game.play_reverse()
+        for player in game.players:
+            game.current_player = player
+            self.assertIs(game.rng.stream(), game.rng.seats[int(player.name)])
+        self.assertEqual(game.players[2].position, 0)
+
+    @number("29.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_aligned_deals(self) -> None:
+        games = []
+        for strategy in (FirstPlayableStrategy(), MostFrequentColorStrategy()):
+            game = PairedGame(17)
+            game.initialise_game(seated([strategy, DEFAULT_STRATEGY, DEFAULT_STRATEGY, DEFAULT_STRATEGY]))
+            games.append(game)
+        first, second = games
+        for p, q in zip(first.players, second.players):
+            self.assertEqual([str(c) for c in p.hand], [str(c) for c in q.hand])
+        self.assertEqual([str(c) for c in first.draw_pile], [str(c) for c in second.draw_pile])
+        self.assertEqual(first.position_hash(), second.position_hash())
+
+        self.assertEqual(play_seat(MostFrequentColorStrategy(), 2, DEFAULT_STRATEGY, 17, 4),
+                         play_seat(MostFrequentColorStrategy(), 2, DEFAULT_STRATEGY, 17, 4),
+                         "A paired game should be repeatable from its seed")
+
+        comparison = compare_paired(MostFrequentColorStrategy(), FirstPlayableStrategy(), range(5), 3,
+                                    cards_at_init=4)
+        self.assertEqual(Constants.NUM_CARDS_AT_INIT, 7, "The comparison should not change the constant")
+        wins = sum(play_seat(MostFrequentColorStrategy(), seat, DEFAULT_STRATEGY, seed, 3, 4)
+                   for seed in range(5) for seat in range(3))
+        self.assertAlmostEqual(comparison.wins_a.mean * comparison.games / 2, wins)
+
+    @number("29.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_same_strategy(self) -> None:
+        comparison = compare_paired(FirstPlayableStrategy(), FirstPlayableStrategy(), range(20), 3)
+        self.assertEqual(comparison.deals, 20)
+        self.assertEqual(comparison.games, 2 * 20 * 3)
+        self.assertEqual(comparison.mean_difference(), 0.0)
+        self.assertEqual(comparison.interval(), (0.0, 0.0), "Identical strategies play identical games")
+        self.assertEqual(comparison.wins_a.mean, comparison.wins_b.mean)
+        low, high = comparison.independent_interval()
+        self.assertLess(low, 0.0)
+        self.assertGreater(high, 0.0)
+        self.assertEqual(comparison.efficiency(), float("inf"))
+
+    @number("29.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_paired_interval(self) -> None:
+        strategies = (MostFrequentColorStrategy(), FirstPlayableStrategy())
+        comparison = compare_paired(*strategies, range(60), 4)
+        low, high = comparison.interval()
+        self.assertLessEqual(low, comparison.mean_difference())
+        self.assertLessEqual(comparison.mean_difference(), high)
+        independent_low, independent_high = comparison.independent_interval()
+        self.assertLess(high - low, independent_high - independent_low, "Pairing should narrow the interval")
+        self.assertGreater(comparison.efficiency(), 1.0)
+        self.assertLess(comparison.games_needed(0.05), comparison.independent_games_needed(0.05))
+
+        merged = PairedComparison(4)
+        merged.merge(compare_paired(*strategies, range(30), 4))
+        merged.merge(compare_paired(*strategies, range(30, 60), 4))
+        with ProcessPoolExecutor(2) as pool:
+            pooled = compare_paired(*strategies, range(60), 4, executor=pool, chunks=3)
+        for other in (merged, pooled):
+            self.assertEqual(other.games, comparison.games)
+            self.assertAlmostEqual(other.mean_difference(), comparison.mean_difference())
+            self.assertAlmostEqual(other.difference.variance(), comparison.difference.variance())
@@ -0,0 +1,108 @@
+import pickle
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from arena import new_table
+from bounded import BoundedGame
+from card import Card, CardColor, CardLabel, CARDS_BY_ID
+from constants import Constants
+from deck import DeckSpec, STANDARD_DECK
+from player import Player
+from game import Game
+from random_gen import RandomGen, RandomStream
+from rules import STANDARD_RULES
+
+
+def round_trip(value):
+    return pickle.loads(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def new_players(count: int) -> ArrayR[Player]:
+    players: ArrayR[Player] = ArrayR(count)
+    for seat in range(count):
+        players[seat] = Player(str(seat), seat)
+    return players
+
+
+class TestPickle(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+
+    @number("17.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_array_and_card(self) -> None:
+        array = ArrayR(4)
+        array[0], array[2] = 5, "x"
+        copy = round_trip(array)
+        self.assertEqual(list(copy), [5, None, "x", None])
+
+        card = Card(CardColor.BLUE, CardLabel.SKIP)
+        self.assertIs(round_trip(card), CARDS_BY_ID[card.id], "Cards should unpickle as the shared card")
+
+    @number("17.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_player(self) -> None:
+        player = Player("p", 3)
+        for card_id in (60, 2, 31, 2):
+            player.add_card(CARDS_BY_ID[card_id])
+        copy = round_trip(player)
+        self.assertEqual((copy.name, copy.position), ("p", 3))
+        self.assertEqual([card.id for card in copy.hand], [card.id for card in player.hand])
+        copy.add_card(CARDS_BY_ID[0])
+        self.assertEqual(copy.hand[0].id, 0, "The unpickled hand should stay sorted")
+
+    @number("17.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_mid_game(self) -> None:
+        game = new_table(new_players(4), 7)
+        for _ in range(25):
+            game.play_turn()
+        copy = round_trip(game)
+        self.assertEqual(copy.snapshot(), game.snapshot())
+        self.assertIs(copy.rules, STANDARD_RULES)
+        self.assertIs(copy.deck_spec, STANDARD_DECK)
+        self.assertIsNot(copy.current_player, game.current_player)
+        self.assertEqual(copy.current_player.name, game.current_player.name)
+        self.assertEqual(copy.play_game().name, game.play_game().name, "The copy should play out the same")
+
+    @number("17.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_subclass_and_deck(self) -> None:
+        spec = DeckSpec(decks=2)
+        game = BoundedGame(spec, max_turns=40)
+        game.rng = RandomStream(2)
+        game.initialise_game(new_players(3))
+        game.play_turn()
+        copy = round_trip(game)
+        self.assertEqual(copy.deck_spec.size, spec.size)
+        self.assertEqual(copy.max_turns, 40)
+        self.assertEqual(copy.position_hash(), game.position_hash())
+        self.assertEqual(copy.play_bounded().turns, game.play_bounded().turns)
+
+    @number("17.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_hands_pickled_once(self) -> None:
+        game = new_table(new_players(3), 4)
+        for _ in range(10):
+            game.play_turn()
+        data = pickle.dumps(game, protocol=pickle.HIGHEST_PROTOCOL)
+        state = game.__getstate__()
+        self.assertEqual(len(state[0]), len(game.snapshot()) - sum(len(player.hand) for player in game.players),
+                         "The pickled snapshot should leave the hands to the players")
+        copy = pickle.loads(data)
+        for seat in range(3):
+            self.assertEqual([card.id for card in copy.players[seat].hand],
+                             [card.id for card in game.players[seat].hand])
+
+        # A game on the shared RandomGen carries its seed with it
+        RandomGen.set_seed(8)
+        game = Game()
+        game.initialise_game(new_players(3))
+        copy = round_trip(game)
+        seed = RandomGen.seed
+        winner = copy.play_game().name
+        self.assertEqual(RandomGen.seed, seed, "The copy should not draw from RandomGen")
+        self.assertEqual(game.play_game().name, winner, "The copy should play out like the original")
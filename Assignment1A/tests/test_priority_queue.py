@@ -0,0 +1,109 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from data_structures.priority_queue_adt import ArrayHeap, DaryHeap
+from random_gen import RandomStream
+
+
+def new_queues():
+    return [ArrayHeap(), DaryHeap(3), DaryHeap(4, 50), DaryHeap(8)]
+
+
+class TestPriorityQueue(TestCase):
+
+    @number("27.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_serve_in_order(self) -> None:
+        rng = RandomStream(7)
+        priorities = [rng.randint(0, 50) for _ in range(300)]
+        expected = [item for priority, item in sorted((priorities[i], i) for i in range(300))]
+        for queue in new_queues():
+            self.assertTrue(queue.is_empty())
+            handles = [queue.add(i, priorities[i]) for i in range(300)]
+            self.assertEqual(len(set(handles)), 300, "Every element should get its own handle")
+            self.assertEqual(len(queue), 300)
+            self.assertEqual(queue.peek(), expected[0])
+            self.assertEqual(queue.peek_priority(), min(priorities))
+            self.assertEqual(queue.priority(handles[17]), priorities[17])
+            self.assertEqual(queue.item(handles[17]), 17)
+            served = [queue.serve() for _ in range(300)]
+            self.assertEqual(served, expected, "Equal priorities are served in the order they were added")
+            with self.assertRaises(Exception):
+                queue.serve()
+            with self.assertRaises(Exception):
+                queue.peek()
+
+    @number("27.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_decrease_key_and_remove(self) -> None:
+        for queue in new_queues():
+            handle = {}
+            for name, time in (("a", 5.0), ("b", 3.0), ("c", 9.0), ("d", 3.0), ("e", 7.5)):
+                handle[name] = queue.add(name, time)
+            queue.decrease_key(handle["c"], 1.0)
+            self.assertEqual(queue.peek(), "c")
+            queue.decrease_key(handle["e"], 3.0)
+            queue.remove(handle["b"])
+            self.assertNotIn(handle["b"], queue)
+            self.assertIn(handle["e"], queue)
+            with self.assertRaises(ValueError):
+                queue.decrease_key(handle["a"], 6.0)
+            with self.assertRaises(KeyError):
+                queue.remove(handle["b"])
+            with self.assertRaises(KeyError):
+                queue.priority(-1)
+            self.assertEqual([queue.serve() for _ in range(len(queue))], ["c", "d", "e", "a"])
+            handle["b"] = queue.add("b", 1.0)
+            queue.add("f", 2.0)
+            queue.clear()
+            self.assertTrue(queue.is_empty())
+            self.assertNotIn(handle["b"], queue)
+            for i in range(len(queue.items)):
+                self.assertIsNone(queue.items[i], "Clearing should drop the references to the elements")
+                self.assertIsNone(queue.slots[i])
+            queue.add("g", 4.0)
+            self.assertEqual(queue.serve(), "g")
+
+    @number("27.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_random_operations(self) -> None:
+        rng = RandomStream(11)
+        for queue in new_queues():
+            # Handle to (priority, element), the elements being numbered in the order they are added
+            reference = {}
+            next_item = 0
+            for _ in range(3000):
+                action = rng.randint(0, 9)
+                if action < 4 or len(reference) == 0:
+                    handle = queue.add(next_item, rng.randint(0, 1000))
+                    self.assertNotIn(handle, reference, "Handles in use should not be given out again")
+                    reference[handle] = (queue.priority(handle), next_item)
+                    next_item += 1
+                elif action < 6:
+                    handle = min(reference, key=reference.get)
+                    self.assertEqual(queue.serve(), reference.pop(handle)[1])
+                    self.assertNotIn(handle, queue)
+                elif action < 8:
+                    handle = list(reference)[rng.randint(0, len(reference) - 1)]
+                    priority = rng.randint(0, reference[handle][0])
+                    queue.decrease_key(handle, priority)
+                    reference[handle] = (priority, reference[handle][1])
+                else:
+                    handle = list(reference)[rng.randint(0, len(reference) - 1)]
+                    queue.remove(handle)
+                    del reference[handle]
+                self.assertEqual(len(queue), len(reference))
+                for slot in range(len(queue)):
+                    self.assertEqual(queue.slots[queue.handles[slot]], slot)
+                    self.assertIs(queue.items[slot], reference[queue.handles[slot]][1])
+            ordered = [reference[handle][1] for handle in sorted(reference, key=reference.get)]
+            self.assertEqual([queue.serve() for _ in range(len(queue))], ordered)
+
+    @number("27.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_arity(self) -> None:
+        self.assertEqual(ArrayHeap().arity, 2)
+        self.assertEqual(DaryHeap(5).arity, 5)
+        with self.assertRaises(ValueError):
+            DaryHeap(1)
@@ -0,0 +1,81 @@
+import os
+import tempfile
+from unittest import TestCase, skipIf
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from batch import play_recorded
+from constants import Constants
+from result_store import NO_HAND, ResultAppender, ResultStore, append_games
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def array_of(*values: int) -> ArrayR[int]:
+    array: ArrayR[int] = ArrayR(len(values))
+    for i in range(len(values)):
+        array[i] = values[i]
+    return array
+
+
+@skipIf(numpy is None, "numpy is not installed")
+class TestResultStore(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "results")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    @number("22.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_round_trip(self) -> None:
+        with ResultAppender(self.path, chunk_rows=2) as appender:
+            appender.append(1 << 40, 1, 30, 2, array_of(3, 0, 5))
+            appender.append(7, -1, 800, 9, array_of(1, 2))
+            appender.append(8, 0, 12, 0, array_of(0, 4, 4, 4))
+        self.assertEqual(os.path.getsize(os.path.join(self.path, "seed.col")), 3 * 8, "Files should be trimmed")
+
+        store = ResultStore(self.path)
+        self.assertEqual(len(store), 3)
+        self.assertEqual(list(store.column("seed")), [1 << 40, 7, 8])
+        self.assertEqual(list(store.column("num_players")), [3, 2, 4])
+        self.assertEqual(list(store.column("winner")), [1, -1, 0])
+        self.assertEqual(list(store.column("turns")), [30, 800, 12])
+        self.assertEqual(list(store.column("recycles")), [2, 9, 0])
+        hands = store.column("hand_sizes")
+        self.assertEqual(hands.shape, (3, Constants.MAX_PLAYERS))
+        self.assertEqual(list(hands[0][:4]), [3, 0, 5, NO_HAND])
+
+    @number("22.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_reopen_and_flush(self) -> None:
+        with ResultAppender(self.path) as appender:
+            appender.append(1, 0, 5, 0, array_of(0, 3))
+        appender = ResultAppender(self.path)
+        appender.append(2, 1, 6, 0, array_of(2, 0))
+        self.assertEqual(len(ResultStore(self.path)), 1, "Rows are not visible before a flush")
+        appender.flush()
+        self.assertEqual(list(ResultStore(self.path).column("seed")), [1, 2])
+        appender.close()
+        self.assertEqual(len(ResultStore(self.path)), 2)
+        self.assertEqual(len(ResultStore(self.path).column("turns")), 2)
+
+    @number("22.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_games(self) -> None:
+        with ResultAppender(self.path) as appender:
+            append_games(appender, array_of(3, 4, 5), 3)
+        store = ResultStore(self.path)
+        for i, seed in enumerate((3, 4, 5)):
+            game, winner, turns = play_recorded(seed, 3)
+            self.assertEqual(store.column("winner")[i], winner)
+            self.assertEqual(store.column("turns")[i], turns)
+            self.assertEqual(store.column("recycles")[i], game.recycles)
+            self.assertEqual(store.column("hand_sizes")[i][winner], 0)
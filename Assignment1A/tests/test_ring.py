@@ -0,0 +1,62 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from data_structures.ring import Ring
+
+
+class TestRing(TestCase):
+
+    @number("25.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_append_and_walk(self) -> None:
+        ring = Ring()
+        self.assertTrue(ring.is_empty())
+        self.assertEqual(list(ring), [])
+        nodes = [ring.append(i) for i in range(5)]
+        self.assertEqual(len(ring), 5)
+        self.assertEqual(list(ring), [0, 1, 2, 3, 4])
+        self.assertIs(ring.after(nodes[4]), nodes[0])
+        self.assertIs(ring.before(nodes[0]), nodes[4])
+        self.assertIs(ring.after(nodes[1]), nodes[2])
+
+        node = ring.insert_after(nodes[1], 10)
+        self.assertEqual(list(ring), [0, 1, 10, 2, 3, 4])
+        self.assertIs(ring.before(node), nodes[1])
+
+    @number("25.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_reverse(self) -> None:
+        ring = Ring()
+        nodes = [ring.append(i) for i in range(4)]
+        ring.reverse()
+        self.assertEqual(list(ring), [0, 3, 2, 1])
+        self.assertIs(ring.after(nodes[0]), nodes[3])
+        self.assertIs(ring.before(nodes[0]), nodes[1])
+        ring.insert_after(nodes[0], 7)
+        self.assertEqual(list(ring), [0, 7, 3, 2, 1])
+        ring.reverse()
+        self.assertEqual(list(ring), [0, 1, 2, 3, 7])
+
+    @number("25.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_remove(self) -> None:
+        ring = Ring()
+        nodes = [ring.append(i) for i in range(4)]
+        self.assertEqual(ring.remove(nodes[2]), 2)
+        self.assertEqual(list(ring), [0, 1, 3])
+        self.assertIs(ring.after(nodes[1]), nodes[3])
+        with self.assertRaises(ValueError):
+            ring.after(nodes[2])
+        with self.assertRaises(ValueError):
+            ring.remove(nodes[2])
+
+        ring.remove(nodes[0])
+        self.assertIs(ring.head, nodes[1], "The head moves on when it is removed")
+        self.assertEqual(list(ring), [1, 3])
+        ring.remove(nodes[1])
+        ring.remove(nodes[3])
+        self.assertTrue(ring.is_empty())
+        self.assertIsNone(ring.head)
+        ring.append(5)
+        self.assertEqual(list(ring), [5])
@@ -0,0 +1,119 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from arena import new_table
+from card import Card, CardColor, CardLabel
+from constants import Constants
+from game import Game
+from player import Player
+from rules import STANDARD_RULES, no_effect, with_draw_stacking, with_jump_in, with_seven_zero
+
+
+class TestRules(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+        self.players: ArrayR[Player] = ArrayR(3)
+        for seat in range(3):
+            self.players[seat] = Player(str(seat), seat)
+        self.game: Game = new_table(self.players, 0)
+        self.game.current_player = self.game.players[0]
+        self.game.current_color, self.game.current_label = CardColor.RED, CardLabel.ONE
+
+    def deal(self, seat: int, *cards: Card) -> None:
+        hand = self.game.players[seat].hand
+        hand.clear()
+        for card in cards:
+            hand.add(card)
+
+    @number("14.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_standard_table(self) -> None:
+        for label in CardLabel:
+            self.assertIsNotNone(STANDARD_RULES.effects[label], f"{label.name} has no handler")
+        for label in range(10):
+            self.assertIs(STANDARD_RULES.effects[label], no_effect)
+
+        self.deal(0, Card(CardColor.RED, CardLabel.FIVE), Card(CardColor.RED, CardLabel.SIX))
+        self.assertIsNone(self.game.play_from_hand(0))
+        self.assertIs(self.game.current_player, self.game.players[0], "A number card has no effect")
+        self.assertEqual((self.game.current_color, self.game.current_label), (CardColor.RED, CardLabel.FIVE))
+
+    @number("14.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_draw_stacking(self) -> None:
+        self.game.rules = with_draw_stacking()
+        self.deal(0, Card(CardColor.RED, CardLabel.DRAW_TWO), Card(CardColor.RED, CardLabel.ONE))
+        self.deal(1, Card(CardColor.BLUE, CardLabel.FIVE), Card(CardColor.BLUE, CardLabel.DRAW_TWO))
+        self.deal(2, Card(CardColor.GREEN, CardLabel.THREE))
+        self.assertIsNone(self.game.play_from_hand(1))
+
+        self.assertEqual(len(self.game.players[1].hand), 1, "Player 1 should have stacked their DRAW_TWO")
+        self.assertEqual(len(self.game.players[2].hand), 5, "Player 2 should have drawn the stacked penalty")
+        self.assertIs(self.game.current_player, self.game.players[2], "Player 2 should miss their turn")
+        self.assertEqual((self.game.current_color, self.game.current_label), (CardColor.BLUE, CardLabel.DRAW_TWO))
+
+    @number("14.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_stacking_last_card_wins(self) -> None:
+        self.game.rules = with_draw_stacking()
+        self.deal(0, Card(CardColor.CRAZY, CardLabel.DRAW_FOUR), Card(CardColor.RED, CardLabel.ONE))
+        self.deal(1, Card(CardColor.CRAZY, CardLabel.DRAW_FOUR))
+        self.deal(2, Card(CardColor.GREEN, CardLabel.THREE))
+        self.assertIs(self.game.play_from_hand(1), self.game.players[1])
+        self.assertEqual(len(self.game.players[2].hand), 9)
+        self.assertIsNone(self.game.current_label)
+
+    @number("14.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_seven_zero(self) -> None:
+        self.game.rules = with_seven_zero()
+        seven = Card(CardColor.RED, CardLabel.SEVEN)
+        self.deal(0, seven, Card(CardColor.RED, CardLabel.ZERO), Card(CardColor.BLUE, CardLabel.ONE))
+        self.deal(1, Card(CardColor.BLUE, CardLabel.TWO), Card(CardColor.BLUE, CardLabel.THREE))
+        self.deal(2, Card(CardColor.GREEN, CardLabel.FOUR))
+        hands = ArrayR(3)
+        for seat in range(3):
+            hands[seat] = self.game.players[seat].hand
+
+        self.game.play_from_hand(1)
+        self.assertIs(self.game.players[0].hand, hands[2], "SEVEN swaps with the smallest hand")
+        self.assertIs(self.game.players[2].hand, hands[0])
+
+        self.game.current_player = self.game.players[2]
+        self.game.play_from_hand(0)
+        self.assertIs(self.game.players[0].hand, hands[0], "ZERO passes every hand to the next player")
+        self.assertIs(self.game.players[1].hand, hands[2])
+        self.assertIs(self.game.players[2].hand, hands[1])
+
+    @number("14.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_jump_in(self) -> None:
+        self.game.rules = with_jump_in()
+        self.deal(0, Card(CardColor.RED, CardLabel.SKIP), Card(CardColor.RED, CardLabel.ONE))
+        self.deal(1, Card(CardColor.BLUE, CardLabel.TWO))
+        self.deal(2, Card(CardColor.RED, CardLabel.SKIP), Card(CardColor.GREEN, CardLabel.FOUR))
+        self.assertIsNone(self.game.play_from_hand(1))
+
+        self.assertEqual(len(self.game.players[2].hand), 1, "Player 2 should have jumped in")
+        self.assertEqual(len(self.game.discard_pile), 3)
+        # The jumped in SKIP skips player 0, so player 1 plays next
+        self.assertIs(self.game.next_player(), self.game.players[1])
+
+    @number("14.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_variant_games_finish(self) -> None:
+        rules = with_jump_in(with_seven_zero(with_draw_stacking()))
+        for seed in range(20):
+            players: ArrayR[Player] = ArrayR(4)
+            for seat in range(4):
+                players[seat] = Player(str(seat), seat)
+            game = new_table(players, seed, rules=rules)
+            winner = game.play_game()
+            self.assertEqual(len(winner.hand), 0)
+            total = len(game.draw_pile) + len(game.discard_pile)
+            for seat in range(4):
+                total += len(game.players[seat].hand)
+            self.assertEqual(total, game.deck_spec.size)
@@ -0,0 +1,93 @@
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from batch import play_recorded
+from card import CardLabel
+from constants import Constants
+from seed_search import LastCardIs, RecycleWithin, Turn, TurnPredicate, Verdict, play_until_decided, search_seeds
+
+
+class Watcher(TurnPredicate):
+    """ Predicate keeping every turn, deciding nothing until turn decide_on. """
+
+    def __init__(self, decide_on: int = 0, verdict: Verdict = Verdict.IMPOSSIBLE) -> None:
+        self.decide_on = decide_on
+        self.verdict = verdict
+        self.turns = []
+
+    def reset(self) -> None:
+        self.turns = []
+
+    def observe(self, turn: Turn) -> Verdict:
+        self.turns.append(turn)
+        return self.verdict if turn.number == self.decide_on else Verdict.UNDECIDED
+
+
+class TestSeedSearch(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+
+    @number("23.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_turn_stream(self) -> None:
+        watcher = Watcher()
+        self.assertEqual(play_until_decided(watcher, 5, 4), 0, "An undecided game does not match")
+        game, winner, turns = play_recorded(5, 4)
+        self.assertEqual(len(watcher.turns), turns)
+        self.assertEqual([turn.number for turn in watcher.turns], list(range(1, turns + 1)))
+        self.assertEqual(watcher.turns[-1].winner, winner)
+        self.assertEqual(watcher.turns[-1].seat, winner)
+        self.assertEqual(sum(turn.drawn for turn in watcher.turns), game.cards_drawn - 4 * 7)
+        self.assertEqual(sum(turn.recycled for turn in watcher.turns), game.recycles)
+        for turn in watcher.turns[:-1]:
+            self.assertEqual(turn.winner, -1)
+
+    @number("23.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_early_stop(self) -> None:
+        watcher = Watcher(3)
+        self.assertEqual(play_until_decided(watcher, 5, 4), 0)
+        self.assertEqual(len(watcher.turns), 3, "The game should stop once the predicate is decided")
+
+        watcher = Watcher(4, Verdict.MATCH)
+        self.assertEqual(play_until_decided(watcher, 5, 4), 4)
+        self.assertEqual(len(watcher.turns), 4)
+
+        self.assertEqual(play_until_decided(RecycleWithin(1), 5, 4), 0)
+
+    @number("23.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_search(self) -> None:
+        predicate = LastCardIs(CardLabel.DRAW_FOUR)
+        expected = []
+        for seed in range(80):
+            turn = play_until_decided(predicate, seed, 4)
+            if turn > 0:
+                expected.append((seed, turn))
+        self.assertGreater(len(expected), 3)
+
+        self.assertEqual(list(search_seeds(predicate, range(80), 4, hits=3, chunk_size=4)), expected[:3])
+        self.assertEqual(list(search_seeds(predicate, range(80), 4, hits=1000, chunk_size=7)), expected)
+        self.assertEqual(len(search_seeds(predicate, range(0), 4)), 0)
+
+        for seed, turn in expected:
+            game, winner, turns = play_recorded(seed, 4)
+            self.assertEqual(turn, turns, "A winning card matches on the last turn")
+
+    @number("23.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_parallel_search(self) -> None:
+        predicate = LastCardIs(CardLabel.DRAW_FOUR)
+        expected = list(search_seeds(predicate, range(60), 3, hits=4, cards_at_init=5))
+        self.assertEqual(Constants.NUM_CARDS_AT_INIT, 7, "The search should not change the constant")
+        dealt_five = [(seed, turn) for seed in range(60)
+                      for turn in (play_until_decided(predicate, seed, 3, 5),) if turn > 0]
+        self.assertEqual(expected, dealt_five[:4], "The search should deal cards_at_init cards")
+        with ProcessPoolExecutor(2) as executor:
+            for chunk_size in (1, 3, 16):
+                found = search_seeds(predicate, range(60), 3, hits=4, executor=executor, chunk_size=chunk_size,
+                                     in_flight=4, cards_at_init=5)
+                self.assertEqual(list(found), expected, "The result should not depend on how the seeds are split")
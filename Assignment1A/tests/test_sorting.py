@@ -0,0 +1,130 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.referential_array import ArrayR
+from data_structures.sorting import merge_sort, counting_sort, radix_sort
+
+from arena import rank
+from card import Card, CardColor, CardLabel
+from deck import STANDARD_DECK, composition
+from random_gen import RandomStream
+
+
+class Tagged:
+    """ Item ordered by key only, with a tag to check stability. """
+
+    def __init__(self, key: int, tag: int) -> None:
+        self.key = key
+        self.tag = tag
+
+    def __lt__(self, other) -> bool:
+        return self.key < other.key
+
+
+class TestSorting(TestCase):
+
+    def random_array(self, size: int, high: int, seed: int) -> ArrayR:
+        rng = RandomStream(seed)
+        array = ArrayR(size)
+        for i in range(size):
+            array[i] = rng.randint(0, high)
+        return array
+
+    @number("12.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_merge_sort(self) -> None:
+        for size in (1, 2, 3, 17, 64, 100):
+            array = self.random_array(size, 20, size)
+            expected = sorted(array[i] for i in range(size))
+            merge_sort(array)
+            self.assertEqual([array[i] for i in range(size)], expected)
+
+    @number("12.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_merge_sort_is_stable(self) -> None:
+        keys = self.random_array(50, 5, 1)
+        array = ArrayR(50)
+        for i in range(50):
+            array[i] = Tagged(keys[i], i)
+        merge_sort(array)
+        for i in range(1, 50):
+            self.assertTrue((array[i - 1].key, array[i - 1].tag) < (array[i].key, array[i].tag))
+
+        # sorting on a key function orders by the key, keeping the original order of equal keys
+        merge_sort(array, key=lambda item: -item.key)
+        for i in range(1, 50):
+            self.assertTrue((-array[i - 1].key, array[i - 1].tag) < (-array[i].key, array[i].tag))
+
+    @number("12.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_add_many(self) -> None:
+        sorted_list = ArraySortedList(1)
+        expected = []
+        for seed in range(4):
+            items = self.random_array(10 + seed, 30, seed)
+            sorted_list.add_many(items)
+            expected.extend(items[i] for i in range(len(items)))
+            expected.sort()
+            self.assertEqual([sorted_list[i] for i in range(len(sorted_list))], expected)
+        self.assertEqual(len(sorted_list), len(expected))
+
+        # equal items added later come after the ones already in the list
+        tagged = ArraySortedList(1)
+        for batch in range(2):
+            items = ArrayR(3)
+            for i in range(3):
+                items[i] = Tagged(i, batch)
+            tagged.add_many(items)
+        self.assertEqual([(tagged[i].key, tagged[i].tag) for i in range(6)],
+                         [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0), (2, 1)])
+
+    @number("12.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_from_array_leaves_input_alone(self) -> None:
+        items = self.random_array(20, 9, 3)
+        before = [items[i] for i in range(20)]
+        sorted_list = ArraySortedList.from_array(items)
+        self.assertEqual([items[i] for i in range(20)], before)
+        self.assertEqual([sorted_list[i] for i in range(20)], sorted(before))
+
+    @number("12.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_counting_sort(self) -> None:
+        keys = self.random_array(60, 6, 5)
+        array = ArrayR(60)
+        for i in range(60):
+            array[i] = Tagged(keys[i], i)
+        counting_sort(array, lambda item: item.key, 7)
+        for i in range(1, 60):
+            self.assertTrue((array[i - 1].key, array[i - 1].tag) < (array[i].key, array[i].tag))
+
+    @number("12.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_radix_sort(self) -> None:
+        rng = RandomStream(9)
+        for radix_bits in (8, 11, 16):
+            array = ArrayR(300)
+            for i in range(300):
+                array[i] = rng.random()
+            expected = sorted(array[i] for i in range(300))
+            radix_sort(array, lambda item: item, 32, radix_bits)
+            self.assertEqual([array[i] for i in range(300)], expected, f"{radix_bits} bit digits")
+
+    @number("12.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_composition(self) -> None:
+        counts = composition(STANDARD_DECK.template())
+        self.assertEqual(counts[Card(CardColor.RED, CardLabel.SEVEN).id], 2)
+        self.assertEqual(counts[Card(CardColor.CRAZY, CardLabel.DRAW_FOUR).id], 4)
+        self.assertEqual(counts[Card(CardColor.CRAZY, CardLabel.SKIP).id], 0)
+        self.assertEqual(sum(counts[i] for i in range(len(counts))), STANDARD_DECK.size)
+
+    @number("12.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_rank(self) -> None:
+        wins = ArrayR(5)
+        for i, count in enumerate((3, 7, 0, 7, 3)):
+            wins[i] = count
+        order = rank(wins)
+        self.assertEqual([order[i] for i in range(5)], [1, 3, 0, 4, 2])
@@ -0,0 +1,68 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase, skipIf
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+
+from batch import run_batch, worker_pool
+from constants import Constants
+from lazy import lazy_import
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def run_python(code: str) -> str:
+    """ Run code in a fresh interpreter from the Assignment1A folder and return what it printed. """
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                               cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return completed.stdout.strip()
+
+
+class TestStartup(TestCase):
+
+    @number("24.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_game_imports(self) -> None:
+        self.assertEqual(run_python("import sys, game; print('unittest' in sys.modules)"), "False",
+                         "Importing the game should not import the test framework")
+        self.assertEqual(run_python("import sys, outcome_cache; print('_sqlite3' in sys.modules)"), "False")
+
+    @number("24.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_lazy_import(self) -> None:
+        self.assertIsNone(lazy_import("no_such_module_anywhere"))
+        self.assertIsNone(lazy_import("no_such_package.module"))
+        self.assertIs(lazy_import("sys"), sys)
+        code = ("import sys; from lazy import lazy_import; colorsys = lazy_import('colorsys'); "
+                "print(type(colorsys).__name__); "
+                "print(colorsys.rgb_to_hsv(1.0, 0.0, 0.0), type(colorsys).__name__, "
+                "sys.modules['colorsys'] is colorsys)")
+        self.assertEqual(run_python(code), "_LazyModule\n(0.0, 1.0, 1.0) module True")
+
+    @number("24.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @skipIf(numpy is None, "numpy is not installed")
+    def test_batch_without_numpy_import(self) -> None:
+        code = ("import sys, batch, result_store; print('numpy.linalg' in sys.modules); "
+                "results = batch.run_batch([1, 2], 2); "
+                "print(int(results.as_array()['seed'].sum()), 'numpy.linalg' in sys.modules); results.close()")
+        self.assertEqual(run_python(code), "False\n3 True")
+
+    @number("24.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_worker_pool(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+        seeds: ArrayR[int] = ArrayR(12)
+        for i in range(12):
+            seeds[i] = 100 + i
+        with run_batch(seeds, 3) as expected:
+            for start_method in ("forkserver", "no-such-method"):
+                with worker_pool(2, start_method=start_method) as executor:
+                    with run_batch(seeds, 3, executor, chunks=3) as results:
+                        for i in range(12):
+                            self.assertEqual(results.record(i), expected.record(i))
@@ -0,0 +1,128 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+
+from constants import Constants
+from outcome_cache import GameConfig, simulate
+from random_gen import RandomStream
+from stats import GameStats, Histogram, QuantileSketch, RunningStats
+
+
+def sample(count: int, seed: int) -> list[float]:
+    rng = RandomStream(seed)
+    return [1000 + rng.random() % 5000 / 7 for _ in range(count)]
+
+
+def bucket_counts(sketch: QuantileSketch) -> list[tuple[int, int]]:
+    return [(bucket.key, bucket.count) for bucket in sketch.buckets]
+
+
+class TestStats(TestCase):
+
+    def setUp(self) -> None:
+        Constants.NUM_CARDS_AT_INIT = 7
+
+    @number("19.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_running_stats(self) -> None:
+        values = sample(500, 1)
+        stats = RunningStats()
+        for value in values:
+            stats.add(value)
+        mean = sum(values) / len(values)
+        variance = sum((value - mean) ** 2 for value in values) / (len(values) - 1)
+        self.assertEqual(stats.count, 500)
+        self.assertAlmostEqual(stats.mean, mean, places=9)
+        self.assertAlmostEqual(stats.variance(), variance, places=6)
+        self.assertEqual((stats.min, stats.max), (min(values), max(values)))
+
+        left, right = RunningStats(), RunningStats()
+        for value in values[:123]:
+            left.add(value)
+        for value in values[123:]:
+            right.add(value)
+        left.merge(right)
+        left.merge(RunningStats())
+        self.assertEqual(left.count, 500)
+        self.assertAlmostEqual(left.mean, stats.mean, places=9)
+        self.assertAlmostEqual(left.variance(), stats.variance(), places=6)
+        self.assertEqual((left.min, left.max), (stats.min, stats.max))
+
+    @number("19.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_histogram(self) -> None:
+        histogram = Histogram(0, 10, 5)
+        for value in (-1, 0, 9.5, 10, 25, 49, 50, 1000):
+            histogram.add(value)
+        self.assertEqual(list(histogram.counts), [2, 1, 1, 0, 1])
+        self.assertEqual((histogram.below, histogram.above, histogram.count), (1, 2, 8))
+        self.assertEqual(histogram.quantile(0), float("-inf"))
+        self.assertEqual(histogram.quantile(0.3), 0)
+        self.assertEqual(histogram.quantile(1), float("inf"))
+
+        other = Histogram(0, 10, 5)
+        other.add(31)
+        histogram.merge(other)
+        self.assertEqual(list(histogram.counts), [2, 1, 1, 1, 1])
+        with self.assertRaises(ValueError):
+            histogram.merge(Histogram(0, 5, 5))
+
+    @number("19.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_quantile_sketch(self) -> None:
+        values = sample(2000, 2) + [0.0] * 10
+        sketch = QuantileSketch(0.01)
+        for value in values:
+            sketch.add(value)
+        ordered = sorted(values)
+        for q in (0.1, 0.25, 0.5, 0.9, 0.99):
+            exact = ordered[int(q * (len(values) - 1))]
+            self.assertLessEqual(abs(sketch.quantile(q) - exact), 0.01 * exact, f"Quantile {q} is too far off")
+        self.assertEqual(sketch.quantile(0), 0.0)
+
+        # Merging partial sketches gives exactly the sketch of the whole stream
+        parts = [QuantileSketch(0.01) for _ in range(3)]
+        for i, value in enumerate(values):
+            parts[i % 3].add(value)
+        merged = QuantileSketch(0.01)
+        for part in parts:
+            merged.merge(part)
+        self.assertEqual(bucket_counts(merged), bucket_counts(sketch))
+        self.assertEqual((merged.zero_count, merged.count), (sketch.zero_count, sketch.count))
+        with self.assertRaises(ValueError):
+            merged.merge(QuantileSketch(0.05))
+
+        # Combining the lowest buckets keeps the highest keys whatever the order, so merges stay exact
+        small = QuantileSketch(0.01, max_buckets=8)
+        for value in values:
+            small.add(value)
+        parts = [QuantileSketch(0.01, max_buckets=8) for _ in range(3)]
+        for i, value in enumerate(reversed(values)):
+            parts[i % 3].add(value)
+        merged = QuantileSketch(0.01, max_buckets=8)
+        for part in reversed(parts):
+            merged.merge(part)
+        self.assertEqual(len(small.buckets), 8)
+        self.assertEqual(bucket_counts(merged), bucket_counts(small))
+        self.assertEqual(sum(count for _, count in bucket_counts(small)) + small.zero_count, len(values))
+
+    @number("19.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_game_stats(self) -> None:
+        config = GameConfig(3)
+        whole, odd, even = GameStats(3), GameStats(3), GameStats(3)
+        for seed in range(30):
+            outcome = simulate(config, seed)
+            whole.add(outcome)
+            (odd if seed % 2 else even).add(outcome)
+        even.merge(odd)
+
+        self.assertEqual(whole.games, 30)
+        self.assertEqual(sum(whole.wins) + whole.unfinished, 30)
+        self.assertEqual(list(even.wins), list(whole.wins))
+        self.assertEqual(list(even.turn_histogram.counts), list(whole.turn_histogram.counts))
+        self.assertEqual(bucket_counts(even.hand_sizes), bucket_counts(whole.hand_sizes))
+        self.assertAlmostEqual(even.turns.mean, whole.turns.mean, places=9)
+        self.assertAlmostEqual(sum(whole.win_rate(seat) for seat in range(3)), 1 - whole.unfinished / 30)
+        with self.assertRaises(ValueError):
+            whole.merge(GameStats(4))